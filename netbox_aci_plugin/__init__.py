@@ -25,7 +25,29 @@ class ACIConfig(PluginConfig):
         "create_default_aci_fabric": True,
         "create_default_aci_tenants": True,
         "create_default_aci_contract_filters": True,
+        "profiling_enabled": False,
+        "fragment_cache_timeout": 3600,
+        "change_feed_overlap": 60,
     }
+    middleware = [
+        "netbox_aci_plugin.permissions.PermissionFilterCacheMiddleware",
+        "netbox_aci_plugin.profiling.ProfilingMiddleware",
+    ]
+
+    def ready(self) -> None:
+        """Register plugin extensions once the app registry is ready."""
+        super().ready()
+
+        from .lookups import register_lookups
+
+        register_lookups()
+
+        from . import fragment_cache  # noqa: F401
+        from .profiling import install_profiling, profiling_enabled
+        from .services import memberships, route_leaks, useg_networks  # noqa: F401
+
+        if profiling_enabled():
+            install_profiling()
 
 
 config = ACIConfig
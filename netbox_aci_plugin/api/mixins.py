@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Conditional GET (ETag) and sparse fieldset support of the API views."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max, Prefetch
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from ..fragment_cache import get_permission_hash
+
+if TYPE_CHECKING:
+    from django.db.models import Field, Model, QuerySet
+    from rest_framework.request import Request
+
+__all__ = ("ConditionalGetMixin", "SparseFieldsetMixin")
+
+
+def _get_related_fields(
+    model: type[Model], relations: set[str] | None = None
+) -> list[Field]:
+    """Return the forward relations to models with a ``last_updated`` field.
+
+    The related objects are nested in the representation of an object, so
+    their changes must change the ETag as well. The relations are limited
+    to the given names, unless they are None.
+    """
+    fields = []
+    for field in model._meta.concrete_fields:
+        if not field.many_to_one:
+            continue
+        if relations is not None and field.name not in relations:
+            continue
+        try:
+            field.related_model._meta.get_field("last_updated")
+        except FieldDoesNotExist:
+            continue
+        fields.append(field)
+    return fields
+
+
+def _iter_select_related(tree: dict, prefix: str = "") -> Iterator[str]:
+    """Yield the lookups of a ``select_related`` tree of a query."""
+    for name, children in tree.items():
+        yield f"{prefix}{name}"
+        yield from _iter_select_related(children, f"{prefix}{name}__")
+
+
+def _get_lookup_relation(lookup: str | Prefetch) -> str:
+    """Return the relation of the object traversed first by a lookup."""
+    if isinstance(lookup, Prefetch):
+        lookup = lookup.prefetch_through
+    return lookup.split(LOOKUP_SEP, 1)[0]
+
+
+class SparseFieldsetMixin:
+    """Load only the relations of the requested serializer fields.
+
+    NetBox prunes the serialized fields to the ``fields`` query parameter
+    (or the brief fields), but the static ``select_related`` and
+    ``prefetch_related`` lookups of the viewset queryset would still join
+    and fetch every related object. The lookups are pruned to the requested
+    fields and the relations used by the string representation of the
+    object (``display_fields``) if ``display`` is requested.
+    """
+
+    # Relations used by the string representation of the object
+    display_fields: tuple[str, ...] = ()
+
+    def get_requested_relations(self) -> set[str] | None:
+        """Return the names of the requested relations.
+
+        Returns None if all fields are requested.
+        """
+        if getattr(self, "brief", False):
+            fields = set(self.get_serializer_class().Meta.brief_fields)
+        elif requested_fields := getattr(self, "requested_fields", None):
+            fields = set(requested_fields)
+        else:
+            return None
+        if "display" in fields:
+            fields.update(self.display_fields)
+        return fields
+
+    def get_queryset(self) -> QuerySet:
+        """Return the queryset loading only the requested relations."""
+        queryset = super().get_queryset()
+        if (relations := self.get_requested_relations()) is None:
+            return queryset
+
+        select_related = queryset.query.select_related
+        if isinstance(select_related, dict):
+            lookups = [
+                lookup
+                for lookup in _iter_select_related(select_related)
+                if _get_lookup_relation(lookup) in relations
+            ]
+            # Without lookups, select_related() would follow every relation
+            queryset = queryset.select_related(None)
+            if lookups:
+                queryset = queryset.select_related(*lookups)
+        prefetch_related = queryset._prefetch_related_lookups  # noqa: SLF001
+        return queryset.prefetch_related(None).prefetch_related(
+            *(
+                lookup
+                for lookup in prefetch_related
+                if _get_lookup_relation(lookup) in relations
+            )
+        )
+
+
+class ConditionalGetMixin:
+    """Answer unchanged list and detail GET requests with 304 Not Modified.
+
+    The ETag of a list is computed from the filtered queryset with a single
+    aggregate query: the count and the latest ``last_updated`` of the
+    objects and of their related objects. The ETag of an object is computed
+    from the ``last_updated`` of the object and its related objects. Both
+    vary by the query parameters, the response format, and the permissions
+    of the user. A request with a matching ``If-None-Match`` header is
+    answered without serializing anything.
+
+    The related objects are limited to the requested relations of the
+    ``SparseFieldsetMixin`` of the viewset.
+    """
+
+    def _get_etag(self, request: Request, *parts) -> str:
+        """Return the quoted ETag of the request and the state parts."""
+        values = (
+            self.queryset.model._meta.label_lower,
+            repr(sorted(request.query_params.lists())),
+            request.accepted_renderer.format,
+            get_permission_hash(request.user),
+            *(repr(part) for part in parts),
+        )
+        return quote_etag(hashlib.sha256("\n".join(values).encode()).hexdigest())
+
+    @staticmethod
+    def _not_modified(request: Request, etag: str) -> Response | None:
+        """Return 304 Not Modified if the ETag matches the request."""
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return None
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Return the list of objects unless it is not modified."""
+        queryset = self.filter_queryset(self.get_queryset())
+        aggregates = queryset.aggregate(
+            count=Count("pk"),
+            last_updated=Max("last_updated"),
+            **{
+                f"{field.name}_last_updated": Max(f"{field.name}__last_updated")
+                for field in _get_related_fields(
+                    queryset.model, self.get_requested_relations()
+                )
+            },
+        )
+        etag = self._get_etag(request, sorted(aggregates.items()))
+        if (response := self._not_modified(request, etag)) is not None:
+            return response
+        response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Return the object unless it is not modified."""
+        instance = self.get_object()
+        # The serializer nests the related objects, which are mostly selected
+        # with the object by the viewset queryset already
+        related = [
+            getattr(getattr(instance, field.name), "last_updated", None)
+            for field in _get_related_fields(
+                type(instance), self.get_requested_relations()
+            )
+            if getattr(instance, field.attname) is not None
+        ]
+        etag = self._get_etag(request, instance.pk, instance.last_updated, related)
+        if (response := self._not_modified(request, etag)) is not None:
+            return response
+        serializer = self.get_serializer(instance)
+        response = Response(serializer.data)
+        response["ETag"] = etag
+        return response
@@ -1,8 +1,15 @@
 from .access_policies.domains import ACIRoutedDomainSerializer
 from .fabric.fabrics import ACIFabricSerializer
-from .fabric.nodes import ACINodeSerializer
+from .fabric.nodes import (
+    ACINodeAllocationSerializer,
+    ACINodeOnboardingSerializer,
+    ACINodeSerializer,
+)
 from .fabric.pods import ACIPodSerializer
-from .tenant.app_profiles import ACIAppProfileSerializer
+from .tenant.app_profiles import (
+    ACIAppProfileCloneSerializer,
+    ACIAppProfileSerializer,
+)
 from .tenant.bridge_domains import (
     ACIBridgeDomainL3OutBindingSerializer,
     ACIBridgeDomainSerializer,
@@ -22,21 +29,30 @@ from .tenant.endpoint_groups import (
     ACIEndpointGroupSerializer,
     ACIUSegEndpointGroupSerializer,
     ACIUSegNetworkAttributeSerializer,
+    ACIUSegResolvedNetworkSerializer,
 )
 from .tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroupSerializer,
     ACIEsgEndpointGroupSelectorSerializer,
     ACIEsgEndpointSelectorSerializer,
+    ACIEsgMembershipSerializer,
 )
 from .tenant.l3outs import (
     ACIExternalEndpointGroupSerializer,
     ACIExternalSubnetSerializer,
     ACIL3OutSerializer,
 )
-from .tenant.tenants import ACITenantSerializer
-from .tenant.vrfs import ACIVRFSerializer
+from .tenant.tenants import (
+    ACITeardownSerializer,
+    ACITenantApplySerializer,
+    ACITenantCloneSerializer,
+    ACITenantSerializer,
+)
+from .tenant.vrfs import ACIRouteLeakSerializer, ACIVRFSerializer
+from .validation import ACIValidationSerializer
 
 __all__ = (
+    "ACIAppProfileCloneSerializer",
     "ACIAppProfileSerializer",
     "ACIBridgeDomainL3OutBindingSerializer",
     "ACIBridgeDomainSerializer",
@@ -51,15 +67,24 @@ __all__ = (
     "ACIEndpointSecurityGroupSerializer",
     "ACIEsgEndpointGroupSelectorSerializer",
     "ACIEsgEndpointSelectorSerializer",
+    "ACIEsgMembershipSerializer",
     "ACIExternalEndpointGroupSerializer",
     "ACIExternalSubnetSerializer",
     "ACIFabricSerializer",
     "ACIL3OutSerializer",
+    "ACINodeAllocationSerializer",
+    "ACINodeOnboardingSerializer",
     "ACINodeSerializer",
     "ACIPodSerializer",
+    "ACIRouteLeakSerializer",
     "ACIRoutedDomainSerializer",
+    "ACITeardownSerializer",
+    "ACITenantApplySerializer",
+    "ACITenantCloneSerializer",
     "ACITenantSerializer",
     "ACIUSegEndpointGroupSerializer",
     "ACIUSegNetworkAttributeSerializer",
+    "ACIUSegResolvedNetworkSerializer",
     "ACIVRFSerializer",
+    "ACIValidationSerializer",
 )
@@ -43,6 +43,7 @@ class ACIRoutedDomainSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
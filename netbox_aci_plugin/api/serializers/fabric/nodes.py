@@ -12,7 +12,8 @@ from netbox.api.serializers import NetBoxModelSerializer
 from tenancy.api.serializers import TenantSerializer
 from users.api.serializers_.mixins import OwnerMixin
 
-from ....constants import NODE_OBJECT_TYPES
+from ....choices import NodeRoleChoices, NodeTypeChoices
+from ....constants import NODE_ALLOCATION_MAX, NODE_OBJECT_TYPES
 from ....models.fabric.nodes import ACINode
 from .pods import ACIPodSerializer
 
@@ -61,6 +62,7 @@ class ACINodeSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -75,3 +77,46 @@ class ACINodeSerializer(OwnerMixin, NetBoxModelSerializer):
             "node_id",
             "nb_tenant",
         )
+
+
+class ACINodeAllocationSerializer(serializers.Serializer):
+    """Serializer for the allocation request of ACI Node IDs and TEPs."""
+
+    count = serializers.IntegerField(
+        min_value=1, max_value=NODE_ALLOCATION_MAX, default=1
+    )
+    role = serializers.ChoiceField(
+        choices=NodeRoleChoices, default=NodeRoleChoices.ROLE_LEAF
+    )
+
+
+class ACINodeOnboardingRowSerializer(serializers.Serializer):
+    """Serializer for an ACI Node of an onboarding request.
+
+    A node references an existing device, or the device type and role of a
+    new device named after the node.
+    """
+
+    name = serializers.CharField(required=False, default="", allow_blank=True)
+    device = serializers.IntegerField(required=False, default=None, allow_null=True)
+    device_type = serializers.IntegerField(
+        required=False, default=None, allow_null=True
+    )
+    device_role = serializers.IntegerField(
+        required=False, default=None, allow_null=True
+    )
+    role = serializers.ChoiceField(
+        choices=NodeRoleChoices, default=NodeRoleChoices.ROLE_LEAF
+    )
+    node_type = serializers.ChoiceField(
+        choices=NodeTypeChoices, default=NodeTypeChoices.TYPE_UNKNOWN
+    )
+
+
+class ACINodeOnboardingSerializer(serializers.Serializer):
+    """Serializer for the bulk onboarding request of ACI Nodes."""
+
+    nodes = ACINodeOnboardingRowSerializer(
+        many=True, allow_empty=False, max_length=NODE_ALLOCATION_MAX
+    )
+    background = serializers.BooleanField(default=False)
@@ -59,6 +59,7 @@ class ACIPodSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -9,7 +9,7 @@ from tenancy.api.serializers import TenantSerializer
 from users.api.serializers_.mixins import OwnerMixin
 
 from ....models.tenant.app_profiles import ACIAppProfile
-from .tenants import ACITenantSerializer
+from .tenants import ACICloneRenameRuleSerializer, ACITenantSerializer
 
 
 class ACIAppProfileSerializer(OwnerMixin, NetBoxModelSerializer):
@@ -36,6 +36,7 @@ class ACIAppProfileSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -49,3 +50,14 @@ class ACIAppProfileSerializer(OwnerMixin, NetBoxModelSerializer):
             "aci_tenant",
             "nb_tenant",
         )
+
+
+class ACIAppProfileCloneSerializer(serializers.Serializer):
+    """Serializer for the clone request of an ACI Application Profile.
+
+    The copy is created in the ACI Tenant of the source by default.
+    """
+
+    name = serializers.CharField(required=False, default="", allow_blank=True)
+    aci_tenant = serializers.IntegerField(required=False, default=None, allow_null=True)
+    rename = ACICloneRenameRuleSerializer(many=True, required=False, default=list)
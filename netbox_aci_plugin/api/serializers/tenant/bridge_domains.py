@@ -71,6 +71,7 @@ class ACIBridgeDomainSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -122,6 +123,7 @@ class ACIBridgeDomainSubnetSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -160,6 +162,7 @@ class ACIBridgeDomainL3OutBindingSerializer(NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -49,6 +49,7 @@ class ACIContractSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -99,6 +100,7 @@ class ACIContractRelationSerializer(NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -149,6 +151,7 @@ class ACIContractSubjectSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -189,6 +192,7 @@ class ACIContractSubjectFilterSerializer(NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -5,6 +5,7 @@
 from django.contrib.contenttypes.models import ContentType
 from rest_framework import serializers
 
+from ipam.api.field_serializers import IPNetworkField
 from netbox.api.fields import ContentTypeField
 from netbox.api.gfk_fields import GFKSerializerField
 from netbox.api.serializers import NetBoxModelSerializer
@@ -16,9 +17,10 @@ from ....models.tenant.endpoint_groups import (
     ACIEndpointGroup,
     ACIUSegEndpointGroup,
     ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
 )
 from .app_profiles import ACIAppProfileSerializer
-from .bridge_domains import ACIBridgeDomainSerializer
+from .bridge_domains import ACIBridgeDomainSerializer, ACIBridgeDomainSubnetSerializer
 
 
 class ACIEndpointGroupSerializer(OwnerMixin, NetBoxModelSerializer):
@@ -54,6 +56,7 @@ class ACIEndpointGroupSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -103,6 +106,7 @@ class ACIUSegEndpointGroupSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -159,6 +163,7 @@ class ACIUSegNetworkAttributeSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -175,3 +180,30 @@ class ACIUSegNetworkAttributeSerializer(OwnerMixin, NetBoxModelSerializer):
             "attr_object",
             "use_epg_subnet",
         )
+
+
+class ACIUSegResolvedNetworkSerializer(serializers.ModelSerializer):
+    """Serializer for the ACI uSeg Resolved Network model (read-only)."""
+
+    aci_useg_endpoint_group = ACIUSegEndpointGroupSerializer(
+        nested=True, read_only=True
+    )
+    aci_useg_network_attribute = ACIUSegNetworkAttributeSerializer(
+        nested=True, read_only=True
+    )
+    aci_bridge_domain_subnet = ACIBridgeDomainSubnetSerializer(
+        nested=True, read_only=True
+    )
+    prefix = IPNetworkField(read_only=True)
+    mac_address = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = ACIUSegResolvedNetwork
+        fields: tuple = (
+            "id",
+            "aci_useg_endpoint_group",
+            "aci_useg_network_attribute",
+            "aci_bridge_domain_subnet",
+            "prefix",
+            "mac_address",
+        )
@@ -19,6 +19,7 @@ from ....models.tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroup,
     ACIEsgEndpointGroupSelector,
     ACIEsgEndpointSelector,
+    ACIEsgMembership,
 )
 from .app_profiles import ACIAppProfileSerializer
 from .vrfs import ACIVRFSerializer
@@ -53,6 +54,7 @@ class ACIEndpointSecurityGroupSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -110,6 +112,7 @@ class ACIEsgEndpointGroupSelectorSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -169,6 +172,7 @@ class ACIEsgEndpointSelectorSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -185,3 +189,27 @@ class ACIEsgEndpointSelectorSerializer(OwnerMixin, NetBoxModelSerializer):
             "ep_object",
             "nb_tenant",
         )
+
+
+class ACIEsgMembershipSerializer(serializers.ModelSerializer):
+    """Serializer for the ACI ESG Membership model (read-only)."""
+
+    aci_endpoint_security_group = ACIEndpointSecurityGroupSerializer(
+        nested=True, read_only=True
+    )
+    member_type = ContentTypeField(read_only=True)
+    member = GFKSerializerField(read_only=True)
+    aci_vrf = ACIVRFSerializer(nested=True, read_only=True)
+
+    class Meta:
+        model = ACIEsgMembership
+        fields: tuple = (
+            "id",
+            "aci_endpoint_security_group",
+            "aci_esg_endpoint_group_selector",
+            "aci_esg_endpoint_selector",
+            "member_type",
+            "member_id",
+            "member",
+            "aci_vrf",
+        )
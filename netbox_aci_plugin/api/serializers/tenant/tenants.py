@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import re
+
 from rest_framework import serializers
 
 from netbox.api.serializers import NetBoxModelSerializer
@@ -36,6 +38,7 @@ class ACITenantSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -49,3 +52,51 @@ class ACITenantSerializer(OwnerMixin, NetBoxModelSerializer):
             "aci_fabric",
             "nb_tenant",
         )
+
+
+class ACICloneRenameRuleSerializer(serializers.Serializer):
+    """Serializer for a rename rule of a clone request.
+
+    The regular expression pattern is replaced in the names of the copies.
+    """
+
+    pattern = serializers.CharField()
+    replacement = serializers.CharField(allow_blank=True, default="")
+
+    def validate_pattern(self, value: str) -> str:
+        """Validate the pattern is a regular expression."""
+        try:
+            re.compile(value)
+        except re.error as e:
+            raise serializers.ValidationError(f"Invalid regular expression: {e}") from e
+        return value
+
+
+class ACITenantApplySerializer(serializers.Serializer):
+    """Serializer for the query parameters of an ACI Tenant apply request.
+
+    A dry run returns the plan without applying it.
+    """
+
+    dry_run = serializers.BooleanField(required=False, default=False)
+
+
+class ACITeardownSerializer(serializers.Serializer):
+    """Serializer for the query parameters of a teardown request.
+
+    Objects of other ACI Tenants depending on the deleted objects are only
+    deleted with ``include_foreign_dependents`` set.
+    """
+
+    include_foreign_dependents = serializers.BooleanField(required=False, default=False)
+
+
+class ACITenantCloneSerializer(serializers.Serializer):
+    """Serializer for the clone request of an ACI Tenant.
+
+    The copy is created in the ACI Fabric of the source by default.
+    """
+
+    name = serializers.CharField(required=False, default="", allow_blank=True)
+    aci_fabric = serializers.IntegerField(required=False, default=None, allow_null=True)
+    rename = ACICloneRenameRuleSerializer(many=True, required=False, default=list)
@@ -4,12 +4,16 @@
 
 from rest_framework import serializers
 
+from ipam.api.field_serializers import IPNetworkField
 from ipam.api.serializers import VRFSerializer
+from netbox.api.fields import ContentTypeField
+from netbox.api.gfk_fields import GFKSerializerField
 from netbox.api.serializers import NetBoxModelSerializer
 from tenancy.api.serializers import TenantSerializer
 from users.api.serializers_.mixins import OwnerMixin
 
-from ....models.tenant.vrfs import ACIVRF
+from ....models.tenant.vrfs import ACIVRF, ACIRouteLeak
+from ..fabric.fabrics import ACIFabricSerializer
 from .tenants import ACITenantSerializer
 
 
@@ -47,6 +51,7 @@ class ACIVRFSerializer(OwnerMixin, NetBoxModelSerializer):
             "comments",
             "tags",
             "custom_fields",
+            "content_hash",
             "created",
             "last_updated",
         )
@@ -61,3 +66,29 @@ class ACIVRFSerializer(OwnerMixin, NetBoxModelSerializer):
             "nb_tenant",
             "nb_vrf",
         )
+
+
+class ACIRouteLeakSerializer(serializers.ModelSerializer):
+    """Serializer for the ACI Route Leak model (read-only)."""
+
+    aci_fabric = ACIFabricSerializer(nested=True, read_only=True)
+    aci_vrf = ACIVRFSerializer(nested=True, read_only=True)
+    source_aci_vrf = ACIVRFSerializer(nested=True, read_only=True)
+    source_type = ContentTypeField(read_only=True)
+    source = GFKSerializerField(read_only=True)
+    prefix = IPNetworkField(read_only=True)
+
+    class Meta:
+        model = ACIRouteLeak
+        fields: tuple = (
+            "id",
+            "aci_fabric",
+            "aci_vrf",
+            "source_aci_vrf",
+            "source_type",
+            "source_id",
+            "source",
+            "prefix",
+            "aggregate",
+            "shared_security_enabled",
+        )
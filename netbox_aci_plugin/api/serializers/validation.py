@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from rest_framework import serializers
+
+
+class ACIValidationObjectSerializer(serializers.Serializer):
+    """Serializer for a candidate object of a validation request.
+
+    With an ID, the field values change the existing object.
+    """
+
+    object_type = serializers.CharField()
+    id = serializers.IntegerField(required=False, default=None, allow_null=True)
+    data = serializers.DictField(required=False, default=dict)
+
+
+class ACIValidationSerializer(serializers.Serializer):
+    """Serializer for the candidate objects of a validation request."""
+
+    objects = ACIValidationObjectSerializer(many=True, allow_empty=False)
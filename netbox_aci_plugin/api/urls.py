@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from django.urls import path
+
 from netbox.api.routers import NetBoxRouter
 
 from . import views
@@ -44,4 +46,29 @@ router.register("contract-relations", views.ACIContractRelationListViewSet)
 router.register("contract-subjects", views.ACIContractSubjectListViewSet)
 router.register("contract-subject-filters", views.ACIContractSubjectFilterListViewSet)
 
-urlpatterns = router.urls
+urlpatterns = [
+    path(
+        "changes/",
+        views.ACIChangeFeedView.as_view(
+            viewsets=[viewset for _prefix, viewset, _basename in router.registry]
+        ),
+        name="changes",
+    ),
+    path("validate/", views.ACIValidationView.as_view(), name="validate"),
+    path(
+        "esg-memberships/",
+        views.ACIEsgMembershipListView.as_view(),
+        name="esg-memberships",
+    ),
+    path(
+        "useg-networks/",
+        views.ACIUSegResolvedNetworkListView.as_view(),
+        name="useg-networks",
+    ),
+    path(
+        "route-leaks/",
+        views.ACIRouteLeakListView.as_view(),
+        name="route-leaks",
+    ),
+    *router.urls,
+]
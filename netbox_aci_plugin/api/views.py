@@ -2,6 +2,22 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
+
+from django.core.exceptions import ValidationError
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.generics import ListAPIView
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.views import APIView
+
+from core.api.serializers import JobSerializer
+from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
 from netbox.api.viewsets import NetBoxModelViewSet
 
 from ..filtersets.access_policies.domains import ACIRoutedDomainFilterSet
@@ -28,11 +44,13 @@ from ..filtersets.tenant.endpoint_groups import (
     ACIEndpointGroupFilterSet,
     ACIUSegEndpointGroupFilterSet,
     ACIUSegNetworkAttributeFilterSet,
+    ACIUSegResolvedNetworkFilterSet,
 )
 from ..filtersets.tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroupFilterSet,
     ACIEsgEndpointGroupSelectorFilterSet,
     ACIEsgEndpointSelectorFilterSet,
+    ACIEsgMembershipFilterSet,
 )
 from ..filtersets.tenant.l3outs import (
     ACIExternalEndpointGroupFilterSet,
@@ -40,7 +58,13 @@ from ..filtersets.tenant.l3outs import (
     ACIL3OutFilterSet,
 )
 from ..filtersets.tenant.tenants import ACITenantFilterSet
-from ..filtersets.tenant.vrfs import ACIVRFFilterSet
+from ..filtersets.tenant.vrfs import ACIRouteLeakFilterSet, ACIVRFFilterSet
+from ..jobs import (
+    ACIBridgeDomainSubnetOverlapJob,
+    ACIExportJob,
+    ACINodeOnboardingJob,
+    ACITeardownJob,
+)
 from ..models.access_policies.domains import ACIRoutedDomain
 from ..models.fabric.fabrics import ACIFabric
 from ..models.fabric.nodes import ACINode
@@ -65,11 +89,13 @@ from ..models.tenant.endpoint_groups import (
     ACIEndpointGroup,
     ACIUSegEndpointGroup,
     ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
 )
 from ..models.tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroup,
     ACIEsgEndpointGroupSelector,
     ACIEsgEndpointSelector,
+    ACIEsgMembership,
 )
 from ..models.tenant.l3outs import (
     ACIExternalEndpointGroup,
@@ -77,8 +103,29 @@ from ..models.tenant.l3outs import (
     ACIL3Out,
 )
 from ..models.tenant.tenants import ACITenant
-from ..models.tenant.vrfs import ACIVRF
+from ..models.tenant.vrfs import ACIVRF, ACIRouteLeak
+from ..services.allocation import allocate_nodes, get_available_nodes
+from ..services.apply import apply_tenants
+from ..services.changes import ChangeFeed, decode_cursor, parse_since
+from ..services.cloning import RenameRule, clone_subtree
+from ..services.export import (
+    EXPORT_EXTENSIONS,
+    EXPORT_FORMAT_APIC_JSON,
+    EXPORT_FORMATS,
+    TenantExporter,
+)
+from ..services.onboarding import NodeOnboarding, NodeOnboardingRow
+from ..services.route_leaks import (
+    enqueue_route_leak_refresh,
+    get_stale_fabric_ids,
+)
+from ..services.snapshot import iter_document_tenants
+from ..services.teardown import DeletionPlan
+from ..services.topology import FabricTopology
+from ..services.validation import Candidate, validate_objects
+from .mixins import ConditionalGetMixin, SparseFieldsetMixin
 from .serializers import (
+    ACIAppProfileCloneSerializer,
     ACIAppProfileSerializer,
     ACIBridgeDomainL3OutBindingSerializer,
     ACIBridgeDomainSerializer,
@@ -93,21 +140,149 @@ from .serializers import (
     ACIEndpointSecurityGroupSerializer,
     ACIEsgEndpointGroupSelectorSerializer,
     ACIEsgEndpointSelectorSerializer,
+    ACIEsgMembershipSerializer,
     ACIExternalEndpointGroupSerializer,
     ACIExternalSubnetSerializer,
     ACIFabricSerializer,
     ACIL3OutSerializer,
+    ACINodeAllocationSerializer,
+    ACINodeOnboardingSerializer,
     ACINodeSerializer,
     ACIPodSerializer,
     ACIRoutedDomainSerializer,
+    ACIRouteLeakSerializer,
+    ACITeardownSerializer,
+    ACITenantApplySerializer,
+    ACITenantCloneSerializer,
     ACITenantSerializer,
     ACIUSegEndpointGroupSerializer,
     ACIUSegNetworkAttributeSerializer,
+    ACIUSegResolvedNetworkSerializer,
+    ACIValidationSerializer,
     ACIVRFSerializer,
 )
 
 
-class ACIFabricListViewSet(NetBoxModelViewSet):
+def _export_response(request, instance, aci_tenants):
+    """Stream (GET) or enqueue (POST) the export of the ACI Tenants.
+
+    The format is selected by the ``output`` query parameter.
+    """
+    export_format = request.query_params.get("output", EXPORT_FORMAT_APIC_JSON)
+    if export_format not in EXPORT_FORMATS:
+        return Response(
+            {"output": [f"Unsupported export format: {export_format}"]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if request.method == "POST":
+        job = ACIExportJob.enqueue(
+            instance=instance, user=request.user, export_format=export_format
+        )
+        serializer = JobSerializer(job, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    exporter = TenantExporter(aci_tenants, user=request.user)
+    extension = EXPORT_EXTENSIONS[export_format]
+    response = StreamingHttpResponse(
+        exporter.iter_export(export_format),
+        content_type=EXPORT_FORMATS[export_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{instance.name}.{extension}"'
+    )
+    return response
+
+
+def _clone_response(request, source, serializer_class, target_field):
+    """Clone the ACI object with its subtree into the requested target.
+
+    The target (the ACI Fabric of a tenant or the ACI Tenant of an
+    application profile) defaults to the parent of the source.
+    """
+    serializer = serializer_class(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+
+    target = None
+    if data[target_field] is not None:
+        target_model = type(source)._meta.get_field(target_field).related_model
+        target = (
+            target_model.objects.restrict(request.user, "view")
+            .filter(pk=data[target_field])
+            .first()
+        )
+        if target is None:
+            return Response(
+                {target_field: [f"{target_model._meta.verbose_name} not found."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+    try:
+        result = clone_subtree(
+            source,
+            target=target,
+            name=data["name"],
+            rename_rules=tuple(RenameRule(**rule) for rule in data["rename"]),
+            user=request.user,
+        )
+    except ValidationError as e:
+        return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(result.serialize(), status=status.HTTP_201_CREATED)
+
+
+def _teardown_response(request, instance):
+    """Return (GET) or enqueue (POST) the deletion of the object.
+
+    The deletion plan lists the objects deleted with the object, in the
+    order of deletion, and separately the dependent objects of other ACI
+    Tenants, which are only deleted with ``include_foreign_dependents``.
+    """
+    serializer = ACITeardownSerializer(data=request.query_params)
+    serializer.is_valid(raise_exception=True)
+    include_foreign_dependents = serializer.validated_data["include_foreign_dependents"]
+    plan = DeletionPlan(
+        instance,
+        user=request.user,
+        include_foreign_dependents=include_foreign_dependents,
+    )
+    if request.method == "POST":
+        plan.check_permissions()
+        try:
+            plan.check_foreign_dependents()
+        except ValidationError as e:
+            return Response(
+                {"detail": e.messages, **plan.serialize()},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        job = ACITeardownJob.enqueue(
+            user=request.user,
+            object_type=instance._meta.label_lower,
+            object_id=instance.pk,
+            include_foreign_dependents=include_foreign_dependents,
+        )
+        serializer = JobSerializer(job, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+    return Response(plan.serialize())
+
+
+def _topology_response(request, aci_fabrics, many=True):
+    """Return the topology of the ACI Fabrics with its ETag.
+
+    A request with a matching ``If-None-Match`` header is answered with
+    304 Not Modified without building the topology.
+    """
+    topology = FabricTopology(aci_fabrics, user=request.user)
+    etag = topology.get_etag()
+    headers = {"ETag": quote_etag(etag)}
+    if headers["ETag"] in parse_etags(request.headers.get("If-None-Match", "")):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    tree = topology.get_or_build(etag)
+    return Response(tree if many else tree[0], headers=headers)
+
+
+class ACIFabricListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Fabric instances."""
 
     queryset = ACIFabric.objects.select_related(
@@ -121,8 +296,114 @@ class ACIFabricListViewSet(NetBoxModelViewSet):
     serializer_class = ACIFabricSerializer
     filterset_class = ACIFabricFilterSet
 
-
-class ACIPodListViewSet(NetBoxModelViewSet):
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+        url_path="subnet-overlap-report",
+    )
+    def subnet_overlap_report(self, request, pk):
+        """Enqueue the BD subnet overlap report job for the ACI Fabric."""
+        aci_fabric = get_object_or_404(
+            ACIFabric.objects.restrict(request.user, "view"), pk=pk
+        )
+        job = ACIBridgeDomainSubnetOverlapJob.enqueue(
+            instance=aci_fabric, user=request.user
+        )
+        serializer = JobSerializer(job, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+        url_path="topology",
+        url_name="topology-list",
+    )
+    def topology_list(self, request):
+        """Return the topology trees of the (filtered) ACI Fabrics."""
+        aci_fabrics = self.filter_queryset(
+            ACIFabric.objects.restrict(request.user, "view")
+        )
+        return _topology_response(request, aci_fabrics)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def topology(self, request, pk):
+        """Return the topology tree of the ACI Fabric."""
+        aci_fabric = get_object_or_404(
+            ACIFabric.objects.restrict(request.user, "view"), pk=pk
+        )
+        return _topology_response(
+            request, ACIFabric.objects.filter(pk=aci_fabric.pk), many=False
+        )
+
+    @action(
+        detail=True,
+        methods=["get", "post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def export(self, request, pk):
+        """Export the ACI Tenants of the ACI Fabric."""
+        aci_fabric = get_object_or_404(
+            ACIFabric.objects.restrict(request.user, "view"), pk=pk
+        )
+        return _export_response(
+            request, aci_fabric, ACITenant.objects.filter(aci_fabric=aci_fabric)
+        )
+
+    @action(
+        detail=True,
+        methods=["get", "post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def teardown(self, request, pk):
+        """Return or enqueue the deletion of the ACI Fabric."""
+        aci_fabric = get_object_or_404(
+            ACIFabric.objects.restrict(request.user, "view"), pk=pk
+        )
+        return _teardown_response(request, aci_fabric)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def apply(self, request, pk):
+        """Apply a desired-state document of ACI Tenants to the ACI Fabric.
+
+        The document holds the ACI Tenant trees in the APIC JSON format.
+        With ``dry_run`` set, the plan is returned without applying it.
+        """
+        aci_fabric = get_object_or_404(
+            ACIFabric.objects.restrict(request.user, "view"), pk=pk
+        )
+        serializer = ACITenantApplySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        tenants = list(iter_document_tenants(request.data))
+        if not tenants:
+            return Response(
+                {"detail": "The document does not contain an ACI Tenant (fvTenant)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        result = apply_tenants(
+            aci_fabric,
+            tenants,
+            dry_run=serializer.validated_data["dry_run"],
+            user=request.user,
+        )
+        return Response(
+            result.serialize(),
+            status=(
+                status.HTTP_400_BAD_REQUEST if result.errors else status.HTTP_200_OK
+            ),
+        )
+
+
+class ACIPodListViewSet(ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet):
     """API view for listing ACI Pod instances."""
 
     queryset = ACIPod.objects.select_related(
@@ -136,8 +417,91 @@ class ACIPodListViewSet(NetBoxModelViewSet):
     serializer_class = ACIPodSerializer
     filterset_class = ACIPodFilterSet
 
-
-class ACINodeListViewSet(NetBoxModelViewSet):
+    @action(
+        detail=True,
+        methods=["get", "post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+        url_path="available-nodes",
+    )
+    def available_nodes(self, request, pk):
+        """Return (GET) or reserve (POST) the next free node IDs and TEPs.
+
+        A GET request reads the free values without locking the pod. A POST
+        request allocates them in the locked pod and reserves the TEP
+        addresses as IP addresses.
+        """
+        aci_pod = get_object_or_404(
+            ACIPod.objects.restrict(request.user, "view"), pk=pk
+        )
+        reserve = request.method == "POST"
+        if reserve and not request.user.has_perm("ipam.add_ipaddress"):
+            raise PermissionDenied("Adding IP addresses is not permitted.")
+
+        serializer = ACINodeAllocationSerializer(
+            data=request.data if reserve else request.query_params
+        )
+        serializer.is_valid(raise_exception=True)
+        try:
+            if reserve:
+                allocations = allocate_nodes(
+                    aci_pod,
+                    reserve_tep_addresses=True,
+                    user=request.user,
+                    **serializer.validated_data,
+                )
+            else:
+                allocations = get_available_nodes(aci_pod, **serializer.validated_data)
+        except ValidationError as e:
+            return Response(
+                {"detail": " ".join(e.messages)}, status=status.HTTP_409_CONFLICT
+            )
+        return Response(
+            [allocation.serialize() for allocation in allocations],
+            status=status.HTTP_201_CREATED if reserve else status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+        url_path="onboard-nodes",
+    )
+    def onboard_nodes(self, request, pk):
+        """Onboard ACI Nodes with their devices and TEP IP addresses.
+
+        With ``background`` set, the onboarding is enqueued as a job.
+        """
+        aci_pod = get_object_or_404(
+            ACIPod.objects.restrict(request.user, "view"), pk=pk
+        )
+        serializer = ACINodeOnboardingSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        nodes = serializer.validated_data["nodes"]
+
+        required_permissions = ["netbox_aci_plugin.add_acinode", "ipam.add_ipaddress"]
+        if any(node["device"] is None for node in nodes):
+            required_permissions.append("dcim.add_device")
+        if not request.user.has_perms(required_permissions):
+            raise PermissionDenied(
+                "Adding ACI Nodes, IP addresses, and devices is not permitted."
+            )
+
+        if serializer.validated_data["background"]:
+            job = ACINodeOnboardingJob.enqueue(
+                instance=aci_pod, user=request.user, nodes=nodes
+            )
+            serializer = JobSerializer(job, context={"request": request})
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+        onboarding = NodeOnboarding(aci_pod, user=request.user)
+        try:
+            result = onboarding.onboard(NodeOnboardingRow(**node) for node in nodes)
+        except ValidationError as e:
+            return Response({"nodes": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result.serialize(), status=status.HTTP_201_CREATED)
+
+
+class ACINodeListViewSet(ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet):
     """API view for listing ACI Node instances."""
 
     queryset = ACINode.objects.select_related(
@@ -154,7 +518,9 @@ class ACINodeListViewSet(NetBoxModelViewSet):
     filterset_class = ACINodeFilterSet
 
 
-class ACIRoutedDomainListViewSet(NetBoxModelViewSet):
+class ACIRoutedDomainListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Routed Domain instances."""
 
     queryset = ACIRoutedDomain.objects.select_related(
@@ -168,7 +534,9 @@ class ACIRoutedDomainListViewSet(NetBoxModelViewSet):
     filterset_class = ACIRoutedDomainFilterSet
 
 
-class ACITenantListViewSet(NetBoxModelViewSet):
+class ACITenantListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Tenant instances."""
 
     queryset = ACITenant.objects.select_related(
@@ -180,8 +548,50 @@ class ACITenantListViewSet(NetBoxModelViewSet):
     serializer_class = ACITenantSerializer
     filterset_class = ACITenantFilterSet
 
-
-class ACIAppProfileListViewSet(NetBoxModelViewSet):
+    @action(
+        detail=True,
+        methods=["get", "post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def export(self, request, pk):
+        """Export the ACI Tenant with its objects."""
+        aci_tenant = get_object_or_404(
+            ACITenant.objects.restrict(request.user, "view"), pk=pk
+        )
+        return _export_response(
+            request, aci_tenant, ACITenant.objects.filter(pk=aci_tenant.pk)
+        )
+
+    @action(
+        detail=True,
+        methods=["get", "post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def teardown(self, request, pk):
+        """Return or enqueue the deletion of the ACI Tenant."""
+        aci_tenant = get_object_or_404(
+            ACITenant.objects.restrict(request.user, "view"), pk=pk
+        )
+        return _teardown_response(request, aci_tenant)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def clone(self, request, pk):
+        """Clone the ACI Tenant with its objects."""
+        aci_tenant = get_object_or_404(
+            ACITenant.objects.restrict(request.user, "view"), pk=pk
+        )
+        return _clone_response(
+            request, aci_tenant, ACITenantCloneSerializer, "aci_fabric"
+        )
+
+
+class ACIAppProfileListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Application Profile instances."""
 
     queryset = ACIAppProfile.objects.select_related(
@@ -194,8 +604,22 @@ class ACIAppProfileListViewSet(NetBoxModelViewSet):
     serializer_class = ACIAppProfileSerializer
     filterset_class = ACIAppProfileFilterSet
 
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def clone(self, request, pk):
+        """Clone the ACI Application Profile with its objects."""
+        aci_app_profile = get_object_or_404(
+            ACIAppProfile.objects.restrict(request.user, "view"), pk=pk
+        )
+        return _clone_response(
+            request, aci_app_profile, ACIAppProfileCloneSerializer, "aci_tenant"
+        )
+
 
-class ACIVRFListViewSet(NetBoxModelViewSet):
+class ACIVRFListViewSet(ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet):
     """API view for listing ACI VRF instances."""
 
     queryset = ACIVRF.objects.select_related(
@@ -208,9 +632,12 @@ class ACIVRFListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIVRFSerializer
     filterset_class = ACIVRFFilterSet
+    display_fields = ("aci_tenant",)
 
 
-class ACIBridgeDomainListViewSet(NetBoxModelViewSet):
+class ACIBridgeDomainListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Bridge Domain instances."""
 
     queryset = ACIBridgeDomain.objects.select_related(
@@ -223,9 +650,12 @@ class ACIBridgeDomainListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIBridgeDomainSerializer
     filterset_class = ACIBridgeDomainFilterSet
+    display_fields = ("aci_tenant",)
 
 
-class ACIBridgeDomainSubnetListViewSet(NetBoxModelViewSet):
+class ACIBridgeDomainSubnetListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Bridge Domain Subnet instances."""
 
     queryset = ACIBridgeDomainSubnet.objects.select_related(
@@ -240,7 +670,7 @@ class ACIBridgeDomainSubnetListViewSet(NetBoxModelViewSet):
     filterset_class = ACIBridgeDomainSubnetFilterSet
 
 
-class ACIL3OutListViewSet(NetBoxModelViewSet):
+class ACIL3OutListViewSet(ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet):
     """API view for listing ACI L3Out instances."""
 
     queryset = ACIL3Out.objects.select_related(
@@ -254,9 +684,12 @@ class ACIL3OutListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIL3OutSerializer
     filterset_class = ACIL3OutFilterSet
+    display_fields = ("aci_tenant",)
 
 
-class ACIExternalEndpointGroupListViewSet(NetBoxModelViewSet):
+class ACIExternalEndpointGroupListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI External EPG instances."""
 
     queryset = ACIExternalEndpointGroup.objects.select_related(
@@ -270,9 +703,12 @@ class ACIExternalEndpointGroupListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIExternalEndpointGroupSerializer
     filterset_class = ACIExternalEndpointGroupFilterSet
+    display_fields = ("aci_l3out",)
 
 
-class ACIExternalSubnetListViewSet(NetBoxModelViewSet):
+class ACIExternalSubnetListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI External Subnet instances."""
 
     queryset = ACIExternalSubnet.objects.select_related(
@@ -286,9 +722,12 @@ class ACIExternalSubnetListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIExternalSubnetSerializer
     filterset_class = ACIExternalSubnetFilterSet
+    display_fields = ("aci_external_endpoint_group",)
 
 
-class ACIBridgeDomainL3OutBindingListViewSet(NetBoxModelViewSet):
+class ACIBridgeDomainL3OutBindingListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Bridge Domain L3Out Relation instances."""
 
     queryset = ACIBridgeDomainL3OutBinding.objects.select_related(
@@ -297,9 +736,12 @@ class ACIBridgeDomainL3OutBindingListViewSet(NetBoxModelViewSet):
     ).prefetch_related("tags")
     serializer_class = ACIBridgeDomainL3OutBindingSerializer
     filterset_class = ACIBridgeDomainL3OutBindingFilterSet
+    display_fields = ("aci_bridge_domain", "aci_l3out")
 
 
-class ACIEndpointGroupListViewSet(NetBoxModelViewSet):
+class ACIEndpointGroupListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Endpoint Group instances."""
 
     queryset = ACIEndpointGroup.objects.select_related(
@@ -314,7 +756,9 @@ class ACIEndpointGroupListViewSet(NetBoxModelViewSet):
     filterset_class = ACIEndpointGroupFilterSet
 
 
-class ACIUSegEndpointGroupListViewSet(NetBoxModelViewSet):
+class ACIUSegEndpointGroupListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI uSeg Endpoint Group instances."""
 
     queryset = ACIUSegEndpointGroup.objects.select_related(
@@ -329,7 +773,9 @@ class ACIUSegEndpointGroupListViewSet(NetBoxModelViewSet):
     filterset_class = ACIUSegEndpointGroupFilterSet
 
 
-class ACIUSegNetworkAttributeListViewSet(NetBoxModelViewSet):
+class ACIUSegNetworkAttributeListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI uSeg Network Attribute instances."""
 
     queryset = ACIUSegNetworkAttribute.objects.select_related(
@@ -343,9 +789,12 @@ class ACIUSegNetworkAttributeListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIUSegNetworkAttributeSerializer
     filterset_class = ACIUSegNetworkAttributeFilterSet
+    display_fields = ("aci_useg_endpoint_group",)
 
 
-class ACIEndpointSecurityGroupListViewSet(NetBoxModelViewSet):
+class ACIEndpointSecurityGroupListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Endpoint Security Group instances."""
 
     queryset = ACIEndpointSecurityGroup.objects.select_related(
@@ -360,7 +809,9 @@ class ACIEndpointSecurityGroupListViewSet(NetBoxModelViewSet):
     filterset_class = ACIEndpointSecurityGroupFilterSet
 
 
-class ACIEsgEndpointGroupSelectorListViewSet(NetBoxModelViewSet):
+class ACIEsgEndpointGroupSelectorListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI ESG Endpoint Group (EPG) Selector instances."""
 
     queryset = ACIEsgEndpointGroupSelector.objects.select_related(
@@ -374,9 +825,12 @@ class ACIEsgEndpointGroupSelectorListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIEsgEndpointGroupSelectorSerializer
     filterset_class = ACIEsgEndpointGroupSelectorFilterSet
+    display_fields = ("aci_endpoint_security_group",)
 
 
-class ACIEsgEndpointSelectorListViewSet(NetBoxModelViewSet):
+class ACIEsgEndpointSelectorListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI ESG Endpoint Selector instances."""
 
     queryset = ACIEsgEndpointSelector.objects.select_related(
@@ -390,9 +844,120 @@ class ACIEsgEndpointSelectorListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIEsgEndpointSelectorSerializer
     filterset_class = ACIEsgEndpointSelectorFilterSet
-
-
-class ACIContractFilterListViewSet(NetBoxModelViewSet):
+    display_fields = ("aci_endpoint_security_group",)
+
+
+class ACIEsgMembershipListView(ListAPIView):
+    """API view listing the members of the ACI Endpoint Security Groups.
+
+    The memberships are read from the materialized membership table and
+    restricted to the ESGs viewable by the user.
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+    serializer_class = ACIEsgMembershipSerializer
+    filterset_class = ACIEsgMembershipFilterSet
+
+    def get_queryset(self):
+        """Return the memberships of the ESGs viewable by the user."""
+        aci_esgs = ACIEndpointSecurityGroup.objects.restrict(self.request.user, "view")
+        return (
+            ACIEsgMembership.objects.filter(aci_endpoint_security_group__in=aci_esgs)
+            .select_related(
+                "aci_endpoint_security_group",
+                "aci_vrf__aci_tenant",
+                "member_type",
+            )
+            .prefetch_related("member")
+        )
+
+
+class ACIUSegResolvedNetworkListView(ListAPIView):
+    """API view listing the resolved networks of the ACI uSeg EPGs.
+
+    The networks are read from the resolved network table and restricted
+    to the uSeg Endpoint Groups viewable by the user.
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+    serializer_class = ACIUSegResolvedNetworkSerializer
+    filterset_class = ACIUSegResolvedNetworkFilterSet
+
+    def get_queryset(self):
+        """Return the networks of the uSeg EPGs viewable by the user."""
+        aci_useg_epgs = ACIUSegEndpointGroup.objects.restrict(self.request.user, "view")
+        return (
+            ACIUSegResolvedNetwork.objects.filter(
+                aci_useg_endpoint_group__in=aci_useg_epgs
+            )
+            .select_related(
+                "aci_useg_endpoint_group__aci_app_profile",
+                "aci_useg_endpoint_group__aci_bridge_domain",
+                "aci_useg_network_attribute__attr_object_type",
+                "aci_bridge_domain_subnet__gateway_ip_address",
+            )
+            .prefetch_related("aci_useg_network_attribute__attr_object")
+        )
+
+
+class ACIRouteLeakListView(ListAPIView):
+    """API view listing the route leaks of the shared services across VRFs.
+
+    The route leaks are read from the route leak table and restricted to
+    the VRFs viewable by the user. The list reports the requested fabrics
+    whose route leaks are outdated (``stale_aci_fabrics``); a POST request
+    enqueues their refresh jobs.
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+    serializer_class = ACIRouteLeakSerializer
+    filterset_class = ACIRouteLeakFilterSet
+
+    def get_aci_fabric_ids(self) -> list[int]:
+        """Return the IDs of the requested fabrics viewable by the user."""
+        aci_fabrics = ACIFabric.objects.restrict(self.request.user, "view")
+        if aci_fabric_ids := [
+            value
+            for value in self.request.query_params.getlist("aci_fabric_id")
+            if value.isdigit()
+        ]:
+            aci_fabrics = aci_fabrics.filter(pk__in=aci_fabric_ids)
+        return list(aci_fabrics.values_list("pk", flat=True))
+
+    def get_queryset(self):
+        """Return the route leaks into the VRFs viewable by the user."""
+        aci_vrfs = ACIVRF.objects.restrict(self.request.user, "view")
+        return (
+            ACIRouteLeak.objects.filter(aci_vrf__in=aci_vrfs)
+            .select_related(
+                "aci_fabric",
+                "aci_vrf__aci_tenant",
+                "source_aci_vrf__aci_tenant",
+                "source_type",
+            )
+            .prefetch_related("source")
+        )
+
+    def list(self, request, *args, **kwargs):
+        """Return the route leaks with the fabrics whose leaks are outdated."""
+        response = super().list(request, *args, **kwargs)
+        response.data["stale_aci_fabrics"] = get_stale_fabric_ids(
+            self.get_aci_fabric_ids()
+        )
+        return response
+
+    def post(self, request):
+        """Enqueue the refresh jobs of the outdated requested fabrics."""
+        jobs = enqueue_route_leak_refresh(
+            get_stale_fabric_ids(self.get_aci_fabric_ids())
+        )
+        serializer = JobSerializer(jobs, many=True, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class ACIContractFilterListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Contract Filter instances."""
 
     queryset = ACIContractFilter.objects.select_related(
@@ -404,9 +969,12 @@ class ACIContractFilterListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIContractFilterSerializer
     filterset_class = ACIContractFilterFilterSet
+    display_fields = ("aci_tenant",)
 
 
-class ACIContractFilterEntryListViewSet(NetBoxModelViewSet):
+class ACIContractFilterEntryListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Contract Filter Entry instances."""
 
     queryset = ACIContractFilterEntry.objects.select_related(
@@ -416,9 +984,12 @@ class ACIContractFilterEntryListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIContractFilterEntrySerializer
     filterset_class = ACIContractFilterEntryFilterSet
+    display_fields = ("aci_contract_filter",)
 
 
-class ACIContractListViewSet(NetBoxModelViewSet):
+class ACIContractListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Contract instances."""
 
     queryset = ACIContract.objects.select_related(
@@ -430,9 +1001,12 @@ class ACIContractListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIContractSerializer
     filterset_class = ACIContractFilterSet
+    display_fields = ("aci_tenant",)
 
 
-class ACIContractRelationListViewSet(NetBoxModelViewSet):
+class ACIContractRelationListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Contract Relation instances."""
 
     queryset = ACIContractRelation.objects.select_related(
@@ -444,9 +1018,12 @@ class ACIContractRelationListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIContractRelationSerializer
     filterset_class = ACIContractRelationFilterSet
+    display_fields = ("aci_contract", "aci_object")
 
 
-class ACIContractSubjectListViewSet(NetBoxModelViewSet):
+class ACIContractSubjectListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Contract Subject instances."""
 
     queryset = ACIContractSubject.objects.select_related(
@@ -458,9 +1035,12 @@ class ACIContractSubjectListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIContractSubjectSerializer
     filterset_class = ACIContractSubjectFilterSet
+    display_fields = ("aci_contract",)
 
 
-class ACIContractSubjectFilterListViewSet(NetBoxModelViewSet):
+class ACIContractSubjectFilterListViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, NetBoxModelViewSet
+):
     """API view for listing ACI Contract Subject Filter instances."""
 
     queryset = ACIContractSubjectFilter.objects.select_related(
@@ -471,3 +1051,100 @@ class ACIContractSubjectFilterListViewSet(NetBoxModelViewSet):
     )
     serializer_class = ACIContractSubjectFilterSerializer
     filterset_class = ACIContractSubjectFilterFilterSet
+    display_fields = ("aci_contract_subject", "aci_contract_filter")
+
+
+class ACIChangeFeedView(APIView):
+    """API view streaming the ACI objects changed since a time or cursor.
+
+    Created and updated objects are represented by the serializers of the
+    viewsets; deleted objects by their type and ID.
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+    # Viewsets of the models in the feed, set by the URL configuration
+    viewsets = ()
+
+    def get(self, request):
+        """Stream the changes since the ``since`` timestamp or ``cursor``."""
+        cursor = request.query_params.get("cursor")
+        since = request.query_params.get("since")
+        if not cursor and not since:
+            return Response(
+                {"since": ["A since timestamp or cursor is required."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            since = decode_cursor(cursor) if cursor else parse_since(since)
+        except ValidationError as e:
+            return Response(
+                {"cursor" if cursor else "since": e.messages},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializers = {
+            viewset.queryset.model: viewset.serializer_class
+            for viewset in self.viewsets
+        }
+        feed = ChangeFeed(
+            (viewset.queryset.all() for viewset in self.viewsets),
+            since,
+            user=request.user,
+        )
+        return StreamingHttpResponse(
+            _iter_change_feed(request, feed, serializers),
+            content_type="application/json",
+        )
+
+
+class ACIValidationView(APIView):
+    """API view validating candidate ACI objects without writing them.
+
+    The candidates of mixed object types are validated by the model rules
+    in one batch, returning the errors per candidate.
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+
+    def post(self, request):
+        """Validate the candidate objects of the request."""
+        serializer = ACIValidationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        report = validate_objects(
+            (
+                Candidate(**candidate)
+                for candidate in serializer.validated_data["objects"]
+            ),
+            user=request.user,
+        )
+        return Response(report.serialize())
+
+
+def _iter_change_feed(request, feed, serializers):
+    """Yield the JSON document of the change feed, one chunk per batch."""
+    context = {"request": request}
+    header = json.dumps(
+        {"since": feed.since, "until": feed.until, "cursor": feed.cursor},
+        cls=JSONEncoder,
+    )
+    # The changes are appended to the header object batch by batch
+    yield f'{header[:-1]},"changes":['
+    separator = ""
+    for batch in feed.iter_batches():
+        changes = [
+            {
+                "action": change.action,
+                "object_type": change.model._meta.label_lower,
+                "object_id": change.object_id,
+                "time": change.time,
+                "object": (
+                    serializers[change.model](change.instance, context=context).data
+                    if change.instance is not None
+                    else None
+                ),
+            }
+            for change in batch
+        ]
+        yield separator + json.dumps(changes, cls=JSONEncoder)[1:-1]
+        separator = ","
+    yield "]}"
@@ -27,6 +27,10 @@ POD_ID_MAX = 255
 
 NODE_ID_MIN = 1
 NODE_ID_MAX = 4000
+# Highest node ID of an APIC; leaf and spine node IDs start above
+NODE_ID_APIC_MAX = 100
+# Maximum number of nodes allocated at once
+NODE_ALLOCATION_MAX = 1000
 
 #
 # Contract Relation
@@ -22,11 +22,13 @@ from .tenant.endpoint_groups import (
     ACIEndpointGroupFilterSet,
     ACIUSegEndpointGroupFilterSet,
     ACIUSegNetworkAttributeFilterSet,
+    ACIUSegResolvedNetworkFilterSet,
 )
 from .tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroupFilterSet,
     ACIEsgEndpointGroupSelectorFilterSet,
     ACIEsgEndpointSelectorFilterSet,
+    ACIEsgMembershipFilterSet,
 )
 from .tenant.l3outs import (
     ACIExternalEndpointGroupFilterSet,
@@ -34,7 +36,7 @@ from .tenant.l3outs import (
     ACIL3OutFilterSet,
 )
 from .tenant.tenants import ACITenantFilterSet
-from .tenant.vrfs import ACIVRFFilterSet
+from .tenant.vrfs import ACIRouteLeakFilterSet, ACIVRFFilterSet
 
 __all__ = (
     "ACIAppProfileFilterSet",
@@ -51,15 +53,18 @@ __all__ = (
     "ACIEndpointSecurityGroupFilterSet",
     "ACIEsgEndpointGroupSelectorFilterSet",
     "ACIEsgEndpointSelectorFilterSet",
+    "ACIEsgMembershipFilterSet",
     "ACIExternalEndpointGroupFilterSet",
     "ACIExternalSubnetFilterSet",
     "ACIFabricFilterSet",
     "ACIL3OutFilterSet",
     "ACINodeFilterSet",
     "ACIPodFilterSet",
+    "ACIRouteLeakFilterSet",
     "ACIRoutedDomainFilterSet",
     "ACITenantFilterSet",
     "ACIUSegEndpointGroupFilterSet",
     "ACIUSegNetworkAttributeFilterSet",
+    "ACIUSegResolvedNetworkFilterSet",
     "ACIVRFFilterSet",
 )
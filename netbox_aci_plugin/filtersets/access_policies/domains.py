@@ -49,6 +49,7 @@ class ACIRoutedDomainFilterSet(
             "description",
             "aci_fabric",
             "nb_tenant",
+            "content_hash",
         )
 
     def filter_security_domain(self, queryset, name, value):
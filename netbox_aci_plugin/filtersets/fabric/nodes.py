@@ -108,6 +108,7 @@ class ACINodeFilterSet(
             "node_type",
             "tep_ip_address",
             "nb_tenant",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
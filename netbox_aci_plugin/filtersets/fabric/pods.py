@@ -49,6 +49,7 @@ class ACIPodFilterSet(
             "tep_pool",
             "scope_type",
             "nb_tenant",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
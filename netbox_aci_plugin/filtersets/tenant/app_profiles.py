@@ -30,6 +30,7 @@ class ACIAppProfileFilterSet(
             "description",
             "aci_tenant",
             "nb_tenant",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
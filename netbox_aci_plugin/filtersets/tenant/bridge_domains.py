@@ -110,6 +110,7 @@ class ACIBridgeDomainFilterSet(
             "unknown_ipv6_multicast",
             "unknown_unicast",
             "virtual_mac_address",
+            "content_hash",
         )
         filter_overrides = {
             ArrayField: {
@@ -217,6 +218,7 @@ class ACIBridgeDomainSubnetFilterSet(
             "preferred_ip_address_enabled",
             "shared_enabled",
             "virtual_ip_enabled",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -292,7 +294,7 @@ class ACIBridgeDomainL3OutBindingFilterSet(NetBoxModelFilterSet):
 
     class Meta:
         model = ACIBridgeDomainL3OutBinding
-        fields = ("id", "comments")
+        fields = ("id", "comments", "content_hash")
 
     def search(self, queryset, name, value):
         """Search ACIBridgeDomainL3OutBinding instances."""
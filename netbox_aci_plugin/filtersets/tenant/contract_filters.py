@@ -54,6 +54,7 @@ class ACIContractFilterFilterSet(
             "description",
             "aci_tenant",
             "nb_tenant",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -206,6 +207,7 @@ class ACIContractFilterEntryFilterSet(OwnerFilterMixin, NetBoxModelFilterSet):
             "source_to_port",
             "stateful_enabled",
             "tcp_rules",
+            "content_hash",
         )
         filter_overrides = {
             ArrayField: {
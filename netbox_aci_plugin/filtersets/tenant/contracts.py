@@ -77,6 +77,7 @@ class ACIContractFilterSet(
             "qos_class",
             "scope",
             "target_dscp",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -209,6 +210,7 @@ class ACIContractRelationFilterSet(NetBoxModelFilterSet):
             "aci_object_type",
             "aci_object_id",
             "role",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -315,6 +317,7 @@ class ACIContractSubjectFilterSet(
             "target_dscp",
             "target_dscp_cons_to_prov",
             "target_dscp_prov_to_cons",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -419,6 +422,7 @@ class ACIContractSubjectFilterFilterSet(NetBoxModelFilterSet):
             "log_enabled",
             "policy_compression_enabled",
             "priority",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import operator
+from functools import reduce
+
 import django_filters
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
@@ -10,7 +13,7 @@ from drf_spectacular.utils import extend_schema_field
 
 from dcim.models import MACAddress
 from ipam.models import VRF, IPAddress, Prefix
-from netbox.filtersets import NetBoxModelFilterSet
+from netbox.filtersets import BaseFilterSet, NetBoxModelFilterSet
 from users.filterset_mixins import OwnerFilterMixin
 from utilities.filters import (
     ContentTypeFilter,
@@ -22,11 +25,12 @@ from utilities.filtersets import register_filterset
 from ...choices import QualityOfServiceClassChoices, USegAttributeTypeChoices
 from ...models.fabric.fabrics import ACIFabric
 from ...models.tenant.app_profiles import ACIAppProfile
-from ...models.tenant.bridge_domains import ACIBridgeDomain
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
 from ...models.tenant.endpoint_groups import (
     ACIEndpointGroup,
     ACIUSegEndpointGroup,
     ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
 )
 from ...models.tenant.endpoint_security_groups import ACIEndpointSecurityGroup
 from ...models.tenant.tenants import ACITenant
@@ -127,6 +131,7 @@ class ACIEndpointGroupFilterSet(
             "qos_class",
             "preferred_group_member_enabled",
             "proxy_arp_enabled",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -244,6 +249,7 @@ class ACIUSegEndpointGroupFilterSet(
             "intra_epg_isolation_enabled",
             "qos_class",
             "preferred_group_member_enabled",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -404,6 +410,7 @@ class ACIUSegNetworkAttributeFilterSet(
             "attr_object_id",
             "type",
             "use_epg_subnet",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -420,3 +427,86 @@ class ACIUSegNetworkAttributeFilterSet(
             | Q(prefix__prefix__icontains=value)
         )
         return queryset.filter(queryset_filter)
+
+
+class ACIUSegResolvedNetworkFilterSet(ACICachedNetworkObjectFilterMixin, BaseFilterSet):
+    """Filter set for the ACI uSeg Resolved Network model."""
+
+    aci_fabric_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_useg_endpoint_group__aci_app_profile__aci_tenant__aci_fabric",
+        queryset=ACIFabric.objects.all(),
+        to_field_name="id",
+        label=_("ACI Fabric (ID)"),
+    )
+    aci_tenant_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_useg_endpoint_group__aci_app_profile__aci_tenant",
+        queryset=ACITenant.objects.all(),
+        to_field_name="id",
+        label=_("ACI Tenant (ID)"),
+    )
+    aci_app_profile_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_useg_endpoint_group__aci_app_profile",
+        queryset=ACIAppProfile.objects.all(),
+        to_field_name="id",
+        label=_("ACI Application Profile (ID)"),
+    )
+    aci_useg_endpoint_group = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_useg_endpoint_group__name",
+        queryset=ACIUSegEndpointGroup.objects.all(),
+        to_field_name="name",
+        label=_("ACI uSeg Endpoint Group (name)"),
+    )
+    aci_useg_endpoint_group_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIUSegEndpointGroup.objects.all(),
+        to_field_name="id",
+        label=_("ACI uSeg Endpoint Group (ID)"),
+    )
+    aci_useg_network_attribute_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIUSegNetworkAttribute.objects.all(),
+        to_field_name="id",
+        label=_("ACI uSeg Network Attribute (ID)"),
+    )
+    aci_bridge_domain_subnet_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIBridgeDomainSubnet.objects.all(),
+        to_field_name="id",
+        label=_("ACI Bridge Domain Subnet (ID)"),
+    )
+    prefix = MultiValueCharFilter(
+        method="filter_resolved_prefix",
+        label=_("Prefix"),
+    )
+    contains = MultiValueCharFilter(
+        method="filter_contains",
+        label=_("Prefixes which contain this prefix or IP address"),
+    )
+    mac_address = MultiValueMACAddressFilter(
+        label=_("MAC Address"),
+    )
+
+    class Meta:
+        model = ACIUSegResolvedNetwork
+        fields: tuple = (
+            "id",
+            "aci_useg_endpoint_group",
+            "aci_useg_network_attribute",
+            "aci_bridge_domain_subnet",
+        )
+
+    def filter_resolved_prefix(self, queryset, name, value):
+        """Return a QuerySet filtered by the resolved prefix."""
+        return queryset.filter(prefix__in=self._parse_inet_networks(value))
+
+    def filter_contains(self, queryset, name, value):
+        """Return a QuerySet of the prefixes containing a network."""
+        networks = self._parse_inet_networks(value)
+        if not networks:
+            return queryset.none()
+        return queryset.filter(
+            reduce(
+                operator.or_,
+                (
+                    Q(prefix__net_contains_or_equals=str(network))
+                    for network in networks
+                ),
+            )
+        )
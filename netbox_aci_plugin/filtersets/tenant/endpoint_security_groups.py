@@ -3,13 +3,18 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import django_filters
+from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from ipam.models import VRF, IPAddress, Prefix
-from netbox.filtersets import NetBoxModelFilterSet
+from netbox.filtersets import BaseFilterSet, NetBoxModelFilterSet
 from users.filterset_mixins import OwnerFilterMixin
-from utilities.filters import ContentTypeFilter, MultiValueCharFilter
+from utilities.filters import (
+    ContentTypeFilter,
+    MultiValueCharFilter,
+    MultiValueNumberFilter,
+)
 from utilities.filtersets import register_filterset
 
 from ...models.fabric.fabrics import ACIFabric
@@ -22,6 +27,7 @@ from ...models.tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroup,
     ACIEsgEndpointGroupSelector,
     ACIEsgEndpointSelector,
+    ACIEsgMembership,
 )
 from ...models.tenant.tenants import ACITenant
 from ...models.tenant.vrfs import ACIVRF
@@ -94,6 +100,7 @@ class ACIEndpointSecurityGroupFilterSet(
             "admin_shutdown",
             "intra_esg_isolation_enabled",
             "preferred_group_member_enabled",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -229,6 +236,7 @@ class ACIEsgEndpointGroupSelectorFilterSet(
             "aci_endpoint_security_group",
             "aci_epg_object_type",
             "aci_epg_object_id",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -366,6 +374,7 @@ class ACIEsgEndpointSelectorFilterSet(
             "aci_endpoint_security_group",
             "ep_object_type",
             "ep_object_id",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -381,3 +390,122 @@ class ACIEsgEndpointSelectorFilterSet(
             | Q(prefix__prefix__icontains=value)
         )
         return queryset.filter(queryset_filter)
+
+
+class ACIEsgMembershipFilterSet(BaseFilterSet):
+    """Filter set for the ACI ESG Membership model."""
+
+    # Member models by the name of their filter
+    member_filter_models = {
+        "aci_endpoint_group_id": ACIEndpointGroup,
+        "aci_useg_endpoint_group_id": ACIUSegEndpointGroup,
+        "ip_address_id": IPAddress,
+        "prefix_id": Prefix,
+    }
+
+    aci_fabric_id = django_filters.ModelMultipleChoiceFilter(
+        field_name=(
+            "aci_endpoint_security_group__aci_app_profile__aci_tenant__aci_fabric"
+        ),
+        queryset=ACIFabric.objects.all(),
+        to_field_name="id",
+        label=_("ACI Fabric (ID)"),
+    )
+    aci_tenant_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_endpoint_security_group__aci_app_profile__aci_tenant",
+        queryset=ACITenant.objects.all(),
+        to_field_name="id",
+        label=_("ACI Tenant (ID)"),
+    )
+    aci_app_profile_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_endpoint_security_group__aci_app_profile",
+        queryset=ACIAppProfile.objects.all(),
+        to_field_name="id",
+        label=_("ACI Application Profile (ID)"),
+    )
+    aci_endpoint_security_group = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_endpoint_security_group__name",
+        queryset=ACIEndpointSecurityGroup.objects.all(),
+        to_field_name="name",
+        label=_("ACI Endpoint Security Group (name)"),
+    )
+    aci_endpoint_security_group_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIEndpointSecurityGroup.objects.all(),
+        to_field_name="id",
+        label=_("ACI Endpoint Security Group (ID)"),
+    )
+    aci_esg_endpoint_group_selector = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_esg_endpoint_group_selector__name",
+        queryset=ACIEsgEndpointGroupSelector.objects.all(),
+        to_field_name="name",
+        label=_("ACI ESG Endpoint Group Selector (name)"),
+    )
+    aci_esg_endpoint_group_selector_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIEsgEndpointGroupSelector.objects.all(),
+        to_field_name="id",
+        label=_("ACI ESG Endpoint Group Selector (ID)"),
+    )
+    aci_esg_endpoint_selector = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_esg_endpoint_selector__name",
+        queryset=ACIEsgEndpointSelector.objects.all(),
+        to_field_name="name",
+        label=_("ACI ESG Endpoint Selector (name)"),
+    )
+    aci_esg_endpoint_selector_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIEsgEndpointSelector.objects.all(),
+        to_field_name="id",
+        label=_("ACI ESG Endpoint Selector (ID)"),
+    )
+    aci_vrf = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_vrf__name",
+        queryset=ACIVRF.objects.all(),
+        to_field_name="name",
+        label=_("ACI VRF (name)"),
+    )
+    aci_vrf_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIVRF.objects.all(),
+        to_field_name="id",
+        label=_("ACI VRF (ID)"),
+    )
+    member_type = ContentTypeFilter(
+        label=_("Member Type"),
+    )
+
+    # Member filters by member model
+    aci_endpoint_group_id = MultiValueNumberFilter(
+        method="filter_member",
+        label=_("ACI Endpoint Group (ID)"),
+    )
+    aci_useg_endpoint_group_id = MultiValueNumberFilter(
+        method="filter_member",
+        label=_("ACI uSeg Endpoint Group (ID)"),
+    )
+    ip_address_id = MultiValueNumberFilter(
+        method="filter_member",
+        label=_("IP Address (ID)"),
+    )
+    prefix_id = MultiValueNumberFilter(
+        method="filter_member",
+        label=_("Prefix (ID)"),
+    )
+
+    class Meta:
+        model = ACIEsgMembership
+        fields: tuple = (
+            "id",
+            "aci_endpoint_security_group",
+            "aci_esg_endpoint_group_selector",
+            "aci_esg_endpoint_selector",
+            "member_type",
+            "member_id",
+            "aci_vrf",
+        )
+
+    def filter_member(self, queryset, name, value):
+        """Return a QuerySet filtered by the members of the filter's model."""
+        return queryset.filter(
+            member_type=ContentType.objects.get_for_model(
+                self.member_filter_models[name]
+            ),
+            member_id__in=value,
+        )
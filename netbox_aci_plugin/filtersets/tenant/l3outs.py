@@ -92,6 +92,7 @@ class ACIL3OutFilterSet(
             "l3_multicast_ipv4_enabled",
             "l3_multicast_ipv6_enabled",
             "multipod_enabled",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -178,6 +179,7 @@ class ACIExternalEndpointGroupFilterSet(
             "preferred_group_member_enabled",
             "qos_class",
             "target_dscp",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -294,6 +296,7 @@ class ACIExternalSubnetFilterSet(
             "bgp_route_summarization_enabled",
             "ospf_route_summarization_enabled",
             "eigrp_route_summarization_enabled",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -43,6 +43,7 @@ class ACITenantFilterSet(
             "description",
             "aci_fabric",
             "nb_tenant",
+            "content_hash",
         )
 
     def search(self, queryset, name, value):
@@ -2,22 +2,36 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import operator
+from functools import reduce
+
 import django_filters
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from ipam.models import VRF
-from netbox.filtersets import NetBoxModelFilterSet
+from netbox.filtersets import BaseFilterSet, NetBoxModelFilterSet
 from users.filterset_mixins import OwnerFilterMixin
+from utilities.filters import (
+    ContentTypeFilter,
+    MultiValueCharFilter,
+    MultiValueNumberFilter,
+)
 from utilities.filtersets import register_filterset
 
 from ...choices import (
     VRFPCEnforcementDirectionChoices,
     VRFPCEnforcementPreferenceChoices,
 )
-from ...models.tenant.vrfs import ACIVRF
+from ...models.fabric.fabrics import ACIFabric
+from ...models.tenant.endpoint_groups import ACIEndpointGroup, ACIUSegEndpointGroup
+from ...models.tenant.l3outs import ACIExternalEndpointGroup
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF, ACIRouteLeak
 from ..mixins import (
+    ACICachedNetworkObjectFilterMixin,
     ACITenantFilterSetMixin,
     ACITenantOrCommonFilterSetMixin,
     NBTenantFilterSetMixin,
@@ -72,6 +86,7 @@ class ACIVRFFilterSet(
             "pim_ipv4_enabled",
             "pim_ipv6_enabled",
             "preferred_group_enabled",
+            "content_hash",
         )
         filter_overrides = {
             ArrayField: {
@@ -92,3 +107,108 @@ class ACIVRFFilterSet(
             | Q(description__icontains=value)
         )
         return queryset.filter(queryset_filter)
+
+
+class ACIRouteLeakFilterSet(ACICachedNetworkObjectFilterMixin, BaseFilterSet):
+    """Filter set for the ACI Route Leak model."""
+
+    # Source models by the name of their filter
+    source_filter_models = {
+        "aci_endpoint_group_id": ACIEndpointGroup,
+        "aci_useg_endpoint_group_id": ACIUSegEndpointGroup,
+        "aci_external_endpoint_group_id": ACIExternalEndpointGroup,
+    }
+
+    aci_fabric_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIFabric.objects.all(),
+        to_field_name="id",
+        label=_("ACI Fabric (ID)"),
+    )
+    aci_tenant_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_vrf__aci_tenant",
+        queryset=ACITenant.objects.all(),
+        to_field_name="id",
+        label=_("ACI Tenant (ID)"),
+    )
+    aci_vrf = django_filters.ModelMultipleChoiceFilter(
+        field_name="aci_vrf__name",
+        queryset=ACIVRF.objects.all(),
+        to_field_name="name",
+        label=_("ACI VRF (name)"),
+    )
+    aci_vrf_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIVRF.objects.all(),
+        to_field_name="id",
+        label=_("ACI VRF (ID)"),
+    )
+    source_aci_vrf_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ACIVRF.objects.all(),
+        to_field_name="id",
+        label=_("Source ACI VRF (ID)"),
+    )
+    source_type = ContentTypeFilter(
+        label=_("Source Type"),
+    )
+    prefix = MultiValueCharFilter(
+        method="filter_leaked_prefix",
+        label=_("Prefix"),
+    )
+    contains = MultiValueCharFilter(
+        method="filter_contains",
+        label=_("Prefixes which contain this prefix or IP address"),
+    )
+
+    # Source filters by source model
+    aci_endpoint_group_id = MultiValueNumberFilter(
+        method="filter_source",
+        label=_("ACI Endpoint Group (ID)"),
+    )
+    aci_useg_endpoint_group_id = MultiValueNumberFilter(
+        method="filter_source",
+        label=_("ACI uSeg Endpoint Group (ID)"),
+    )
+    aci_external_endpoint_group_id = MultiValueNumberFilter(
+        method="filter_source",
+        label=_("ACI External Endpoint Group (ID)"),
+    )
+
+    class Meta:
+        model = ACIRouteLeak
+        fields: tuple = (
+            "id",
+            "aci_fabric",
+            "aci_vrf",
+            "source_aci_vrf",
+            "source_type",
+            "source_id",
+            "aggregate",
+            "shared_security_enabled",
+        )
+
+    def filter_leaked_prefix(self, queryset, name, value):
+        """Return a QuerySet filtered by the leaked prefix."""
+        return queryset.filter(prefix__in=self._parse_inet_networks(value))
+
+    def filter_contains(self, queryset, name, value):
+        """Return a QuerySet of the prefixes containing a network."""
+        networks = self._parse_inet_networks(value)
+        if not networks:
+            return queryset.none()
+        return queryset.filter(
+            reduce(
+                operator.or_,
+                (
+                    Q(prefix__net_contains_or_equals=str(network))
+                    for network in networks
+                ),
+            )
+        )
+
+    def filter_source(self, queryset, name, value):
+        """Return a QuerySet filtered by the sources of the filter's model."""
+        return queryset.filter(
+            source_type=ContentType.objects.get_for_model(
+                self.source_filter_models[name]
+            ),
+            source_id__in=value,
+        )
@@ -40,6 +40,7 @@ from ...models.tenant.bridge_domains import (
 from ...models.tenant.l3outs import ACIL3Out
 from ...models.tenant.tenants import ACITenant
 from ...models.tenant.vrfs import ACIVRF
+from ...services.vrf_moves import analyze_bridge_domain_vrf_moves
 
 #
 # Bridge Domain forms
@@ -284,6 +285,18 @@ class ACIBridgeDomainEditForm(NetBoxModelForm):
             "tags",
         )
 
+    def clean(self) -> None:
+        """Validate the impact of moving the Bridge Domain to another VRF."""
+        super().clean()
+
+        aci_vrf = self.cleaned_data.get("aci_vrf")
+        if self.instance.pk and aci_vrf:
+            impact = analyze_bridge_domain_vrf_moves({self.instance.pk: aci_vrf.pk})
+            if impact.conflicts:
+                raise forms.ValidationError(
+                    {"aci_vrf": [conflict.message for conflict in impact.conflicts]}
+                )
+
 
 class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
     """NetBox bulk edit form for the ACI Bridge Domain model."""
@@ -495,6 +508,23 @@ class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
         "comments",
     )
 
+    def clean(self) -> None:
+        """Validate the impact of moving the Bridge Domains to another VRF."""
+        super().clean()
+
+        aci_vrf = self.cleaned_data.get("aci_vrf")
+        aci_bridge_domains = self.cleaned_data.get("pk")
+        if aci_vrf and aci_bridge_domains:
+            impact = analyze_bridge_domain_vrf_moves(
+                dict.fromkeys(
+                    aci_bridge_domains.values_list("pk", flat=True), aci_vrf.pk
+                )
+            )
+            if impact.conflicts:
+                raise forms.ValidationError(
+                    {"aci_vrf": [conflict.message for conflict in impact.conflicts]}
+                )
+
 
 class ACIBridgeDomainFilterForm(NetBoxModelFilterSetForm):
     """NetBox filter form for the ACI Bridge Domain model."""
@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Cache of the rendered attribute panels of the ACI object detail pages.
+
+The panels are stored in the configured (Redis) cache, keyed on the object,
+its ``last_updated`` timestamp and content hash, the permissions (with the
+object permission constraints) and the language of the user, and a version
+token of the object and of each related object shown in the panels (the
+referenced objects and the parent chain).
+
+Saving or deleting an ACI object renews its version token and the tokens of
+the objects it references, which invalidates the panels of the object, of
+its children (through their parent chain), and of the referenced parents.
+The bulk writers (ingest, clone, onboarding) bypass the signals and renew
+the tokens of the written objects with ``invalidate_bulk_fragments()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Model, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import get_language
+
+from netbox.plugins.utils import get_plugin_config
+from users.constants import CONSTRAINT_TOKEN_USER
+from users.models import ObjectPermission
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractBaseUser
+
+PLUGIN_NAME = "netbox_aci_plugin"
+FRAGMENT_CACHE_PREFIX = f"{PLUGIN_NAME}.fragment"
+FRAGMENT_CACHE_TIMEOUT = 3600
+
+# Version token of objects without a renewed token
+INITIAL_VERSION = "0"
+
+# Attribute of the user instance holding its permission hash
+PERMISSION_HASH_ATTR = "_aci_permission_hash"
+
+
+def fragment_cache_timeout() -> int:
+    """Return the fragment cache timeout in seconds (0 disables the cache)."""
+    return int(
+        get_plugin_config(PLUGIN_NAME, "fragment_cache_timeout", FRAGMENT_CACHE_TIMEOUT)
+    )
+
+
+def _is_plugin_model(model: type[Model] | None) -> bool:
+    """Return whether the model belongs to the plugin."""
+    return model is not None and model._meta.app_label == PLUGIN_NAME
+
+
+def _get_version_key(model: type[Model], pk: int) -> str:
+    """Return the cache key of the version token of an object."""
+    return f"{FRAGMENT_CACHE_PREFIX}.version.{model._meta.label_lower}.{pk}"
+
+
+def _iter_referenced_objects(instance: Model) -> Iterator[tuple[type[Model], int]]:
+    """Yield the model and primary key of the ACI objects referenced."""
+    for field in instance._meta.concrete_fields:
+        pk = getattr(instance, field.attname)
+        if (
+            field.many_to_one
+            and pk is not None
+            and _is_plugin_model(field.related_model)
+        ):
+            yield field.related_model, pk
+    for field in instance._meta.private_fields:
+        if not isinstance(field, GenericForeignKey):
+            continue
+        content_type_id = getattr(instance, f"{field.ct_field}_id")
+        object_id = getattr(instance, field.fk_field)
+        model = (
+            ContentType.objects.get_for_id(content_type_id).model_class()
+            if content_type_id is not None and object_id is not None
+            else None
+        )
+        if _is_plugin_model(model):
+            yield model, object_id
+
+
+def _iter_parent_objects(instance: Model) -> Iterator[Model]:
+    """Yield the parent chain of an ACI object."""
+    parent = getattr(instance, "parent_object", None)
+    while parent is not None:
+        yield parent
+        parent = getattr(parent, "parent_object", None)
+
+
+def get_permission_hash(user: AbstractBaseUser | None) -> str:
+    """Return a hash of the permissions of a user.
+
+    The hash covers the permission names and the object permissions of the
+    user and their groups with their constraints, so that users with the
+    same permissions but different constraints do not share a hash.
+    Constraints with the ``$user`` token make the hash specific to the
+    user. The hash is kept on the user instance, which lives for a request.
+    """
+    if user is None or not user.is_authenticated:
+        return "anonymous"
+    if user.is_superuser:
+        return "superuser"
+    if (permission_hash := getattr(user, PERMISSION_HASH_ATTR, None)) is not None:
+        return permission_hash
+    object_permissions = sorted(
+        json.dumps(row, sort_keys=True, default=str)
+        for row in ObjectPermission.objects.filter(
+            Q(users=user) | Q(groups__in=user.groups.all()), enabled=True
+        )
+        .distinct()
+        .values_list("pk", "actions", "constraints", "object_types")
+    )
+    parts = [*sorted(user.get_all_permissions()), *object_permissions]
+    if any(CONSTRAINT_TOKEN_USER in row for row in object_permissions):
+        parts.append(f"user={user.pk}")
+    permission_hash = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    setattr(user, PERMISSION_HASH_ATTR, permission_hash)
+    return permission_hash
+
+
+def get_fragment_key(name: str, instance: Model, user: AbstractBaseUser | None) -> str:
+    """Return the cache key of a fragment of an ACI object detail page."""
+    related = {
+        _get_version_key(instance._meta.model, instance.pk),
+        *(
+            _get_version_key(model, pk)
+            for model, pk in _iter_referenced_objects(instance)
+        ),
+        *(
+            _get_version_key(parent._meta.model, parent.pk)
+            for parent in _iter_parent_objects(instance)
+        ),
+    }
+    versions = cache.get_many(related)
+    last_updated = getattr(instance, "last_updated", None)
+    parts = (
+        name,
+        instance._meta.label_lower,
+        str(instance.pk),
+        last_updated.isoformat() if last_updated else "",
+        getattr(instance, "content_hash", ""),
+        get_permission_hash(user),
+        get_language() or "",
+        *(f"{key}={versions.get(key, INITIAL_VERSION)}" for key in sorted(related)),
+    )
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return f"{FRAGMENT_CACHE_PREFIX}.{digest}"
+
+
+def get_or_render_fragment(
+    name: str,
+    instance: Model,
+    user: AbstractBaseUser | None,
+    render: Callable[[], str],
+) -> str:
+    """Return the cached fragment or render and cache it."""
+    timeout = fragment_cache_timeout()
+    if not timeout or instance is None or instance.pk is None:
+        return render()
+    key = get_fragment_key(name, instance, user)
+    if (fragment := cache.get(key)) is None:
+        fragment = render()
+        cache.set(key, fragment, timeout)
+    return fragment
+
+
+def _iter_version_keys(instance: Model) -> Iterator[str]:
+    """Yield the version token keys of an object and its referenced objects."""
+    yield _get_version_key(instance._meta.model, instance.pk)
+    for model, pk in _iter_referenced_objects(instance):
+        yield _get_version_key(model, pk)
+
+
+def invalidate_fragments(instance: Model) -> None:
+    """Renew the version tokens of an ACI object and its referenced objects.
+
+    The tokens are kept twice as long as the fragments, so the fragments
+    cached before a renewal have expired when a token falls back to the
+    initial version.
+    """
+    invalidate_bulk_fragments((instance,))
+
+
+def invalidate_bulk_fragments(instances: Iterable[Model]) -> None:
+    """Renew the version tokens of bulk written ACI objects.
+
+    The tokens of all objects and their referenced objects are renewed
+    with a single cache write.
+    """
+    if not (timeout := fragment_cache_timeout()):
+        return
+    keys = {key for instance in instances for key in _iter_version_keys(instance)}
+    if keys:
+        cache.set_many(dict.fromkeys(keys, uuid4().hex), timeout * 2)
+
+
+@receiver(post_save, dispatch_uid="aci_invalidate_fragments_on_save")
+@receiver(post_delete, dispatch_uid="aci_invalidate_fragments_on_delete")
+def handle_object_change(sender: type[Model], instance: Model, **kwargs) -> None:
+    """Invalidate the cached fragments of a saved or deleted ACI object."""
+    if _is_plugin_model(sender):
+        invalidate_fragments(instance)
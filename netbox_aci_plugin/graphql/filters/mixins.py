@@ -30,6 +30,7 @@ class ACIBaseFilterMixin(NetBoxModelFilter):
     name: StrFilterLookup[str] | None = strawberry_django.filter_field()
     name_alias: StrFilterLookup[str] | None = strawberry_django.filter_field()
     description: StrFilterLookup[str] | None = strawberry_django.filter_field()
+    content_hash: StrFilterLookup[str] | None = strawberry_django.filter_field()
 
     nb_tenant: (
         Annotated["TenantFilter", strawberry.lazy("tenancy.graphql.filters")] | None
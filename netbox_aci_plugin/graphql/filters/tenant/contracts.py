@@ -99,6 +99,7 @@ class ACIContractRelationFilter(NetBoxModelFilter):
         Annotated["ContentTypeFilter", strawberry.lazy("core.graphql.filters")] | None
     ) = strawberry_django.filter_field()
     aci_object_id: ID | None = strawberry_django.filter_field()
+    content_hash: StrFilterLookup[str] | None = strawberry_django.filter_field()
     role: (
         BaseFilterLookup[
             Annotated[
@@ -125,6 +126,7 @@ class ACIContractSubjectFilter(NetBoxModelFilter):
     apply_both_directions_enabled: FilterLookup[bool] | None = (
         strawberry_django.filter_field()
     )
+    content_hash: StrFilterLookup[str] | None = strawberry_django.filter_field()
     qos_class: (
         BaseFilterLookup[
             Annotated[
@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Background jobs of the NetBox ACI plugin."""
+
+from django.apps import apps
+
+from netbox.jobs import JobRunner
+
+from .models.fabric.fabrics import ACIFabric
+from .models.fabric.pods import ACIPod
+from .models.tenant.bridge_domains import ACIBridgeDomainSubnet
+from .models.tenant.tenants import ACITenant
+from .services.diff import SnapshotDiff
+from .services.export import EXPORT_FORMAT_APIC_JSON, TenantExporter
+from .services.ingest import IngestResult, SnapshotCheckpoint, SnapshotIngester
+from .services.onboarding import NodeOnboarding, NodeOnboardingRow
+from .services.route_leaks import refresh_route_leaks
+from .services.snapshot import iter_snapshot_tenants
+from .services.subnet_overlaps import find_bridge_domain_subnet_overlaps
+from .services.teardown import DeletionPlan
+
+
+class ACIBridgeDomainSubnetOverlapJob(JobRunner):
+    """Report overlapping Bridge Domain subnets within the ACI VRFs.
+
+    The report covers the ACI Fabric the job is attached to, or all ACI
+    Fabrics if the job is not bound to an object.
+    """
+
+    class Meta:
+        name = "ACI Bridge Domain Subnet Overlap Report"
+
+    def run(self, *args, **kwargs) -> None:
+        """Analyze the Bridge Domain subnets and store the overlaps."""
+        aci_bd_subnets = ACIBridgeDomainSubnet.objects.all()
+        if isinstance(self.job.object, ACIFabric):
+            aci_bd_subnets = aci_bd_subnets.filter(
+                aci_bridge_domain__aci_tenant__aci_fabric=self.job.object
+            )
+
+        overlaps = find_bridge_domain_subnet_overlaps(aci_bd_subnets)
+        for overlap in overlaps:
+            self.logger.warning(
+                "Subnet %s (ACI Bridge Domain Subnet ID %s) overlaps with "
+                "subnet %s (ACI Bridge Domain Subnet ID %s) in ACI VRF ID %s.",
+                overlap.subnet,
+                overlap.subnet_id,
+                overlap.overlapping_subnet,
+                overlap.overlapping_subnet_id,
+                overlap.aci_vrf_id,
+            )
+        self.logger.info("Found %d overlapping subnet(s).", len(overlaps))
+
+        self.job.data = {
+            "overlap_count": len(overlaps),
+            "overlaps": [overlap.serialize() for overlap in overlaps],
+        }
+
+
+class ACIExportJob(JobRunner):
+    """Export ACI Tenants as APIC REST JSON or Network-as-Code YAML.
+
+    The export covers the ACI Tenant or the ACI Tenants of the ACI Fabric
+    the job is attached to, or all ACI Tenants if the job is not bound to an
+    object. Only objects viewable by the job's user are exported. The
+    document is saved in the storage and referenced by the job data.
+    """
+
+    class Meta:
+        name = "ACI Export"
+
+    def run(
+        self, *args, export_format: str = EXPORT_FORMAT_APIC_JSON, **kwargs
+    ) -> None:
+        """Save the export document and reference it in the job data."""
+        aci_tenants = ACITenant.objects.all()
+        if isinstance(self.job.object, ACITenant):
+            aci_tenants = aci_tenants.filter(pk=self.job.object.pk)
+        elif isinstance(self.job.object, ACIFabric):
+            aci_tenants = aci_tenants.filter(aci_fabric=self.job.object)
+
+        exporter = TenantExporter(aci_tenants, user=self.job.user)
+        name, size = exporter.save_export(export_format, str(self.job.job_id))
+        self.logger.info(
+            "Exported %d ACI Tenant(s) as %s to %s.",
+            exporter.aci_tenants.count(),
+            export_format,
+            name,
+        )
+
+        self.job.data = {"format": export_format, "file": name, "size": size}
+
+
+class ACISnapshotIngestJob(JobRunner):
+    """Ingest the ACI Tenants of an offline APIC snapshot into an ACI Fabric.
+
+    The job must be attached to the target ACI Fabric. With a checkpoint
+    file, an interrupted ingest resumes after the last completed tenant.
+    """
+
+    class Meta:
+        name = "ACI Snapshot Ingest"
+
+    def run(
+        self,
+        *args,
+        snapshot_path: str,
+        checkpoint_path: str | None = None,
+        **kwargs,
+    ) -> None:
+        """Ingest the snapshot tenant by tenant and store the result."""
+        if not isinstance(self.job.object, ACIFabric):
+            raise ValueError("The snapshot ingest job requires an ACI Fabric.")
+
+        def progress(name: str, result: IngestResult) -> None:
+            self.logger.info("Ingested ACI Tenant %s.", name)
+            self.job.data = result.serialize()
+            self.job.save(update_fields=("data",))
+
+        ingester = SnapshotIngester(self.job.object)
+        result = ingester.ingest(
+            iter_snapshot_tenants(snapshot_path),
+            checkpoint=SnapshotCheckpoint(checkpoint_path) if checkpoint_path else None,
+            progress=progress,
+        )
+        for error in result.errors:
+            self.logger.warning("Skipped %s: %s", error["dn"], error["error"])
+        self.logger.info(
+            "Ingested %d ACI Tenant(s) with %d error(s).",
+            len(result.tenants),
+            len(result.errors),
+        )
+
+        self.job.data = result.serialize()
+
+
+class ACISnapshotDiffJob(JobRunner):
+    """Compare the ACI Tenants of an offline APIC snapshot with an ACI Fabric.
+
+    The job must be attached to the compared ACI Fabric. Objects of the
+    fabric missing from the snapshot are reported as deleted.
+    """
+
+    class Meta:
+        name = "ACI Snapshot Diff"
+
+    def run(self, *args, snapshot_path: str, **kwargs) -> None:
+        """Compare the snapshot with the fabric and store the differences."""
+        if not isinstance(self.job.object, ACIFabric):
+            raise ValueError("The snapshot diff job requires an ACI Fabric.")
+
+        snapshot_diff = SnapshotDiff(self.job.object)
+        diffs = [
+            diff.serialize()
+            for diff in snapshot_diff.iter_diffs(iter_snapshot_tenants(snapshot_path))
+        ]
+        self.logger.info(
+            "Found %d added, %d changed and %d deleted object(s).",
+            *snapshot_diff.counts.values(),
+        )
+
+        self.job.data = {"counts": snapshot_diff.counts, "diffs": diffs}
+
+
+class ACINodeOnboardingJob(JobRunner):
+    """Onboard ACI Nodes with their devices and TEP IP addresses.
+
+    The job must be attached to the target ACI Pod. Each node is given as
+    a dictionary of the ``NodeOnboardingRow`` fields.
+    """
+
+    class Meta:
+        name = "ACI Node Onboarding"
+
+    def run(self, *args, nodes: list[dict], **kwargs) -> None:
+        """Onboard the nodes and store the created objects."""
+        if not isinstance(self.job.object, ACIPod):
+            raise ValueError("The node onboarding job requires an ACI Pod.")
+
+        onboarding = NodeOnboarding(self.job.object, user=self.job.user)
+        result = onboarding.onboard(NodeOnboardingRow(**node) for node in nodes)
+        self.logger.info(
+            "Onboarded %d ACI Node(s) with %d new device(s).",
+            len(result.aci_nodes),
+            result.counts["dcim.Device"],
+        )
+
+        self.job.data = result.serialize()
+
+
+class ACITeardownJob(JobRunner):
+    """Delete an ACI Fabric or ACI Tenant with its dependent objects.
+
+    The deleted object is given by its object type label and ID, since the
+    job must not be attached to an object it deletes. The deletion plan is
+    built when the job runs, and refused if objects of other ACI Tenants
+    depend on it, unless ``include_foreign_dependents`` is set.
+    """
+
+    class Meta:
+        name = "ACI Teardown"
+
+    def run(
+        self,
+        *args,
+        object_type: str,
+        object_id: int,
+        include_foreign_dependents: bool = False,
+        **kwargs,
+    ) -> None:
+        """Execute the deletion plan and store the deleted object counts."""
+        model = apps.get_model(object_type)
+        if model not in (ACIFabric, ACITenant):
+            raise ValueError("The teardown job requires an ACI Fabric or Tenant.")
+
+        plan = DeletionPlan(
+            model.objects.get(pk=object_id),
+            user=self.job.user,
+            include_foreign_dependents=include_foreign_dependents,
+        )
+        counts = plan.execute()
+        self.logger.info("Deleted %d object(s).", sum(counts.values()))
+
+        self.job.data = {"counts": counts}
+
+
+class ACIRouteLeakRefreshJob(JobRunner):
+    """Recompute the route leaks of the shared services of an ACI Fabric.
+
+    The job must be attached to the ACI Fabric. It is enqueued once a
+    change outdating the route leaks of the fabric is committed.
+    """
+
+    class Meta:
+        name = "ACI Route Leak Refresh"
+
+    def run(self, *args, **kwargs) -> None:
+        """Recompute the route leaks and store their number."""
+        if not isinstance(self.job.object, ACIFabric):
+            raise ValueError("The route leak refresh job requires an ACI Fabric.")
+
+        count = refresh_route_leaks(self.job.object.pk)
+        self.logger.info("Computed %d route leak(s).", count)
+
+        self.job.data = {"route_leak_count": count}
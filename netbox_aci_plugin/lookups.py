@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Custom database lookups used by the NetBox ACI plugin."""
+
+from django.db.models import Lookup
+
+from ipam.fields import IPAddressField, IPNetworkField
+
+
+class NetOverlaps(Lookup):
+    """Match IP networks overlapping the given network.
+
+    Uses the PostgreSQL ``&&`` operator ("contains or is contained by"),
+    which evaluates two networks on their common prefix length and is
+    therefore true for equal, enclosing, and enclosed networks. The
+    operator uses a GiST index with ``inet_ops`` only, which the NetBox IP
+    fields do not have, so the lookup is evaluated row by row.
+    """
+
+    lookup_name = "net_overlaps"
+
+    def as_sql(self, compiler, connection) -> tuple[str, list]:
+        """Return the SQL fragment and parameters for the lookup."""
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} && {rhs}", [*lhs_params, *rhs_params]
+
+
+def register_lookups() -> None:
+    """Register the plugin lookups on the NetBox IP fields.
+
+    A lookup already provided by NetBox under the same name takes
+    precedence and is left untouched.
+    """
+    for field in (IPAddressField, IPNetworkField):
+        if NetOverlaps.lookup_name not in field.get_class_lookups():
+            field.register_lookup(NetOverlaps)
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Management command comparing an offline APIC snapshot with an ACI Fabric."""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models.fabric.fabrics import ACIFabric
+from ...services.diff import SnapshotDiff
+from ...services.snapshot import SnapshotError, iter_snapshot_tenants
+
+
+class Command(BaseCommand):
+    """Report the differences between an APIC snapshot and an ACI Fabric."""
+
+    help = (
+        "Compare the ACI Tenants of an offline APIC snapshot (JSON/XML/tar) "
+        "with an ACI Fabric and write the differences as JSON lines."
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Add the command line arguments."""
+        parser.add_argument("path", help="Path of the snapshot file or archive.")
+        parser.add_argument(
+            "--fabric", required=True, help="Name of the compared ACI Fabric."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Stream the differences to the standard output."""
+        try:
+            aci_fabric = ACIFabric.objects.get(name=options["fabric"])
+        except ACIFabric.DoesNotExist as exc:
+            raise CommandError(
+                f"ACI Fabric {options['fabric']} does not exist."
+            ) from exc
+
+        snapshot_diff = SnapshotDiff(aci_fabric)
+        try:
+            for diff in snapshot_diff.iter_diffs(
+                iter_snapshot_tenants(options["path"])
+            ):
+                self.stdout.write(json.dumps(diff.serialize(), default=str))
+        except SnapshotError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stderr.write(
+            "{added} added, {changed} changed, {deleted} deleted".format_map(
+                snapshot_diff.counts
+            )
+        )
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Management command ingesting an offline APIC snapshot."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models.fabric.fabrics import ACIFabric
+from ...services.ingest import (
+    BULK_BATCH_SIZE,
+    IngestResult,
+    SnapshotCheckpoint,
+    SnapshotIngester,
+)
+from ...services.snapshot import SnapshotError, iter_snapshot_tenants
+
+
+class Command(BaseCommand):
+    """Ingest the ACI Tenants of an APIC snapshot into an ACI Fabric."""
+
+    help = "Ingest the ACI Tenants of an offline APIC snapshot (JSON/XML/tar)."
+
+    def add_arguments(self, parser) -> None:
+        """Add the command line arguments."""
+        parser.add_argument("path", help="Path of the snapshot file or archive.")
+        parser.add_argument(
+            "--fabric", required=True, help="Name of the target ACI Fabric."
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Path of a checkpoint file to resume an interrupted ingest.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help="Number of objects written per database statement.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Ingest the snapshot and report the progress."""
+        try:
+            aci_fabric = ACIFabric.objects.get(name=options["fabric"])
+        except ACIFabric.DoesNotExist as exc:
+            raise CommandError(
+                f"ACI Fabric {options['fabric']} does not exist."
+            ) from exc
+
+        def progress(name: str, result: IngestResult) -> None:
+            self.stdout.write(
+                f"Ingested ACI Tenant {name} "
+                f"({len(result.tenants)} done, {len(result.errors)} error(s))"
+            )
+
+        checkpoint = (
+            SnapshotCheckpoint(options["checkpoint"]) if options["checkpoint"] else None
+        )
+        ingester = SnapshotIngester(aci_fabric, batch_size=options["batch_size"])
+        try:
+            result = ingester.ingest(
+                iter_snapshot_tenants(options["path"]),
+                checkpoint=checkpoint,
+                progress=progress,
+            )
+        except SnapshotError as exc:
+            raise CommandError(str(exc)) from exc
+
+        for error in result.errors:
+            self.stderr.write(f"Skipped {error['dn']}: {error['error']}")
+        for label, count in sorted(result.counts.items()):
+            self.stdout.write(f"{label}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Ingested {len(result.tenants)} ACI Tenant(s), skipped "
+                f"{len(result.skipped_tenants)} completed ACI Tenant(s)."
+            )
+        )
@@ -0,0 +1,278 @@
+import hashlib
+import json
+
+from django.db import migrations, models
+
+from netbox_aci_plugin import ACIConfig
+
+# Frozen copy of the content hash of netbox_aci_plugin.models.mixins at the
+# time of this migration, independent of later changes to the runtime hash
+CONTENT_HASH_EXCLUDED_FIELDS = frozenset(
+    {
+        "id",
+        "created",
+        "last_updated",
+        "custom_field_data",
+        "comments",
+        "owner",
+        "content_hash",
+    }
+)
+CONTENT_HASH_BATCH_SIZE = 1000
+
+CONTENT_HASH_MODELS = (
+    "ACIAppProfile",
+    "ACIBridgeDomain",
+    "ACIBridgeDomainL3OutBinding",
+    "ACIBridgeDomainSubnet",
+    "ACIContract",
+    "ACIContractFilter",
+    "ACIContractFilterEntry",
+    "ACIContractRelation",
+    "ACIContractSubject",
+    "ACIContractSubjectFilter",
+    "ACIEndpointGroup",
+    "ACIEndpointSecurityGroup",
+    "ACIEsgEndpointGroupSelector",
+    "ACIEsgEndpointSelector",
+    "ACIExternalEndpointGroup",
+    "ACIExternalSubnet",
+    "ACIL3Out",
+    "ACINode",
+    "ACIPod",
+    "ACIRoutedDomain",
+    "ACITenant",
+    "ACIUSegEndpointGroup",
+    "ACIUSegNetworkAttribute",
+    "ACIVRF",
+)
+
+
+def get_content_hash(instance: models.Model) -> str:
+    """Returns the SHA-256 content hash of a model instance."""
+    values = sorted(
+        (field.attname, field.value_to_string(instance))
+        for field in instance._meta.concrete_fields
+        if field.name not in CONTENT_HASH_EXCLUDED_FIELDS
+        and not field.name.startswith("_")
+    )
+    return hashlib.sha256(
+        json.dumps(values, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def compute_content_hashes(apps, schema_editor) -> None:
+    """Computes the content hashes of the existing objects."""
+    db_alias = schema_editor.connection.alias
+    for model_name in CONTENT_HASH_MODELS:
+        model = apps.get_model(ACIConfig.name, model_name)
+        queryset = model.objects.using(db_alias).all()
+        instances = []
+        for instance in queryset.iterator(chunk_size=CONTENT_HASH_BATCH_SIZE):
+            instance.content_hash = get_content_hash(instance)
+            instances.append(instance)
+        queryset.bulk_update(
+            instances, ("content_hash",), batch_size=CONTENT_HASH_BATCH_SIZE
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_aci_plugin", "0019_default_related_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aciappprofile",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acibridgedomain",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acibridgedomainl3outbinding",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acibridgedomainsubnet",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acicontract",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acicontractfilter",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acicontractfilterentry",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acicontractrelation",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acicontractsubject",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acicontractsubjectfilter",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciendpointgroup",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciendpointsecuritygroup",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciesgendpointgroupselector",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciesgendpointselector",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciexternalendpointgroup",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciexternalsubnet",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acil3out",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acinode",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acipod",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acirouteddomain",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acitenant",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciusegendpointgroup",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="aciusegnetworkattribute",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="acivrf",
+            name="content_hash",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=64
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(compute_content_hashes, migrations.RunPython.noop),
+    ]
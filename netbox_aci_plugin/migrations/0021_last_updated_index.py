@@ -0,0 +1,135 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_aci_plugin", "0020_content_hash"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="aciappprofile",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acibridgedomain",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acibridgedomainl3outbinding",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acibridgedomainsubnet",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acicontract",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acicontractfilter",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acicontractfilterentry",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acicontractrelation",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acicontractsubject",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acicontractsubjectfilter",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciendpointgroup",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciendpointsecuritygroup",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciesgendpointgroupselector",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciesgendpointselector",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciexternalendpointgroup",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciexternalsubnet",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acifabric",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acil3out",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acinode",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acipod",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acirouteddomain",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acitenant",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciusegendpointgroup",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="aciusegnetworkattribute",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="acivrf",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,134 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+from netbox_aci_plugin import ACIConfig
+from netbox_aci_plugin.services.memberships import get_esg_memberships
+
+
+def populate_esg_memberships(apps, schema_editor) -> None:
+    """Populate the ESG memberships from the existing selectors."""
+    membership_model = apps.get_model(ACIConfig.name, "ACIEsgMembership")
+    membership_model.objects.bulk_create(
+        (
+            membership_model(**values)
+            for values in get_esg_memberships(
+                apps.get_model(
+                    ACIConfig.name, "ACIEsgEndpointGroupSelector"
+                ).objects.all(),
+                apps.get_model(ACIConfig.name, "ACIEsgEndpointSelector").objects.all(),
+            )
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("netbox_aci_plugin", "0021_last_updated_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ACIEsgMembership",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                ("member_id", models.PositiveBigIntegerField(verbose_name="Member ID")),
+                (
+                    "aci_endpoint_security_group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="netbox_aci_plugin.aciendpointsecuritygroup",
+                        verbose_name="ACI Endpoint Security Group",
+                    ),
+                ),
+                (
+                    "aci_esg_endpoint_group_selector",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aci_esg_membership",
+                        to="netbox_aci_plugin.aciesgendpointgroupselector",
+                        verbose_name="ACI ESG Endpoint Group Selector",
+                    ),
+                ),
+                (
+                    "aci_esg_endpoint_selector",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aci_esg_membership",
+                        to="netbox_aci_plugin.aciesgendpointselector",
+                        verbose_name="ACI ESG Endpoint Selector",
+                    ),
+                ),
+                (
+                    "aci_vrf",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="netbox_aci_plugin.acivrf",
+                        verbose_name="ACI VRF",
+                    ),
+                ),
+                (
+                    "member_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                        verbose_name="Member Type",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ACI ESG Membership",
+                "ordering": (
+                    "aci_endpoint_security_group",
+                    "member_type",
+                    "member_id",
+                ),
+                "default_related_name": "aci_esg_memberships",
+                "indexes": [
+                    models.Index(
+                        fields=["member_type", "member_id"],
+                        name="netbox_aci__member__22feec_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "aci_endpoint_security_group",
+                            "member_type",
+                            "member_id",
+                        ),
+                        name=(
+                            "netbox_aci_plugin_aciesgmembership_unique_member_"
+                            "per_endpoint_security_group"
+                        ),
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            models.Q(
+                                ("aci_esg_endpoint_group_selector__isnull", False),
+                                ("aci_esg_endpoint_selector__isnull", True),
+                            ),
+                            models.Q(
+                                ("aci_esg_endpoint_group_selector__isnull", True),
+                                ("aci_esg_endpoint_selector__isnull", False),
+                            ),
+                            _connector="OR",
+                        ),
+                        name="netbox_aci_plugin_aciesgmembership_one_selector",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(populate_esg_memberships, migrations.RunPython.noop),
+    ]
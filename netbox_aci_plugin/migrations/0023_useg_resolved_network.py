@@ -0,0 +1,129 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+import dcim.fields
+import ipam.fields
+from netbox_aci_plugin import ACIConfig
+from netbox_aci_plugin.services.useg_networks import resolve_useg_networks
+
+
+def populate_useg_resolved_networks(apps, schema_editor) -> None:
+    """Populate the resolved networks from the existing uSeg attributes."""
+    network_model = apps.get_model(ACIConfig.name, "ACIUSegResolvedNetwork")
+    network_model.objects.bulk_create(
+        (
+            network_model(**values)
+            for values in resolve_useg_networks(
+                apps.get_model(ACIConfig.name, "ACIUSegNetworkAttribute").objects.all()
+            )
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_aci_plugin", "0022_esg_membership"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ACIUSegResolvedNetwork",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "prefix",
+                    ipam.fields.IPNetworkField(
+                        blank=True, null=True, verbose_name="prefix"
+                    ),
+                ),
+                (
+                    "mac_address",
+                    dcim.fields.MACAddressField(
+                        blank=True, null=True, verbose_name="MAC address"
+                    ),
+                ),
+                (
+                    "aci_bridge_domain_subnet",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="netbox_aci_plugin.acibridgedomainsubnet",
+                        verbose_name="ACI Bridge Domain Subnet",
+                    ),
+                ),
+                (
+                    "aci_useg_endpoint_group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="netbox_aci_plugin.aciusegendpointgroup",
+                        verbose_name="ACI uSeg Endpoint Group",
+                    ),
+                ),
+                (
+                    "aci_useg_network_attribute",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="netbox_aci_plugin.aciusegnetworkattribute",
+                        verbose_name="ACI uSeg Network Attribute",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ACI uSeg Resolved Network",
+                "ordering": ("aci_useg_endpoint_group", "prefix", "mac_address"),
+                "default_related_name": "aci_useg_resolved_networks",
+                "indexes": [
+                    models.Index(
+                        fields=["prefix"], name="netbox_aci__prefix_277a93_idx"
+                    ),
+                    models.Index(
+                        fields=["mac_address"], name="netbox_aci__mac_add_f0c031_idx"
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("aci_bridge_domain_subnet__isnull", True)),
+                        fields=("aci_useg_network_attribute",),
+                        name=(
+                            "netbox_aci_plugin_aciusegresolvednetwork_unique_"
+                            "network_per_attribute"
+                        ),
+                    ),
+                    models.UniqueConstraint(
+                        fields=(
+                            "aci_useg_network_attribute",
+                            "aci_bridge_domain_subnet",
+                        ),
+                        name=(
+                            "netbox_aci_plugin_aciusegresolvednetwork_unique_"
+                            "subnet_per_attribute"
+                        ),
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            models.Q(
+                                ("mac_address__isnull", True),
+                                ("prefix__isnull", False),
+                            ),
+                            models.Q(
+                                ("mac_address__isnull", False),
+                                ("prefix__isnull", True),
+                            ),
+                            _connector="OR",
+                        ),
+                        name="netbox_aci_plugin_aciusegresolvednetwork_one_network",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            populate_useg_resolved_networks, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,97 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+import ipam.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("netbox_aci_plugin", "0023_useg_resolved_network"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ACIRouteLeak",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "source_id",
+                    models.PositiveBigIntegerField(verbose_name="source ID"),
+                ),
+                ("prefix", ipam.fields.IPNetworkField(verbose_name="prefix")),
+                (
+                    "aggregate",
+                    models.BooleanField(default=False, verbose_name="aggregate"),
+                ),
+                (
+                    "shared_security_enabled",
+                    models.BooleanField(
+                        default=False, verbose_name="shared security enabled"
+                    ),
+                ),
+                (
+                    "aci_fabric",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="netbox_aci_plugin.acifabric",
+                        verbose_name="ACI Fabric",
+                    ),
+                ),
+                (
+                    "aci_vrf",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="netbox_aci_plugin.acivrf",
+                        verbose_name="ACI VRF",
+                    ),
+                ),
+                (
+                    "source_aci_vrf",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="netbox_aci_plugin.acivrf",
+                        verbose_name="source ACI VRF",
+                    ),
+                ),
+                (
+                    "source_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                        verbose_name="source type",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ACI Route Leak",
+                "ordering": ("aci_vrf", "prefix", "source_type", "source_id"),
+                "default_related_name": "aci_route_leaks",
+                "indexes": [
+                    models.Index(
+                        fields=["source_type", "source_id"],
+                        name="netbox_aci__source__d3cee6_idx",
+                    ),
+                    models.Index(
+                        fields=["prefix"], name="netbox_aci__prefix_b63877_idx"
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("aci_vrf", "source_type", "source_id", "prefix"),
+                        name=(
+                            "netbox_aci_plugin_acirouteleak_unique_prefix_"
+                            "per_source_and_aci_vrf"
+                        ),
+                    ),
+                ],
+            },
+        ),
+    ]
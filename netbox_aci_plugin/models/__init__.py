@@ -21,11 +21,13 @@ from .tenant.endpoint_groups import (
     ACIEndpointGroup,
     ACIUSegEndpointGroup,
     ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
 )
 from .tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroup,
     ACIEsgEndpointGroupSelector,
     ACIEsgEndpointSelector,
+    ACIEsgMembership,
 )
 from .tenant.l3outs import (
     ACIExternalEndpointGroup,
@@ -33,7 +35,7 @@ from .tenant.l3outs import (
     ACIL3Out,
 )
 from .tenant.tenants import ACITenant
-from .tenant.vrfs import ACIVRF
+from .tenant.vrfs import ACIVRF, ACIRouteLeak
 
 __all__ = (
     "ACIVRF",
@@ -51,14 +53,17 @@ __all__ = (
     "ACIEndpointSecurityGroup",
     "ACIEsgEndpointGroupSelector",
     "ACIEsgEndpointSelector",
+    "ACIEsgMembership",
     "ACIExternalEndpointGroup",
     "ACIExternalSubnet",
     "ACIFabric",
     "ACIL3Out",
     "ACINode",
     "ACIPod",
+    "ACIRouteLeak",
     "ACIRoutedDomain",
     "ACITenant",
     "ACIUSegEndpointGroup",
     "ACIUSegNetworkAttribute",
+    "ACIUSegResolvedNetwork",
 )
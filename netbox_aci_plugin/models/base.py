@@ -15,23 +15,25 @@ from netbox.models import NetBoxModel
 from netbox.models.mixins import OwnerMixin
 
 from ..constants import ACI_DESC_MAX_LEN, ACI_NAME_MAX_LEN
+from ..permissions import ACIRestrictedQuerySet
 from ..validators import (
     ACIPolicyDescriptionValidator,
     ACIPolicyNameOptionalValidator,
     ACIPolicyNameRequiredValidator,
 )
+from .mixins import ContentHashMixin, LastUpdatedIndexMixin
 
 if TYPE_CHECKING:
     from .fabric.fabrics import ACIFabric
     from .tenant.tenants import ACITenant
 
 
-class ACIBaseModel(OwnerMixin, NetBoxModel):
+class ACIBaseModel(LastUpdatedIndexMixin, ContentHashMixin, OwnerMixin, NetBoxModel):
     """Abstract base for every primary ACI policy object.
 
     Provides the common identity and ownership fields (name,
-    name alias, description, NetBox tenant, comments) and the
-    ``parent_object`` contract used throughout the plugin.
+    name alias, description, NetBox tenant, comments), the content
+    hash, and the ``parent_object`` contract used throughout the plugin.
     """
 
     name = models.CharField(
@@ -64,6 +66,8 @@ class ACIBaseModel(OwnerMixin, NetBoxModel):
         blank=True,
     )
 
+    objects = ACIRestrictedQuerySet.as_manager()
+
     clone_fields: tuple = (
         "description",
         "nb_tenant",
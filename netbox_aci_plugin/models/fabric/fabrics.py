@@ -23,10 +23,12 @@ from ...constants import (
     VLAN_VID_MAX,
     VLAN_VID_MIN,
 )
+from ...permissions import ACIRestrictedQuerySet
 from ...validators import ACIPolicyDescriptionValidator, ACIPolicyNameRequiredValidator
+from ..mixins import LastUpdatedIndexMixin
 
 
-class ACIFabric(CachedScopeMixin, OwnerMixin, NetBoxModel):
+class ACIFabric(LastUpdatedIndexMixin, CachedScopeMixin, OwnerMixin, NetBoxModel):
     """Top-level ACI fabric that all other ACI objects belong to.
 
     Represents one APIC-managed fabric, identified by a fabric ID
@@ -100,6 +102,8 @@ class ACIFabric(CachedScopeMixin, OwnerMixin, NetBoxModel):
         blank=True,
     )
 
+    objects = ACIRestrictedQuerySet.as_manager()
+
     clone_fields: tuple = (
         "description",
         "infra_vlan_vid",
@@ -4,8 +4,110 @@
 
 """Reusable model mixins for ACI policy objects."""
 
+import hashlib
+import json
+
 from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.db.models import QuerySet
 from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy
+
+# Fields excluded from the content hash (bookkeeping or NetBox-only)
+CONTENT_HASH_EXCLUDED_FIELDS: frozenset[str] = frozenset(
+    {
+        "id",
+        "created",
+        "last_updated",
+        "custom_field_data",
+        "comments",
+        "owner",
+        "content_hash",
+    }
+)
+CONTENT_HASH_BATCH_SIZE = 1000
+
+
+def get_content_hash(instance: models.Model) -> str:
+    """Return the SHA-256 content hash of a model instance.
+
+    The hash covers the normalized string values of the concrete fields
+    (related objects by their primary key), except the bookkeeping fields
+    and the cached relations prefixed with an underscore.
+    """
+    values = sorted(
+        (field.attname, field.value_to_string(instance))
+        for field in instance._meta.concrete_fields
+        if field.name not in CONTENT_HASH_EXCLUDED_FIELDS
+        and not field.name.startswith("_")
+    )
+    return hashlib.sha256(
+        json.dumps(values, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def update_content_hashes(
+    queryset: QuerySet, batch_size: int = CONTENT_HASH_BATCH_SIZE
+) -> int:
+    """Recompute the content hashes of the objects of a queryset.
+
+    Bulk writes bypass ``save()``, so the hashes of the written objects
+    must be updated afterward. Returns the number of updated objects.
+    """
+    changed = []
+    for instance in queryset.iterator(chunk_size=batch_size):
+        content_hash = get_content_hash(instance)
+        if instance.content_hash != content_hash:
+            instance.content_hash = content_hash
+            changed.append(instance)
+    queryset.bulk_update(changed, ("content_hash",), batch_size=batch_size)
+    return len(changed)
+
+
+class LastUpdatedIndexMixin(models.Model):
+    """Index the ``last_updated`` timestamp of the change logging.
+
+    Overrides the field of NetBox's change logging mixin, so that the
+    conditional requests and the change feed of the API filter and
+    aggregate the timestamp with an index.
+    """
+
+    last_updated = models.DateTimeField(
+        verbose_name=gettext_lazy("last updated"),
+        auto_now=True,
+        blank=True,
+        null=True,
+        db_index=True,
+    )
+
+    class Meta:
+        abstract = True
+
+
+class ContentHashMixin(models.Model):
+    """Maintain a hash of the ACI-relevant field values of an object.
+
+    The indexed hash allows sync clients to detect changed objects without
+    fetching and comparing their full representation.
+    """
+
+    content_hash = models.CharField(
+        verbose_name=gettext_lazy("content hash"),
+        max_length=64,
+        editable=False,
+        db_index=True,
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs) -> None:
+        """Update the content hash and save the instance."""
+        self.content_hash = get_content_hash(self)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "content_hash"}
+        super().save(*args, **kwargs)
 
 
 class UniqueGenericForeignKeyMixin:
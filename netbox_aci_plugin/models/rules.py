@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Declarative validation rule tables of the ACI models.
+
+A rule table lists the validation rules of a model. Each rule is a
+condition (``Q`` object) over the fields of the object and of its parent
+objects (by their lookup path, e.g. ``aci_l3out__bgp_enabled``), matched by
+the invalid objects, with the fields and the message of the error.
+
+The same table validates a single object from its field values and its
+related objects, or a batch of objects with a single query reading the
+field values of the objects and their parents. For a batch, parent objects
+may be given as instances with unsaved changes, which tells the objects
+invalidated by changing the parent before it is saved. The parent values
+are then bound into the rule conditions, so the query reads the objects
+violating a rule only.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from functools import reduce
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+# Python equivalents of the lookups supported in rule conditions
+LOOKUPS: dict[str, Callable[[Any, Any], bool]] = {
+    "exact": operator.eq,
+    "isnull": lambda value, isnull: (value is None) == isnull,
+    "net_mask_length": lambda value, length: (
+        value is not None and value.prefixlen == length
+    ),
+}
+
+
+# Conditions matching no object and all objects
+_FALSE = Q(pk__in=[])
+_TRUE = ~_FALSE
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """Validation rule violated by the objects matching the condition."""
+
+    fields: tuple[str, ...]
+    condition: Q
+    message: str
+
+
+class RuleTable:
+    """Table of validation rules evaluated per object or per batch."""
+
+    def __init__(self, *rules: Rule) -> None:
+        """Initialize the table with the rules in evaluation order."""
+        self.rules = rules
+        self._lookups: dict[type[Model], dict[str, tuple[str, str]]] = {}
+
+    def get_lookups(self, model: type[Model]) -> dict[str, tuple[str, str]]:
+        """Return the field paths and lookup types of the rule lookups."""
+        if model not in self._lookups:
+            self._lookups[model] = {
+                lookup: _split_lookup(model, lookup)
+                for rule in self.rules
+                for lookup in _iter_lookups(rule.condition)
+            }
+        return self._lookups[model]
+
+    def get_parent_rules(self, parent_path: str) -> RuleTable:
+        """Return the table of the rules depending on a parent object."""
+        prefix = f"{parent_path}{LOOKUP_SEP}"
+        return RuleTable(
+            *(
+                rule
+                for rule in self.rules
+                if any(
+                    lookup.startswith(prefix)
+                    for lookup in _iter_lookups(rule.condition)
+                )
+            )
+        )
+
+    def check(self, instance: Model) -> dict[str, list[str]]:
+        """Return the error messages of the rules violated by an instance."""
+        lookups = self.get_lookups(type(instance))
+        values = {path: _resolve(instance, path) for path, _type in lookups.values()}
+        return self._check(values, lookups)
+
+    def check_batch(
+        self, queryset: QuerySet, parents: Mapping[str, Model] | None = None
+    ) -> dict[int, dict[str, list[str]]]:
+        """Return the error messages of the invalid objects by their ID.
+
+        The field values of the objects and their parents are read with one
+        query. The values of the parents given by their lookup path are
+        taken from the given instances instead.
+        """
+        lookups = self.get_lookups(queryset.model)
+        paths = {path for path, _type in lookups.values()}
+        overrides = {}
+        for parent_path, parent in (parents or {}).items():
+            prefix = f"{parent_path}{LOOKUP_SEP}"
+            for path in paths:
+                if path.startswith(prefix):
+                    overrides[path] = _resolve(parent, path.removeprefix(prefix))
+
+        if overrides:
+            queryset = queryset.filter(
+                reduce(
+                    operator.or_,
+                    (_bind(rule.condition, overrides, lookups) for rule in self.rules),
+                    _FALSE,
+                )
+            )
+
+        invalid = {}
+        for row in queryset.values("pk", *paths.difference(overrides)):
+            if errors := self._check({**row, **overrides}, lookups):
+                invalid[row["pk"]] = errors
+        return invalid
+
+    def _check(
+        self, values: Mapping[str, Any], lookups: dict[str, tuple[str, str]]
+    ) -> dict[str, list[str]]:
+        """Return the error messages of the rules violated by the values."""
+        errors: dict[str, list[str]] = {}
+        for rule in self.rules:
+            if _matches(rule.condition, values, lookups):
+                for name in rule.fields:
+                    errors.setdefault(name, []).append(rule.message)
+        return errors
+
+
+def _iter_lookups(condition: Q) -> Iterator[str]:
+    """Yield the lookups of a condition."""
+    for child in condition.children:
+        if isinstance(child, Q):
+            yield from _iter_lookups(child)
+        else:
+            yield child[0]
+
+
+def _bind(
+    condition: Q, values: Mapping[str, Any], lookups: dict[str, tuple[str, str]]
+) -> Q:
+    """Return the condition with the lookups of the given values evaluated."""
+    bound = Q(_connector=condition.connector, _negated=condition.negated)
+    for child in condition.children:
+        if isinstance(child, Q):
+            bound.children.append(_bind(child, values, lookups))
+            continue
+        lookup, value = child
+        path, lookup_type = lookups[lookup]
+        if path not in values:
+            bound.children.append(child)
+        elif LOOKUPS[lookup_type](values[path], value):
+            bound.children.append(_TRUE)
+        else:
+            bound.children.append(_FALSE)
+    return bound
+
+
+def _split_lookup(model: type[Model], lookup: str) -> tuple[str, str]:
+    """Return the field path and the lookup type of a lookup."""
+    parts = lookup.split(LOOKUP_SEP)
+    path = []
+    opts = model._meta
+    for part in parts:
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            break
+        path.append(part)
+        if not field.is_relation:
+            break
+        opts = field.related_model._meta
+    lookup_type = LOOKUP_SEP.join(parts[len(path) :]) or "exact"
+    return LOOKUP_SEP.join(path), lookup_type
+
+
+def _resolve(obj: Model, path: str) -> Any:
+    """Return the field value of an object by its path.
+
+    Related objects are given by their ID. Missing parent objects resolve
+    to None.
+    """
+    *relations, name = path.split(LOOKUP_SEP)
+    for relation in relations:
+        # A missing required relation raises a subclass of AttributeError
+        if (obj := getattr(obj, relation, None)) is None:
+            return None
+    return getattr(obj, obj._meta.get_field(name).attname)
+
+
+def _matches(
+    condition: Q, values: Mapping[str, Any], lookups: dict[str, tuple[str, str]]
+) -> bool:
+    """Return whether the field values match the condition."""
+
+    def evaluate(child: Q | tuple[str, Any]) -> bool:
+        if isinstance(child, Q):
+            return _matches(child, values, lookups)
+        lookup, value = child
+        path, lookup_type = lookups[lookup]
+        return LOOKUPS[lookup_type](values[path], value)
+
+    results = map(evaluate, condition.children)
+    matched = all(results) if condition.connector == Q.AND else any(results)
+    return matched != condition.negated
@@ -22,8 +22,10 @@ from ...choices import (
     BDUnknownUnicastChoices,
 )
 from ...constants import ACI_NAME_MAX_LEN
+from ...permissions import ACIRestrictedQuerySet
 from ...validators import ACIPolicyNameOptionalValidator
 from ..base import ACITenantBaseModel
+from ..mixins import ContentHashMixin, LastUpdatedIndexMixin
 
 if TYPE_CHECKING:
     from core.models import ObjectChange
@@ -482,6 +484,43 @@ class ACIBridgeDomainSubnet(ACITenantBaseModel):
         ordering: tuple = ("aci_bridge_domain", "name")
         verbose_name: str = _("ACI Bridge Domain Subnet")
 
+    def clean(self) -> None:
+        """Override the model's clean method for custom field validation."""
+        super().clean()
+
+        errors = {}
+
+        # Validate the gateway subnet does not overlap with a subnet of
+        # another ACIBridgeDomain using the same ACIVRF (including ACI Bridge
+        # Domains of other ACITenants using an ACIVRF in 'common')
+        if (
+            self.aci_bridge_domain_id
+            and self.gateway_ip_address_id
+            and self.get_overlapping_subnets().exists()
+        ):
+            errors.setdefault("gateway_ip_address", []).append(
+                _(
+                    "The gateway IP address must not overlap with a subnet "
+                    "of another ACI Bridge Domain in the same ACI VRF."
+                )
+            )
+
+        if errors:
+            raise ValidationError(errors)
+
+    def get_overlapping_subnets(self) -> models.QuerySet:
+        """Return subnets of other BDs in the same VRF overlapping this one.
+
+        The overlap is not backed by an index on the IP address (NetBox has
+        no GiST index on ``ipam_ipaddress.address``); the subnets are found
+        by the foreign key indexes of the VRF and the overlap is evaluated
+        per subnet of the VRF.
+        """
+        return ACIBridgeDomainSubnet.objects.filter(
+            aci_bridge_domain__aci_vrf_id=self.aci_bridge_domain.aci_vrf_id,
+            gateway_ip_address__address__net_overlaps=self.gateway_ip_address.address,
+        ).exclude(aci_bridge_domain_id=self.aci_bridge_domain_id)
+
     def to_objectchange(self, action):
         """Return an ObjectChange for the change made to an instance."""
         objectchange = super().to_objectchange(action)
@@ -504,7 +543,7 @@ class ACIBridgeDomainSubnet(ACITenantBaseModel):
         return self.aci_bridge_domain
 
 
-class ACIBridgeDomainL3OutBinding(NetBoxModel):
+class ACIBridgeDomainL3OutBinding(LastUpdatedIndexMixin, ContentHashMixin, NetBoxModel):
     """Association between a bridge domain and an L3Out.
 
     Links one ACIBridgeDomain to one ACIL3Out so the bridge domain
@@ -533,6 +572,8 @@ class ACIBridgeDomainL3OutBinding(NetBoxModel):
         blank=True,
     )
 
+    objects = ACIRestrictedQuerySet.as_manager()
+
     clone_fields: tuple = (
         "aci_bridge_domain",
         "aci_l3out",
@@ -27,9 +27,14 @@ from ...choices import (
     QualityOfServiceDSCPChoices,
 )
 from ...constants import ACI_NAME_MAX_LEN, CONTRACT_RELATION_OBJECT_TYPES
+from ...permissions import ACIRestrictedQuerySet
 from ...validators import ACIPolicyNameOptionalValidator
 from ..base import ACITenantBaseModel
-from ..mixins import UniqueGenericForeignKeyMixin
+from ..mixins import (
+    ContentHashMixin,
+    LastUpdatedIndexMixin,
+    UniqueGenericForeignKeyMixin,
+)
 from .endpoint_groups import ACIEndpointGroup, ACIUSegEndpointGroup
 from .endpoint_security_groups import ACIEndpointSecurityGroup
 
@@ -125,7 +130,12 @@ class ACIContract(ACITenantBaseModel):
         return ContractScopeChoices.colors.get(self.scope)
 
 
-class ACIContractRelation(NetBoxModel, UniqueGenericForeignKeyMixin):
+class ACIContractRelation(
+    LastUpdatedIndexMixin,
+    ContentHashMixin,
+    NetBoxModel,
+    UniqueGenericForeignKeyMixin,
+):
     """Provider or consumer attachment of a contract to an object.
 
     Links an ACIContract to an endpoint group, uSeg endpoint group,
@@ -223,6 +233,8 @@ class ACIContractRelation(NetBoxModel, UniqueGenericForeignKeyMixin):
         null=True,
     )
 
+    objects = ACIRestrictedQuerySet.as_manager()
+
     clone_fields: tuple = (
         "aci_contract",
         "aci_object_type",
@@ -604,7 +616,7 @@ class ACIContractSubject(ACITenantBaseModel):
         return QualityOfServiceClassChoices.colors.get(self.qos_class_prov_to_cons)
 
 
-class ACIContractSubjectFilter(NetBoxModel):
+class ACIContractSubjectFilter(LastUpdatedIndexMixin, ContentHashMixin, NetBoxModel):
     """Attachment of a contract filter to a contract subject.
 
     Applies one ACIContractFilter to one ACIContractSubject with an
@@ -679,6 +691,8 @@ class ACIContractSubjectFilter(NetBoxModel):
         blank=True,
     )
 
+    objects = ACIRestrictedQuerySet.as_manager()
+
     clone_fields: tuple = (
         "aci_contract_subject",
         "action",
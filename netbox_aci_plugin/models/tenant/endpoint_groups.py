@@ -17,7 +17,9 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from dcim.fields import MACAddressField
 from dcim.models import MACAddress
+from ipam.fields import IPNetworkField
 from ipam.models import IPAddress, Prefix
 
 from ...choices import (
@@ -605,6 +607,86 @@ class ACIUSegNetworkAttribute(ACIUSegAttributeBaseModel, UniqueGenericForeignKey
     set_attribute_type.alters_data = True
 
 
+#
+# ACI uSeg Resolved Network
+#
+
+
+class ACIUSegResolvedNetwork(models.Model):
+    """Network matched by a uSeg network attribute, resolved to its value.
+
+    Mirrors the prefix or MAC address matched by a uSeg network attribute:
+    the host prefix of an IP address, the prefix of a prefix, the MAC
+    address of a MAC address, or, for an attribute using the EPG subnet,
+    one row per subnet of the bridge domain of the uSeg endpoint group.
+
+    Notes:
+        The rows are derived data maintained by the uSeg network service;
+        they are deleted with their attribute or bridge domain subnet.
+    """
+
+    aci_useg_endpoint_group = models.ForeignKey(
+        to="netbox_aci_plugin.ACIUSegEndpointGroup",
+        on_delete=models.CASCADE,
+        verbose_name=_("ACI uSeg Endpoint Group"),
+    )
+    aci_useg_network_attribute = models.ForeignKey(
+        to="netbox_aci_plugin.ACIUSegNetworkAttribute",
+        on_delete=models.CASCADE,
+        verbose_name=_("ACI uSeg Network Attribute"),
+    )
+    aci_bridge_domain_subnet = models.ForeignKey(
+        to="netbox_aci_plugin.ACIBridgeDomainSubnet",
+        on_delete=models.CASCADE,
+        verbose_name=_("ACI Bridge Domain Subnet"),
+        blank=True,
+        null=True,
+    )
+    prefix = IPNetworkField(
+        verbose_name=_("prefix"),
+        blank=True,
+        null=True,
+    )
+    mac_address = MACAddressField(
+        verbose_name=_("MAC address"),
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        constraints: list[models.BaseConstraint] = [
+            models.UniqueConstraint(
+                fields=("aci_useg_network_attribute",),
+                name="%(app_label)s_%(class)s_unique_network_per_attribute",
+                condition=models.Q(aci_bridge_domain_subnet__isnull=True),
+            ),
+            models.UniqueConstraint(
+                fields=("aci_useg_network_attribute", "aci_bridge_domain_subnet"),
+                name="%(app_label)s_%(class)s_unique_subnet_per_attribute",
+            ),
+            models.CheckConstraint(
+                condition=(
+                    models.Q(prefix__isnull=False, mac_address__isnull=True)
+                    | models.Q(prefix__isnull=True, mac_address__isnull=False)
+                ),
+                name="%(app_label)s_%(class)s_one_network",
+            ),
+        ]
+        default_related_name: str = "aci_useg_resolved_networks"
+        indexes: tuple = (
+            models.Index(fields=("prefix",)),
+            models.Index(fields=("mac_address",)),
+        )
+        ordering: tuple = ("aci_useg_endpoint_group", "prefix", "mac_address")
+        verbose_name: str = _("ACI uSeg Resolved Network")
+
+    def __str__(self) -> str:
+        """Return string representation of the instance."""
+        return (
+            f"{self.prefix or self.mac_address} ({self.aci_useg_endpoint_group.name})"
+        )
+
+
 #
 # Generic Relations: ACIUSegNetworkAttribute
 #
@@ -578,3 +578,99 @@ GenericRelation(
     object_id_field="ep_object_id",
     related_query_name="prefix",
 ).contribute_to_class(Prefix, name="aci_esg_endpoint_selectors")
+
+
+#
+# ACI Endpoint Security Group (ESG) Membership
+#
+
+
+class ACIEsgMembership(models.Model):
+    """Member of an ESG materialized from one of its selectors.
+
+    Mirrors the object selected by an ESG selector (an endpoint group, a
+    uSeg endpoint group, an IP address or a prefix) with the VRF of the
+    member, so the members of any number of ESGs, or the ESGs of any number
+    of members, are read with a single join.
+
+    Notes:
+        The rows are derived data maintained by the ESG membership
+        service; they are deleted with their selector. The VRF of an
+        endpoint group is the VRF of its bridge domain; the VRF of an
+        endpoint is the VRF of the ESG.
+    """
+
+    aci_endpoint_security_group = models.ForeignKey(
+        to="netbox_aci_plugin.ACIEndpointSecurityGroup",
+        on_delete=models.CASCADE,
+        verbose_name=_("ACI Endpoint Security Group"),
+    )
+    aci_esg_endpoint_group_selector = models.OneToOneField(
+        to="netbox_aci_plugin.ACIEsgEndpointGroupSelector",
+        on_delete=models.CASCADE,
+        related_name="aci_esg_membership",
+        verbose_name=_("ACI ESG Endpoint Group Selector"),
+        blank=True,
+        null=True,
+    )
+    aci_esg_endpoint_selector = models.OneToOneField(
+        to="netbox_aci_plugin.ACIEsgEndpointSelector",
+        on_delete=models.CASCADE,
+        related_name="aci_esg_membership",
+        verbose_name=_("ACI ESG Endpoint Selector"),
+        blank=True,
+        null=True,
+    )
+    member_type = models.ForeignKey(
+        to="contenttypes.ContentType",
+        on_delete=models.PROTECT,
+        related_name="+",
+        verbose_name=_("Member Type"),
+    )
+    member_id = models.PositiveBigIntegerField(
+        verbose_name=_("Member ID"),
+    )
+    member = GenericForeignKey(
+        ct_field="member_type",
+        fk_field="member_id",
+    )
+    aci_vrf = models.ForeignKey(
+        to="netbox_aci_plugin.ACIVRF",
+        on_delete=models.CASCADE,
+        verbose_name=_("ACI VRF"),
+    )
+
+    class Meta:
+        constraints: list[models.BaseConstraint] = [
+            models.UniqueConstraint(
+                fields=(
+                    "aci_endpoint_security_group",
+                    "member_type",
+                    "member_id",
+                ),
+                name=(
+                    "%(app_label)s_%(class)s_unique_member_per_endpoint_security_group"
+                ),
+            ),
+            models.CheckConstraint(
+                condition=(
+                    models.Q(
+                        aci_esg_endpoint_group_selector__isnull=False,
+                        aci_esg_endpoint_selector__isnull=True,
+                    )
+                    | models.Q(
+                        aci_esg_endpoint_group_selector__isnull=True,
+                        aci_esg_endpoint_selector__isnull=False,
+                    )
+                ),
+                name="%(app_label)s_%(class)s_one_selector",
+            ),
+        ]
+        default_related_name: str = "aci_esg_memberships"
+        indexes: tuple = (models.Index(fields=("member_type", "member_id")),)
+        ordering: tuple = ("aci_endpoint_security_group", "member_type", "member_id")
+        verbose_name: str = _("ACI ESG Membership")
+
+    def __str__(self) -> str:
+        """Return string representation of the instance."""
+        return f"{self.member} ({self.aci_endpoint_security_group.name})"
@@ -6,11 +6,13 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from django.contrib.contenttypes.fields import GenericRelation
-from django.core.exceptions import ValidationError
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from ipam.fields import IPNetworkField
@@ -19,6 +21,7 @@ from ...choices import QualityOfServiceClassChoices, QualityOfServiceDSCPChoices
 from ...constants import ACI_NAME_MAX_LEN
 from ...validators import ACIPolicyNameOptionalValidator
 from ..base import ACITenantBaseModel
+from ..rules import Rule, RuleTable
 
 if TYPE_CHECKING:
     from core.models import ObjectChange
@@ -27,6 +30,297 @@ if TYPE_CHECKING:
     from .vrfs import ACIVRF
 
 
+# Lookup path of the parent ACI L3Out of an ACI External Subnet
+EXTERNAL_SUBNET_L3OUT_PATH = "aci_external_endpoint_group__aci_l3out"
+
+
+def _l3out(**lookups) -> Q:
+    """Return a condition on the parent ACI L3Out of an ACI External Subnet."""
+    return Q(
+        **{
+            f"{EXTERNAL_SUBNET_L3OUT_PATH}__{lookup}": value
+            for lookup, value in lookups.items()
+        }
+    )
+
+
+# Validation rules of the ACI L3Out flags and policies
+L3OUT_RULES = RuleTable(
+    Rule(
+        fields=("multipod_enabled",),
+        condition=Q(multipod_enabled=True, aci_tenant__isnull=False)
+        & ~Q(aci_tenant__name="infra"),
+        message=_(
+            "Multi-Pod can only be enabled for L3Outs in the 'infra' ACI Tenant."
+        ),
+    ),
+    Rule(
+        fields=("eigrp_enabled",),
+        condition=Q(eigrp_enabled=True) & (Q(bgp_enabled=True) | Q(ospf_enabled=True)),
+        message=_(
+            "EIGRP cannot be enabled together with BGP or OSPF on the same ACI L3Out."
+        ),
+    ),
+    Rule(
+        fields=("import_route_control_enforcement_enabled",),
+        condition=Q(
+            import_route_control_enforcement_enabled=True,
+            bgp_enabled=False,
+            ospf_enabled=False,
+        ),
+        message=_(
+            "Import route control enforcement requires BGP or OSPF "
+            "to be enabled for the ACI L3Out."
+        ),
+    ),
+    # APIC always enforces export route control for L3Outs
+    Rule(
+        fields=("export_route_control_enforcement_enabled",),
+        condition=Q(export_route_control_enforcement_enabled=False),
+        message=_("Export route control enforcement is always enabled by APIC."),
+    ),
+    Rule(
+        fields=("ospf_external_policy_name",),
+        condition=~Q(ospf_external_policy_name="") & Q(ospf_enabled=False),
+        message=_(
+            "An OSPF external policy can only be assigned when "
+            "OSPF is enabled for the ACI L3Out."
+        ),
+    ),
+    Rule(
+        fields=("eigrp_interface_policy_name",),
+        condition=~Q(eigrp_interface_policy_name="") & Q(eigrp_enabled=False),
+        message=_(
+            "An EIGRP interface policy can only be assigned when "
+            "EIGRP is enabled for the ACI L3Out."
+        ),
+    ),
+    Rule(
+        fields=("pim_policy_name",),
+        condition=~Q(pim_policy_name="")
+        & Q(l3_multicast_ipv4_enabled=False, l3_multicast_ipv6_enabled=False),
+        message=_(
+            "A PIM policy can only be assigned when L3 multicast "
+            "IPv4 or IPv6 is enabled for the ACI L3Out."
+        ),
+    ),
+    Rule(
+        fields=("igmp_interface_policy_name",),
+        condition=~Q(igmp_interface_policy_name="")
+        & Q(l3_multicast_ipv4_enabled=False),
+        message=_(
+            "An IGMP interface policy can only be assigned when "
+            "L3 multicast IPv4 is enabled for the ACI L3Out."
+        ),
+    ),
+)
+
+_ROUTE_SUMMARIZATION_ENABLED = (
+    Q(bgp_route_summarization_enabled=True)
+    | Q(ospf_route_summarization_enabled=True)
+    | Q(eigrp_route_summarization_enabled=True)
+)
+
+# Validation rules of the ACI External Subnet flags and the parent ACI L3Out
+# flags they depend on
+EXTERNAL_SUBNET_RULES = RuleTable(
+    # Import Route Control Subnet is only meaningful when Import Route
+    # Control Enforcement is enabled on the parent L3Out. In APIC this is an
+    # L3Out-level option and is supported for BGP and OSPF, but not for
+    # EIGRP.
+    Rule(
+        fields=("import_route_control_enabled",),
+        condition=Q(import_route_control_enabled=True)
+        & _l3out(import_route_control_enforcement_enabled=False),
+        message=_(
+            "Import route control can only be enabled when import "
+            "route control enforcement is enabled on the parent "
+            "ACI L3Out."
+        ),
+    ),
+    Rule(
+        fields=("import_route_control_enabled",),
+        condition=Q(import_route_control_enabled=True)
+        & _l3out(eigrp_enabled=True, bgp_enabled=False, ospf_enabled=False),
+        message=_(
+            "Import route control is supported for BGP and OSPF "
+            "L3Outs, but not for EIGRP-only L3Outs."
+        ),
+    ),
+    # Aggregate Import and Aggregate Export are refinements of their
+    # matching route-control scopes. They must not be enabled without the
+    # corresponding base route-control flag.
+    Rule(
+        fields=("aggregate_import_route_control_enabled",),
+        condition=Q(
+            aggregate_import_route_control_enabled=True,
+            import_route_control_enabled=False,
+        ),
+        message=_(
+            "Aggregate import route control requires import route "
+            "control to be enabled."
+        ),
+    ),
+    Rule(
+        fields=("aggregate_export_route_control_enabled",),
+        condition=Q(
+            aggregate_export_route_control_enabled=True,
+            export_route_control_enabled=False,
+        ),
+        message=_(
+            "Aggregate export route control requires export route "
+            "control to be enabled."
+        ),
+    ),
+    Rule(
+        fields=("aggregate_shared_route_control_enabled",),
+        condition=Q(
+            aggregate_shared_route_control_enabled=True,
+            shared_route_control_enabled=False,
+        ),
+        message=_(
+            "Aggregate shared route control requires shared route "
+            "control to be enabled."
+        ),
+    ),
+    # ACI supports Aggregate Import and Aggregate Export only for the
+    # default-route subnet. Treat both IPv4 0.0.0.0/0 and IPv6 ::/0 as
+    # default routes by checking prefix length 0.
+    Rule(
+        fields=("aggregate_import_route_control_enabled",),
+        condition=Q(aggregate_import_route_control_enabled=True)
+        & ~Q(matched_prefix__net_mask_length=0),
+        message=_(
+            "Aggregate import route control can only be enabled "
+            "for a default-route prefix."
+        ),
+    ),
+    Rule(
+        fields=("aggregate_export_route_control_enabled",),
+        condition=Q(aggregate_export_route_control_enabled=True)
+        & ~Q(matched_prefix__net_mask_length=0),
+        message=_(
+            "Aggregate export route control can only be enabled "
+            "for a default-route prefix."
+        ),
+    ),
+    # Shared Security Import leaks the prefix-to-pcTag mapping for shared
+    # L3Out contracts. ACI requires the subnet to be classified as an
+    # External Subnet for the External EPG first; otherwise the original VRF
+    # does not know which External EPG the prefix belongs to.
+    Rule(
+        fields=("shared_security_enabled",),
+        condition=Q(shared_security_enabled=True, import_security_enabled=False),
+        message=_(
+            "Shared security can only be enabled when import security is enabled."
+        ),
+    ),
+    # l3extSubnet has a single l3extRsSubnetToRtSumm relation. Network as
+    # Code also resolves the target policy with BGP > OSPF > EIGRP precedence
+    # if multiple booleans are true. Reject that ambiguity in NetBox instead
+    # of silently ignoring later selections.
+    *(
+        Rule(
+            fields=(f"{protocol}_route_summarization_enabled",),
+            condition=Q(**{f"{protocol}_route_summarization_enabled": True})
+            & (
+                Q(**{f"{other}_route_summarization_enabled": True})
+                | Q(**{f"{another}_route_summarization_enabled": True})
+            ),
+            message=_(
+                "Only one route summarization type can be enabled "
+                "on the same ACI External Subnet."
+            ),
+        )
+        for protocol, other, another in (
+            ("bgp", "ospf", "eigrp"),
+            ("ospf", "bgp", "eigrp"),
+            ("eigrp", "bgp", "ospf"),
+        )
+    ),
+    # Route summarization under an External EPG is used to advertise a
+    # summarized prefix toward L3Out peers. APIC's GUI workflow enables this
+    # through Export Route Control Subnet.
+    Rule(
+        fields=("export_route_control_enabled",),
+        condition=_ROUTE_SUMMARIZATION_ENABLED & Q(export_route_control_enabled=False),
+        message=_(
+            "Export route control must be enabled when route summarization is enabled."
+        ),
+    ),
+    # Cisco's GUI procedure for External EPG route summarization also marks
+    # the subnet as External Subnet for the External EPG. Keep this as a hard
+    # validation so the summarized prefix remains tied to the External EPG
+    # for policy classification.
+    Rule(
+        fields=("import_security_enabled",),
+        condition=_ROUTE_SUMMARIZATION_ENABLED & Q(import_security_enabled=False),
+        message=_(
+            "Import security must be enabled when route summarization is enabled."
+        ),
+    ),
+    *(
+        Rule(
+            fields=(f"{protocol}_route_summarization_enabled",),
+            condition=Q(**{f"{protocol}_route_summarization_enabled": True})
+            & _l3out(**{f"{protocol}_enabled": False}),
+            message=message,
+        )
+        for protocol, message in (
+            (
+                "bgp",
+                _(
+                    "BGP route summarization can only be enabled when BGP "
+                    "is enabled on the parent ACI L3Out."
+                ),
+            ),
+            (
+                "ospf",
+                _(
+                    "OSPF route summarization can only be enabled when "
+                    "OSPF is enabled on the parent ACI L3Out."
+                ),
+            ),
+            (
+                "eigrp",
+                _(
+                    "EIGRP route summarization can only be enabled when "
+                    "EIGRP is enabled on the parent ACI L3Out."
+                ),
+            ),
+        )
+    ),
+    # Policy name fields should not be populated when the matching route
+    # summarization type is disabled.
+    Rule(
+        fields=("bgp_route_summarization_policy_name",),
+        condition=~Q(bgp_route_summarization_policy_name="")
+        & Q(bgp_route_summarization_enabled=False),
+        message=_(
+            "A BGP route summarization policy can only be assigned "
+            "when BGP route summarization is enabled."
+        ),
+    ),
+    Rule(
+        fields=("ospf_route_summarization_policy_name",),
+        condition=~Q(ospf_route_summarization_policy_name="")
+        & Q(ospf_route_summarization_enabled=False),
+        message=_(
+            "An OSPF route summarization policy can only be assigned "
+            "when OSPF route summarization is enabled."
+        ),
+    ),
+)
+
+# Validation rules of the ACI External Subnets depending on the ACI L3Out
+EXTERNAL_SUBNET_L3OUT_RULES = EXTERNAL_SUBNET_RULES.get_parent_rules(
+    EXTERNAL_SUBNET_L3OUT_PATH
+)
+
+# Invalidated ACI External Subnets named per error message
+INVALID_SUBNETS_NAMED = 5
+
+
 class ACIL3Out(ACITenantBaseModel):
     """External Layer 3 connection out of an ACI Fabric.
 
@@ -273,90 +567,71 @@ class ACIL3Out(ACITenantBaseModel):
                 )
             )
 
-        # Ensure that Multi-Pod is only enabled for L3Outs in the
-        # ACI Tenant 'infra'.
-        if (
-            self.multipod_enabled
-            and self.aci_tenant_id
-            and self.aci_tenant.name != "infra"
-        ):
-            errors.setdefault("multipod_enabled", []).append(
-                _("Multi-Pod can only be enabled for L3Outs in the 'infra' ACI Tenant.")
-            )
-
-        # Ensure that EIGRP is not combined with BGP or OSPF on the same
-        # ACI L3Out.
-        if self.eigrp_enabled and (self.bgp_enabled or self.ospf_enabled):
-            errors.setdefault("eigrp_enabled", []).append(
-                _(
-                    "EIGRP cannot be enabled together with BGP or OSPF "
-                    "on the same ACI L3Out."
-                )
-            )
+        for name, messages in L3OUT_RULES.check(self).items():
+            errors.setdefault(name, []).extend(messages)
 
-        # Ensure that import route control enforcement is only enabled
-        # for BGP or OSPF L3Outs.
-        if self.import_route_control_enforcement_enabled and not (
-            self.bgp_enabled or self.ospf_enabled
-        ):
-            errors.setdefault("import_route_control_enforcement_enabled", []).append(
-                _(
-                    "Import route control enforcement requires BGP or OSPF "
-                    "to be enabled for the ACI L3Out."
-                )
+        # Ensure that the changed routing flags do not invalidate the ACI
+        # External Subnets of the ACI L3Out (e.g. a BGP route summarization
+        # when disabling BGP).
+        if self.pk and (invalid_subnets := self.get_invalid_external_subnets()):
+            errors.setdefault(NON_FIELD_ERRORS, []).extend(
+                self._get_invalid_external_subnet_messages(invalid_subnets)
             )
 
-        # Ensure that export route control enforcement stays enabled, as
-        # APIC always enforces export route control for L3Outs.
-        if not self.export_route_control_enforcement_enabled:
-            errors.setdefault("export_route_control_enforcement_enabled", []).append(
-                _("Export route control enforcement is always enabled by APIC.")
-            )
+        if errors:
+            raise ValidationError(errors)
 
-        # Ensure that an OSPF external policy is only assigned when OSPF
-        # is enabled.
-        if self.ospf_external_policy_name and not self.ospf_enabled:
-            errors.setdefault("ospf_external_policy_name", []).append(
-                _(
-                    "An OSPF external policy can only be assigned when "
-                    "OSPF is enabled for the ACI L3Out."
-                )
-            )
+    def get_invalid_external_subnets(self) -> dict[int, dict[str, list[str]]]:
+        """Return the errors of the ACI External Subnets by their ID.
 
-        # Ensure that an EIGRP interface policy is only assigned when EIGRP
-        # is enabled.
-        if self.eigrp_interface_policy_name and not self.eigrp_enabled:
-            errors.setdefault("eigrp_interface_policy_name", []).append(
-                _(
-                    "An EIGRP interface policy can only be assigned when "
-                    "EIGRP is enabled for the ACI L3Out."
-                )
-            )
+        The ACI External Subnets are validated against the current field
+        values of the instance, which may not be saved yet, with a single
+        query reading the subnets violating a rule only.
+        """
+        return EXTERNAL_SUBNET_L3OUT_RULES.check_batch(
+            ACIExternalSubnet.objects.filter(
+                aci_external_endpoint_group__aci_l3out=self.pk
+            ),
+            parents={EXTERNAL_SUBNET_L3OUT_PATH: self},
+        )
 
-        # Ensure that a PIM policy is only assigned when L3 multicast is
-        # enabled.
-        if self.pim_policy_name and not (
-            self.l3_multicast_ipv4_enabled or self.l3_multicast_ipv6_enabled
-        ):
-            errors.setdefault("pim_policy_name", []).append(
-                _(
-                    "A PIM policy can only be assigned when L3 multicast "
-                    "IPv4 or IPv6 is enabled for the ACI L3Out."
-                )
-            )
+    @staticmethod
+    def _get_invalid_external_subnet_messages(
+        invalid_subnets: dict[int, dict[str, list[str]]],
+    ) -> list[str]:
+        """Return the error messages of the invalidated ACI External Subnets.
 
-        # Ensure that an IGMP interface policy is only assigned when L3
-        # multicast IPv4 is enabled.
-        if self.igmp_interface_policy_name and not self.l3_multicast_ipv4_enabled:
-            errors.setdefault("igmp_interface_policy_name", []).append(
-                _(
-                    "An IGMP interface policy can only be assigned when "
-                    "L3 multicast IPv4 is enabled for the ACI L3Out."
-                )
+        The subnets are grouped by error message, naming the first subnets
+        of each message only.
+        """
+        pks_by_message: dict[str, list[int]] = defaultdict(list)
+        for pk, subnet_errors in invalid_subnets.items():
+            for messages in subnet_errors.values():
+                for message in messages:
+                    pks_by_message[str(message)].append(pk)
+        subnets = ACIExternalSubnet.objects.select_related(
+            "aci_external_endpoint_group"
+        ).in_bulk(
+            {
+                pk
+                for pks in pks_by_message.values()
+                for pk in pks[:INVALID_SUBNETS_NAMED]
+            }
+        )
+        return [
+            _(
+                "The change invalidates {count} ACI External Subnet(s) "
+                "({subnets}): {message}"
+            ).format(
+                count=len(pks),
+                subnets=", ".join(
+                    [str(subnets[pk]) for pk in pks[:INVALID_SUBNETS_NAMED]]
+                    + (["..."] if len(pks) > INVALID_SUBNETS_NAMED else [])
+                ),
+                message=message,
             )
-
-        if errors:
-            raise ValidationError(errors)
+            for message, pks in pks_by_message.items()
+        ]
 
     def save(self, *args, **kwargs) -> None:
         """Save the current instance to the database."""
@@ -724,124 +999,8 @@ class ACIExternalSubnet(ACITenantBaseModel):
             )
 
         if self.aci_external_endpoint_group_id:
-            aci_l3out = self.aci_l3out
-
-            # Import Route Control Subnet is only meaningful when Import Route
-            # Control Enforcement is enabled on the parent L3Out. In APIC this
-            # is an L3Out-level option and is supported for BGP and OSPF, but
-            # not for EIGRP.
-            if (
-                self.import_route_control_enabled
-                and not aci_l3out.import_route_control_enforcement_enabled
-            ):
-                errors.setdefault("import_route_control_enabled", []).append(
-                    _(
-                        "Import route control can only be enabled when import "
-                        "route control enforcement is enabled on the parent "
-                        "ACI L3Out."
-                    )
-                )
-
-            if (
-                self.import_route_control_enabled
-                and aci_l3out.eigrp_enabled
-                and not (aci_l3out.bgp_enabled or aci_l3out.ospf_enabled)
-            ):
-                errors.setdefault("import_route_control_enabled", []).append(
-                    _(
-                        "Import route control is supported for BGP and OSPF "
-                        "L3Outs, but not for EIGRP-only L3Outs."
-                    )
-                )
-
-            # Aggregate Import and Aggregate Export are refinements of their
-            # matching route-control scopes. They must not be enabled without
-            # the corresponding base route-control flag.
-            if (
-                self.aggregate_import_route_control_enabled
-                and not self.import_route_control_enabled
-            ):
-                errors.setdefault(
-                    "aggregate_import_route_control_enabled",
-                    [],
-                ).append(
-                    _(
-                        "Aggregate import route control requires import route "
-                        "control to be enabled."
-                    )
-                )
-
-            if (
-                self.aggregate_export_route_control_enabled
-                and not self.export_route_control_enabled
-            ):
-                errors.setdefault(
-                    "aggregate_export_route_control_enabled",
-                    [],
-                ).append(
-                    _(
-                        "Aggregate export route control requires export route "
-                        "control to be enabled."
-                    )
-                )
-
-            if (
-                self.aggregate_shared_route_control_enabled
-                and not self.shared_route_control_enabled
-            ):
-                errors.setdefault(
-                    "aggregate_shared_route_control_enabled",
-                    [],
-                ).append(
-                    _(
-                        "Aggregate shared route control requires shared route "
-                        "control to be enabled."
-                    )
-                )
-
-            # ACI supports Aggregate Import and Aggregate Export only for the
-            # default-route subnet. Treat both IPv4 0.0.0.0/0 and IPv6 ::/0 as
-            # default routes by checking prefix length 0.
-            if (
-                self.aggregate_import_route_control_enabled
-                and not self._is_default_route()
-            ):
-                errors.setdefault(
-                    "aggregate_import_route_control_enabled",
-                    [],
-                ).append(
-                    _(
-                        "Aggregate import route control can only be enabled "
-                        "for a default-route prefix."
-                    )
-                )
-
-            if (
-                self.aggregate_export_route_control_enabled
-                and not self._is_default_route()
-            ):
-                errors.setdefault(
-                    "aggregate_export_route_control_enabled",
-                    [],
-                ).append(
-                    _(
-                        "Aggregate export route control can only be enabled "
-                        "for a default-route prefix."
-                    )
-                )
-
-            # Shared Security Import leaks the prefix-to-pcTag mapping for
-            # shared L3Out contracts. ACI requires the subnet to be classified
-            # as an External Subnet for the External EPG first; otherwise
-            # the original VRF does not know which External EPG the prefix
-            # belongs to.
-            if self.shared_security_enabled and not self.import_security_enabled:
-                errors.setdefault("shared_security_enabled", []).append(
-                    _(
-                        "Shared security can only be enabled when import "
-                        "security is enabled."
-                    )
-                )
+            for name, messages in EXTERNAL_SUBNET_RULES.check(self).items():
+                errors.setdefault(name, []).extend(messages)
 
             # Shared Security Import is normally configured together
             # with Shared Route Control, but it may also be more
@@ -859,108 +1018,6 @@ class ACIExternalSubnet(ACITenantBaseModel):
                     )
                 )
 
-            route_summarization_fields = (
-                "bgp_route_summarization_enabled",
-                "ospf_route_summarization_enabled",
-                "eigrp_route_summarization_enabled",
-            )
-            enabled_route_summarizations = [
-                field for field in route_summarization_fields if getattr(self, field)
-            ]
-
-            # l3extSubnet has a single l3extRsSubnetToRtSumm relation. Net as
-            # Code also resolves the target policy with BGP > OSPF > EIGRP
-            # precedence if multiple booleans are true. Reject that ambiguity
-            # in NetBox instead of silently ignoring later selections.
-            if len(enabled_route_summarizations) > 1:
-                for field in enabled_route_summarizations:
-                    errors.setdefault(field, []).append(
-                        _(
-                            "Only one route summarization type can be enabled "
-                            "on the same ACI External Subnet."
-                        )
-                    )
-
-            if enabled_route_summarizations:
-                # Route summarization under an External EPG is used to
-                # advertise a summarized prefix toward L3Out peers.
-                # APIC's GUI workflow enables this through Export Route
-                # Control Subnet.
-                if not self.export_route_control_enabled:
-                    errors.setdefault("export_route_control_enabled", []).append(
-                        _(
-                            "Export route control must be enabled when route "
-                            "summarization is enabled."
-                        )
-                    )
-
-                # Cisco's GUI procedure for External EPG route
-                # summarization also marks the subnet as External
-                # Subnet for the External EPG. Keep this as a hard
-                # validation so the summarized prefix remains tied to
-                # the External EPG for policy classification.
-                if not self.import_security_enabled:
-                    errors.setdefault("import_security_enabled", []).append(
-                        _(
-                            "Import security must be enabled when route "
-                            "summarization is enabled."
-                        )
-                    )
-
-            if self.bgp_route_summarization_enabled and not aci_l3out.bgp_enabled:
-                errors.setdefault("bgp_route_summarization_enabled", []).append(
-                    _(
-                        "BGP route summarization can only be enabled when BGP "
-                        "is enabled on the parent ACI L3Out."
-                    )
-                )
-
-            if self.ospf_route_summarization_enabled and not aci_l3out.ospf_enabled:
-                errors.setdefault("ospf_route_summarization_enabled", []).append(
-                    _(
-                        "OSPF route summarization can only be enabled when "
-                        "OSPF is enabled on the parent ACI L3Out."
-                    )
-                )
-
-            if self.eigrp_route_summarization_enabled and not aci_l3out.eigrp_enabled:
-                errors.setdefault("eigrp_route_summarization_enabled", []).append(
-                    _(
-                        "EIGRP route summarization can only be enabled when "
-                        "EIGRP is enabled on the parent ACI L3Out."
-                    )
-                )
-
-            # Policy name fields should not be populated when the
-            # matching route summarization type is disabled.
-            if (
-                self.bgp_route_summarization_policy_name
-                and not self.bgp_route_summarization_enabled
-            ):
-                errors.setdefault(
-                    "bgp_route_summarization_policy_name",
-                    [],
-                ).append(
-                    _(
-                        "A BGP route summarization policy can only be assigned "
-                        "when BGP route summarization is enabled."
-                    )
-                )
-
-            if (
-                self.ospf_route_summarization_policy_name
-                and not self.ospf_route_summarization_enabled
-            ):
-                errors.setdefault(
-                    "ospf_route_summarization_policy_name",
-                    [],
-                ).append(
-                    _(
-                        "An OSPF route summarization policy can only be assigned "
-                        "when OSPF route summarization is enabled."
-                    )
-                )
-
         if errors:
             raise ValidationError(errors)
 
@@ -1021,10 +1078,6 @@ class ACIExternalSubnet(ACITenantBaseModel):
             and parent_prefix.last >= child_prefix.last
         )
 
-    def _is_default_route(self) -> bool:
-        """Return True if the matched prefix is a default route."""
-        return bool(self.matched_prefix and self.matched_prefix.prefixlen == 0)
-
     def _has_shared_route_control_covering_prefix(self) -> bool:
         """Return True if Shared Route Control covers this subnet.
 
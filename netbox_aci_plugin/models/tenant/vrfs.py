@@ -2,13 +2,15 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-"""Model for ACI VRFs."""
+"""Models for ACI VRFs and their route leaks."""
 
-from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from ipam.fields import IPNetworkField
+
 from ...choices import (
     VRFPCEnforcementDirectionChoices,
     VRFPCEnforcementPreferenceChoices,
@@ -158,3 +160,78 @@ class ACIVRF(ACITenantBaseModel):
         return VRFPCEnforcementPreferenceChoices.colors.get(
             self.pc_enforcement_preference
         )
+
+
+class ACIRouteLeak(models.Model):
+    """Prefix leaked into a VRF by a shared service across VRFs.
+
+    Mirrors a prefix of an endpoint group or external endpoint group
+    leaked into the VRF of a contract peer in another VRF: the shared
+    subnets of the bridge domain of an endpoint group, or the external
+    subnets with shared route control of an external endpoint group.
+
+    Notes:
+        The rows are derived data computed per fabric by the route leak
+        service; they are replaced when the fabric is recomputed. An
+        aggregate prefix leaks the prefixes it contains.
+    """
+
+    aci_fabric = models.ForeignKey(
+        to="netbox_aci_plugin.ACIFabric",
+        on_delete=models.CASCADE,
+        verbose_name=_("ACI Fabric"),
+    )
+    aci_vrf = models.ForeignKey(
+        to="netbox_aci_plugin.ACIVRF",
+        on_delete=models.CASCADE,
+        verbose_name=_("ACI VRF"),
+    )
+    source_aci_vrf = models.ForeignKey(
+        to="netbox_aci_plugin.ACIVRF",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("source ACI VRF"),
+    )
+    source_type = models.ForeignKey(
+        to="contenttypes.ContentType",
+        on_delete=models.PROTECT,
+        related_name="+",
+        verbose_name=_("source type"),
+    )
+    source_id = models.PositiveBigIntegerField(
+        verbose_name=_("source ID"),
+    )
+    source = GenericForeignKey(
+        ct_field="source_type",
+        fk_field="source_id",
+    )
+    prefix = IPNetworkField(
+        verbose_name=_("prefix"),
+    )
+    aggregate = models.BooleanField(
+        verbose_name=_("aggregate"),
+        default=False,
+    )
+    shared_security_enabled = models.BooleanField(
+        verbose_name=_("shared security enabled"),
+        default=False,
+    )
+
+    class Meta:
+        constraints: list[models.BaseConstraint] = [
+            models.UniqueConstraint(
+                fields=("aci_vrf", "source_type", "source_id", "prefix"),
+                name="%(app_label)s_%(class)s_unique_prefix_per_source_and_aci_vrf",
+            ),
+        ]
+        default_related_name: str = "aci_route_leaks"
+        indexes: tuple = (
+            models.Index(fields=("source_type", "source_id")),
+            models.Index(fields=("prefix",)),
+        )
+        ordering: tuple = ("aci_vrf", "prefix", "source_type", "source_id")
+        verbose_name: str = _("ACI Route Leak")
+
+    def __str__(self) -> str:
+        """Return string representation of the instance."""
+        return f"{self.prefix} ({self.aci_vrf.name})"
@@ -0,0 +1,231 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Request-scoped cache of the object permission filters and counts.
+
+Restricting a queryset compiles the user's object permission constraints
+into a filter, which is repeated for every queryset of the same model in a
+request (the children views, the related objects panel, the tab badges, and
+the tables). Within a request (or a ``permission_filter_cache()`` block),
+the compiled constraints are cached per user, model, and action, and the
+querysets of the plugin models restrict with the cached filter. Unlike
+NetBox's ``RestrictedQuerySet.restrict()``, the constraints filter the
+queryset directly instead of through a subquery of the permitted objects,
+unless they span a multi-valued relation (which would duplicate rows).
+
+The tab badges, the related objects panel, and the table of a children
+view count the same restricted objects. Within a read-only request (or a
+``query_count_cache()`` block), the counts of the plugin querysets are
+cached by their SQL, so each is queried once.
+
+The caches end with their request or block. Saving or deleting an object
+permission (or changing its users, groups, or object types) clears the
+cached filters of the current scope; the counts are only cached for
+requests not writing any objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db.models import Model, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from netbox.context import current_request
+from users.constants import CONSTRAINT_TOKEN_USER
+from users.models import ObjectPermission
+from utilities.permissions import (
+    get_permission_for_model,
+    permission_is_exempt,
+    qs_filter_from_constraints,
+)
+from utilities.querysets import RestrictedQuerySet
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractBaseUser
+    from django.db.models import Manager
+
+# Filter of a permission granted without constraints
+UNRESTRICTED = Q()
+# Request methods not writing any objects, whose counts are cached
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Permission filters by (user, model, action); None outside a scope
+_permission_filters: ContextVar[dict[tuple, Q | None] | None] = ContextVar(
+    "aci_permission_filters", default=None
+)
+# Query counts by (database, SQL, parameters); None outside a scope
+_query_counts: ContextVar[dict[tuple, int] | None] = ContextVar(
+    "aci_query_counts", default=None
+)
+
+
+def _spans_multi_valued_relation(model: type[Model], attrs: Q) -> bool:
+    """Return whether a lookup of the filter spans a multi-valued relation."""
+    for child in attrs.children:
+        if isinstance(child, Q):
+            if _spans_multi_valued_relation(model, child):
+                return True
+            continue
+        opts = model._meta
+        for name in child[0].split(LOOKUP_SEP):
+            try:
+                model_field = opts.get_field(name)
+            except FieldDoesNotExist:
+                break
+            if model_field.many_to_many or model_field.one_to_many:
+                return True
+            if not model_field.is_relation:
+                break
+            opts = model_field.related_model._meta
+    return False
+
+
+def get_permission_filter(
+    user: AbstractBaseUser | None, model: type[Model], action: str
+) -> Q | None:
+    """Return the object permission filter of a user.
+
+    The filter is compiled from the constraints of the user's permissions
+    as by NetBox's restriction. Returns ``UNRESTRICTED`` if all objects are
+    permitted and ``None`` if none are.
+    """
+    if user is None:
+        return None
+    permission_required = get_permission_for_model(model, action)
+    if user.is_superuser or permission_is_exempt(permission_required):
+        return UNRESTRICTED
+    if (
+        not user.is_authenticated
+        or permission_required not in user.get_all_permissions()
+    ):
+        return None
+    # Loaded by get_all_permissions(), as read by NetBox's restriction
+    constraints = user._object_perm_cache[permission_required]  # noqa: SLF001
+    attrs = qs_filter_from_constraints(constraints, {CONSTRAINT_TOKEN_USER: user})
+    if attrs and _spans_multi_valued_relation(model, attrs):
+        return Q(pk__in=model.objects.filter(attrs).values("pk"))
+    return attrs
+
+
+@contextmanager
+def _cache_scope(var: ContextVar) -> Generator[dict]:
+    """Set an empty cache of the context variable within the block.
+
+    A nested block reuses the cache of the outer block.
+    """
+    if (cache := var.get()) is not None:
+        yield cache
+        return
+    cache = {}
+    token = var.set(cache)
+    try:
+        yield cache
+    finally:
+        var.reset(token)
+
+
+def permission_filter_cache() -> Generator[dict[tuple, Q | None]]:
+    """Cache the permission filters within the block."""
+    return _cache_scope(_permission_filters)
+
+
+def query_count_cache() -> Generator[dict[tuple, int]]:
+    """Cache the counts of the plugin querysets within the block.
+
+    The counts are not invalidated by writes within the block.
+    """
+    return _cache_scope(_query_counts)
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+def clear_permission_filters(**kwargs) -> None:
+    """Clear the cached permission filters when a permission changes."""
+    if (permission_filters := _permission_filters.get()) is not None:
+        permission_filters.clear()
+
+
+def count_viewable(model: type[Model], **filters) -> int:
+    """Return the number of objects the user of the request may view.
+
+    The objects are restricted before filtering them, as in the related
+    objects panel, so both share their cached count. Outside a request,
+    all objects are counted.
+    """
+    queryset = model.objects.all()
+    if (request := current_request.get()) is not None:
+        queryset = queryset.restrict(request.user, "view")
+    return queryset.filter(**filters).count()
+
+
+def count_related(manager: Manager) -> int:
+    """Return the number of related objects the user of the request may see."""
+    return count_viewable(manager.model, **manager.core_filters)
+
+
+class ACIRestrictedQuerySet(RestrictedQuerySet):
+    """Restricted queryset using the cached permission filters and counts."""
+
+    def restrict(self, user, action="view"):
+        """Filter the queryset to the objects the user may act on."""
+        permission_filters = _permission_filters.get()
+        if permission_filters is None:
+            return super().restrict(user, action)
+
+        key = (getattr(user, "pk", None), self.model._meta.label_lower, action)
+        if key not in permission_filters:
+            permission_filters[key] = get_permission_filter(user, self.model, action)
+        attrs = permission_filters[key]
+
+        if attrs is None:
+            return self.none()
+        if attrs == UNRESTRICTED:
+            return self
+        return self.filter(attrs)
+
+    def count(self):
+        """Return the number of objects, cached by the SQL of the query."""
+        query_counts = _query_counts.get()
+        if query_counts is None or self._result_cache is not None:
+            return super().count()
+        query = self.query.chain()
+        query.clear_ordering(force=True)
+        query.select_related = False
+        try:
+            sql, params = query.sql_with_params()
+        except EmptyResultSet:
+            return super().count()
+        key = (self.db, sql, repr(params))
+        if key not in query_counts:
+            query_counts[key] = super().count()
+        return query_counts[key]
+
+
+class PermissionFilterCacheMiddleware:
+    """Cache the permission filters and counts for the duration of a request.
+
+    The counts are only cached for the requests of the safe methods.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Handle the request within a permission filter cache."""
+        with permission_filter_cache():
+            if request.method not in SAFE_METHODS:
+                return self.get_response(request)
+            with query_count_cache():
+                return self.get_response(request)
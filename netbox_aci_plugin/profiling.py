@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Opt-in profiling of the plugin hot paths.
+
+When the ``profiling_enabled`` plugin setting is set, the plugin views and
+API viewsets, the filterset ``search()`` and ``filter_*()`` methods, and the
+model ``clean()``, ``save()``, and ``cache_related_objects()`` methods are
+wrapped to record the number of database queries, the SQL time, and the
+Python time per hook.
+
+The totals are exported as Prometheus metrics (with the NetBox metrics
+endpoint) and the per-request values are returned in the ``Server-Timing``
+response header.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import inspect
+import pkgutil
+from collections.abc import Callable, Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+
+from django.apps import apps
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.views import View
+from django_filters import FilterSet
+from prometheus_client import Counter
+
+from netbox.plugins.utils import get_plugin_config
+
+PLUGIN_NAME = "netbox_aci_plugin"
+
+# Methods wrapped per kind of plugin class
+FILTERSET_METHOD_PREFIX = "filter_"
+MODEL_METHODS: tuple[str, ...] = ("clean", "save", "cache_related_objects")
+VIEW_METHODS: tuple[str, ...] = ("dispatch",)
+
+HOOK_CALLS = Counter(
+    "netbox_aci_hook_calls_total",
+    "Number of calls of the profiled plugin hooks.",
+    ("hook",),
+)
+HOOK_QUERIES = Counter(
+    "netbox_aci_hook_queries_total",
+    "Number of database queries executed within the profiled plugin hooks.",
+    ("hook",),
+)
+HOOK_SQL_SECONDS = Counter(
+    "netbox_aci_hook_sql_seconds_total",
+    "Time spent in database queries within the profiled plugin hooks.",
+    ("hook",),
+)
+HOOK_PYTHON_SECONDS = Counter(
+    "netbox_aci_hook_python_seconds_total",
+    "Time spent outside database queries within the profiled plugin hooks.",
+    ("hook",),
+)
+
+
+@dataclass(slots=True)
+class HookStats:
+    """Accumulated statistics of a profiled hook."""
+
+    calls: int = 0
+    queries: int = 0
+    sql_time: float = 0.0
+    total_time: float = 0.0
+
+    @property
+    def python_time(self) -> float:
+        """Time spent outside database queries."""
+        return max(self.total_time - self.sql_time, 0.0)
+
+
+# Stack of the hooks being executed; queries count toward each of them
+_active_hooks: ContextVar[tuple[HookStats, ...]] = ContextVar(
+    "aci_active_hooks", default=()
+)
+# Statistics of the current request by hook name
+_request_stats: ContextVar[dict[str, HookStats] | None] = ContextVar(
+    "aci_request_stats", default=None
+)
+
+
+def profiling_enabled() -> bool:
+    """Return whether the profiling is enabled in the plugin settings."""
+    return bool(get_plugin_config(PLUGIN_NAME, "profiling_enabled", False))
+
+
+def _record_query(execute, sql, params, many, context):
+    """Execute a query and add its duration to the active hooks."""
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = perf_counter() - start
+        for stats in _active_hooks.get():
+            stats.queries += 1
+            stats.sql_time += duration
+
+
+def _record_hook(name: str, stats: HookStats) -> None:
+    """Export the statistics of a finished hook call."""
+    HOOK_CALLS.labels(name).inc()
+    HOOK_QUERIES.labels(name).inc(stats.queries)
+    HOOK_SQL_SECONDS.labels(name).inc(stats.sql_time)
+    HOOK_PYTHON_SECONDS.labels(name).inc(stats.python_time)
+
+    request_stats = _request_stats.get()
+    if request_stats is not None:
+        totals = request_stats.setdefault(name, HookStats())
+        totals.calls += 1
+        totals.queries += stats.queries
+        totals.sql_time += stats.sql_time
+        totals.total_time += stats.total_time
+
+
+def profile_hook(name: str, func: Callable) -> Callable:
+    """Return the function wrapped to record its statistics under a name.
+
+    The query wrapper is installed by the outermost profiled hook only;
+    nested hooks share it and each records the queries executed within it.
+    """
+    if getattr(func, "__aci_profiled__", False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stats = HookStats(calls=1)
+        outer_hooks = _active_hooks.get()
+        token = _active_hooks.set((*outer_hooks, stats))
+        start = perf_counter()
+        try:
+            if outer_hooks:
+                return func(*args, **kwargs)
+            with connection.execute_wrapper(_record_query):
+                return func(*args, **kwargs)
+        finally:
+            stats.total_time = perf_counter() - start
+            _active_hooks.reset(token)
+            _record_hook(name, stats)
+
+    wrapper.__aci_profiled__ = True
+    return wrapper
+
+
+def _iter_plugin_classes(package: str, base: type) -> Iterator[type]:
+    """Yield the classes of a plugin package derived from a base class."""
+    module = importlib.import_module(package)
+    modules = [module]
+    if hasattr(module, "__path__"):
+        modules.extend(
+            importlib.import_module(info.name)
+            for info in pkgutil.walk_packages(module.__path__, f"{package}.")
+        )
+    seen = set()
+    for module in modules:
+        for _name, cls in inspect.getmembers(module, inspect.isclass):
+            if (
+                cls not in seen
+                and cls.__module__.startswith(f"{PLUGIN_NAME}.")
+                and issubclass(cls, base)
+            ):
+                seen.add(cls)
+                yield cls
+
+
+def _wrap_methods(
+    cls: type, kind: str, names: Iterable[str], inherited: bool = False
+) -> None:
+    """Wrap the given methods of a class with the profiler.
+
+    Only methods defined by the class itself are wrapped, unless inherited
+    methods are requested (e.g. ``dispatch()`` of the generic views).
+    """
+    for name in names:
+        func = getattr(cls, name, None) if inherited else cls.__dict__.get(name)
+        if callable(func):
+            if getattr(func, "__aci_profiled__", False):
+                func = func.__wrapped__
+            setattr(cls, name, profile_hook(f"{kind}.{cls.__name__}.{name}", func))
+
+
+def install_profiling() -> None:
+    """Wrap the plugin hooks with the profiler.
+
+    Methods are wrapped where they are defined, so an overridden method
+    calling ``super()`` records both the subclass and the base class hook.
+    """
+    for package, kind in (
+        (f"{PLUGIN_NAME}.views", "view"),
+        (f"{PLUGIN_NAME}.api.views", "api"),
+    ):
+        for cls in _iter_plugin_classes(package, View):
+            _wrap_methods(cls, kind, VIEW_METHODS, inherited=True)
+
+    for cls in _iter_plugin_classes(f"{PLUGIN_NAME}.filtersets", FilterSet):
+        _wrap_methods(
+            cls,
+            "filterset",
+            [
+                name
+                for name in vars(cls)
+                if name == "search" or name.startswith(FILTERSET_METHOD_PREFIX)
+            ],
+        )
+
+    for model in apps.get_app_config(PLUGIN_NAME).get_models():
+        for cls in model.__mro__:
+            if cls.__module__.startswith(f"{PLUGIN_NAME}."):
+                _wrap_methods(cls, "model", MODEL_METHODS)
+
+
+def format_server_timing(stats: dict[str, HookStats]) -> str:
+    """Return the ``Server-Timing`` header value of the request statistics."""
+    return ", ".join(
+        f"{name};dur={hook.total_time * 1000:.2f};"
+        f'desc="{hook.calls} call(s), {hook.queries} queries, '
+        f'{hook.sql_time * 1000:.2f} ms SQL"'
+        for name, hook in stats.items()
+    )
+
+
+class ProfilingMiddleware:
+    """Collect the hook statistics per request and add the debug header.
+
+    The middleware is disabled unless the profiling is enabled.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        """Initialize the middleware if the profiling is enabled."""
+        if not profiling_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Handle the request and report the hook statistics."""
+        stats: dict[str, HookStats] = {}
+        token = _request_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_stats.reset(token)
+        if stats:
+            response["Server-Timing"] = format_server_timing(stats)
+        return response
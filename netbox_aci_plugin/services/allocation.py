@@ -0,0 +1,300 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Allocation of free Node IDs and TEP IP addresses of an ACI Pod."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import transaction
+from django.db.models import (
+    BigIntegerField,
+    ExpressionWrapper,
+    F,
+    GenericIPAddressField,
+    Q,
+    Value,
+    Window,
+)
+from django.db.models.functions import Cast, Lag, Lead
+from django.utils.translation import gettext as _
+from netaddr import IPAddress as NetIPAddress
+from netaddr import IPNetwork
+
+from ipam.choices import IPAddressStatusChoices
+from ipam.models import IPAddress
+
+from ..choices import NodeRoleChoices
+from ..constants import NODE_ID_APIC_MAX, NODE_ID_MAX, NODE_ID_MIN
+from ..models.fabric.nodes import ACINode
+from ..models.fabric.pods import ACIPod
+
+if TYPE_CHECKING:
+    from django.db.models import Expression, QuerySet
+
+    from users.models import User
+
+# Integer value of an IPv4 address (the offset from 0.0.0.0)
+IPV4_HOST_VALUE = ExpressionWrapper(
+    F("address") - Cast(Value("0.0.0.0"), output_field=GenericIPAddressField()),
+    output_field=BigIntegerField(),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class NodeAllocation:
+    """Node ID and TEP address allocated for a new ACI Node."""
+
+    node_id: int
+    tep_address: IPNetwork | None = None
+    tep_ip_address_id: int | None = None
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the allocation."""
+        return {
+            "node_id": self.node_id,
+            "tep_address": str(self.tep_address) if self.tep_address else None,
+            "tep_ip_address": self.tep_ip_address_id,
+        }
+
+
+def iter_free_ranges(
+    queryset: QuerySet, value: Expression, first: int, last: int
+) -> Iterator[tuple[int, int]]:
+    """Yield the (first, last) ranges of the values not used by a queryset.
+
+    The used values form islands of consecutive values. A single query
+    returns the island boundaries only: the lowest value and each value
+    whose successor (by the LEAD window function) is not consecutive.
+    The gaps between the islands, limited to the first and last value,
+    are the free ranges.
+    """
+    boundaries = list(
+        queryset.annotate(used_value=value)
+        .annotate(
+            previous_value=Window(Lag("used_value"), order_by=F("used_value").asc()),
+            next_value=Window(Lead("used_value"), order_by=F("used_value").asc()),
+        )
+        .filter(
+            Q(previous_value__isnull=True)
+            | Q(next_value__isnull=True)
+            | Q(next_value__gt=F("used_value") + 1)
+        )
+        .order_by("used_value")
+        .values_list("used_value", "previous_value", "next_value")
+    )
+    if not boundaries:
+        yield first, last
+        return
+
+    for used_value, previous_value, next_value in boundaries:
+        gaps = [(used_value + 1, last if next_value is None else next_value - 1)]
+        if previous_value is None:
+            gaps.insert(0, (first, used_value - 1))
+        for gap_first, gap_last in gaps:
+            gap_first, gap_last = max(gap_first, first), min(gap_last, last)
+            if gap_first <= gap_last:
+                yield gap_first, gap_last
+
+
+def _iter_values(ranges: Iterable[tuple[int, int]]) -> Iterator[int]:
+    """Yield the values of the (first, last) ranges."""
+    return chain.from_iterable(range(first, last + 1) for first, last in ranges)
+
+
+def get_node_id_range(role: str) -> tuple[int, int]:
+    """Return the first and last node ID of the node role."""
+    if role == NodeRoleChoices.ROLE_APIC:
+        return NODE_ID_MIN, NODE_ID_APIC_MAX
+    return NODE_ID_APIC_MAX + 1, NODE_ID_MAX
+
+
+def get_available_node_ids(
+    aci_pod: ACIPod, count: int, role: str = NodeRoleChoices.ROLE_LEAF
+) -> list[int]:
+    """Return up to count lowest node IDs of the role not used in the pod."""
+    first, last = get_node_id_range(role)
+    ranges = iter_free_ranges(
+        ACINode.objects.filter(aci_pod=aci_pod, node_id__range=(first, last)),
+        F("node_id"),
+        first,
+        last,
+    )
+    return list(islice(_iter_values(ranges), count))
+
+
+def get_available_tep_addresses(aci_pod: ACIPod, count: int) -> list[IPNetwork]:
+    """Return up to count lowest free TEP addresses of the pod's TEP pool.
+
+    The addresses carry the mask length of the TEP pool; IP addresses in
+    the VRF of the TEP pool are used, regardless of their mask length.
+    """
+    if (tep_pool := aci_pod.tep_pool) is None:
+        return []
+    prefix = tep_pool.prefix
+    ranges = iter_free_ranges(
+        IPAddress.objects.filter(
+            vrf_id=tep_pool.vrf_id, address__net_host_contained=str(prefix)
+        ),
+        IPV4_HOST_VALUE,
+        # Exclude the network and broadcast address
+        prefix.first + 1,
+        prefix.last - 1,
+    )
+    return [
+        IPNetwork(f"{NetIPAddress(value, version=4)}/{prefix.prefixlen}")
+        for value in islice(_iter_values(ranges), count)
+    ]
+
+
+def lock_aci_pod(aci_pod: ACIPod) -> ACIPod:
+    """Lock and return a fresh ACI Pod until the end of the transaction.
+
+    Must be called within a transaction. Holding the lock of the pod row
+    (``SELECT ... FOR UPDATE``) serializes the allocations in the pod.
+    """
+    return (
+        ACIPod.objects.select_for_update(of=("self",))
+        .select_related("tep_pool")
+        .get(pk=aci_pod.pk)
+    )
+
+
+def allocate_node_ids(aci_pod: ACIPod, count: int, role: str) -> list[int]:
+    """Return count free node IDs of the role in a locked ACI Pod.
+
+    Raises a ValidationError if the pod has not enough free node IDs.
+    """
+    node_ids = get_available_node_ids(aci_pod, count, role)
+    if len(node_ids) < count:
+        raise ValidationError(
+            _(
+                "ACI Pod {pod} has only {available} free node IDs for the role {role}."
+            ).format(pod=aci_pod, available=len(node_ids), role=role)
+        )
+    return node_ids
+
+
+def allocate_tep_addresses(aci_pod: ACIPod, count: int) -> list[IPNetwork]:
+    """Return count free TEP addresses of a locked ACI Pod.
+
+    Raises a ValidationError if the TEP pool has not enough free addresses.
+    """
+    tep_addresses = get_available_tep_addresses(aci_pod, count)
+    if len(tep_addresses) < count:
+        raise ValidationError(
+            _(
+                "TEP Pool {prefix} of ACI Pod {pod} has only {available} "
+                "free addresses."
+            ).format(
+                prefix=aci_pod.tep_pool.prefix,
+                pod=aci_pod,
+                available=len(tep_addresses),
+            )
+        )
+    return tep_addresses
+
+
+def get_tep_ip_address(
+    aci_pod: ACIPod, node_id: int, tep_address: IPNetwork, status: str
+) -> IPAddress:
+    """Return an unsaved TEP IP address of an ACI Node in the pod."""
+    return IPAddress(
+        address=tep_address,
+        vrf_id=aci_pod.tep_pool.vrf_id,
+        status=status,
+        description=f"TEP of ACI Node {node_id} ({aci_pod})",
+    )
+
+
+def _get_allocations(
+    aci_pod: ACIPod, count: int, role: str
+) -> list[tuple[int, IPNetwork | None]]:
+    """Return count free node IDs of the role paired with free TEP addresses.
+
+    Raises a ValidationError if the pod has not enough free node IDs or
+    TEP addresses.
+    """
+    node_ids = allocate_node_ids(aci_pod, count, role)
+    if aci_pod.tep_pool is None:
+        return [(node_id, None) for node_id in node_ids]
+    tep_addresses = allocate_tep_addresses(aci_pod, count)
+    return list(zip(node_ids, tep_addresses, strict=True))
+
+
+def get_available_nodes(
+    aci_pod: ACIPod, count: int, role: str = NodeRoleChoices.ROLE_LEAF
+) -> list[NodeAllocation]:
+    """Return the node IDs and TEP addresses of count new ACI Nodes.
+
+    The values are read without locking the pod, so they may be allocated
+    concurrently. Raises a ValidationError if the pod has not enough free
+    node IDs or TEP addresses.
+    """
+    aci_pod = ACIPod.objects.select_related("tep_pool").get(pk=aci_pod.pk)
+    return [
+        NodeAllocation(node_id=node_id, tep_address=tep_address)
+        for node_id, tep_address in _get_allocations(aci_pod, count, role)
+    ]
+
+
+def allocate_nodes(
+    aci_pod: ACIPod,
+    count: int,
+    role: str = NodeRoleChoices.ROLE_LEAF,
+    reserve_tep_addresses: bool = False,
+    user: User | None = None,
+) -> list[NodeAllocation]:
+    """Allocate the node IDs and TEP addresses of count new ACI Nodes.
+
+    The ACI Pod row is locked until the end of the outermost transaction,
+    so concurrent allocations in the same pod are serialized: nodes
+    created within the calling transaction keep the allocated values.
+    Optionally, the TEP addresses are reserved as IP addresses with the
+    status 'reserved', which the given user must be permitted to add.
+
+    Raises a ValidationError if the pod has not enough free node IDs or
+    TEP addresses, and PermissionDenied if the user may not add the
+    reserved IP addresses.
+    """
+    with transaction.atomic():
+        aci_pod = lock_aci_pod(aci_pod)
+        allocations = []
+        for node_id, tep_address in _get_allocations(aci_pod, count, role):
+            tep_ip_address = None
+            if reserve_tep_addresses and tep_address is not None:
+                tep_ip_address = get_tep_ip_address(
+                    aci_pod,
+                    node_id,
+                    tep_address,
+                    IPAddressStatusChoices.STATUS_RESERVED,
+                )
+                tep_ip_address.full_clean()
+                tep_ip_address.save()
+            allocations.append(
+                NodeAllocation(
+                    node_id=node_id,
+                    tep_address=tep_address,
+                    tep_ip_address_id=getattr(tep_ip_address, "pk", None),
+                )
+            )
+        tep_ip_address_ids = [
+            allocation.tep_ip_address_id
+            for allocation in allocations
+            if allocation.tep_ip_address_id is not None
+        ]
+        if user is not None:
+            permitted = IPAddress.objects.restrict(user, "add").filter(
+                pk__in=tep_ip_address_ids
+            )
+            if permitted.count() != len(tep_ip_address_ids):
+                raise PermissionDenied(
+                    _("Adding the TEP IP addresses is not permitted.")
+                )
+        return allocations
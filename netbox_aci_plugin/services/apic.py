@@ -0,0 +1,956 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Declarative mapping of the plugin models to the APIC and NaC object model.
+
+Each tenant-level model is described by an ``ObjectSpec`` naming its APIC
+class (e.g. ``fvBD``), its Network-as-Code (NaC) key, the foreign key to its
+parent in the tenant tree, and the mapping of model fields to APIC
+attributes and NaC keys. The specs form a tree rooted at ``TENANT_SPEC``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+
+from ..models.tenant.app_profiles import ACIAppProfile
+from ..models.tenant.bridge_domains import (
+    ACIBridgeDomain,
+    ACIBridgeDomainL3OutBinding,
+    ACIBridgeDomainSubnet,
+)
+from ..models.tenant.contract_filters import ACIContractFilter, ACIContractFilterEntry
+from ..models.tenant.contracts import (
+    ACIContract,
+    ACIContractRelation,
+    ACIContractSubject,
+    ACIContractSubjectFilter,
+)
+from ..models.tenant.endpoint_groups import (
+    ACIEndpointGroup,
+    ACIUSegEndpointGroup,
+    ACIUSegNetworkAttribute,
+)
+from ..models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+    ACIEsgEndpointSelector,
+)
+from ..models.tenant.l3outs import ACIExternalEndpointGroup, ACIExternalSubnet, ACIL3Out
+from ..models.tenant.tenants import ACITenant
+from ..models.tenant.vrfs import ACIVRF
+
+#
+# Value codecs
+#
+
+
+class Codec:
+    """Convert a model value into its APIC and NaC representation."""
+
+    def to_apic(self, value) -> str:
+        """Return the APIC attribute value."""
+        return "" if value is None else str(value)
+
+    def to_nac(self, value):
+        """Return the NaC (YAML) value."""
+        if value is None or isinstance(value, bool | int | str):
+            return value
+        return str(value)
+
+    def from_apic(self, value: str):
+        """Return the model value of an APIC attribute value."""
+        return value
+
+
+class BooleanCodec(Codec):
+    """Convert a boolean into the APIC keyword pair of an attribute."""
+
+    def __init__(self, true: str, false: str) -> None:
+        """Initialize the codec with the APIC keywords."""
+        self.true = true
+        self.false = false
+
+    def to_apic(self, value) -> str:
+        """Return the APIC keyword for the boolean value."""
+        return self.true if value else self.false
+
+    def from_apic(self, value: str) -> bool:
+        """Return the boolean value of an APIC keyword."""
+        return value == self.true
+
+
+class ListCodec(Codec):
+    """Convert an array field into a comma-separated APIC attribute."""
+
+    def to_apic(self, value) -> str:
+        """Return the comma-separated APIC attribute value."""
+        return ",".join(value or ())
+
+    def to_nac(self, value) -> list:
+        """Return the list of values."""
+        return list(value or ())
+
+    def from_apic(self, value: str) -> list[str]:
+        """Return the list of a comma-separated APIC attribute value."""
+        return [item for item in value.split(",") if item]
+
+
+TEXT = Codec()
+LIST = ListCodec()
+YES_NO = BooleanCodec("yes", "no")
+ENABLED_DISABLED = BooleanCodec("enabled", "disabled")
+ENFORCED_UNENFORCED = BooleanCodec("enforced", "unenforced")
+INCLUDE_EXCLUDE = BooleanCodec("include", "exclude")
+
+
+#
+# Spec building blocks
+#
+
+
+@dataclass(frozen=True, slots=True)
+class ManagedObject:
+    """APIC managed object (MO) with its attributes and child objects."""
+
+    apic_class: str
+    attributes: dict[str, str]
+    children: tuple[ManagedObject, ...] = ()
+
+    def get_children(self, *apic_classes: str) -> Iterator[ManagedObject]:
+        """Yield the child objects of the given APIC classes."""
+        for child in self.children:
+            if child.apic_class in apic_classes:
+                yield child
+
+
+@dataclass(frozen=True, slots=True)
+class Attribute:
+    """Mapping of a model field to an APIC attribute and a NaC key."""
+
+    field: str
+    apic: str | None = None
+    nac: str | None = None
+    codec: Codec = TEXT
+
+
+@dataclass(frozen=True, slots=True)
+class Computed:
+    """APIC attribute and NaC key derived from several model fields.
+
+    The function returns ``None`` if the attribute does not apply.
+    """
+
+    fields: tuple[str, ...]
+    func: Callable[[dict], object]
+    apic: str | None = None
+    nac: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Flag:
+    """Boolean field rendered as token of a comma-separated APIC attribute."""
+
+    field: str
+    on: str
+    off: str | None = None
+    nac: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FlagSet:
+    """Comma-separated APIC attribute composed of boolean flags."""
+
+    apic: str
+    flags: tuple[Flag, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Relation:
+    """Single-attribute APIC child object derived from a field.
+
+    Without ``apic_attr`` the child is a marker object present only if the
+    field is true (e.g. ``bgpExtP``); otherwise it is a named relation
+    (e.g. ``fvRsCtx``) present only if the field is not empty.
+    """
+
+    apic_class: str
+    field: str
+    apic_attr: str | None = None
+    nac: str | None = None
+    template: str = "{}"
+
+
+@dataclass(frozen=True, eq=False)
+class ObjectSpec:
+    """Mapping of a plugin model to an APIC class and a NaC list key."""
+
+    model: type
+    apic_class: str
+    nac: str
+    parent: str | None = None
+    attributes: tuple[Attribute | Computed, ...] = ()
+    flag_sets: tuple[FlagSet, ...] = ()
+    relations: tuple[Relation, ...] = ()
+    children: tuple[ObjectSpec, ...] = ()
+    static_attributes: tuple[tuple[str, str], ...] = ()
+    filters: dict = field(default_factory=dict)
+    order_by: tuple[str, ...] = ("name",)
+    # Relative name (RN) of the APIC object as template of field values (or
+    # function of the field values); objects without RN are not diffed
+    rn: str | Callable[[dict], str] | None = None
+    # APIC class chosen by the value of a field (e.g. fvRsProv/fvRsCons)
+    apic_class_field: str | None = None
+    apic_class_map: dict = field(default_factory=dict)
+    # Wrapping APIC object of the children (e.g. fvCrtrn of uSeg EPGs),
+    # with attributes taken from the parent object
+    container: str | None = None
+    container_attributes: tuple[Attribute, ...] = ()
+    container_static_attributes: tuple[tuple[str, str], ...] = ()
+    # NaC rendering as list of scalars, optionally grouped by a field
+    nac_value: str | None = None
+    nac_group_field: str | None = None
+    nac_group_map: dict = field(default_factory=dict)
+
+    @property
+    def fields(self) -> set[str]:
+        """Return the model field paths required to render the object."""
+        fields = {"pk"}
+        if self.parent:
+            fields.add(f"{self.parent}_id")
+        for attribute in self.attributes:
+            if isinstance(attribute, Computed):
+                fields.update(attribute.fields)
+            else:
+                fields.add(attribute.field)
+        for flag_set in self.flag_sets:
+            fields.update(flag.field for flag in flag_set.flags)
+        fields.update(relation.field for relation in self.relations)
+        for child in self.children:
+            fields.update(attribute.field for attribute in child.container_attributes)
+        for name in (self.apic_class_field, self.nac_value, self.nac_group_field):
+            if name:
+                fields.add(name)
+        return fields
+
+    def from_apic(self, mo: ManagedObject) -> dict:
+        """Return the model field values of an APIC managed object.
+
+        Only attributes present in the managed object are returned. Values of
+        related fields (e.g. ``aci_vrf__name``) are returned by their lookup
+        path and must be resolved by the caller.
+        """
+        values = {}
+        for attribute in self.attributes:
+            if isinstance(attribute, Attribute) and attribute.apic in mo.attributes:
+                values[attribute.field] = attribute.codec.from_apic(
+                    mo.attributes[attribute.apic]
+                )
+        for flag_set in self.flag_sets:
+            if flag_set.apic in mo.attributes:
+                tokens = set(mo.attributes[flag_set.apic].split(","))
+                for flag in flag_set.flags:
+                    values[flag.field] = flag.on in tokens
+        for relation in self.relations:
+            child = next(mo.get_children(relation.apic_class), None)
+            if relation.apic_attr is None:
+                values[relation.field] = child is not None
+            elif child is not None:
+                prefix, _, suffix = relation.template.partition("{}")
+                value = child.attributes.get(relation.apic_attr, "")
+                values[relation.field] = value.removeprefix(prefix).removesuffix(suffix)
+        if self.apic_class_field:
+            apic_classes = {value: key for key, value in self.apic_class_map.items()}
+            values[self.apic_class_field] = apic_classes[mo.apic_class]
+        return values
+
+    def get_rn(self, values: dict) -> str:
+        """Return the relative name (RN) of the object with given values."""
+        if callable(self.rn):
+            return self.rn(values)
+        return self.rn.format_map(values)
+
+
+NAME_ATTRIBUTES: tuple[Attribute, ...] = (
+    Attribute("name", "name", "name"),
+    Attribute("name_alias", "nameAlias", "alias"),
+    Attribute("description", "descr", "description"),
+)
+
+
+def _ip_host(value) -> str | None:
+    """Return the host address of an IP address value."""
+    return str(value.ip) if value is not None else None
+
+
+def _epg_dn(row: dict) -> str | None:
+    """Return the DN of the EPG or uSeg EPG selected by an ESG selector."""
+    for prefix in ("_aci_endpoint_group", "_aci_useg_endpoint_group"):
+        if row[f"{prefix}__name"]:
+            return (
+                f"uni/tn-{row[f'{prefix}__aci_app_profile__aci_tenant__name']}"
+                f"/ap-{row[f'{prefix}__aci_app_profile__name']}"
+                f"/epg-{row[f'{prefix}__name']}"
+            )
+    return None
+
+
+def _ep_selector_expression(row: dict) -> str | None:
+    """Return the match expression of an ESG endpoint (IP subnet) selector."""
+    value = _ip_host(row["_ip_address__address"]) or row["_prefix__prefix"]
+    return f"ip=='{value}'" if value else None
+
+
+def _ep_selector_ip(row: dict) -> str | None:
+    """Return the IP address or prefix of an ESG endpoint selector."""
+    value = _ip_host(row["_ip_address__address"]) or row["_prefix__prefix"]
+    return str(value) if value else None
+
+
+def _useg_ip(row: dict) -> str | None:
+    """Return the IP value of a uSeg network attribute."""
+    if row["type"] != "ip":
+        return None
+    if row["use_epg_subnet"]:
+        return "0.0.0.0"
+    value = _ip_host(row["_ip_address__address"]) or row["_prefix__prefix"]
+    return str(value) if value else None
+
+
+def _useg_mac(row: dict) -> str | None:
+    """Return the MAC value of a uSeg network attribute."""
+    if row["type"] != "mac" or row["_mac_address__mac_address"] is None:
+        return None
+    return str(row["_mac_address__mac_address"])
+
+
+_EP_SELECTOR_FIELDS = ("_ip_address__address", "_prefix__prefix")
+_EPG_SELECTOR_FIELDS = tuple(
+    f"{prefix}__{path}"
+    for prefix in ("_aci_endpoint_group", "_aci_useg_endpoint_group")
+    for path in ("name", "aci_app_profile__name", "aci_app_profile__aci_tenant__name")
+)
+
+
+def contract_relation_spec(parent: str) -> ObjectSpec:
+    """Return the spec of the contract relations attached via ``parent``."""
+    return ObjectSpec(
+        model=ACIContractRelation,
+        apic_class="fvRsProv",
+        rn="rs{role}-{aci_contract__name}",
+        nac="contracts",
+        parent=parent,
+        attributes=(Attribute("aci_contract__name", "tnVzBrCPName"),),
+        filters={f"{parent}__isnull": False},
+        order_by=("role", "aci_contract__name"),
+        apic_class_field="role",
+        apic_class_map={"prov": "fvRsProv", "cons": "fvRsCons"},
+        nac_value="aci_contract__name",
+        nac_group_field="role",
+        nac_group_map={"prov": "providers", "cons": "consumers"},
+    )
+
+
+EPG_ATTRIBUTES: tuple[Attribute, ...] = (
+    *NAME_ATTRIBUTES,
+    Attribute("admin_shutdown", "shutdown", "shutdown", YES_NO),
+    Attribute(
+        "flood_in_encap_enabled", "floodOnEncap", "flood_in_encap", ENABLED_DISABLED
+    ),
+    Attribute(
+        "intra_epg_isolation_enabled",
+        "pcEnfPref",
+        "intra_epg_isolation",
+        ENFORCED_UNENFORCED,
+    ),
+    Attribute(
+        "preferred_group_member_enabled",
+        "prefGrMemb",
+        "preferred_group",
+        INCLUDE_EXCLUDE,
+    ),
+    Attribute("qos_class", "prio", "qos_class"),
+)
+EPG_RELATIONS: tuple[Relation, ...] = (
+    Relation("fvRsBd", "aci_bridge_domain__name", "tnFvBDName", "bridge_domain"),
+    Relation(
+        "fvRsCustQosPol", "custom_qos_policy_name", "tnQosCustomPolName", "qos_policy"
+    ),
+)
+
+
+VRF_SPEC = ObjectSpec(
+    model=ACIVRF,
+    apic_class="fvCtx",
+    rn="ctx-{name}",
+    nac="vrfs",
+    parent="aci_tenant",
+    attributes=(
+        *NAME_ATTRIBUTES,
+        Attribute(
+            "bd_enforcement_enabled", "bdEnforcedEnable", "bd_enforcement", YES_NO
+        ),
+        Attribute(
+            "ip_data_plane_learning_enabled",
+            "ipDataPlaneLearning",
+            "data_plane_learning",
+            ENABLED_DISABLED,
+        ),
+        Attribute("pc_enforcement_direction", "pcEnfDir", "enforcement_direction"),
+        Attribute("pc_enforcement_preference", "pcEnfPref", "enforcement_preference"),
+        Attribute("preferred_group_enabled", nac="preferred_group"),
+        Attribute("dns_labels", nac="dns_labels", codec=LIST),
+    ),
+)
+
+BRIDGE_DOMAIN_SUBNET_SPEC = ObjectSpec(
+    model=ACIBridgeDomainSubnet,
+    apic_class="fvSubnet",
+    rn="subnet-[{gateway_ip_address__address}]",
+    nac="subnets",
+    parent="aci_bridge_domain",
+    attributes=(
+        *NAME_ATTRIBUTES,
+        Attribute("gateway_ip_address__address", "ip", "ip"),
+        Attribute(
+            "ip_data_plane_learning_enabled",
+            "ipDPLearning",
+            "ip_dataplane_learning",
+            ENABLED_DISABLED,
+        ),
+        Attribute("preferred_ip_address_enabled", "preferred", "primary_ip", YES_NO),
+        Attribute("virtual_ip_enabled", "virtual", "virtual", YES_NO),
+    ),
+    flag_sets=(
+        FlagSet(
+            "ctrl",
+            (
+                Flag("igmp_querier_enabled", "querier", nac="igmp_querier"),
+                Flag("nd_ra_enabled", "nd", nac="nd_ra_prefix"),
+                Flag(
+                    "no_default_gateway",
+                    "no-default-gateway",
+                    nac="no_default_gateway",
+                ),
+            ),
+        ),
+        FlagSet(
+            "scope",
+            (
+                Flag(
+                    "advertised_externally_enabled",
+                    "public",
+                    "private",
+                    nac="public",
+                ),
+                Flag("shared_enabled", "shared", nac="shared"),
+            ),
+        ),
+    ),
+    relations=(
+        Relation(
+            "fvRsNdPfxPol",
+            "nd_ra_prefix_policy_name",
+            "tnNdPfxPolName",
+            "nd_ra_prefix_policy",
+        ),
+    ),
+    order_by=("gateway_ip_address__address", "name"),
+)
+
+BRIDGE_DOMAIN_SPEC = ObjectSpec(
+    model=ACIBridgeDomain,
+    apic_class="fvBD",
+    rn="BD-{name}",
+    nac="bridge_domains",
+    parent="aci_tenant",
+    attributes=(
+        *NAME_ATTRIBUTES,
+        Attribute(
+            "advertise_host_routes_enabled",
+            "hostBasedRouting",
+            "advertise_host_routes",
+            YES_NO,
+        ),
+        Attribute("arp_flooding_enabled", "arpFlood", "arp_flooding", YES_NO),
+        Attribute(
+            "clear_remote_mac_enabled", "epClear", "clear_remote_mac_entries", YES_NO
+        ),
+        Attribute("dhcp_labels", nac="dhcp_labels", codec=LIST),
+        Attribute(
+            "ep_move_detection_enabled",
+            "epMoveDetectMode",
+            "ep_move_detection",
+            BooleanCodec("garp", ""),
+        ),
+        Attribute(
+            "ip_data_plane_learning_enabled",
+            "ipLearning",
+            "ip_dataplane_learning",
+            YES_NO,
+        ),
+        Attribute(
+            "limit_ip_learn_enabled",
+            "limitIpLearnToSubnets",
+            "limit_ip_learn_to_subnets",
+            YES_NO,
+        ),
+        Attribute("mac_address", "mac", "mac"),
+        Attribute(
+            "multi_destination_flooding",
+            "multiDstPktAct",
+            "multi_destination_flooding",
+        ),
+        Attribute("pim_ipv4_enabled", "mcastAllow", "l3_multicast", YES_NO),
+        Attribute("pim_ipv6_enabled", "ipv6McastAllow", "l3_multicast_ipv6", YES_NO),
+        Attribute("unicast_routing_enabled", "unicastRoute", "unicast_routing", YES_NO),
+        Attribute("unknown_ipv4_multicast", "unkMcastAct", "unknown_ipv4_multicast"),
+        Attribute("unknown_ipv6_multicast", "v6unkMcastAct", "unknown_ipv6_multicast"),
+        Attribute("unknown_unicast", "unkMacUcastAct", "unknown_unicast"),
+        Attribute("virtual_mac_address", "vmac", "virtual_mac"),
+    ),
+    relations=(
+        Relation("fvRsCtx", "aci_vrf__name", "tnFvCtxName", "vrf"),
+        Relation(
+            "fvRsIgmpsn",
+            "igmp_snooping_policy_name",
+            "tnIgmpSnoopPolName",
+            "igmp_snooping_policy",
+        ),
+    ),
+    children=(
+        BRIDGE_DOMAIN_SUBNET_SPEC,
+        ObjectSpec(
+            model=ACIBridgeDomainL3OutBinding,
+            apic_class="fvRsBDToOut",
+            rn="rsBDToOut-{aci_l3out__name}",
+            nac="l3outs",
+            parent="aci_bridge_domain",
+            attributes=(Attribute("aci_l3out__name", "tnL3extOutName"),),
+            order_by=("aci_l3out__name",),
+            nac_value="aci_l3out__name",
+        ),
+    ),
+)
+
+ENDPOINT_GROUP_SPEC = ObjectSpec(
+    model=ACIEndpointGroup,
+    apic_class="fvAEPg",
+    rn="epg-{name}",
+    nac="endpoint_groups",
+    parent="aci_app_profile",
+    attributes=(
+        *EPG_ATTRIBUTES,
+        Attribute("proxy_arp_enabled", nac="proxy_arp"),
+    ),
+    relations=EPG_RELATIONS,
+    children=(contract_relation_spec("_aci_endpoint_group"),),
+)
+
+APP_PROFILE_SPEC = ObjectSpec(
+    model=ACIAppProfile,
+    apic_class="fvAp",
+    rn="ap-{name}",
+    nac="application_profiles",
+    parent="aci_tenant",
+    attributes=NAME_ATTRIBUTES,
+    children=(
+        ENDPOINT_GROUP_SPEC,
+        ObjectSpec(
+            model=ACIUSegEndpointGroup,
+            apic_class="fvAEPg",
+            rn="epg-{name}",
+            nac="useg_endpoint_groups",
+            parent="aci_app_profile",
+            attributes=(
+                *EPG_ATTRIBUTES,
+                Attribute("match_operator", nac="match_type"),
+            ),
+            relations=EPG_RELATIONS,
+            static_attributes=(("isAttrBasedEPg", "yes"),),
+            children=(
+                ObjectSpec(
+                    model=ACIUSegNetworkAttribute,
+                    apic_class="fvIpAttr",
+                    rn="crtrn/{type}attr-{name}",
+                    nac="attributes",
+                    parent="aci_useg_endpoint_group",
+                    attributes=(
+                        *NAME_ATTRIBUTES,
+                        Attribute("type", nac="type"),
+                        Computed(
+                            ("type", "use_epg_subnet", *_EP_SELECTOR_FIELDS),
+                            _useg_ip,
+                            apic="ip",
+                            nac="ip",
+                        ),
+                        Computed(
+                            ("type", "_mac_address__mac_address"),
+                            _useg_mac,
+                            apic="mac",
+                            nac="mac",
+                        ),
+                        Attribute(
+                            "use_epg_subnet", "usefvSubnet", "use_epg_subnet", YES_NO
+                        ),
+                    ),
+                    apic_class_field="type",
+                    apic_class_map={"ip": "fvIpAttr", "mac": "fvMacAttr"},
+                    container="fvCrtrn",
+                    container_attributes=(Attribute("match_operator", "match"),),
+                    container_static_attributes=(("name", "default"),),
+                ),
+                contract_relation_spec("_aci_useg_endpoint_group"),
+            ),
+        ),
+        ObjectSpec(
+            model=ACIEndpointSecurityGroup,
+            apic_class="fvESg",
+            rn="esg-{name}",
+            nac="endpoint_security_groups",
+            parent="aci_app_profile",
+            attributes=(
+                *NAME_ATTRIBUTES,
+                Attribute("admin_shutdown", "shutdown", "shutdown", YES_NO),
+                Attribute(
+                    "intra_esg_isolation_enabled",
+                    "pcEnfPref",
+                    "intra_esg_isolation",
+                    ENFORCED_UNENFORCED,
+                ),
+                Attribute(
+                    "preferred_group_member_enabled",
+                    "prefGrMemb",
+                    "preferred_group",
+                    INCLUDE_EXCLUDE,
+                ),
+            ),
+            relations=(Relation("fvRsScope", "aci_vrf__name", "tnFvCtxName", "vrf"),),
+            children=(
+                ObjectSpec(
+                    model=ACIEsgEndpointGroupSelector,
+                    apic_class="fvEPgSelector",
+                    nac="epg_selectors",
+                    parent="aci_endpoint_security_group",
+                    attributes=(
+                        *NAME_ATTRIBUTES,
+                        Computed(
+                            _EPG_SELECTOR_FIELDS,
+                            _epg_dn,
+                            apic="matchEpgDn",
+                            nac="endpoint_group_dn",
+                        ),
+                    ),
+                ),
+                ObjectSpec(
+                    model=ACIEsgEndpointSelector,
+                    apic_class="fvEPSelector",
+                    nac="ip_subnet_selectors",
+                    parent="aci_endpoint_security_group",
+                    attributes=(
+                        *NAME_ATTRIBUTES,
+                        Computed(
+                            _EP_SELECTOR_FIELDS,
+                            _ep_selector_expression,
+                            apic="matchExpression",
+                        ),
+                        Computed(_EP_SELECTOR_FIELDS, _ep_selector_ip, nac="value"),
+                    ),
+                ),
+                contract_relation_spec("_aci_endpoint_security_group"),
+            ),
+        ),
+    ),
+)
+
+L3OUT_SPEC = ObjectSpec(
+    model=ACIL3Out,
+    apic_class="l3extOut",
+    rn="out-{name}",
+    nac="l3outs",
+    parent="aci_tenant",
+    attributes=(
+        *NAME_ATTRIBUTES,
+        Attribute("target_dscp", "targetDscp", "target_dscp"),
+    ),
+    flag_sets=(
+        FlagSet(
+            "enforceRtctrl",
+            (
+                Flag("export_route_control_enforcement_enabled", "export"),
+                Flag(
+                    "import_route_control_enforcement_enabled",
+                    "import",
+                    nac="import_route_control_enforcement",
+                ),
+            ),
+        ),
+    ),
+    relations=(
+        Relation("l3extRsEctx", "aci_vrf__name", "tnFvCtxName", "vrf"),
+        Relation(
+            "l3extRsL3DomAtt",
+            "aci_routed_domain__name",
+            "tDn",
+            "domain",
+            template="uni/l3dom-{}",
+        ),
+        Relation("bgpExtP", "bgp_enabled", nac="bgp"),
+        Relation("ospfExtP", "ospf_enabled", nac="ospf"),
+        Relation("eigrpExtP", "eigrp_enabled", nac="eigrp"),
+    ),
+    children=(
+        ObjectSpec(
+            model=ACIExternalEndpointGroup,
+            apic_class="l3extInstP",
+            rn="instP-{name}",
+            nac="external_endpoint_groups",
+            parent="aci_l3out",
+            attributes=(
+                *NAME_ATTRIBUTES,
+                Attribute(
+                    "preferred_group_member_enabled",
+                    "prefGrMemb",
+                    "preferred_group",
+                    INCLUDE_EXCLUDE,
+                ),
+                Attribute("qos_class", "prio", "qos_class"),
+                Attribute("target_dscp", "targetDscp", "target_dscp"),
+            ),
+            children=(
+                ObjectSpec(
+                    model=ACIExternalSubnet,
+                    apic_class="l3extSubnet",
+                    rn="extsubnet-[{matched_prefix}]",
+                    nac="subnets",
+                    parent="aci_external_endpoint_group",
+                    attributes=(
+                        *NAME_ATTRIBUTES,
+                        Attribute("matched_prefix", "ip", "prefix"),
+                    ),
+                    flag_sets=(
+                        FlagSet(
+                            "scope",
+                            (
+                                Flag(
+                                    "export_route_control_enabled",
+                                    "export-rtctrl",
+                                    nac="export_route_control",
+                                ),
+                                Flag(
+                                    "import_route_control_enabled",
+                                    "import-rtctrl",
+                                    nac="import_route_control",
+                                ),
+                                Flag(
+                                    "import_security_enabled",
+                                    "import-security",
+                                    nac="import_security",
+                                ),
+                                Flag(
+                                    "shared_route_control_enabled",
+                                    "shared-rtctrl",
+                                    nac="shared_route_control",
+                                ),
+                                Flag(
+                                    "shared_security_enabled",
+                                    "shared-security",
+                                    nac="shared_security",
+                                ),
+                            ),
+                        ),
+                        FlagSet(
+                            "aggregate",
+                            (
+                                Flag(
+                                    "aggregate_export_route_control_enabled",
+                                    "export-rtctrl",
+                                    nac="aggregate_export_route_control",
+                                ),
+                                Flag(
+                                    "aggregate_import_route_control_enabled",
+                                    "import-rtctrl",
+                                    nac="aggregate_import_route_control",
+                                ),
+                                Flag(
+                                    "aggregate_shared_route_control_enabled",
+                                    "shared-rtctrl",
+                                    nac="aggregate_shared_route_control",
+                                ),
+                            ),
+                        ),
+                    ),
+                    order_by=("matched_prefix", "name"),
+                ),
+                contract_relation_spec("_aci_external_endpoint_group"),
+            ),
+        ),
+    ),
+)
+
+CONTRACT_FILTER_ENTRY_SPEC = ObjectSpec(
+    model=ACIContractFilterEntry,
+    apic_class="vzEntry",
+    rn="e-{name}",
+    nac="entries",
+    parent="aci_contract_filter",
+    attributes=(
+        *NAME_ATTRIBUTES,
+        Attribute("arp_opc", "arpOpc", "arp_flag"),
+        Attribute("destination_from_port", "dFromPort", "destination_from_port"),
+        Attribute("destination_to_port", "dToPort", "destination_to_port"),
+        Attribute("ether_type", "etherT", "ethertype"),
+        Attribute("ip_protocol", "prot", "protocol"),
+        Attribute("match_dscp", "matchDscp", "match_dscp"),
+        Attribute(
+            "match_only_fragments_enabled",
+            "applyToFrag",
+            "match_only_fragments",
+            YES_NO,
+        ),
+        Attribute("source_from_port", "sFromPort", "source_from_port"),
+        Attribute("source_to_port", "sToPort", "source_to_port"),
+        Attribute("stateful_enabled", "stateful", "stateful", YES_NO),
+        Attribute("tcp_rules", "tcpRules", "tcp_flags", LIST),
+    ),
+)
+
+CONTRACT_FILTER_SPEC = ObjectSpec(
+    model=ACIContractFilter,
+    apic_class="vzFilter",
+    rn="flt-{name}",
+    nac="filters",
+    parent="aci_tenant",
+    attributes=NAME_ATTRIBUTES,
+    children=(CONTRACT_FILTER_ENTRY_SPEC,),
+)
+
+# Subject filter relations by their container object, as (APIC class,
+# apply direction, RN prefix) of the container's relations
+SUBJECT_FILTER_TERMS: dict[str, tuple[str, str, str]] = {
+    "vzSubj": ("vzRsSubjFiltAtt", "both", "rssubjFiltAtt"),
+    "vzInTerm": ("vzRsFiltAtt", "ctp", "intmnl/rsfiltAtt"),
+    "vzOutTerm": ("vzRsFiltAtt", "ptc", "outtmnl/rsfiltAtt"),
+}
+
+
+def iter_subject_filters(mo: ManagedObject) -> Iterator[tuple[ManagedObject, str]]:
+    """Yield the filter relations of a vzSubj with their apply direction.
+
+    Filters applied in both directions are children of the subject, while
+    direction-specific filters are children of its vzInTerm or vzOutTerm.
+    """
+    for term in (mo, *mo.get_children("vzInTerm", "vzOutTerm")):
+        apic_class, apply_direction, _prefix = SUBJECT_FILTER_TERMS[term.apic_class]
+        for child in term.get_children(apic_class):
+            yield child, apply_direction
+
+
+def applies_both_directions(mo: ManagedObject) -> bool:
+    """Return whether a vzSubj applies its filters in both directions.
+
+    Subjects applying their filters per direction hold a vzInTerm and a
+    vzOutTerm (possibly without filters).
+    """
+    return not any(mo.get_children("vzInTerm", "vzOutTerm"))
+
+
+def _subject_filter_rn(values: dict) -> str:
+    """Return the RN of a subject filter relation by its apply direction."""
+    prefix = next(
+        prefix
+        for _apic_class, apply_direction, prefix in SUBJECT_FILTER_TERMS.values()
+        if apply_direction == values["apply_direction"]
+    )
+    return f"{prefix}-{values['aci_contract_filter__name']}"
+
+
+CONTRACT_SUBJECT_FILTER_SPEC = ObjectSpec(
+    model=ACIContractSubjectFilter,
+    apic_class="vzRsSubjFiltAtt",
+    rn=_subject_filter_rn,
+    nac="filters",
+    parent="aci_contract_subject",
+    attributes=(
+        Attribute("aci_contract_filter__name", "tnVzFilterName", "filter"),
+        Attribute("action", "action", "action"),
+        Attribute("apply_direction", nac="apply_direction"),
+        Attribute("priority", "priorityOverride", "priority"),
+    ),
+    flag_sets=(
+        FlagSet(
+            "directives",
+            (
+                Flag("log_enabled", "log", nac="log"),
+                Flag(
+                    "policy_compression_enabled",
+                    "no_stats",
+                    nac="no_stats",
+                ),
+            ),
+        ),
+    ),
+    order_by=("aci_contract_filter__name",),
+)
+
+CONTRACT_SUBJECT_SPEC = ObjectSpec(
+    model=ACIContractSubject,
+    apic_class="vzSubj",
+    rn="subj-{name}",
+    nac="subjects",
+    parent="aci_contract",
+    attributes=(
+        *NAME_ATTRIBUTES,
+        Attribute("apply_both_directions_enabled", nac="apply_both_directions"),
+        Attribute("qos_class", "prio", "qos_class"),
+        Attribute(
+            "reverse_filter_ports_enabled",
+            "revFltPorts",
+            "reverse_filter_ports",
+            YES_NO,
+        ),
+        Attribute("target_dscp", "targetDscp", "target_dscp"),
+    ),
+    relations=(
+        Relation(
+            "vzRsSubjGraphAtt",
+            "service_graph_name",
+            "tnVnsAbsGraphName",
+            "service_graph",
+        ),
+    ),
+    children=(CONTRACT_SUBJECT_FILTER_SPEC,),
+)
+
+CONTRACT_SPEC = ObjectSpec(
+    model=ACIContract,
+    apic_class="vzBrCP",
+    rn="brc-{name}",
+    nac="contracts",
+    parent="aci_tenant",
+    attributes=(
+        *NAME_ATTRIBUTES,
+        Attribute("qos_class", "prio", "qos_class"),
+        Attribute("scope", "scope", "scope"),
+        Attribute("target_dscp", "targetDscp", "target_dscp"),
+    ),
+    children=(CONTRACT_SUBJECT_SPEC,),
+)
+
+TENANT_SPEC = ObjectSpec(
+    model=ACITenant,
+    apic_class="fvTenant",
+    rn="tn-{name}",
+    nac="tenants",
+    attributes=NAME_ATTRIBUTES,
+    children=(
+        VRF_SPEC,
+        BRIDGE_DOMAIN_SPEC,
+        APP_PROFILE_SPEC,
+        L3OUT_SPEC,
+        CONTRACT_FILTER_SPEC,
+        CONTRACT_SPEC,
+    ),
+)
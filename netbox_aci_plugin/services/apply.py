@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Idempotent apply of desired-state ACI Tenant documents.
+
+A document holds whole ACI Tenant trees in the APIC JSON format of the
+tenant export and the snapshot ingest. The existing subtrees of the tenants
+are loaded with one query per model and compared with the document in
+memory by the snapshot diff, which yields the plan: the objects to create,
+update, and delete. A document matching the plugin objects results in an
+empty plan and nothing is written.
+
+Otherwise, the plan is applied in a single transaction. The created and
+updated objects are validated per model as a set and by the model rules,
+and written with bulk upserts by the snapshot ingester, skipping the
+unchanged objects. The created objects are then checked against the
+constraints of the user's "add" permissions, like the REST API does. The
+objects missing from the document are deleted with a bulk delete per model
+in reverse dependency order. The transaction is rolled back if an object
+fails validation or cannot be deleted, and for a dry run.
+
+The compared and written objects are those of the snapshot ingest (see
+``INGESTED_SPECS``); other objects of the tenants are kept.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import ProtectedError, RestrictedError
+
+from utilities.permissions import get_permission_for_model
+
+from .apic import BRIDGE_DOMAIN_SUBNET_SPEC, TENANT_SPEC, ManagedObject
+from .diff import DIFF_ADDED, DIFF_CHANGED, DIFF_DELETED, ObjectDiff, SnapshotDiff
+from .ingest import INGESTED_SPECS, SnapshotIngester
+from .route_leaks import bulk_route_leak_changes
+from .teardown import get_dependency_order
+
+if TYPE_CHECKING:
+    from users.models import User
+
+    from ..models.fabric.fabrics import ACIFabric
+
+# Objects written per INSERT and deleted per DELETE statement
+BULK_BATCH_SIZE = 1000
+
+# Permission action required by each planned change
+PERMISSION_ACTIONS = {
+    DIFF_ADDED: "add",
+    DIFF_CHANGED: "change",
+    DIFF_DELETED: "delete",
+}
+
+
+@dataclass(slots=True)
+class ApplyResult:
+    """Plan and outcome of applying ACI Tenant documents."""
+
+    dry_run: bool
+    applied: bool = False
+    counts: dict[str, int] = field(default_factory=dict)
+    changes: list[ObjectDiff] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+    warnings: list[dict] = field(default_factory=list)
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "dry_run": self.dry_run,
+            "applied": self.applied,
+            "counts": self.counts,
+            "changes": [change.serialize() for change in self.changes],
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+
+class TenantApply:
+    """Apply desired-state ACI Tenant documents to an ACI Fabric.
+
+    Applying the plan requires the given user to be permitted to add,
+    change, and delete the planned objects.
+    """
+
+    def __init__(
+        self,
+        aci_fabric: ACIFabric,
+        user: User | None = None,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> None:
+        """Initialize the apply for the given ACI Fabric."""
+        self.aci_fabric = aci_fabric
+        self.user = user
+        self.batch_size = batch_size
+
+    def apply(
+        self, tenants: Iterable[ManagedObject], dry_run: bool = False
+    ) -> ApplyResult:
+        """Apply the ACI Tenant managed objects and return the result.
+
+        A dry run applies the plan to validate it and rolls it back.
+        Raises PermissionDenied if the user may not apply the plan.
+        """
+        tenants = list(tenants)
+        snapshot_diff = SnapshotDiff(
+            self.aci_fabric,
+            tenant_names={TENANT_SPEC.from_apic(mo).get("name", "") for mo in tenants},
+            specs=INGESTED_SPECS,
+        )
+        changes = list(snapshot_diff.iter_diffs(tenants))
+        result = ApplyResult(
+            dry_run=dry_run, counts=snapshot_diff.counts, changes=changes
+        )
+        if not changes:
+            result.applied = not dry_run
+            return result
+        self.check_permissions(changes)
+
+        with (
+            bulk_route_leak_changes(self.aci_fabric.pk),
+            transaction.atomic(),
+        ):
+            ingester = SnapshotIngester(
+                self.aci_fabric,
+                batch_size=self.batch_size,
+                unchanged=snapshot_diff.unchanged,
+            )
+            for mo in tenants:
+                ingester.ingest_tenant(mo)
+            result.errors.extend(ingester.result.errors)
+            result.warnings.extend(ingester.result.warnings)
+            if not result.errors:
+                self.check_added(changes, ingester.written)
+                self._delete(changes, ingester.written, result)
+            result.applied = not (dry_run or result.errors)
+            if not result.applied:
+                transaction.set_rollback(True)
+        return result
+
+    def check_permissions(self, changes: list[ObjectDiff]) -> None:
+        """Check the user may apply the planned changes.
+
+        Raises PermissionDenied with the models of the objects the user may
+        not add, change, or delete. The constraints of the "add" permissions
+        are checked on the created objects by ``check_added()``.
+        """
+        if self.user is None:
+            return
+        planned: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for change in changes:
+            planned[(change.model, PERMISSION_ACTIONS[change.action])].append(change.pk)
+        # New Bridge Domain subnets get new gateway IP addresses
+        if (BRIDGE_DOMAIN_SUBNET_SPEC.model._meta.label, "add") in planned:
+            planned[("ipam.IPAddress", "add")] = []
+
+        denied = []
+        for (label, action), pks in planned.items():
+            model = apps.get_model(label)
+            if action == "add":
+                permitted = self.user.has_perm(get_permission_for_model(model, action))
+            else:
+                permitted = model.objects.restrict(self.user, action).filter(
+                    pk__in=pks
+                ).count() == len(pks)
+            if not permitted:
+                denied.append(f"{action} {model._meta.verbose_name_plural}")
+        if denied:
+            raise PermissionDenied(
+                f"The following changes are not permitted: {', '.join(denied)}."
+            )
+
+    def check_added(
+        self, changes: list[ObjectDiff], written: dict[str, set[int]]
+    ) -> None:
+        """Check the user may add the objects created by the apply.
+
+        The written objects other than the changed and deleted (matched)
+        objects of the plan are created. They are checked within the
+        transaction against the object permission constraints, and raise
+        PermissionDenied with the models of the objects the user may not add.
+        """
+        if self.user is None:
+            return
+        existing: dict[str, set[int]] = defaultdict(set)
+        for change in changes:
+            if change.action != DIFF_ADDED:
+                existing[change.model].add(change.pk)
+        denied = []
+        for label, pks in written.items():
+            if not (created := pks - existing[label]):
+                continue
+            model = apps.get_model(label)
+            if model.objects.restrict(self.user, "add").filter(
+                pk__in=created
+            ).count() != len(created):
+                denied.append(f"add {model._meta.verbose_name_plural}")
+        if denied:
+            raise PermissionDenied(
+                f"The following changes are not permitted: {', '.join(denied)}."
+            )
+
+    def _delete(
+        self,
+        changes: list[ObjectDiff],
+        written: dict[str, set[int]],
+        result: ApplyResult,
+    ) -> None:
+        """Delete the objects missing from the documents, dependents first.
+
+        Objects written by the ingest are kept, as an object may be matched
+        under a new DN (e.g. a subnet by its name with a new gateway IP).
+        """
+        deleted: dict[str, list[int]] = defaultdict(list)
+        for change in changes:
+            if change.action == DIFF_DELETED and change.pk not in written[change.model]:
+                deleted[change.model].append(change.pk)
+        for model, _fields in reversed(get_dependency_order()):
+            pks = deleted.get(model._meta.label)
+            if not pks:
+                continue
+            try:
+                for index in range(0, len(pks), self.batch_size):
+                    model.objects.filter(
+                        pk__in=pks[index : index + self.batch_size]
+                    ).delete()
+            except (ProtectedError, RestrictedError) as exc:
+                result.errors.append({"dn": None, "error": exc.args[0]})
+                return
+
+
+def apply_tenants(
+    aci_fabric: ACIFabric,
+    tenants: Iterable[ManagedObject],
+    dry_run: bool = False,
+    user: User | None = None,
+) -> ApplyResult:
+    """Apply the ACI Tenant managed objects to the ACI Fabric."""
+    return TenantApply(aci_fabric, user=user).apply(tenants, dry_run=dry_run)
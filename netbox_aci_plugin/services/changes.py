@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Change feed of the ACI objects created, updated, or deleted since a time.
+
+Created and updated objects are found by the indexed ``last_updated``
+timestamp of every model, which also covers the bulk writes of the ingest
+and the node onboarding that bypass the change log. Deleted objects no
+longer exist, so they are found in the change log (``ObjectChange``),
+filtered to the content types of the models.
+
+The feed covers the window from ``since`` up to ``until``, the time the
+feed was started, and is read in batches with keyset pagination by primary
+key.
+
+The timestamps are stamped when an object is written, not when its
+transaction commits, so a long transaction (an ingest, apply, or teardown)
+commits changes older than a feed started meanwhile. The cursor of the
+next poll therefore starts at the oldest transaction still open after the
+feed started (from ``pg_stat_activity``), or at ``until`` if there is none,
+less the configurable overlap (``change_feed_overlap`` setting) covering
+the clock skew between the NetBox workers and the database. Changes after
+the start of the cursor are reported again.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.models import ContentType
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange
+from netbox.plugins.utils import get_plugin_config
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+    from users.models import User
+
+PLUGIN_NAME = "netbox_aci_plugin"
+# Objects fetched per database round trip and yielded per batch
+CHANGE_FEED_BATCH_SIZE = 1000
+# Seconds before the start of a cursor repeated by its poll
+CHANGE_FEED_OVERLAP = 60
+CHANGE_FEED_CURSOR_SALT = f"{PLUGIN_NAME}.changes"
+
+
+@dataclass(slots=True, frozen=True)
+class Change:
+    """Created, updated, or deleted object of the change feed.
+
+    The instance is None for deleted objects.
+    """
+
+    action: str
+    model: type[Model]
+    object_id: int
+    time: datetime
+    instance: Model | None = None
+
+
+def change_feed_overlap() -> timedelta:
+    """Return the period before the start of a cursor repeated by its poll."""
+    return timedelta(
+        seconds=int(
+            get_plugin_config(PLUGIN_NAME, "change_feed_overlap", CHANGE_FEED_OVERLAP)
+        )
+    )
+
+
+def get_oldest_transaction_start() -> datetime | None:
+    """Return the start time of the oldest open transaction of the database.
+
+    The transaction of the current connection is not taken into account.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT min(xact_start) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+        )
+        return cursor.fetchone()[0]
+
+
+def encode_cursor(start: datetime) -> str:
+    """Return the opaque cursor continuing a feed at the given time.
+
+    The cursor starts the overlap period before the given time.
+    """
+    since = start - change_feed_overlap()
+    return signing.dumps(since.isoformat(), salt=CHANGE_FEED_CURSOR_SALT)
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """Return the start time of the feed of a cursor.
+
+    Raises a ValidationError if the cursor is invalid.
+    """
+    try:
+        return parse_since(signing.loads(cursor, salt=CHANGE_FEED_CURSOR_SALT))
+    except signing.BadSignature as exc:
+        raise ValidationError("Invalid cursor.") from exc
+
+
+def parse_since(value: str) -> datetime:
+    """Return the aware datetime of an ISO 8601 timestamp.
+
+    Timestamps without a timezone are in the current timezone. Raises a
+    ValidationError if the timestamp is invalid.
+    """
+    try:
+        since = parse_datetime(value)
+    except ValueError:
+        since = None
+    if since is None:
+        raise ValidationError(f"Invalid timestamp: {value}")
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+class ChangeFeed:
+    """Objects of the given models changed since a point in time.
+
+    The objects are restricted to those the given user may view; deleted
+    objects are reported for the models the user may view.
+    """
+
+    def __init__(
+        self,
+        querysets: Iterable[QuerySet],
+        since: datetime,
+        user: User | None = None,
+        batch_size: int = CHANGE_FEED_BATCH_SIZE,
+    ) -> None:
+        """Initialize the feed of the changes since the given time."""
+        self.since = since
+        self.until = timezone.now()
+        # Changes of the transactions open after the start are committed
+        # later with an older timestamp and continued by the cursor
+        oldest_transaction_start = get_oldest_transaction_start()
+        self.cursor_start = (
+            min(self.until, oldest_transaction_start)
+            if oldest_transaction_start is not None
+            else self.until
+        )
+        self.user = user
+        self.batch_size = batch_size
+        self.querysets = [
+            self._restrict(queryset)
+            for queryset in querysets
+            if self._has_view_permission(queryset.model)
+        ]
+
+    def _has_view_permission(self, model: type[Model]) -> bool:
+        """Return True if the user may view objects of the model."""
+        if self.user is None:
+            return True
+        return self.user.has_perm(
+            f"{model._meta.app_label}.view_{model._meta.model_name}"
+        )
+
+    def _restrict(self, queryset: QuerySet) -> QuerySet:
+        """Return the queryset restricted to objects viewable by the user."""
+        if self.user is None:
+            return queryset
+        return queryset.restrict(self.user, "view")
+
+    @property
+    def cursor(self) -> str:
+        """Opaque cursor of the next poll continuing this feed."""
+        return encode_cursor(self.cursor_start)
+
+    def iter_batches(self) -> Iterator[list[Change]]:
+        """Yield the changes in batches, model by model, deletions last."""
+        for queryset in self.querysets:
+            yield from self._iter_object_batches(queryset)
+        yield from self._iter_deletion_batches()
+
+    def _iter_object_batches(self, queryset: QuerySet) -> Iterator[list[Change]]:
+        """Yield the created and updated objects of a model in batches."""
+        queryset = queryset.filter(
+            last_updated__gt=self.since, last_updated__lte=self.until
+        ).order_by("pk")
+        last_pk = 0
+        while objects := list(queryset.filter(pk__gt=last_pk)[: self.batch_size]):
+            yield [
+                Change(
+                    action=(
+                        ObjectChangeActionChoices.ACTION_CREATE
+                        if instance.created and instance.created > self.since
+                        else ObjectChangeActionChoices.ACTION_UPDATE
+                    ),
+                    model=queryset.model,
+                    object_id=instance.pk,
+                    time=instance.last_updated,
+                    instance=instance,
+                )
+                for instance in objects
+            ]
+            last_pk = objects[-1].pk
+
+    def _iter_deletion_batches(self) -> Iterator[list[Change]]:
+        """Yield the objects deleted according to the change log in batches."""
+        content_types = ContentType.objects.get_for_models(
+            *(queryset.model for queryset in self.querysets)
+        )
+        models = {
+            content_type.pk: model for model, content_type in content_types.items()
+        }
+        if not models:
+            return
+        queryset = (
+            ObjectChange.objects.filter(
+                action=ObjectChangeActionChoices.ACTION_DELETE,
+                changed_object_type__in=list(models),
+                time__gt=self.since,
+                time__lte=self.until,
+            )
+            .order_by("pk")
+            .values_list("pk", "changed_object_type", "changed_object_id", "time")
+        )
+        last_pk = 0
+        while rows := list(queryset.filter(pk__gt=last_pk)[: self.batch_size]):
+            yield [
+                Change(
+                    action=ObjectChangeActionChoices.ACTION_DELETE,
+                    model=models[object_type_id],
+                    object_id=object_id,
+                    time=time,
+                )
+                for _pk, object_type_id, object_id, time in rows
+            ]
+            last_pk = rows[-1][0]
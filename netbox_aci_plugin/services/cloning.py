@@ -0,0 +1,599 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Deep clone of an ACI Tenant or Application Profile with its subtree.
+
+The objects of the subtree are read with one query per model and copied
+in memory, layer by layer in dependency order, and each layer is written
+with one bulk insert. The foreign keys and generic foreign keys of the
+copies are remapped to the copied objects. The content hashes of the
+copies are computed after each layer, as bulk inserts bypass ``save()``,
+and the tags of the objects are copied in bulk as well. Each Bridge Domain
+subnet gets a new gateway IP address.
+
+References to objects outside of the subtree (for example a VRF of the
+tenant *common*, or the Routed Domain of an L3Out) are kept within the
+same ACI Fabric. Cloned into another ACI Tenant or Fabric, the referenced
+objects are resolved by name: objects of the source tenant in the target
+tenant, objects of another tenant in the tenant of the same name in the
+target fabric, and fabric objects in the target fabric.
+
+The copies are validated by the model rules before each insert, and the
+inserted copies are checked against the constraints of the "add"
+permissions of the user. The names of the copies can be rewritten with
+regular expression rules. Any error aborts the clone and nothing is
+written.
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    PermissionDenied,
+    ValidationError,
+)
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from extras.models import TaggedItem
+from ipam.models import IPAddress
+
+from ..fragment_cache import invalidate_bulk_fragments
+from ..models.mixins import update_content_hashes
+from ..models.tenant.app_profiles import ACIAppProfile
+from ..models.tenant.bridge_domains import (
+    ACIBridgeDomain,
+    ACIBridgeDomainL3OutBinding,
+    ACIBridgeDomainSubnet,
+)
+from ..models.tenant.contract_filters import ACIContractFilter, ACIContractFilterEntry
+from ..models.tenant.contracts import (
+    ACIContract,
+    ACIContractRelation,
+    ACIContractSubject,
+    ACIContractSubjectFilter,
+)
+from ..models.tenant.endpoint_groups import (
+    ACIEndpointGroup,
+    ACIUSegEndpointGroup,
+    ACIUSegNetworkAttribute,
+)
+from ..models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+    ACIEsgEndpointSelector,
+)
+from ..models.tenant.l3outs import ACIExternalEndpointGroup, ACIExternalSubnet, ACIL3Out
+from ..models.tenant.tenants import ACITenant
+from ..models.tenant.vrfs import ACIVRF
+from .memberships import refresh_esg_memberships
+from .route_leaks import invalidate_route_leaks
+from .subnet_overlaps import find_bridge_domain_subnet_overlaps
+from .useg_networks import refresh_useg_networks
+from .validation import BatchValidator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.db.models import Model, QuerySet
+
+    from users.models import User
+
+    from ..models.fabric.fabrics import ACIFabric
+
+PLUGIN_NAME = "netbox_aci_plugin"
+# Objects written per INSERT statement
+BULK_BATCH_SIZE = 1000
+
+# Models of a subtree in dependency order with the relations to the parent
+# objects of their objects. Contract Relations belong to the subtree of
+# their object rather than of their contract, which may be in 'common'.
+CLONE_LAYERS: dict[type[Model], tuple[str, ...]] = {
+    ACITenant: (),
+    ACIVRF: ("aci_tenant",),
+    ACIContractFilter: ("aci_tenant",),
+    ACIContractFilterEntry: ("aci_contract_filter",),
+    ACIBridgeDomain: ("aci_tenant",),
+    ACIBridgeDomainSubnet: ("aci_bridge_domain",),
+    ACIL3Out: ("aci_tenant",),
+    ACIExternalEndpointGroup: ("aci_l3out",),
+    ACIExternalSubnet: ("aci_external_endpoint_group",),
+    ACIBridgeDomainL3OutBinding: ("aci_bridge_domain",),
+    ACIAppProfile: ("aci_tenant",),
+    ACIEndpointGroup: ("aci_app_profile",),
+    ACIUSegEndpointGroup: ("aci_app_profile",),
+    ACIUSegNetworkAttribute: ("aci_useg_endpoint_group",),
+    ACIEndpointSecurityGroup: ("aci_app_profile",),
+    ACIEsgEndpointGroupSelector: ("aci_endpoint_security_group",),
+    ACIEsgEndpointSelector: ("aci_endpoint_security_group",),
+    ACIContract: ("aci_tenant",),
+    ACIContractSubject: ("aci_contract",),
+    ACIContractSubjectFilter: ("aci_contract_subject",),
+    ACIContractRelation: (
+        "_aci_endpoint_group",
+        "_aci_useg_endpoint_group",
+        "_aci_endpoint_security_group",
+        "_aci_external_endpoint_group",
+        "_aci_vrf",
+    ),
+}
+# Fields set by the database or computed for the copies
+EXCLUDED_FIELDS = frozenset(("id", "created", "last_updated", "content_hash"))
+
+
+@dataclass(frozen=True, slots=True)
+class RenameRule:
+    """Regular expression substitution applied to the names of the copies."""
+
+    pattern: str
+    replacement: str
+
+    def apply(self, name: str) -> str:
+        """Return the name with the matches of the pattern replaced."""
+        return re.sub(self.pattern, self.replacement, name)
+
+
+@dataclass(slots=True)
+class CloneResult:
+    """Copy of the cloned root object and the number of copies per model."""
+
+    root: Model | None = None
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "object_type": self.root._meta.label_lower,
+            "id": self.root.pk,
+            "name": self.root.name,
+            "counts": self.counts,
+        }
+
+
+class SubtreeCloner:
+    """Clone an ACI Tenant or ACI Application Profile with its subtree.
+
+    An ACI Tenant is cloned into an ACI Fabric and an ACI Application
+    Profile into an ACI Tenant, by default the parent of the source. The
+    source objects are restricted to the objects the given user may view,
+    and the user must be permitted to add objects of the cloned models.
+    """
+
+    def __init__(
+        self,
+        source: ACITenant | ACIAppProfile,
+        target: ACIFabric | ACITenant | None = None,
+        name: str = "",
+        rename_rules: tuple[RenameRule, ...] = (),
+        user: User | None = None,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> None:
+        """Initialize the clone of the source into the target.
+
+        The name of the copy of the source defaults to the name of the
+        source rewritten by the rename rules.
+        """
+        self.source = source
+        self.name = name
+        self.rename_rules = rename_rules
+        self.user = user
+        self.batch_size = batch_size
+        # Primary keys of the copies and of the referenced objects outside
+        # of the subtree by the primary key of the source object, per model
+        self.copies: dict[type[Model], dict[int, int]] = defaultdict(dict)
+        self.references: dict[type[Model], dict[int, int]] = defaultdict(dict)
+        if isinstance(source, ACITenant):
+            self.source_tenant = source
+            self.target_fabric = target or source.aci_fabric
+            self.target_tenant: ACITenant | None = None
+            self.references[type(self.target_fabric)][source.aci_fabric_id] = (
+                self.target_fabric.pk
+            )
+        else:
+            self.source_tenant = source.aci_tenant
+            self.target_tenant = target or self.source_tenant
+            self.target_fabric = self.target_tenant.aci_fabric
+            self.references[ACITenant][self.source_tenant.pk] = self.target_tenant.pk
+        self.errors: list[str] = []
+        self.result = CloneResult()
+
+    def _restrict(self, queryset: QuerySet) -> QuerySet:
+        """Return the queryset restricted to objects viewable by the user."""
+        if self.user is None:
+            return queryset
+        return queryset.restrict(self.user, "view")
+
+    def _rename(self, name: str) -> str:
+        """Return the name rewritten by the rename rules."""
+        for rule in self.rename_rules:
+            try:
+                name = rule.apply(name)
+            except re.error as exc:
+                raise ValidationError(
+                    f"Invalid rename rule {rule.pattern!r}: {exc}"
+                ) from exc
+        return name
+
+    def clone(self) -> CloneResult:
+        """Clone the source with its subtree and return the result.
+
+        Raises a ValidationError with the errors of the clone, or
+        PermissionDenied if the user may not add the cloned objects (or
+        the copies are outside the constraints of its permissions).
+        """
+        self.name = self.name or self._rename(self.source.name)
+        self._validate_name()
+        with transaction.atomic():
+            for model, relations in CLONE_LAYERS.items():
+                if model is type(self.source):
+                    query = Q(pk=self.source.pk)
+                else:
+                    filters = []
+                    for relation in relations:
+                        related_model = model._meta.get_field(relation).related_model
+                        if copies := self.copies.get(related_model):
+                            filters.append(Q(**{f"{relation}__in": list(copies)}))
+                    if not filters:
+                        continue
+                    query = reduce(operator.or_, filters)
+                self._clone_layer(model, query)
+            self._validate_subnet_overlaps()
+            # The selectors and attributes are inserted in bulk, bypassing the
+            # signals
+            if aci_esg_ids := self.copies.get(ACIEndpointSecurityGroup):
+                refresh_esg_memberships(aci_esg_ids.values())
+            if attribute_ids := self.copies.get(ACIUSegNetworkAttribute):
+                refresh_useg_networks(attribute_ids.values())
+            invalidate_route_leaks([self.target_fabric.pk])
+        return self.result
+
+    def _validate_name(self) -> None:
+        """Validate the name of the copy of the source.
+
+        Raises a ValidationError if the name is invalid or already used in
+        the target.
+        """
+        if isinstance(self.source, ACITenant):
+            siblings = ACITenant.objects.filter(aci_fabric=self.target_fabric)
+        else:
+            siblings = ACIAppProfile.objects.filter(aci_tenant=self.target_tenant)
+        errors = self._get_name_errors(type(self.source), self.name)
+        if siblings.filter(name=self.name).exists():
+            errors.append(
+                f"The {self.source._meta.verbose_name} {self.name} already exists "
+                f"in the target."
+            )
+        if errors:
+            raise ValidationError(errors)
+
+    @staticmethod
+    def _get_name_errors(model: type[Model], name: str) -> list[str]:
+        """Return the validation errors of the name of an object."""
+        name_field = model._meta.get_field("name")
+        try:
+            name_field.clean(name, None)
+        except ValidationError as exc:
+            return [
+                f"{model._meta.verbose_name} {name}: {message}"
+                for message in exc.messages
+            ]
+        return []
+
+    def _clone_layer(self, model: type[Model], query: Q) -> None:
+        """Copy the source objects of a model and insert the copies in bulk."""
+        sources = list(self._restrict(model.objects.filter(query)).order_by("pk"))
+        if not sources:
+            return
+        opts = model._meta
+        if self.user is not None and not self.user.has_perm(
+            f"{opts.app_label}.add_{opts.model_name}"
+        ):
+            raise PermissionDenied(
+                f"Adding {opts.verbose_name_plural} is not permitted."
+            )
+
+        self._resolve_references(model, sources)
+        copies = [self._copy(model, source) for source in sources]
+        if self.errors:
+            raise ValidationError(self.errors)
+        if model is ACIBridgeDomainSubnet:
+            self._copy_gateway_ip_addresses(sources, copies)
+        self._check_rules(model, copies)
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create(copies, batch_size=self.batch_size)
+        except IntegrityError as exc:
+            raise ValidationError(
+                f"The copies of the {opts.verbose_name_plural} conflict with "
+                f"existing objects: {exc}"
+            ) from exc
+        self.copies[model].update(
+            (source.pk, copy.pk) for source, copy in zip(sources, copies, strict=True)
+        )
+        update_content_hashes(
+            model.objects.filter(pk__in=[copy.pk for copy in copies]),
+            batch_size=self.batch_size,
+        )
+        invalidate_bulk_fragments(copies)
+        self._copy_tags(model)
+        self._check_added(model, [copy.pk for copy in copies])
+        self.result.counts[opts.label] = len(copies)
+        if model is type(self.source):
+            self.result.root = copies[0]
+            if model is ACITenant:
+                self.target_tenant = copies[0]
+
+    @staticmethod
+    def _check_rules(model: type[Model], copies: list[Model]) -> None:
+        """Validate the copies of a model by the model rules.
+
+        Raises a ValidationError with the errors of the invalid copies.
+        """
+        errors = [
+            f"{model._meta.verbose_name} {copy}: {name}: {message}"
+            for copy, copy_errors in zip(
+                copies, BatchValidator().check_rules(copies), strict=True
+            )
+            for name, messages in copy_errors.items()
+            for message in messages
+        ]
+        if errors:
+            raise ValidationError(errors)
+
+    def _check_added(self, model: type[Model], pks: list[int]) -> None:
+        """Check the user may add the inserted copies of a model.
+
+        The copies are checked against the constraints of the permissions
+        of the user, as inserted and tagged. Raises PermissionDenied if any
+        copy is outside of them.
+        """
+        if self.user is None:
+            return
+        permitted = model.objects.restrict(self.user, "add").filter(pk__in=pks)
+        if permitted.count() != len(pks):
+            raise PermissionDenied(
+                f"Adding {model._meta.verbose_name_plural} is not permitted."
+            )
+
+    def _iter_references(
+        self, model: type[Model], source: Model
+    ) -> Iterator[tuple[str, type[Model], int]]:
+        """Yield the field names, models and IDs of the referenced objects.
+
+        Only the references to plugin objects are yielded.
+        """
+        opts = model._meta
+        for model_field in opts.concrete_fields:
+            if (
+                not model_field.many_to_one
+                or model_field.related_model._meta.app_label != PLUGIN_NAME
+            ):
+                continue
+            if (object_id := getattr(source, model_field.attname)) is not None:
+                yield model_field.attname, model_field.related_model, object_id
+        for generic_field in opts.private_fields:
+            if not isinstance(generic_field, GenericForeignKey):
+                continue
+            content_type_id = getattr(
+                source, opts.get_field(generic_field.ct_field).attname
+            )
+            object_id = getattr(source, generic_field.fk_field)
+            if content_type_id is None or object_id is None:
+                continue
+            related_model = ContentType.objects.get_for_id(
+                content_type_id
+            ).model_class()
+            if related_model._meta.app_label == PLUGIN_NAME:
+                yield generic_field.fk_field, related_model, object_id
+
+    def _resolve_references(self, model: type[Model], sources: list[Model]) -> None:
+        """Resolve the referenced objects outside of the subtree.
+
+        The references of all source objects of a model are resolved with
+        a few queries per referenced model.
+        """
+        unresolved: dict[type[Model], set[int]] = defaultdict(set)
+        for source in sources:
+            for _attname, related_model, object_id in self._iter_references(
+                model, source
+            ):
+                if (
+                    object_id not in self.copies[related_model]
+                    and object_id not in self.references[related_model]
+                ):
+                    unresolved[related_model].add(object_id)
+        for related_model, object_ids in unresolved.items():
+            self._resolve(related_model, object_ids)
+
+    @staticmethod
+    def _get_owner_field(model: type[Model]) -> str | None:
+        """Return the relation to the tenant or fabric owning the objects."""
+        for name in ("aci_tenant", "aci_fabric"):
+            try:
+                model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            return name
+        return None
+
+    def _resolve(self, model: type[Model], object_ids: set[int]) -> None:
+        """Resolve the referenced objects of a model in the target by name.
+
+        Objects without a tenant or fabric are only resolved within the
+        source tenant.
+        """
+        verbose_name = model._meta.verbose_name
+        owner_field = self._get_owner_field(model)
+        if owner_field is None:
+            if self.target_tenant == self.source_tenant:
+                self.references[model].update((pk, pk) for pk in object_ids)
+            else:
+                self.errors.extend(
+                    f"The referenced {verbose_name} {pk} is outside of the "
+                    f"cloned objects."
+                    for pk in sorted(object_ids)
+                )
+            return
+
+        fabric_lookup = (
+            "aci_tenant__aci_fabric_id"
+            if owner_field == "aci_tenant"
+            else "aci_fabric_id"
+        )
+        owner_model = model._meta.get_field(owner_field).related_model
+        objects = list(
+            model.objects.filter(pk__in=object_ids).values_list(
+                "pk", "name", f"{owner_field}_id", f"{owner_field}__name", fabric_lookup
+            )
+        )
+        # The target owner of each object: the target tenant for objects of
+        # the source tenant, the owner itself within the same fabric, or the
+        # owner of the same name in the target fabric
+        owners: dict[int, int | str] = {}
+        for _pk, _name, owner_id, owner_name, fabric_id in objects:
+            if owner_model is ACITenant and owner_id == self.source_tenant.pk:
+                owners[owner_id] = self.target_tenant.pk
+            elif fabric_id == self.target_fabric.pk:
+                owners[owner_id] = owner_id
+            elif owner_model is ACITenant:
+                owners[owner_id] = owner_name
+            else:
+                owners[owner_id] = self.target_fabric.pk
+        if owner_names := {name for name in owners.values() if isinstance(name, str)}:
+            tenant_ids = dict(
+                ACITenant.objects.filter(
+                    aci_fabric=self.target_fabric, name__in=owner_names
+                ).values_list("name", "pk")
+            )
+            for owner_id, owner in owners.items():
+                if isinstance(owner, str):
+                    owners[owner_id] = tenant_ids.get(owner)
+
+        targets = {
+            (owner_id, name): pk
+            for pk, owner_id, name in model.objects.filter(
+                **{
+                    f"{owner_field}_id__in": set(owners.values()) - {None},
+                    "name__in": {name for _pk, name, *_ in objects},
+                }
+            ).values_list("pk", f"{owner_field}_id", "name")
+        }
+        for pk, name, owner_id, owner_name, _fabric_id in objects:
+            if (target_id := targets.get((owners[owner_id], name))) is None:
+                self.errors.append(
+                    f"The referenced {verbose_name} {name} ({owner_name}) does not "
+                    f"exist in the target."
+                )
+            else:
+                self.references[model][pk] = target_id
+
+    def _copy(self, model: type[Model], source: Model) -> Model:
+        """Return the unsaved copy of an object with remapped references."""
+        values = {
+            model_field.attname: getattr(source, model_field.attname)
+            for model_field in model._meta.concrete_fields
+            if model_field.name not in EXCLUDED_FIELDS
+        }
+        for attname, related_model, object_id in self._iter_references(model, source):
+            values[attname] = self.copies[related_model].get(
+                object_id, self.references[related_model].get(object_id)
+            )
+        if model is type(self.source):
+            values["name"] = self.name
+        elif values.get("name"):
+            values["name"] = self._rename(values["name"])
+            self.errors.extend(self._get_name_errors(model, values["name"]))
+        return model(**values)
+
+    def _copy_gateway_ip_addresses(
+        self, sources: list[ACIBridgeDomainSubnet], copies: list[ACIBridgeDomainSubnet]
+    ) -> None:
+        """Assign a new copy of its gateway IP address to each subnet copy."""
+        ip_addresses = {
+            ip_address.pk: ip_address
+            for ip_address in IPAddress.objects.filter(
+                pk__in=[source.gateway_ip_address_id for source in sources]
+            )
+        }
+        new_ip_addresses = []
+        for source, copy in zip(sources, copies, strict=True):
+            ip_address = ip_addresses[source.gateway_ip_address_id]
+            new_ip_addresses.append(
+                IPAddress(
+                    address=ip_address.address,
+                    vrf_id=ip_address.vrf_id,
+                    tenant_id=ip_address.tenant_id,
+                    status=ip_address.status,
+                )
+            )
+        IPAddress.objects.bulk_create(new_ip_addresses, batch_size=self.batch_size)
+        self._check_added(IPAddress, [ip_address.pk for ip_address in new_ip_addresses])
+        for copy, ip_address in zip(copies, new_ip_addresses, strict=True):
+            copy.gateway_ip_address_id = ip_address.pk
+        self.result.counts[IPAddress._meta.label] = len(new_ip_addresses)
+
+    def _copy_tags(self, model: type[Model]) -> None:
+        """Copy the tags of the source objects of a model to their copies."""
+        copies = self.copies[model]
+        content_type = ContentType.objects.get_for_model(model)
+        TaggedItem.objects.bulk_create(
+            [
+                TaggedItem(
+                    content_type=content_type,
+                    object_id=copies[object_id],
+                    tag_id=tag_id,
+                )
+                for object_id, tag_id in TaggedItem.objects.filter(
+                    content_type=content_type, object_id__in=list(copies)
+                ).values_list("object_id", "tag_id")
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def _validate_subnet_overlaps(self) -> None:
+        """Validate the subnet copies do not overlap within their VRFs.
+
+        Raises a ValidationError if a subnet copy overlaps with a subnet of
+        another Bridge Domain, for example in a VRF of the tenant 'common'.
+        """
+        subnet_ids = set(self.copies[ACIBridgeDomainSubnet].values())
+        if not subnet_ids:
+            return
+        overlaps = find_bridge_domain_subnet_overlaps(
+            ACIBridgeDomainSubnet.objects.filter(
+                aci_bridge_domain__aci_vrf_id__in=ACIBridgeDomainSubnet.objects.filter(
+                    pk__in=subnet_ids
+                ).values("aci_bridge_domain__aci_vrf_id")
+            )
+        )
+        errors = [
+            f"The subnet {overlap.subnet} overlaps with the subnet "
+            f"{overlap.overlapping_subnet} in the VRF of its ACI Bridge Domain."
+            for overlap in overlaps
+            if subnet_ids & {overlap.subnet_id, overlap.overlapping_subnet_id}
+        ]
+        if errors:
+            raise ValidationError(errors)
+
+
+def clone_subtree(
+    source: ACITenant | ACIAppProfile,
+    target: ACIFabric | ACITenant | None = None,
+    name: str = "",
+    rename_rules: tuple[RenameRule, ...] = (),
+    user: User | None = None,
+) -> CloneResult:
+    """Clone an ACI Tenant or Application Profile with its subtree."""
+    return SubtreeCloner(
+        source, target=target, name=name, rename_rules=rename_rules, user=user
+    ).clone()
@@ -0,0 +1,354 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Differences between an offline APIC snapshot and the plugin objects.
+
+The objects of an ACI Fabric are loaded with one query per model into
+dictionaries keyed by their APIC distinguished name (DN), holding only the
+hash of the normalized tuple of their compared field values. The snapshot
+tenants are then streamed and each managed object is looked up by its DN
+and compared by hash, so the comparison is linear in the number of objects.
+Field-level deltas are computed only for the changed objects, fetching
+their values with one (batched) query per model.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ..models.tenant.contracts import ACIContractSubject, ACIContractSubjectFilter
+from ..models.tenant.tenants import ACITenant
+from .apic import (
+    TENANT_SPEC,
+    Attribute,
+    Codec,
+    ManagedObject,
+    ObjectSpec,
+    applies_both_directions,
+    iter_subject_filters,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from ..models.fabric.fabrics import ACIFabric
+
+DIFF_ADDED = "added"
+DIFF_CHANGED = "changed"
+DIFF_DELETED = "deleted"
+
+# Rows fetched per database round trip
+DIFF_CHUNK_SIZE = 2000
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectDiff:
+    """Difference of one object between the plugin and the snapshot.
+
+    The changes map the field names to (plugin value, snapshot value) pairs;
+    added objects hold all snapshot values, deleted objects none.
+    """
+
+    action: str
+    model: str
+    dn: str
+    pk: int | None = None
+    changes: dict[str, tuple] = field(default_factory=dict)
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the difference."""
+        return {
+            "action": self.action,
+            "model": self.model,
+            "dn": self.dn,
+            "id": self.pk,
+            "changes": {
+                name: {"netbox": netbox_value, "snapshot": snapshot_value}
+                for name, (netbox_value, snapshot_value) in self.changes.items()
+            },
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _ComparedField:
+    """Compared field of a model with its normalization and default."""
+
+    name: str
+    normalize: Callable[[object], object]
+    default: object
+
+
+def _codec_normalizer(codec: Codec) -> Callable[[object], object]:
+    """Return a function normalizing a value by its APIC representation."""
+
+    def normalize(value):
+        value = codec.from_apic(codec.to_apic(value))
+        return tuple(value) if isinstance(value, list) else value
+
+    return normalize
+
+
+_TEXT_NORMALIZER = _codec_normalizer(Codec())
+
+
+def _compared_fields(spec: ObjectSpec) -> tuple[_ComparedField, ...]:
+    """Return the fields of a spec represented by APIC attributes.
+
+    Fields missing from a managed object are compared with the model field
+    default (or an empty value for related fields).
+    """
+    normalizers: list[tuple[str, Callable]] = [
+        (attribute.field, _codec_normalizer(attribute.codec))
+        for attribute in spec.attributes
+        if isinstance(attribute, Attribute) and attribute.apic
+    ]
+    normalizers.extend(
+        (flag.field, bool) for flag_set in spec.flag_sets for flag in flag_set.flags
+    )
+    normalizers.extend(
+        (relation.field, _TEXT_NORMALIZER if relation.apic_attr else bool)
+        for relation in spec.relations
+    )
+    if spec.apic_class_field:
+        normalizers.append((spec.apic_class_field, _TEXT_NORMALIZER))
+    # Represented by the presence of the vzInTerm/vzOutTerm of the subject
+    if spec.model is ACIContractSubject:
+        normalizers.append(("apply_both_directions_enabled", bool))
+
+    fields = []
+    for name, normalize in normalizers:
+        default = None
+        if "__" not in name:
+            default = spec.model._meta.get_field(name).get_default()
+        fields.append(_ComparedField(name, normalize, normalize(default)))
+    return tuple(fields)
+
+
+def _iter_child_mos(
+    spec: ObjectSpec, mo: ManagedObject, child: ObjectSpec
+) -> Iterator[tuple[ManagedObject, dict]]:
+    """Yield the managed objects of a child spec with their field values."""
+    if child.model is ACIContractSubjectFilter:
+        for child_mo, apply_direction in iter_subject_filters(mo):
+            values = child.from_apic(child_mo)
+            values["apply_direction"] = apply_direction
+            yield child_mo, values
+        return
+
+    apic_classes = tuple(child.apic_class_map.values()) or (child.apic_class,)
+    containers = mo.get_children(child.container) if child.container else (mo,)
+    for container in containers:
+        for child_mo in container.get_children(*apic_classes):
+            if _get_child_spec(spec, child_mo) is not child:
+                continue
+            values = child.from_apic(child_mo)
+            if child.model is ACIContractSubject:
+                values["apply_both_directions_enabled"] = applies_both_directions(
+                    child_mo
+                )
+            yield child_mo, values
+
+
+def _get_child_spec(spec: ObjectSpec, mo: ManagedObject) -> ObjectSpec | None:
+    """Return the child spec of a managed object.
+
+    Specs sharing an APIC class are told apart by their static attributes
+    (e.g. uSeg EPGs are fvAEPg objects with ``isAttrBasedEPg=yes``).
+    """
+    candidates = sorted(
+        (
+            child
+            for child in spec.children
+            if mo.apic_class
+            in (tuple(child.apic_class_map.values()) or (child.apic_class,))
+        ),
+        key=lambda child: -len(child.static_attributes),
+    )
+    for child in candidates:
+        if all(
+            mo.attributes.get(name) == value for name, value in child.static_attributes
+        ):
+            return child
+    return None
+
+
+class SnapshotDiff:
+    """Compare the ACI Tenants of an APIC snapshot with an ACI Fabric.
+
+    All object types with an APIC relative name (RN) in the APIC specs are
+    compared; ESG selectors (identified by computed attributes) are not.
+    The comparison can be limited to ACI Tenants by name and to a subset of
+    the specs (including the parents of each spec).
+
+    The primary keys of the unchanged objects are kept by DN in
+    ``unchanged``.
+    """
+
+    def __init__(
+        self,
+        aci_fabric: ACIFabric,
+        tenant_names: Collection[str] | None = None,
+        specs: Collection[ObjectSpec] | None = None,
+    ) -> None:
+        """Initialize the diff for the given ACI Fabric."""
+        self.aci_fabric = aci_fabric
+        self.tenant_names = tenant_names
+        self.specs = specs
+        self.counts: dict[str, int] = {
+            DIFF_ADDED: 0,
+            DIFF_CHANGED: 0,
+            DIFF_DELETED: 0,
+        }
+        self.unchanged: dict[str, int] = {}
+        self._fields: dict[ObjectSpec, tuple[_ComparedField, ...]] = {}
+
+    def _is_compared(self, spec: ObjectSpec) -> bool:
+        """Return whether the objects of a spec are compared."""
+        return spec.rn is not None and (self.specs is None or spec in self.specs)
+
+    def _get_fields(self, spec: ObjectSpec) -> tuple[_ComparedField, ...]:
+        """Return the (cached) compared fields of a spec."""
+        if spec not in self._fields:
+            self._fields[spec] = _compared_fields(spec)
+        return self._fields[spec]
+
+    def _normalize(self, spec: ObjectSpec, values: dict) -> tuple:
+        """Return the normalized tuple of the compared field values."""
+        return tuple(
+            compared.normalize(values[compared.name])
+            if compared.name in values
+            else compared.default
+            for compared in self._get_fields(spec)
+        )
+
+    #
+    # Plugin state
+    #
+
+    def _load_state(self) -> dict[ObjectSpec, dict[str, tuple[int, int]]]:
+        """Return the (hash, pk) of the plugin objects by spec and DN."""
+        state: dict[ObjectSpec, dict[str, tuple[int, int]]] = {}
+        queryset = ACITenant.objects.filter(aci_fabric=self.aci_fabric)
+        if self.tenant_names is not None:
+            queryset = queryset.filter(name__in=self.tenant_names)
+        self._load_spec_state(state, TENANT_SPEC, queryset, None)
+        return state
+
+    def _load_spec_state(
+        self,
+        state: dict,
+        spec: ObjectSpec,
+        queryset: QuerySet,
+        parent_dns: dict[int, str] | None,
+    ) -> None:
+        """Load the objects of a spec and its children with one query each."""
+        objects = state[spec] = {}
+        dns: dict[int, str] = {}
+        parent_key = f"{spec.parent}_id"
+        for row in queryset.values(*spec.fields).iterator(chunk_size=DIFF_CHUNK_SIZE):
+            parent_dn = "uni" if parent_dns is None else parent_dns[row[parent_key]]
+            dn = dns[row["pk"]] = f"{parent_dn}/{spec.get_rn(row)}"
+            objects[dn] = (hash(self._normalize(spec, row)), row["pk"])
+
+        for child in spec.children:
+            if not self._is_compared(child):
+                continue
+            child_queryset = child.model.objects.filter(
+                **{f"{child.parent}__in": queryset.values("pk")}, **child.filters
+            )
+            self._load_spec_state(state, child, child_queryset, dns)
+
+    #
+    # Snapshot
+    #
+
+    def _iter_snapshot_objects(
+        self, spec: ObjectSpec, mo: ManagedObject, dn: str, values: dict
+    ) -> Iterator[tuple[ObjectSpec, str, dict]]:
+        """Yield the (spec, DN, field values) of an object and its children."""
+        yield spec, dn, values
+        for child in spec.children:
+            if not self._is_compared(child):
+                continue
+            for child_mo, child_values in _iter_child_mos(spec, mo, child):
+                rn_values = {
+                    compared.name: compared.default
+                    for compared in self._get_fields(child)
+                }
+                rn_values.update(child_values)
+                yield from self._iter_snapshot_objects(
+                    child, child_mo, f"{dn}/{child.get_rn(rn_values)}", child_values
+                )
+
+    #
+    # Diff
+    #
+
+    def iter_diffs(self, tenants: Iterable[ManagedObject]) -> Iterator[ObjectDiff]:
+        """Yield the differences between the snapshot tenants and the fabric.
+
+        Added objects are yielded while the snapshot is streamed, changed
+        and deleted objects once the snapshot has been read completely.
+        """
+        state = self._load_state()
+        changed: dict[ObjectSpec, dict[int, tuple[str, tuple]]] = {}
+
+        for tenant_mo in tenants:
+            tenant_values = TENANT_SPEC.from_apic(tenant_mo)
+            tenant_dn = f"uni/{TENANT_SPEC.get_rn({'name': '', **tenant_values})}"
+            for spec, dn, values in self._iter_snapshot_objects(
+                TENANT_SPEC, tenant_mo, tenant_dn, tenant_values
+            ):
+                normalized = self._normalize(spec, values)
+                entry = state[spec].pop(dn, None)
+                if entry is None:
+                    yield self._diff(
+                        DIFF_ADDED,
+                        spec,
+                        dn,
+                        changes={
+                            compared.name: (None, value)
+                            for compared, value in zip(
+                                self._get_fields(spec), normalized, strict=True
+                            )
+                        },
+                    )
+                elif entry[0] != hash(normalized):
+                    changed.setdefault(spec, {})[entry[1]] = (dn, normalized)
+                else:
+                    self.unchanged[dn] = entry[1]
+
+        for spec, objects in changed.items():
+            yield from self._iter_changes(spec, objects)
+        for spec, objects in state.items():
+            for dn, (_hash, pk) in objects.items():
+                yield self._diff(DIFF_DELETED, spec, dn, pk=pk)
+
+    def _iter_changes(
+        self, spec: ObjectSpec, objects: dict[int, tuple[str, tuple]]
+    ) -> Iterator[ObjectDiff]:
+        """Yield the field-level changes of the changed objects of a spec."""
+        fields = self._get_fields(spec)
+        pks = list(objects)
+        for start in range(0, len(pks), DIFF_CHUNK_SIZE):
+            rows = spec.model.objects.filter(
+                pk__in=pks[start : start + DIFF_CHUNK_SIZE]
+            ).values(*spec.fields)
+            for row in rows:
+                dn, snapshot_values = objects[row["pk"]]
+                changes = {
+                    compared.name: (netbox_value, snapshot_value)
+                    for compared, netbox_value, snapshot_value in zip(
+                        fields, self._normalize(spec, row), snapshot_values, strict=True
+                    )
+                    if netbox_value != snapshot_value
+                }
+                yield self._diff(DIFF_CHANGED, spec, dn, pk=row["pk"], changes=changes)
+
+    def _diff(self, action: str, spec: ObjectSpec, dn: str, **kwargs) -> ObjectDiff:
+        """Return an object difference and count it."""
+        self.counts[action] += 1
+        return ObjectDiff(action, spec.model._meta.label, dn, **kwargs)
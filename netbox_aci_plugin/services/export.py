@@ -0,0 +1,381 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Streaming export of ACI Tenants to APIC REST JSON and NaC YAML.
+
+Each model of the tenant tree is fetched with exactly one query, ordered by
+the position of its parent in the tree. The writers walk the tenants and
+consume the child rows of every object in lockstep from these ordered
+streams, so a tenant is rendered without ever holding the object tree (or
+the rendered document) in memory. Exports of the background jobs are
+written chunk by chunk to a temporary file and saved in the storage of
+NetBox.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+
+from ..models.tenant.contracts import ACIContractSubjectFilter
+from .apic import SUBJECT_FILTER_TERMS, TENANT_SPEC, Computed, ObjectSpec
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from users.models import User
+
+EXPORT_FORMAT_APIC_JSON = "apic-json"
+EXPORT_FORMAT_NAC_YAML = "nac-yaml"
+EXPORT_FORMATS: dict[str, str] = {
+    EXPORT_FORMAT_APIC_JSON: "application/json",
+    EXPORT_FORMAT_NAC_YAML: "application/yaml",
+}
+EXPORT_EXTENSIONS: dict[str, str] = {
+    EXPORT_FORMAT_APIC_JSON: "json",
+    EXPORT_FORMAT_NAC_YAML: "yaml",
+}
+# Directory of the saved export documents in the storage
+EXPORT_STORAGE_PATH = "netbox_aci_plugin/exports"
+
+# Rows fetched per database round trip by the row streams
+STREAM_CHUNK_SIZE = 2000
+# Minimum size of the chunks yielded by the writers
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+class _RowStream:
+    """Ordered rows of one model consumed group by group in lockstep."""
+
+    def __init__(self, queryset: QuerySet, key: str) -> None:
+        self._queryset = queryset
+        self._key = key
+        self._rows: Iterator[dict] | None = None
+        self._next: dict | None = None
+
+    def take(self, parent_id: int) -> Iterator[dict]:
+        """Yield the consecutive rows belonging to the given parent."""
+        if self._rows is None:
+            self._rows = self._queryset.iterator(chunk_size=STREAM_CHUNK_SIZE)
+            self._next = next(self._rows, None)
+        while self._next is not None and self._next[self._key] == parent_id:
+            row = self._next
+            self._next = next(self._rows, None)
+            yield row
+
+
+class TenantExporter:
+    """Render ACI Tenants with their object tree as APIC JSON or NaC YAML.
+
+    The exported objects are restricted to those the given user may view.
+    """
+
+    def __init__(self, aci_tenants: QuerySet, user: User | None = None) -> None:
+        """Initialize the exporter for the given ACI Tenants."""
+        self.user = user
+        self.aci_tenants = self._restrict(aci_tenants)
+        self._streams: dict[ObjectSpec, _RowStream] = {}
+        self._build_streams(
+            TENANT_SPEC, self.aci_tenants, (*TENANT_SPEC.order_by, "pk")
+        )
+
+    def _restrict(self, queryset: QuerySet) -> QuerySet:
+        """Return the queryset restricted to objects viewable by the user."""
+        if self.user is None:
+            return queryset
+        return queryset.restrict(self.user, "view")
+
+    def _build_streams(
+        self, spec: ObjectSpec, parents: QuerySet, ordering: tuple[str, ...]
+    ) -> None:
+        """Prepare one ordered row stream for every child model of the spec.
+
+        The children are ordered by the ordering of their parents first, so
+        that they are read in the same sequence as the parents are rendered.
+        Filtering on the (restricted) parent queryset ensures that no child
+        of an unexported parent blocks the stream.
+        """
+        for child in spec.children:
+            queryset = self._restrict(child.model.objects.all()).filter(
+                **{f"{child.parent}__in": parents.values("pk")},
+                **child.filters,
+            )
+            child_ordering = (
+                *(f"{child.parent}__{order}" for order in ordering),
+                *child.order_by,
+                "pk",
+            )
+            self._streams[child] = _RowStream(
+                queryset.order_by(*child_ordering).values(*sorted(child.fields)),
+                key=f"{child.parent}_id",
+            )
+            self._build_streams(child, queryset, child_ordering)
+
+    def _iter_tenant_rows(self) -> Iterator[dict]:
+        """Yield the rows of the exported ACI Tenants."""
+        return (
+            self.aci_tenants.order_by(*TENANT_SPEC.order_by, "pk")
+            .values(*sorted(TENANT_SPEC.fields))
+            .iterator(chunk_size=STREAM_CHUNK_SIZE)
+        )
+
+    def _children(self, spec: ObjectSpec, row: dict) -> Iterator[tuple]:
+        """Yield (child spec, child rows) pairs of an object."""
+        for child in spec.children:
+            yield child, self._streams[child].take(row["pk"])
+
+    #
+    # APIC JSON
+    #
+
+    @staticmethod
+    def _apic_attributes(spec: ObjectSpec, row: dict) -> dict[str, str]:
+        """Return the APIC attributes of an object."""
+        attributes = dict(spec.static_attributes)
+        for attribute in spec.attributes:
+            if not attribute.apic:
+                continue
+            if isinstance(attribute, Computed):
+                value = attribute.func(row)
+                if value is not None:
+                    attributes[attribute.apic] = str(value)
+            else:
+                attributes[attribute.apic] = attribute.codec.to_apic(
+                    row[attribute.field]
+                )
+        for flag_set in spec.flag_sets:
+            tokens = [
+                flag.on if row[flag.field] else flag.off for flag in flag_set.flags
+            ]
+            attributes[flag_set.apic] = ",".join(token for token in tokens if token)
+        return attributes
+
+    @staticmethod
+    def _apic_relations(spec: ObjectSpec, row: dict) -> Iterator[str]:
+        """Yield the rendered APIC relation and marker children."""
+        for relation in spec.relations:
+            value = row[relation.field]
+            if not value:
+                continue
+            attributes = (
+                {relation.apic_attr: relation.template.format(value)}
+                if relation.apic_attr
+                else {}
+            )
+            yield json.dumps({relation.apic_class: {"attributes": attributes}})
+
+    def _apic_object(
+        self, spec: ObjectSpec, row: dict, apic_class: str | None = None
+    ) -> Iterator[str]:
+        """Yield the chunks of an APIC object including its children."""
+        apic_class = apic_class or spec.apic_class_map.get(
+            row.get(spec.apic_class_field), spec.apic_class
+        )
+        attributes = json.dumps(self._apic_attributes(spec, row))
+        yield f'{{"{apic_class}":{{"attributes":{attributes},"children":['
+        yield from _join(self._apic_children(spec, row))
+        yield "]}}"
+
+    def _apic_children(self, spec: ObjectSpec, row: dict) -> Iterator[Iterable[str]]:
+        """Yield the chunk iterables of the APIC children of an object."""
+        for relation in self._apic_relations(spec, row):
+            yield (relation,)
+        for child, rows in self._children(spec, row):
+            if child.model is ACIContractSubjectFilter:
+                yield from self._apic_subject_filters(child, row, rows)
+                continue
+            objects = (self._apic_object(child, child_row) for child_row in rows)
+            if not child.container:
+                yield from objects
+                continue
+            attributes = json.dumps(
+                {
+                    **dict(child.container_static_attributes),
+                    **{
+                        attribute.apic: attribute.codec.to_apic(row[attribute.field])
+                        for attribute in child.container_attributes
+                    },
+                }
+            )
+            yield (
+                f'{{"{child.container}":{{"attributes":{attributes},"children":[',
+                *_join(objects),
+                "]}}",
+            )
+
+    def _apic_subject_filters(
+        self, spec: ObjectSpec, subject_row: dict, rows: Iterator[dict]
+    ) -> Iterator[Iterable[str]]:
+        """Yield the chunk iterables of the filter relations of a subject.
+
+        Filters applied in both directions are children of the subject,
+        direction-specific filters of its vzInTerm or vzOutTerm. Subjects
+        not applied in both directions hold both terms, even if empty.
+        """
+        by_direction: dict[str, list[dict]] = {}
+        for row in rows:
+            by_direction.setdefault(row["apply_direction"], []).append(row)
+        for term, term_values in SUBJECT_FILTER_TERMS.items():
+            apic_class, apply_direction, _prefix = term_values
+            objects = (
+                self._apic_object(spec, row, apic_class)
+                for row in by_direction.get(apply_direction, ())
+            )
+            if term == "vzSubj":
+                yield from objects
+            elif (
+                apply_direction in by_direction
+                or not subject_row["apply_both_directions_enabled"]
+            ):
+                yield (
+                    f'{{"{term}":{{"attributes":{{}},"children":[',
+                    *_join(objects),
+                    "]}}",
+                )
+
+    def iter_apic_json(self) -> Iterator[str]:
+        """Yield the APIC REST JSON document (``polUni``) in chunks."""
+        yield from _buffered(
+            _chain(
+                ('{"polUni":{"attributes":{},"children":[',),
+                _join(
+                    self._apic_object(TENANT_SPEC, row)
+                    for row in self._iter_tenant_rows()
+                ),
+                ("]}}\n",),
+            )
+        )
+
+    #
+    # NaC YAML
+    #
+
+    @staticmethod
+    def _nac_values(spec: ObjectSpec, row: dict) -> Iterator[tuple[str, object]]:
+        """Yield the NaC keys and values of an object's own attributes."""
+        for attribute in spec.attributes:
+            if not attribute.nac:
+                continue
+            if isinstance(attribute, Computed):
+                value = attribute.func(row)
+            else:
+                value = attribute.codec.to_nac(row[attribute.field])
+            if value not in (None, "", []):
+                yield attribute.nac, value
+        for flag_set in spec.flag_sets:
+            for flag in flag_set.flags:
+                if flag.nac:
+                    yield flag.nac, bool(row[flag.field])
+        for relation in spec.relations:
+            if relation.nac and row[relation.field] not in (None, ""):
+                yield relation.nac, row[relation.field]
+
+    def _nac_object(self, spec: ObjectSpec, row: dict, indent: int) -> Iterator[str]:
+        """Yield the lines of a NaC list item including its children."""
+        pad = " " * indent
+        prefix = f"{pad}- "
+        for key, value in self._nac_values(spec, row):
+            yield f"{prefix}{key}: {_nac_scalar(value)}\n"
+            prefix = f"{pad}  "
+        for child, rows in self._children(spec, row):
+            yield from self._nac_children(child, rows, f"{pad}  ", indent + 2)
+
+    def _nac_children(
+        self, spec: ObjectSpec, rows: Iterator[dict], pad: str, indent: int
+    ) -> Iterator[str]:
+        """Yield the lines of a NaC child list (omitted if empty)."""
+        first = next(rows, None)
+        if first is None:
+            return
+        rows = _chain((first,), rows)
+        if spec.nac_group_field:
+            groups: dict[str, list] = {}
+            for row in rows:
+                group = spec.nac_group_map[row[spec.nac_group_field]]
+                groups.setdefault(group, []).append(row[spec.nac_value])
+            yield f"{pad}{spec.nac}:\n"
+            for group, values in sorted(groups.items()):
+                yield f"{pad}  {group}:\n"
+                for value in values:
+                    yield f"{pad}    - {_nac_scalar(value)}\n"
+            return
+        yield f"{pad}{spec.nac}:\n"
+        for row in rows:
+            if spec.nac_value:
+                yield f"{pad}  - {_nac_scalar(row[spec.nac_value])}\n"
+            else:
+                yield from self._nac_object(spec, row, indent + 2)
+
+    def iter_nac_yaml(self) -> Iterator[str]:
+        """Yield the NaC YAML document (``apic.tenants``) in chunks."""
+        yield from _buffered(
+            _chain(
+                ("apic:\n",),
+                self._nac_children(TENANT_SPEC, self._iter_tenant_rows(), "  ", 2),
+            )
+        )
+
+    def iter_export(self, export_format: str) -> Iterator[str]:
+        """Yield the export document in the requested format."""
+        if export_format == EXPORT_FORMAT_NAC_YAML:
+            return self.iter_nac_yaml()
+        return self.iter_apic_json()
+
+    def save_export(self, export_format: str, name: str) -> tuple[str, int]:
+        """Save the export document in the storage under the given name.
+
+        The name is completed by the extension of the format (and made
+        unique by the storage). Returns the storage name and the size of
+        the document in bytes.
+        """
+        with tempfile.TemporaryFile() as fileobj:
+            for chunk in self.iter_export(export_format):
+                fileobj.write(chunk.encode())
+            size = fileobj.tell()
+            fileobj.seek(0)
+            storage_name = default_storage.save(
+                f"{EXPORT_STORAGE_PATH}/{name}.{EXPORT_EXTENSIONS[export_format]}",
+                File(fileobj),
+            )
+        return storage_name, size
+
+
+def _nac_scalar(value) -> str:
+    """Return a YAML flow scalar (JSON is valid YAML flow syntax)."""
+    return json.dumps(value)
+
+
+def _chain(*iterables: Iterable) -> Iterator:
+    """Yield the items of the iterables one after another."""
+    for iterable in iterables:
+        yield from iterable
+
+
+def _join(items: Iterable[Iterable[str]]) -> Iterator[str]:
+    """Yield the chunks of the items separated by commas."""
+    separator = ""
+    for item in items:
+        yield separator
+        yield from item
+        separator = ","
+
+
+def _buffered(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield the chunks combined into pieces of at least the buffer size."""
+    buffer: list[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= WRITE_BUFFER_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,825 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Bulk upsert of APIC snapshot tenants into the plugin models.
+
+Each ACI Tenant of a snapshot is ingested in its own transaction. The
+managed objects of a tenant are mapped to model values by the APIC specs,
+validated per model as a set (field values, references, and the unique
+constraints, against each other and the existing objects) and by the model
+rules (``clean()``, with the referenced objects preloaded), and written
+with one ``bulk_create`` upsert per model in dependency order: tenant,
+VRFs, contract filters and entries, Bridge Domains and subnets,
+Application Profiles and EPGs, contracts, subjects and subject filters,
+and finally the EPG contract relations. The content hashes of the written
+objects are recomputed after each upsert, as bulk writes bypass ``save()``.
+
+Objects failing validation are skipped together with their children and
+reported in the ingest result. A tenant failing to be written anyway
+(e.g. due to concurrent writes) is rolled back and reported. Objects
+missing from the snapshot are kept. Objects known to be unchanged (by
+their DN) are neither validated nor written again.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q, UniqueConstraint
+from netaddr import AddrFormatError, IPNetwork
+
+from ipam.models import IPAddress
+
+from ..fragment_cache import invalidate_bulk_fragments
+from ..models.mixins import update_content_hashes
+from ..models.tenant.app_profiles import ACIAppProfile
+from ..models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ..models.tenant.contract_filters import ACIContractFilter, ACIContractFilterEntry
+from ..models.tenant.contracts import (
+    ACIContract,
+    ACIContractRelation,
+    ACIContractSubject,
+    ACIContractSubjectFilter,
+)
+from ..models.tenant.endpoint_groups import ACIEndpointGroup, ACIUSegNetworkAttribute
+from ..models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+)
+from ..models.tenant.tenants import ACITenant
+from ..models.tenant.vrfs import ACIVRF
+from .apic import (
+    APP_PROFILE_SPEC,
+    BRIDGE_DOMAIN_SPEC,
+    BRIDGE_DOMAIN_SUBNET_SPEC,
+    CONTRACT_FILTER_ENTRY_SPEC,
+    CONTRACT_FILTER_SPEC,
+    CONTRACT_SPEC,
+    CONTRACT_SUBJECT_FILTER_SPEC,
+    CONTRACT_SUBJECT_SPEC,
+    ENDPOINT_GROUP_SPEC,
+    TENANT_SPEC,
+    VRF_SPEC,
+    ManagedObject,
+    ObjectSpec,
+    applies_both_directions,
+    iter_subject_filters,
+)
+from .memberships import refresh_esg_memberships
+from .route_leaks import invalidate_route_leaks
+from .subnet_overlaps import find_bridge_domain_subnet_overlaps
+from .useg_networks import refresh_useg_networks
+from .validation import BatchValidator, evaluate_condition
+
+if TYPE_CHECKING:
+    from django.db.models import Field, Model
+
+    from ..models.fabric.fabrics import ACIFabric
+
+# Objects written per INSERT statement of the bulk upserts
+BULK_BATCH_SIZE = 1000
+
+# Specs of the objects written by the ingest, with their parents
+INGESTED_SPECS = (
+    TENANT_SPEC,
+    VRF_SPEC,
+    CONTRACT_FILTER_SPEC,
+    CONTRACT_FILTER_ENTRY_SPEC,
+    BRIDGE_DOMAIN_SPEC,
+    BRIDGE_DOMAIN_SUBNET_SPEC,
+    APP_PROFILE_SPEC,
+    ENDPOINT_GROUP_SPEC,
+    ENDPOINT_GROUP_SPEC.children[0],
+    CONTRACT_SPEC,
+    CONTRACT_SUBJECT_SPEC,
+    CONTRACT_SUBJECT_FILTER_SPEC,
+)
+
+
+@dataclass(slots=True)
+class IngestResult:
+    """Summary of a snapshot ingest."""
+
+    tenants: list[str] = field(default_factory=list)
+    skipped_tenants: list[str] = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+    errors: list[dict] = field(default_factory=list)
+    warnings: list[dict] = field(default_factory=list)
+
+    def add_error(self, dn: str, error: str | dict) -> None:
+        """Record an object which could not be ingested."""
+        self.errors.append({"dn": dn, "error": error})
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "tenants": self.tenants,
+            "skipped_tenants": self.skipped_tenants,
+            "counts": self.counts,
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+
+class SnapshotCheckpoint:
+    """Names of the ACI Tenants already ingested, persisted as JSON file.
+
+    The checkpoint allows resuming an interrupted ingest without repeating
+    the completed tenants.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the checkpoint and load the completed tenants."""
+        self.path = Path(path)
+        self.completed: set[str] = set()
+        if self.path.is_file():
+            data = json.loads(self.path.read_text())
+            self.completed.update(data.get("completed_tenants", ()))
+
+    def mark_completed(self, name: str) -> None:
+        """Record an ACI Tenant as completed and persist the checkpoint."""
+        self.completed.add(name)
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        temp_path.write_text(json.dumps({"completed_tenants": sorted(self.completed)}))
+        temp_path.replace(self.path)
+
+
+@dataclass(frozen=True, slots=True)
+class _Row:
+    """Model field values of a managed object with its DN."""
+
+    dn: str
+    mo: ManagedObject
+    values: dict
+
+
+class SnapshotIngester:
+    """Upsert the ACI Tenants of an APIC snapshot into an ACI Fabric."""
+
+    def __init__(
+        self,
+        aci_fabric: ACIFabric,
+        batch_size: int = BULK_BATCH_SIZE,
+        unchanged: Mapping[str, int] | None = None,
+    ) -> None:
+        """Initialize the ingester for the given ACI Fabric.
+
+        The unchanged objects map the DN to the primary key of the objects
+        matching the snapshot already, which are not written again.
+        """
+        self.aci_fabric = aci_fabric
+        self.batch_size = batch_size
+        self.unchanged = unchanged or {}
+        self.result = IngestResult()
+        # Primary keys of the written objects by model label
+        self.written: dict[str, set[int]] = defaultdict(set)
+        self._common_tenant_id = (
+            ACITenant.objects.filter(aci_fabric=aci_fabric, name="common")
+            .values_list("pk", flat=True)
+            .first()
+        )
+        self._validation_cache: dict[tuple, list[str]] = {}
+
+    def ingest(
+        self,
+        tenants: Iterable[ManagedObject],
+        checkpoint: SnapshotCheckpoint | None = None,
+        progress: Callable[[str, IngestResult], None] | None = None,
+    ) -> IngestResult:
+        """Ingest the ACI Tenant managed objects one tenant at a time.
+
+        Tenants completed according to the checkpoint are skipped. The
+        progress callback is called with the tenant name after each tenant.
+        """
+        for mo in tenants:
+            name = mo.attributes.get("name", "")
+            if checkpoint is not None and name in checkpoint.completed:
+                self.result.skipped_tenants.append(name)
+                continue
+            self.ingest_tenant(mo)
+            if checkpoint is not None:
+                checkpoint.mark_completed(name)
+            if progress is not None:
+                progress(name, self.result)
+        return self.result
+
+    def ingest_tenant(self, mo: ManagedObject) -> None:
+        """Ingest an ACI Tenant managed object with its object tree.
+
+        A tenant failing to be written (e.g. due to objects written
+        concurrently) is rolled back and reported.
+        """
+        counts = dict(self.result.counts)
+        tenant_count = len(self.result.tenants)
+        written = {label: set(pks) for label, pks in self.written.items()}
+        common_tenant_id = self._common_tenant_id
+        try:
+            with transaction.atomic():
+                self._ingest_tenant(mo)
+        except IntegrityError as exc:
+            self.result.counts = counts
+            del self.result.tenants[tenant_count:]
+            self.written = defaultdict(set, written)
+            self._common_tenant_id = common_tenant_id
+            self.result.add_error(
+                f"uni/tn-{mo.attributes.get('name', '')}",
+                f"The ACI Tenant could not be written: {exc}",
+            )
+
+    def _ingest_tenant(self, mo: ManagedObject) -> None:
+        """Ingest the object tree of an ACI Tenant managed object."""
+        values = TENANT_SPEC.from_apic(mo)
+        values.setdefault("name", "")
+        tenant = _Row(
+            f"uni/tn-{values['name']}",
+            mo,
+            {**values, "aci_fabric_id": self.aci_fabric.pk},
+        )
+        upserted = self._upsert(ACITenant, [tenant], ("aci_fabric", "name"))
+        if not upserted:
+            return
+        tenant_id = upserted[0][1]
+        if values["name"] == "common":
+            self._common_tenant_id = tenant_id
+        self.result.tenants.append(values["name"])
+
+        self._ingest_vrfs(tenant, tenant_id)
+        self._ingest_contract_filters(tenant, tenant_id)
+        self._ingest_bridge_domains(tenant, tenant_id)
+        epgs = self._ingest_app_profiles(tenant, tenant_id)
+        self._ingest_contracts(tenant, tenant_id)
+        self._ingest_contract_relations(tenant_id, epgs)
+        self._refresh_esg_memberships(tenant_id)
+        self._refresh_useg_networks(tenant_id)
+        # The upserts bypass the signals invalidating the route leaks
+        invalidate_route_leaks([self.aci_fabric.pk])
+
+    @staticmethod
+    def _refresh_esg_memberships(tenant_id: int) -> None:
+        """Refresh the ESG memberships of the ingested EPGs and BDs.
+
+        The upserts of the EPGs and BDs bypass the signals maintaining the
+        VRF of the memberships of the endpoint groups.
+        """
+        refresh_esg_memberships(
+            ACIEsgEndpointGroupSelector.objects.filter(
+                Q(_aci_endpoint_group__aci_app_profile__aci_tenant_id=tenant_id)
+                | Q(_aci_endpoint_group__aci_bridge_domain__aci_tenant_id=tenant_id)
+                | Q(
+                    _aci_useg_endpoint_group__aci_bridge_domain__aci_tenant_id=tenant_id
+                )
+            )
+            .order_by()
+            .values_list("aci_endpoint_security_group", flat=True)
+            .distinct()
+        )
+
+    @staticmethod
+    def _refresh_useg_networks(tenant_id: int) -> None:
+        """Refresh the uSeg networks resolved from the ingested BD subnets.
+
+        The upserts of the BD subnets and their gateway IP addresses bypass
+        the signals maintaining the networks of the uSeg attributes using
+        the EPG subnet.
+        """
+        refresh_useg_networks(
+            ACIUSegNetworkAttribute.objects.filter(
+                use_epg_subnet=True,
+                aci_useg_endpoint_group__aci_bridge_domain__aci_tenant_id=tenant_id,
+            ).values_list("pk", flat=True)
+        )
+
+    #
+    # Layers
+    #
+
+    def _ingest_vrfs(self, tenant: _Row, tenant_id: int) -> None:
+        """Ingest the VRFs (fvCtx) of a tenant."""
+        rows = [
+            _child_row(tenant, mo, VRF_SPEC, aci_tenant_id=tenant_id)
+            for mo in tenant.mo.get_children(VRF_SPEC.apic_class)
+        ]
+        self._upsert(ACIVRF, rows, ("aci_tenant", "name"))
+
+    def _ingest_contract_filters(self, tenant: _Row, tenant_id: int) -> None:
+        """Ingest the contract filters (vzFilter) and their entries."""
+        rows = [
+            _child_row(tenant, mo, CONTRACT_FILTER_SPEC, aci_tenant_id=tenant_id)
+            for mo in tenant.mo.get_children(CONTRACT_FILTER_SPEC.apic_class)
+        ]
+        entries = [
+            _child_row(row, mo, CONTRACT_FILTER_ENTRY_SPEC, aci_contract_filter_id=pk)
+            for row, pk in self._upsert(ACIContractFilter, rows, ("aci_tenant", "name"))
+            for mo in row.mo.get_children(CONTRACT_FILTER_ENTRY_SPEC.apic_class)
+        ]
+        self._upsert(ACIContractFilterEntry, entries, ("aci_contract_filter", "name"))
+
+    def _ingest_bridge_domains(self, tenant: _Row, tenant_id: int) -> None:
+        """Ingest the Bridge Domains (fvBD) and their subnets (fvSubnet)."""
+        vrfs = self._get_tenant_objects(ACIVRF, tenant_id, "nb_vrf_id")
+        rows = []
+        for mo in tenant.mo.get_children(BRIDGE_DOMAIN_SPEC.apic_class):
+            row = _child_row(tenant, mo, BRIDGE_DOMAIN_SPEC, aci_tenant_id=tenant_id)
+            vrf = vrfs.get(row.values.pop("aci_vrf__name", ""))
+            if vrf is None:
+                self.result.add_error(
+                    row.dn,
+                    "The ACI VRF must exist in the same ACI Tenant or in the "
+                    "ACI Tenant 'common'.",
+                )
+                continue
+            row.values["aci_vrf_id"] = vrf[0]
+            rows.append(row)
+
+        nb_vrf_ids = dict(vrfs.values())
+        subnets = []
+        bridge_domains = self._upsert(ACIBridgeDomain, rows, ("aci_tenant", "name"))
+        for row, pk in bridge_domains:
+            for mo in row.mo.get_children(BRIDGE_DOMAIN_SUBNET_SPEC.apic_class):
+                values = BRIDGE_DOMAIN_SUBNET_SPEC.from_apic(mo)
+                ip = values.pop("gateway_ip_address__address", "")
+                # Unnamed APIC subnets (no or an empty name) are named after
+                # their gateway
+                values["name"] = values.get("name") or ip.replace("/", "_")
+                subnet = _Row(
+                    f"{row.dn}/subnet-[{ip}]",
+                    mo,
+                    {**values, "aci_bridge_domain_id": pk},
+                )
+                try:
+                    address = IPNetwork(ip)
+                except (AddrFormatError, ValueError):
+                    self.result.add_error(
+                        subnet.dn, "The gateway IP address is not valid."
+                    )
+                    continue
+                subnets.append((subnet, address, nb_vrf_ids[row.values["aci_vrf_id"]]))
+        self._ingest_subnets(subnets)
+
+        # Report subnets overlapping with subnets of other Bridge Domains
+        # sharing the VRF (rejected by the APIC, so expected to be rare)
+        bd_ids = {pk for _row, pk in bridge_domains}
+        if subnets:
+            overlaps = find_bridge_domain_subnet_overlaps(
+                ACIBridgeDomainSubnet.objects.filter(
+                    aci_bridge_domain__aci_vrf_id__in={
+                        row.values["aci_vrf_id"] for row, _pk in bridge_domains
+                    }
+                )
+            )
+            self.result.warnings.extend(
+                overlap.serialize()
+                for overlap in overlaps
+                if bd_ids
+                & {
+                    overlap.aci_bridge_domain_id,
+                    overlap.overlapping_aci_bridge_domain_id,
+                }
+            )
+
+    def _ingest_subnets(self, subnets: list[tuple[_Row, IPNetwork, int]]) -> None:
+        """Ingest the Bridge Domain subnets with their gateway IP addresses.
+
+        An existing subnet is matched by its gateway IP address, or else by
+        its name (updating its gateway IP address). New subnets get a new
+        IP address in the NetBox VRF of their ACI VRF.
+        """
+        by_address = {}
+        by_name = {}
+        for bd_id, name, ip_id, address in ACIBridgeDomainSubnet.objects.filter(
+            aci_bridge_domain_id__in={
+                row.values["aci_bridge_domain_id"] for row, *_ in subnets
+            }
+        ).values_list(
+            "aci_bridge_domain_id",
+            "name",
+            "gateway_ip_address_id",
+            "gateway_ip_address__address",
+        ):
+            by_address[(bd_id, address)] = ip_id
+            by_name[(bd_id, name)] = ip_id
+
+        rows = []
+        preferred_bd_ids = set()
+        changed_ip_addresses: list[tuple[_Row, IPAddress]] = []
+        new_ip_addresses: list[tuple[_Row, IPAddress]] = []
+        for row, address, nb_vrf_id in subnets:
+            bd_id = row.values["aci_bridge_domain_id"]
+            # Validate a single preferred (primary) subnet per Bridge Domain
+            if row.values.get("preferred_ip_address_enabled"):
+                if bd_id in preferred_bd_ids:
+                    self.result.add_error(
+                        row.dn,
+                        "Only one preferred (primary) gateway IP address is "
+                        "permitted per ACI Bridge Domain.",
+                    )
+                    continue
+                preferred_bd_ids.add(bd_id)
+
+            if (bd_id, address) in by_address:
+                row.values["gateway_ip_address_id"] = by_address[(bd_id, address)]
+            elif (bd_id, row.values["name"]) in by_name:
+                ip_id = by_name[(bd_id, row.values["name"])]
+                row.values["gateway_ip_address_id"] = ip_id
+                changed_ip_addresses.append((row, IPAddress(pk=ip_id, address=address)))
+            else:
+                new_ip_addresses.append(
+                    (row, IPAddress(address=address, vrf_id=nb_vrf_id))
+                )
+            rows.append(row)
+
+        IPAddress.objects.bulk_create(
+            [ip_address for _row, ip_address in new_ip_addresses],
+            batch_size=self.batch_size,
+        )
+        for row, ip_address in new_ip_addresses:
+            row.values["gateway_ip_address_id"] = ip_address.pk
+
+        written = {
+            row.dn
+            for row, _pk in self._upsert(
+                ACIBridgeDomainSubnet,
+                rows,
+                ("aci_bridge_domain", "gateway_ip_address"),
+            )
+        }
+        # The gateway IP addresses of rejected subnets are kept unchanged or
+        # removed again
+        updated_ip_addresses = [
+            ip_address for row, ip_address in changed_ip_addresses if row.dn in written
+        ]
+        IPAddress.objects.bulk_update(
+            updated_ip_addresses, ["address"], batch_size=self.batch_size
+        )
+        IPAddress.objects.filter(
+            pk__in=[
+                ip_address.pk
+                for row, ip_address in new_ip_addresses
+                if row.dn not in written
+            ]
+        ).delete()
+        self.written[IPAddress._meta.label].update(
+            ip_address.pk for row, ip_address in new_ip_addresses if row.dn in written
+        )
+        self._count(
+            IPAddress,
+            len(updated_ip_addresses)
+            + sum(row.dn in written for row, _ip_address in new_ip_addresses),
+        )
+
+    def _ingest_app_profiles(
+        self, tenant: _Row, tenant_id: int
+    ) -> list[tuple[_Row, int]]:
+        """Ingest the Application Profiles (fvAp) and their EPGs (fvAEPg).
+
+        Returns the upserted EPG rows with their primary keys.
+        """
+        rows = [
+            _child_row(tenant, mo, APP_PROFILE_SPEC, aci_tenant_id=tenant_id)
+            for mo in tenant.mo.get_children(APP_PROFILE_SPEC.apic_class)
+        ]
+        bridge_domains = self._get_tenant_objects(ACIBridgeDomain, tenant_id)
+        epgs = []
+        for row, pk in self._upsert(ACIAppProfile, rows, ("aci_tenant", "name")):
+            for mo in row.mo.get_children(ENDPOINT_GROUP_SPEC.apic_class):
+                # uSeg EPGs are attribute-based fvAEPg objects
+                if mo.attributes.get("isAttrBasedEPg") == "yes":
+                    continue
+                epg = _child_row(row, mo, ENDPOINT_GROUP_SPEC, aci_app_profile_id=pk)
+                bd = bridge_domains.get(epg.values.pop("aci_bridge_domain__name", ""))
+                if bd is None:
+                    self.result.add_error(
+                        epg.dn,
+                        "The ACI Bridge Domain must exist in the same ACI Tenant "
+                        "or in the ACI Tenant 'common'.",
+                    )
+                    continue
+                epg.values["aci_bridge_domain_id"] = bd[0]
+                epgs.append(epg)
+        return self._upsert(ACIEndpointGroup, epgs, ("aci_app_profile", "name"))
+
+    def _ingest_contracts(self, tenant: _Row, tenant_id: int) -> None:
+        """Ingest the contracts (vzBrCP), subjects, and subject filters."""
+        rows = [
+            _child_row(tenant, mo, CONTRACT_SPEC, aci_tenant_id=tenant_id)
+            for mo in tenant.mo.get_children(CONTRACT_SPEC.apic_class)
+        ]
+        subjects = []
+        for row, pk in self._upsert(ACIContract, rows, ("aci_tenant", "name")):
+            for mo in row.mo.get_children(CONTRACT_SUBJECT_SPEC.apic_class):
+                subject = _child_row(row, mo, CONTRACT_SUBJECT_SPEC, aci_contract_id=pk)
+                subject.values["apply_both_directions_enabled"] = (
+                    applies_both_directions(mo)
+                )
+                subjects.append(subject)
+
+        contract_filters = self._get_tenant_objects(ACIContractFilter, tenant_id)
+        subject_filters = []
+        for row, pk in self._upsert(
+            ACIContractSubject, subjects, ("aci_contract", "name")
+        ):
+            for mo, apply_direction in iter_subject_filters(row.mo):
+                values = {
+                    "aci_contract_filter__name": "",
+                    **CONTRACT_SUBJECT_FILTER_SPEC.from_apic(mo),
+                    "apply_direction": apply_direction,
+                }
+                subject_filter = _Row(
+                    f"{row.dn}/{CONTRACT_SUBJECT_FILTER_SPEC.get_rn(values)}",
+                    mo,
+                    {**values, "aci_contract_subject_id": pk},
+                )
+                name = subject_filter.values.pop("aci_contract_filter__name")
+                contract_filter = contract_filters.get(name)
+                if contract_filter is None:
+                    self.result.add_error(
+                        subject_filter.dn,
+                        "The ACI Contract Filter must exist in the same ACI "
+                        "Tenant or in the ACI Tenant 'common'.",
+                    )
+                    continue
+                subject_filter.values["aci_contract_filter_id"] = contract_filter[0]
+                subject_filters.append(subject_filter)
+        self._upsert(
+            ACIContractSubjectFilter,
+            subject_filters,
+            ("aci_contract_subject", "aci_contract_filter"),
+        )
+
+    def _ingest_contract_relations(
+        self, tenant_id: int, epgs: list[tuple[_Row, int]]
+    ) -> None:
+        """Ingest the contract relations (fvRsProv/fvRsCons) of the EPGs."""
+        relation_spec = ENDPOINT_GROUP_SPEC.children[0]
+        contracts = self._get_tenant_objects(ACIContract, tenant_id)
+        epg_type_id = ContentType.objects.get_for_model(ACIEndpointGroup).pk
+        # A contract must not be related to both ESGs and EPGs
+        esg_contract_ids = set(
+            ACIContractRelation.objects.filter(
+                aci_contract_id__in=[pk for (pk,) in contracts.values()],
+                aci_object_type=ContentType.objects.get_for_model(
+                    ACIEndpointSecurityGroup
+                ),
+            ).values_list("aci_contract_id", flat=True)
+        )
+
+        relations = []
+        for epg, epg_id in epgs:
+            for mo in epg.mo.get_children(*relation_spec.apic_class_map.values()):
+                values = {"aci_contract__name": "", **relation_spec.from_apic(mo)}
+                relation = _Row(f"{epg.dn}/{relation_spec.get_rn(values)}", mo, values)
+                name = values.pop("aci_contract__name")
+                values.update(
+                    aci_object_type_id=epg_type_id,
+                    aci_object_id=epg_id,
+                    _aci_endpoint_group_id=epg_id,
+                )
+                contract = contracts.get(name)
+                if contract is None:
+                    self.result.add_error(
+                        relation.dn,
+                        "The ACI Contract must exist in the same ACI Tenant or "
+                        "in the ACI Tenant 'common'.",
+                    )
+                    continue
+                if contract[0] in esg_contract_ids:
+                    self.result.add_error(
+                        relation.dn,
+                        "The ACI Contract is already related to ACI Endpoint "
+                        "Security Groups.",
+                    )
+                    continue
+                relation.values["aci_contract_id"] = contract[0]
+                relations.append(relation)
+        self._upsert(
+            ACIContractRelation,
+            relations,
+            ("aci_contract", "aci_object_type", "aci_object_id", "role"),
+        )
+
+    #
+    # Helpers
+    #
+
+    def _get_tenant_objects(
+        self, model: type[Model], tenant_id: int, *fields: str
+    ) -> dict[str, tuple]:
+        """Return the objects of the tenant and of 'common' by name.
+
+        Each object is returned as tuple of its primary key and the values
+        of the given fields. Objects of the tenant take precedence over
+        objects with the same name in 'common'.
+        """
+        tenant_ids = {tenant_id}
+        if self._common_tenant_id is not None:
+            tenant_ids.add(self._common_tenant_id)
+        objects = {}
+        for aci_tenant_id, name, *values in model.objects.filter(
+            aci_tenant_id__in=tenant_ids
+        ).values_list("aci_tenant_id", "name", "pk", *fields):
+            if name not in objects or aci_tenant_id == tenant_id:
+                objects[name] = tuple(values)
+        return objects
+
+    def _upsert(
+        self, model: type[Model], rows: list[_Row], unique_fields: tuple[str, ...]
+    ) -> list[tuple[_Row, int]]:
+        """Validate and bulk upsert the rows of a model.
+
+        Rows with invalid field values, duplicate unique keys, violating the
+        other unique constraints of the model, or failing the model rules
+        are skipped and reported.
+        Returns the written and the unchanged rows with their
+        primary keys.
+        """
+        opts = model._meta
+        key_fields = [opts.get_field(name).attname for name in unique_fields]
+        unchanged_rows: list[tuple[_Row, int]] = []
+        valid_rows: dict[tuple, _Row] = {}
+        for row in rows:
+            if (pk := self.unchanged.get(row.dn)) is not None:
+                unchanged_rows.append((row, pk))
+                continue
+            errors = self._validate(model, row.values)
+            key = tuple(row.values.get(name) for name in key_fields)
+            if key in valid_rows:
+                errors.setdefault("__all__", []).append(
+                    "The object is duplicated in the snapshot."
+                )
+            if errors:
+                self.result.add_error(row.dn, errors)
+                continue
+            valid_rows[key] = row
+        instances = {key: model(**row.values) for key, row in valid_rows.items()}
+        for constraint in opts.constraints:
+            if (
+                isinstance(constraint, UniqueConstraint)
+                and constraint.fields
+                and set(constraint.fields) != set(unique_fields)
+            ):
+                self._check_unique(model, valid_rows, instances, key_fields, constraint)
+        self._check_rules(model, valid_rows, key_fields)
+        if not valid_rows:
+            return unchanged_rows
+
+        update_fields = {
+            opts.get_field(name).attname
+            for row in valid_rows.values()
+            for name in row.values
+        }.difference(key_fields)
+        objects = [instances[key] for key in valid_rows]
+        model.objects.bulk_create(
+            objects,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=[*sorted(update_fields), "last_updated"],
+        )
+        update_content_hashes(
+            model.objects.filter(pk__in=[obj.pk for obj in objects]),
+            batch_size=self.batch_size,
+        )
+        # The upserts bypass the signals invalidating the cached fragments
+        invalidate_bulk_fragments(objects)
+        self._count(model, len(objects))
+        self.written[opts.label].update(obj.pk for obj in objects)
+        return [
+            *unchanged_rows,
+            *zip(valid_rows.values(), (obj.pk for obj in objects), strict=True),
+        ]
+
+    def _check_unique(
+        self,
+        model: type[Model],
+        rows: dict[tuple, _Row],
+        instances: dict[tuple, Model],
+        key_fields: list[str],
+        constraint: UniqueConstraint,
+    ) -> None:
+        """Skip and report the rows violating a unique constraint.
+
+        The rows are keyed by their upsert key (the values of the key
+        fields) and checked set-wise against each other and the existing
+        objects, with one query. The existing objects upserted by the rows
+        are compared by their row values only.
+        """
+        opts = model._meta
+        attnames = [opts.get_field(name).attname for name in constraint.fields]
+        keyed: dict[tuple, list[tuple]] = defaultdict(list)
+        for key in rows:
+            instance = instances[key]
+            if constraint.condition is not None and not evaluate_condition(
+                constraint.condition, instance
+            ):
+                continue
+            value = tuple(getattr(instance, attname) for attname in attnames)
+            if None not in value:
+                keyed[value].append(key)
+        if not keyed:
+            return
+
+        queryset = model.objects.filter(
+            **{f"{attnames[0]}__in": {value[0] for value in keyed}}
+        )
+        if constraint.condition is not None:
+            queryset = queryset.filter(constraint.condition)
+        existing = {
+            values[: len(attnames)]
+            for values in queryset.values_list(*attnames, *key_fields)
+            if values[len(attnames) :] not in rows
+        }
+
+        for value, keys in keyed.items():
+            if len(keys) == 1 and value not in existing:
+                continue
+            if (
+                constraint.condition is None
+                and constraint.violation_error_message
+                == constraint.default_violation_error_message
+            ):
+                messages = (
+                    instances[keys[0]]
+                    .unique_error_message(model, constraint.fields)
+                    .messages
+                )
+            else:
+                messages = [constraint.get_violation_error_message()]
+            for key in keys:
+                self.result.add_error(rows.pop(key).dn, {"__all__": messages})
+
+    def _check_rules(
+        self, model: type[Model], rows: dict[tuple, _Row], key_fields: list[str]
+    ) -> None:
+        """Skip and report the rows failing the model rules.
+
+        The rules are evaluated on copies of the rows carrying the primary
+        key of the existing object they upsert (loaded with one query), so
+        that the rules comparing an object with its stored state apply.
+        """
+        if not rows:
+            return
+        existing = {
+            tuple(values): pk
+            for pk, *values in model.objects.filter(
+                **{f"{key_fields[0]}__in": {key[0] for key in rows}}
+            ).values_list("pk", *key_fields)
+        }
+        keys = list(rows)
+        errors = BatchValidator().check_rules(
+            model(pk=existing.get(key), **rows[key].values) for key in keys
+        )
+        for key, row_errors in zip(keys, errors, strict=True):
+            if row_errors:
+                self.result.add_error(rows.pop(key).dn, row_errors)
+
+    def _validate(self, model: type[Model], values: dict) -> dict[str, list[str]]:
+        """Return the validation errors of the field values by field name.
+
+        Relations are resolved by the caller and not validated here.
+        """
+        errors = {}
+        for name, value in values.items():
+            model_field = model._meta.get_field(name)
+            if model_field.is_relation:
+                continue
+            messages = self._validate_value(model_field, value)
+            if messages:
+                errors[model_field.name] = messages
+        return errors
+
+    def _validate_value(self, model_field: Field, value) -> list[str]:
+        """Return the validation error messages of a field value.
+
+        The result of each distinct (field, value) pair is cached, so that
+        a value repeated across the snapshot is validated only once.
+        """
+        cache_key = (model_field, tuple(value) if isinstance(value, list) else value)
+        if cache_key not in self._validation_cache:
+            try:
+                model_field.clean(value, None)
+            except ValidationError as exc:
+                self._validation_cache[cache_key] = [str(m) for m in exc.messages]
+            else:
+                self._validation_cache[cache_key] = []
+        return self._validation_cache[cache_key]
+
+    def _count(self, model: type[Model], count: int) -> None:
+        """Add the number of written objects of a model to the result."""
+        label = model._meta.label
+        self.result.counts[label] = self.result.counts.get(label, 0) + count
+
+
+def _child_row(parent: _Row, mo: ManagedObject, spec: ObjectSpec, **values) -> _Row:
+    """Return the row of a named child managed object."""
+    mo_values = spec.from_apic(mo)
+    mo_values.setdefault("name", "")
+    return _Row(f"{parent.dn}/{spec.get_rn(mo_values)}", mo, {**mo_values, **values})
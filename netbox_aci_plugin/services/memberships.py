@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Materialized membership of the ACI Endpoint Security Groups.
+
+The members of an ESG are selected through generic foreign keys by its
+Endpoint Group selectors (Endpoint Groups and uSeg Endpoint Groups) and its
+Endpoint selectors (IP addresses and prefixes). The membership table holds
+one row per selector with the selected member and its ACI VRF, so the
+members of any number of ESGs, or the ESGs of any number of members, are
+read with a single join.
+
+The rows are kept in sync by the signal receivers of this module:
+
+- saving a selector writes (or removes) its row, deleting a selector
+  deletes its row,
+- saving an ESG updates the VRF of its endpoint rows,
+- saving an Endpoint Group, a uSeg Endpoint Group or a Bridge Domain
+  updates the VRF of the rows of the affected endpoint groups.
+
+Bulk writes bypass the signals, so the writers refresh the rows of the
+affected ESGs with ``refresh_esg_memberships()``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ..models.tenant.bridge_domains import ACIBridgeDomain
+from ..models.tenant.endpoint_groups import ACIEndpointGroup, ACIUSegEndpointGroup
+from ..models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+    ACIEsgEndpointSelector,
+    ACIEsgMembership,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import Expression, Model, QuerySet
+
+# Memberships inserted per INSERT statement
+BULK_BATCH_SIZE = 1000
+
+
+def _iter_memberships(
+    selectors: QuerySet, selector_field: str, object_field: str, aci_vrf: Expression
+) -> Iterator[dict]:
+    """Yield the field values of the memberships of the selectors."""
+    for pk, aci_esg_id, member_type_id, member_id, aci_vrf_id in (
+        selectors.filter(**{f"{object_field}_id__isnull": False})
+        .order_by("pk")
+        .values_list(
+            "pk",
+            "aci_endpoint_security_group_id",
+            f"{object_field}_type_id",
+            f"{object_field}_id",
+            aci_vrf,
+        )
+    ):
+        # A selector written without its cached relations has no VRF
+        if aci_vrf_id is not None:
+            yield {
+                f"{selector_field}_id": pk,
+                "aci_endpoint_security_group_id": aci_esg_id,
+                "member_type_id": member_type_id,
+                "member_id": member_id,
+                "aci_vrf_id": aci_vrf_id,
+            }
+
+
+def _iter_epg_memberships(selectors: QuerySet) -> Iterator[dict]:
+    """Yield the memberships of ESG Endpoint Group selectors."""
+    return _iter_memberships(
+        selectors,
+        "aci_esg_endpoint_group_selector",
+        "aci_epg_object",
+        Coalesce(
+            "_aci_endpoint_group__aci_bridge_domain__aci_vrf",
+            "_aci_useg_endpoint_group__aci_bridge_domain__aci_vrf",
+        ),
+    )
+
+
+def _iter_ep_memberships(selectors: QuerySet) -> Iterator[dict]:
+    """Yield the memberships of ESG Endpoint selectors."""
+    return _iter_memberships(
+        selectors,
+        "aci_esg_endpoint_selector",
+        "ep_object",
+        F("aci_endpoint_security_group__aci_vrf"),
+    )
+
+
+def get_esg_memberships(
+    epg_selectors: QuerySet, ep_selectors: QuerySet
+) -> Iterator[dict]:
+    """Yield the field values of the memberships of the selectors.
+
+    The members and their VRFs are read with one query per selector model.
+    Selectors without a selected object have no membership.
+    """
+    yield from _iter_epg_memberships(epg_selectors)
+    yield from _iter_ep_memberships(ep_selectors)
+
+
+def refresh_esg_memberships(
+    aci_esg_ids: Iterable[int], batch_size: int = BULK_BATCH_SIZE
+) -> int:
+    """Rebuild the memberships of the ESGs and return their number."""
+    selected = Q(aci_endpoint_security_group__in=list(aci_esg_ids))
+    memberships = [
+        ACIEsgMembership(**values)
+        for values in get_esg_memberships(
+            ACIEsgEndpointGroupSelector.objects.filter(selected),
+            ACIEsgEndpointSelector.objects.filter(selected),
+        )
+    ]
+    with transaction.atomic():
+        ACIEsgMembership.objects.filter(selected).delete()
+        ACIEsgMembership.objects.bulk_create(memberships, batch_size=batch_size)
+    return len(memberships)
+
+
+def update_esg_membership(
+    selector: ACIEsgEndpointGroupSelector | ACIEsgEndpointSelector,
+) -> None:
+    """Write or remove the membership of a saved selector."""
+    selectors = type(selector).objects.filter(pk=selector.pk)
+    if isinstance(selector, ACIEsgEndpointGroupSelector):
+        selector_field = "aci_esg_endpoint_group_selector"
+        memberships = _iter_epg_memberships(selectors)
+    else:
+        selector_field = "aci_esg_endpoint_selector"
+        memberships = _iter_ep_memberships(selectors)
+
+    if (values := next(memberships, None)) is None:
+        ACIEsgMembership.objects.filter(**{selector_field: selector}).delete()
+    else:
+        ACIEsgMembership.objects.update_or_create(
+            **{selector_field: selector}, defaults=values
+        )
+
+
+def _get_member_query(model: type[Model], member_ids: Iterable | QuerySet) -> Q:
+    """Return the query of the memberships of the objects of a model."""
+    return Q(
+        member_type=ContentType.objects.get_for_model(model),
+        member_id__in=member_ids,
+    )
+
+
+def update_esg_membership_vrfs(
+    instance: ACIEndpointSecurityGroup
+    | ACIEndpointGroup
+    | ACIUSegEndpointGroup
+    | ACIBridgeDomain,
+) -> int:
+    """Update the VRF of the memberships depending on a saved object.
+
+    Returns the number of updated memberships.
+    """
+    if isinstance(instance, ACIEndpointSecurityGroup):
+        query = Q(
+            aci_endpoint_security_group=instance,
+            aci_esg_endpoint_selector__isnull=False,
+        )
+        aci_vrf_id = instance.aci_vrf_id
+    elif isinstance(instance, ACIBridgeDomain):
+        query = _get_member_query(
+            ACIEndpointGroup,
+            ACIEndpointGroup.objects.filter(aci_bridge_domain=instance).values("pk"),
+        ) | _get_member_query(
+            ACIUSegEndpointGroup,
+            ACIUSegEndpointGroup.objects.filter(aci_bridge_domain=instance).values(
+                "pk"
+            ),
+        )
+        aci_vrf_id = instance.aci_vrf_id
+    else:
+        query = _get_member_query(type(instance), [instance.pk])
+        aci_vrf_id = instance.aci_bridge_domain.aci_vrf_id
+    return (
+        ACIEsgMembership.objects.filter(query)
+        .exclude(aci_vrf_id=aci_vrf_id)
+        .update(aci_vrf_id=aci_vrf_id)
+    )
+
+
+@receiver(
+    post_save,
+    sender=ACIEsgEndpointGroupSelector,
+    dispatch_uid="aci_update_esg_membership_epg_selector",
+)
+@receiver(
+    post_save,
+    sender=ACIEsgEndpointSelector,
+    dispatch_uid="aci_update_esg_membership_ep_selector",
+)
+def handle_esg_selector_save(
+    sender: type[Model],
+    instance: ACIEsgEndpointGroupSelector | ACIEsgEndpointSelector,
+    **kwargs,
+) -> None:
+    """Write the membership of a saved ESG selector."""
+    update_esg_membership(instance)
+
+
+@receiver(
+    post_save,
+    sender=ACIEndpointSecurityGroup,
+    dispatch_uid="aci_update_esg_membership_vrfs_esg",
+)
+@receiver(
+    post_save,
+    sender=ACIEndpointGroup,
+    dispatch_uid="aci_update_esg_membership_vrfs_epg",
+)
+@receiver(
+    post_save,
+    sender=ACIUSegEndpointGroup,
+    dispatch_uid="aci_update_esg_membership_vrfs_useg_epg",
+)
+@receiver(
+    post_save,
+    sender=ACIBridgeDomain,
+    dispatch_uid="aci_update_esg_membership_vrfs_bd",
+)
+def handle_esg_member_save(
+    sender: type[Model], instance: Model, created: bool, **kwargs
+) -> None:
+    """Update the VRF of the memberships depending on a saved object."""
+    if not created:
+        update_esg_membership_vrfs(instance)
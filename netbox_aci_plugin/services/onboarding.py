@@ -0,0 +1,377 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Bulk onboarding of ACI Nodes with their devices and TEP IP addresses.
+
+The nodes of an onboarding are validated as a set with a fixed number of
+queries (node names, devices, device types and roles, and the Pod scope),
+instead of one ``ACINode.clean()`` per node. In a single transaction
+holding the lock of the ACI Pod, the nodes are validated, the node IDs and
+TEP addresses are allocated, and the TEP IP addresses and nodes are
+written with one ``bulk_create`` each. New devices are saved one by one,
+so that NetBox instantiates their components from the device type.
+
+Any invalid node aborts the onboarding; nothing is written. A conflicting
+concurrent change, such as the same device assigned by an onboarding into
+another pod, is reported as a ValidationError as well.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from dcim.models import Device, DeviceRole, DeviceType, Location, Region, Site
+from ipam.choices import IPAddressStatusChoices
+from ipam.models import IPAddress
+
+from ..choices import NodeRoleChoices, NodeTypeChoices
+from ..fragment_cache import invalidate_bulk_fragments
+from ..models.fabric.nodes import ACINode
+from ..models.mixins import update_content_hashes
+from .allocation import (
+    allocate_node_ids,
+    allocate_tep_addresses,
+    get_node_id_range,
+    get_tep_ip_address,
+    lock_aci_pod,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+    from users.models import User
+
+    from ..models.fabric.pods import ACIPod
+
+# Objects written per INSERT statement of the bulk inserts
+BULK_BATCH_SIZE = 1000
+
+
+@dataclass(slots=True)
+class NodeOnboardingRow:
+    """Requested ACI Node of an onboarding.
+
+    The node is backed by an existing device, or by a new device of the
+    device type and role, created in the site and location of the Pod. The
+    node name defaults to the name of the existing device.
+    """
+
+    name: str = ""
+    device: int | None = None
+    device_type: int | None = None
+    device_role: int | None = None
+    role: str = NodeRoleChoices.ROLE_LEAF
+    node_type: str = NodeTypeChoices.TYPE_UNKNOWN
+
+
+@dataclass(slots=True)
+class NodeOnboardingResult:
+    """Summary of a node onboarding."""
+
+    aci_nodes: list[ACINode] = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "counts": self.counts,
+            "nodes": [
+                {
+                    "id": aci_node.pk,
+                    "name": aci_node.name,
+                    "node_id": aci_node.node_id,
+                    "role": aci_node.role,
+                    "device": aci_node.node_object_id,
+                    "tep_ip_address": aci_node.tep_ip_address_id,
+                }
+                for aci_node in self.aci_nodes
+            ],
+        }
+
+
+def get_scope_filter(scope: Model) -> Q:
+    """Return the filter of the devices located within a Pod scope.
+
+    Mirrors the scope validation of ``ACINode.clean()``: the scope must be
+    the device's site or location, or an ancestor of them.
+    """
+    if isinstance(scope, Site):
+        return Q(site=scope)
+    tree = scope.get_descendants(include_self=True)
+    if isinstance(scope, Location):
+        return Q(location__in=tree)
+    if isinstance(scope, Region):
+        return Q(site__region__in=tree)
+    return Q(site__group__in=tree)
+
+
+class NodeOnboarding:
+    """Validate and onboard a set of ACI Nodes into an ACI Pod.
+
+    The referenced devices, device types, and device roles are restricted
+    to those the given user may view.
+    """
+
+    def __init__(
+        self,
+        aci_pod: ACIPod,
+        user: User | None = None,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> None:
+        """Initialize the onboarding into the ACI Pod."""
+        self.aci_pod = aci_pod
+        self.user = user
+        self.batch_size = batch_size
+        self.devices: dict[int, Device] = {}
+        self.device_types: dict[int, DeviceType] = {}
+        self.device_roles: dict[int, DeviceRole] = {}
+        self.names: list[str] = []
+
+    def _restrict(self, queryset: QuerySet) -> QuerySet:
+        """Return the queryset restricted to objects viewable by the user."""
+        if self.user is None:
+            return queryset
+        return queryset.restrict(self.user, "view")
+
+    def onboard(self, rows: Iterable[NodeOnboardingRow]) -> NodeOnboardingResult:
+        """Create the ACI Nodes, their new devices, and TEP IP addresses.
+
+        Raises a ValidationError with the errors of all invalid nodes, if
+        the Pod has not enough free node IDs or TEP addresses, or if a
+        concurrent change conflicts with the nodes.
+        """
+        rows = list(rows)
+        try:
+            with transaction.atomic():
+                # The nodes are validated holding the lock of the pod, so
+                # that concurrent onboardings cannot claim the same names
+                self.aci_pod = lock_aci_pod(self.aci_pod)
+                self.validate(rows)
+                return self._create_nodes(rows)
+        except IntegrityError as exc:
+            raise ValidationError(f"The ACI Nodes could not be written: {exc}") from exc
+
+    def _create_nodes(self, rows: list[NodeOnboardingRow]) -> NodeOnboardingResult:
+        """Create the validated ACI Nodes in the locked ACI Pod."""
+        aci_pod = self.aci_pod
+        result = NodeOnboardingResult()
+        node_ids = self._allocate_node_ids(aci_pod, rows)
+        tep_addresses = []
+        if aci_pod.tep_pool is not None:
+            tep_addresses = allocate_tep_addresses(aci_pod, len(rows))
+
+        tep_ip_addresses = []
+        device_object_type = ContentType.objects.get_for_model(Device)
+        for index, (row, name) in enumerate(zip(rows, self.names, strict=True)):
+            device = self._get_or_create_device(aci_pod, row)
+            aci_node = ACINode(
+                name=name,
+                aci_pod=aci_pod,
+                node_id=node_ids[index],
+                role=row.role,
+                node_type=row.node_type,
+                node_object_type=device_object_type,
+                node_object_id=device.pk,
+                _device=device,
+            )
+            if tep_addresses:
+                aci_node.tep_ip_address = get_tep_ip_address(
+                    aci_pod,
+                    aci_node.node_id,
+                    tep_addresses[index],
+                    IPAddressStatusChoices.STATUS_ACTIVE,
+                )
+                tep_ip_addresses.append(aci_node.tep_ip_address)
+            result.aci_nodes.append(aci_node)
+
+        self._validate_tep_ip_addresses(tep_ip_addresses)
+        # The nodes pick up the primary keys of their TEP IP addresses
+        IPAddress.objects.bulk_create(tep_ip_addresses, batch_size=self.batch_size)
+        ACINode.objects.bulk_create(result.aci_nodes, batch_size=self.batch_size)
+        update_content_hashes(
+            ACINode.objects.filter(pk__in=[n.pk for n in result.aci_nodes]),
+            batch_size=self.batch_size,
+        )
+        invalidate_bulk_fragments(result.aci_nodes)
+
+        result.counts = {
+            Device._meta.label: sum(row.device is None for row in rows),
+            IPAddress._meta.label: len(tep_ip_addresses),
+            ACINode._meta.label: len(result.aci_nodes),
+        }
+        return result
+
+    @staticmethod
+    def _validate_tep_ip_addresses(tep_ip_addresses: list[IPAddress]) -> None:
+        """Check the TEP IP addresses are not duplicates within their VRF.
+
+        Mirrors the duplicate check of ``IPAddress.clean()`` for the bulk
+        insert, for addresses written meanwhile by another ACI Pod sharing
+        the VRF. Raises a ValidationError with the duplicate addresses.
+        """
+        if not tep_ip_addresses:
+            return
+        duplicates = IPAddress.objects.filter(
+            vrf_id=tep_ip_addresses[0].vrf_id,
+            address__net_in=[str(ip.address.ip) for ip in tep_ip_addresses],
+        ).values_list("address", flat=True)
+        if duplicates:
+            raise ValidationError(
+                f"Duplicate TEP IP addresses found: "
+                f"{', '.join(str(address) for address in duplicates)}."
+            )
+
+    @staticmethod
+    def _allocate_node_ids(aci_pod: ACIPod, rows: list[NodeOnboardingRow]) -> list[int]:
+        """Allocate the node IDs of the rows in a locked ACI Pod.
+
+        Leaf and spine nodes share the node ID range, so the node IDs are
+        allocated once per range.
+        """
+        indexes_by_range = defaultdict(list)
+        for index, row in enumerate(rows):
+            indexes_by_range[get_node_id_range(row.role)].append(index)
+        node_ids = [0] * len(rows)
+        for indexes in indexes_by_range.values():
+            role = rows[indexes[0]].role
+            allocated = allocate_node_ids(aci_pod, len(indexes), role)
+            for index, node_id in zip(indexes, allocated, strict=True):
+                node_ids[index] = node_id
+        return node_ids
+
+    def _get_or_create_device(self, aci_pod: ACIPod, row: NodeOnboardingRow) -> Device:
+        """Return the existing device or a new saved device of a node."""
+        if row.device is not None:
+            return self.devices[row.device]
+        device = Device(
+            name=row.name,
+            device_type=self.device_types[row.device_type],
+            role=self.device_roles[row.device_role],
+            site_id=aci_pod._site_id,  # noqa: SLF001
+            location_id=aci_pod._location_id,  # noqa: SLF001
+        )
+        device.save()
+        return device
+
+    def validate(self, rows: list[NodeOnboardingRow]) -> None:
+        """Validate the requested nodes as a set.
+
+        Resolves the referenced devices, device types, and device roles.
+        Raises a ValidationError with the errors of all invalid nodes.
+        """
+        aci_pod = self.aci_pod
+        device_ids = {row.device for row in rows if row.device is not None}
+        new_rows = [row for row in rows if row.device is None]
+
+        self.devices = self._restrict(Device.objects.all()).in_bulk(device_ids)
+        self.device_types = self._restrict(DeviceType.objects.all()).in_bulk(
+            {row.device_type for row in new_rows} - {None}
+        )
+        self.device_roles = self._restrict(DeviceRole.objects.all()).in_bulk(
+            {row.device_role for row in new_rows} - {None}
+        )
+        self.names = [
+            row.name or getattr(self.devices.get(row.device), "name", "")
+            for row in rows
+        ]
+
+        in_scope_ids = set(self.devices)
+        if aci_pod.scope is not None:
+            in_scope_ids = set(
+                Device.objects.filter(
+                    get_scope_filter(aci_pod.scope), pk__in=device_ids
+                ).values_list("pk", flat=True)
+            )
+        assigned_ids = set(
+            ACINode.objects.filter(_device__in=device_ids).values_list(
+                "_device", flat=True
+            )
+        )
+        existing_names = set(
+            ACINode.objects.filter(aci_pod=aci_pod, name__in=self.names).values_list(
+                "name", flat=True
+            )
+        )
+        existing_device_names = set(
+            Device.objects.annotate(lower_name=Lower("name"))
+            .filter(
+                site_id=aci_pod._site_id,  # noqa: SLF001
+                tenant__isnull=True,
+                lower_name__in={row.name.lower() for row in new_rows},
+            )
+            .values_list("lower_name", flat=True)
+        )
+        name_counts = Counter(self.names)
+        device_counts = Counter(row.device for row in rows)
+        device_name_counts = Counter(row.name.lower() for row in new_rows)
+
+        errors = []
+        for index, (row, name) in enumerate(zip(rows, self.names, strict=True)):
+            row_errors = self._validate_fields(row, name)
+            if name_counts[name] > 1 or name in existing_names:
+                row_errors.append(
+                    f"The node name {name} is not unique within the ACI Pod."
+                )
+            if row.device is None:
+                row_errors.extend(
+                    self._validate_new_device(
+                        row,
+                        device_name_counts[row.name.lower()] > 1
+                        or row.name.lower() in existing_device_names,
+                    )
+                )
+            elif row.device not in self.devices:
+                row_errors.append(f"Device {row.device} does not exist.")
+            elif device_counts[row.device] > 1 or row.device in assigned_ids:
+                row_errors.append(
+                    f"Device {row.device} is already assigned to another ACI Node."
+                )
+            elif row.device not in in_scope_ids:
+                row_errors.append(
+                    f"Device {row.device} does not match the Pod's scope."
+                )
+            errors.extend(f"Node {index} ({name}): {error}" for error in row_errors)
+        if errors:
+            raise ValidationError(errors)
+
+    @staticmethod
+    def _validate_fields(row: NodeOnboardingRow, name: str) -> list[str]:
+        """Return the validation errors of the node field values."""
+        errors = []
+        for field_name, value in (
+            ("name", name),
+            ("role", row.role),
+            ("node_type", row.node_type),
+        ):
+            try:
+                ACINode._meta.get_field(field_name).clean(value, None)
+            except ValidationError as exc:
+                errors.extend(f"{field_name}: {message}" for message in exc.messages)
+        return errors
+
+    def _validate_new_device(
+        self, row: NodeOnboardingRow, duplicate_name: bool
+    ) -> list[str]:
+        """Return the validation errors of the new device of a node."""
+        errors = []
+        if self.aci_pod._site_id is None:  # noqa: SLF001
+            errors.append(
+                "A new device requires the Pod to be scoped to a site or location."
+            )
+        if row.device_type not in self.device_types:
+            errors.append(f"Device type {row.device_type} does not exist.")
+        if row.device_role not in self.device_roles:
+            errors.append(f"Device role {row.device_role} does not exist.")
+        if duplicate_name:
+            errors.append(f"The device name {row.name} is not unique within the site.")
+        return errors
@@ -0,0 +1,446 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Route leaks of the shared services between the VRFs of an ACI Fabric.
+
+A contract with tenant or global scope between a provider and a consumer
+in different VRFs leaks the prefixes of each side into the VRF of the
+other side:
+
+- an Endpoint Group or uSeg Endpoint Group leaks the subnets of its bridge
+  domain shared between VRFs (``shared_enabled``); towards an External EPG
+  the subnets must also be advertised externally,
+- an External EPG leaks its external subnets with shared route control,
+  as aggregate with aggregate shared route control. The shared security
+  of the subnet tells whether the prefix is also classified in the VRF.
+
+The route leaks are computed per fabric with one query for the contract
+relations and one query per subnet model, and stored in the route leak
+table. The aggregates leaked by a source into a VRF are merged into
+intervals, absorbing the prefixes they contain.
+
+The computed route leaks of a fabric are valid as long as its version
+token, kept in the cache, is unchanged. Saving or deleting an object the
+route leaks depend on renews the token of its fabric once the transaction
+commits and enqueues a refresh job recomputing the route leaks of the
+fabric in the background; the readers serve the table and report the
+outdated fabrics. Bulk writers renew the token explicitly, or wrap their
+changes in ``bulk_route_leak_changes()`` to renew it once.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import netaddr
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.choices import JobStatusChoices
+from ipam.models import IPAddress
+
+from ..choices import ContractRelationRoleChoices, ContractScopeChoices
+from ..models.fabric.fabrics import ACIFabric
+from ..models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ..models.tenant.contracts import ACIContract, ACIContractRelation
+from ..models.tenant.endpoint_groups import ACIEndpointGroup, ACIUSegEndpointGroup
+from ..models.tenant.l3outs import (
+    ACIExternalEndpointGroup,
+    ACIExternalSubnet,
+    ACIL3Out,
+)
+from ..models.tenant.vrfs import ACIRouteLeak
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+    from core.models import Job
+
+PLUGIN_NAME = "netbox_aci_plugin"
+ROUTE_LEAK_CACHE_PREFIX = f"{PLUGIN_NAME}.route_leaks"
+
+# Route leaks inserted per INSERT statement
+BULK_BATCH_SIZE = 1000
+
+# Contract scopes sharing services between VRFs
+SHARED_SCOPES = (ContractScopeChoices.SCOPE_TENANT, ContractScopeChoices.SCOPE_GLOBAL)
+
+# Models of the objects the route leaks depend on
+ROUTE_LEAK_MODELS = (
+    ACIBridgeDomain,
+    ACIBridgeDomainSubnet,
+    ACIContract,
+    ACIContractRelation,
+    ACIEndpointGroup,
+    ACIExternalEndpointGroup,
+    ACIExternalSubnet,
+    ACIL3Out,
+    ACIUSegEndpointGroup,
+)
+
+# ACI Fabric whose changes are invalidated once by the bulk writer
+_bulk_aci_fabric_id: ContextVar[int | None] = ContextVar(
+    "aci_route_leaks_bulk_fabric", default=None
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _Endpoint:
+    """Provider or consumer of a contract leaking its prefixes."""
+
+    model: type[Model]
+    pk: int
+    aci_vrf_id: int
+    aci_tenant_id: int
+    aci_bridge_domain_id: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class _Prefix:
+    """Prefix leaked by an endpoint."""
+
+    prefix: netaddr.IPNetwork
+    aggregate: bool = False
+    shared_security_enabled: bool = True
+    advertised_externally_enabled: bool = True
+
+
+def _get_version_key(aci_fabric_id: int) -> str:
+    """Return the cache key of the version token of a fabric."""
+    return f"{ROUTE_LEAK_CACHE_PREFIX}.version.{aci_fabric_id}"
+
+
+def _get_computed_key(aci_fabric_id: int) -> str:
+    """Return the cache key of the token the route leaks were computed for."""
+    return f"{ROUTE_LEAK_CACHE_PREFIX}.computed.{aci_fabric_id}"
+
+
+def invalidate_route_leaks(aci_fabric_ids: Iterable[int]) -> None:
+    """Outdate the route leaks of the fabrics once the transaction commits.
+
+    The version tokens of the fabrics are renewed and their route leaks
+    are recomputed by a refresh job.
+    """
+    aci_fabric_ids = list(aci_fabric_ids)
+
+    def renew() -> None:
+        cache.set_many(
+            dict.fromkeys(map(_get_version_key, aci_fabric_ids), uuid4().hex), None
+        )
+        enqueue_route_leak_refresh(aci_fabric_ids)
+
+    transaction.on_commit(renew)
+
+
+def enqueue_route_leak_refresh(aci_fabric_ids: Iterable[int]) -> list[Job]:
+    """Enqueue the refresh job of the fabrics and return the jobs.
+
+    A fabric with a pending refresh job is not enqueued again, as the job
+    recomputes the route leaks of the latest version token.
+    """
+    # The jobs import the services
+    from ..jobs import ACIRouteLeakRefreshJob
+
+    jobs = []
+    for aci_fabric in ACIFabric.objects.filter(pk__in=list(aci_fabric_ids)):
+        job = (
+            ACIRouteLeakRefreshJob.get_jobs(aci_fabric)
+            .filter(status=JobStatusChoices.STATUS_PENDING)
+            .first()
+        )
+        jobs.append(job or ACIRouteLeakRefreshJob.enqueue(instance=aci_fabric))
+    return jobs
+
+
+@contextmanager
+def bulk_route_leak_changes(aci_fabric_id: int | None) -> Generator[None]:
+    """Invalidate the route leaks of a fabric once for the enclosed changes.
+
+    The signal receivers skip the objects saved or deleted in the block.
+    Objects outside of a fabric are left to the receivers.
+    """
+    if aci_fabric_id is None:
+        yield
+        return
+    token = _bulk_aci_fabric_id.set(aci_fabric_id)
+    try:
+        yield
+    finally:
+        _bulk_aci_fabric_id.reset(token)
+    invalidate_route_leaks([aci_fabric_id])
+
+
+def get_stale_fabric_ids(aci_fabric_ids: Iterable[int]) -> list[int]:
+    """Return the fabrics whose route leaks are not computed or outdated."""
+    aci_fabric_ids = list(aci_fabric_ids)
+    tokens = cache.get_many(
+        [_get_version_key(pk) for pk in aci_fabric_ids]
+        + [_get_computed_key(pk) for pk in aci_fabric_ids]
+    )
+    return [
+        pk
+        for pk in aci_fabric_ids
+        if tokens.get(_get_version_key(pk)) is None
+        or tokens.get(_get_version_key(pk)) != tokens.get(_get_computed_key(pk))
+    ]
+
+
+def _iter_endpoints(aci_fabric_id: int) -> Iterator[tuple[int, str, str, _Endpoint]]:
+    """Yield the contract, role, scope, and endpoint of the relations."""
+    for (
+        aci_contract_id,
+        role,
+        scope,
+        aci_epg_id,
+        aci_useg_epg_id,
+        aci_external_epg_id,
+        aci_bd_id,
+        aci_vrf_id,
+        aci_tenant_id,
+    ) in (
+        ACIContractRelation.objects.filter(
+            aci_contract__aci_tenant__aci_fabric_id=aci_fabric_id,
+            aci_contract__scope__in=SHARED_SCOPES,
+        )
+        .order_by("pk")
+        .values_list(
+            "aci_contract_id",
+            "role",
+            "aci_contract__scope",
+            "_aci_endpoint_group_id",
+            "_aci_useg_endpoint_group_id",
+            "_aci_external_endpoint_group_id",
+            Coalesce(
+                "_aci_endpoint_group__aci_bridge_domain",
+                "_aci_useg_endpoint_group__aci_bridge_domain",
+            ),
+            Coalesce(
+                "_aci_endpoint_group__aci_bridge_domain__aci_vrf",
+                "_aci_useg_endpoint_group__aci_bridge_domain__aci_vrf",
+                "_aci_external_endpoint_group__aci_l3out__aci_vrf",
+            ),
+            Coalesce(
+                "_aci_endpoint_group__aci_app_profile__aci_tenant",
+                "_aci_useg_endpoint_group__aci_app_profile__aci_tenant",
+                "_aci_external_endpoint_group__aci_l3out__aci_tenant",
+            ),
+        )
+    ):
+        # Relations of ESGs and VRFs (vzAny) do not leak subnets
+        if aci_epg_id is not None:
+            model, pk = ACIEndpointGroup, aci_epg_id
+        elif aci_useg_epg_id is not None:
+            model, pk = ACIUSegEndpointGroup, aci_useg_epg_id
+        elif aci_external_epg_id is not None:
+            model, pk = ACIExternalEndpointGroup, aci_external_epg_id
+        else:
+            continue
+        endpoint = _Endpoint(model, pk, aci_vrf_id, aci_tenant_id, aci_bd_id)
+        yield aci_contract_id, role, scope, endpoint
+
+
+def _get_bd_prefixes(aci_fabric_id: int) -> dict[int, list[_Prefix]]:
+    """Return the shared subnet prefixes of the bridge domains by their ID."""
+    prefixes = defaultdict(list)
+    for aci_bd_id, advertised_externally_enabled, address in (
+        ACIBridgeDomainSubnet.objects.filter(
+            aci_bridge_domain__aci_tenant__aci_fabric_id=aci_fabric_id,
+            shared_enabled=True,
+        )
+        .order_by("pk")
+        .values_list(
+            "aci_bridge_domain_id",
+            "advertised_externally_enabled",
+            "gateway_ip_address__address",
+        )
+    ):
+        prefixes[aci_bd_id].append(
+            _Prefix(
+                address.cidr,
+                advertised_externally_enabled=advertised_externally_enabled,
+            )
+        )
+    return prefixes
+
+
+def _get_external_prefixes(aci_fabric_id: int) -> dict[int, list[_Prefix]]:
+    """Return the shared external subnet prefixes of the External EPGs."""
+    prefixes = defaultdict(list)
+    for aci_external_epg_id, matched_prefix, aggregate, shared_security in (
+        ACIExternalSubnet.objects.filter(
+            aci_external_endpoint_group__aci_l3out__aci_tenant__aci_fabric_id=(
+                aci_fabric_id
+            ),
+            shared_route_control_enabled=True,
+        )
+        .order_by("pk")
+        .values_list(
+            "aci_external_endpoint_group_id",
+            "matched_prefix",
+            "aggregate_shared_route_control_enabled",
+            "shared_security_enabled",
+        )
+    ):
+        prefixes[aci_external_epg_id].append(
+            _Prefix(matched_prefix, aggregate, shared_security)
+        )
+    return prefixes
+
+
+def merge_prefixes(prefixes: Iterable[_Prefix]) -> list[_Prefix]:
+    """Return the prefixes with the aggregates merged into intervals.
+
+    Overlapping and adjacent aggregates of the same shared security are
+    merged, and the prefixes contained in such an aggregate are dropped. A
+    prefix leaked with and without shared security keeps it.
+    """
+    prefixes = list(prefixes)
+    merged: dict[netaddr.IPNetwork, _Prefix] = {}
+    for shared_security in (True, False):
+        group = [p for p in prefixes if p.shared_security_enabled == shared_security]
+        aggregates = netaddr.cidr_merge([p.prefix for p in group if p.aggregate])
+        covered = netaddr.IPSet(aggregates)
+        for prefix in aggregates:
+            merged.setdefault(prefix, _Prefix(prefix, True, shared_security))
+        for prefix in group:
+            if not prefix.aggregate and prefix.prefix not in covered:
+                merged.setdefault(
+                    prefix.prefix, _Prefix(prefix.prefix, False, shared_security)
+                )
+    return sorted(merged.values(), key=lambda prefix: prefix.prefix.sort_key())
+
+
+def compute_route_leaks(aci_fabric_id: int) -> list[ACIRouteLeak]:
+    """Return the (unsaved) route leaks of the shared services of a fabric.
+
+    The contract relations and the subnets of the fabric are read with
+    three queries, the leaks are derived in memory.
+    """
+    contracts: dict[int, dict[str, set[_Endpoint]]] = defaultdict(
+        lambda: defaultdict(set)
+    )
+    scopes: dict[int, str] = {}
+    for aci_contract_id, role, scope, endpoint in _iter_endpoints(aci_fabric_id):
+        contracts[aci_contract_id][role].add(endpoint)
+        scopes[aci_contract_id] = scope
+    bd_prefixes = _get_bd_prefixes(aci_fabric_id)
+    external_prefixes = _get_external_prefixes(aci_fabric_id)
+
+    def get_prefixes(source: _Endpoint, peer: _Endpoint) -> Iterator[_Prefix]:
+        if source.model is ACIExternalEndpointGroup:
+            yield from external_prefixes.get(source.pk, ())
+            return
+        for prefix in bd_prefixes.get(source.aci_bridge_domain_id, ()):
+            # Subnets leak into the VRF of an L3Out when advertised only
+            if (
+                prefix.advertised_externally_enabled
+                or peer.model is not ACIExternalEndpointGroup
+            ):
+                yield prefix
+
+    leaks: dict[tuple[int, _Endpoint], set[_Prefix]] = defaultdict(set)
+    for aci_contract_id, roles in contracts.items():
+        for provider in roles[ContractRelationRoleChoices.ROLE_PROVIDER]:
+            for consumer in roles[ContractRelationRoleChoices.ROLE_CONSUMER]:
+                if provider.aci_vrf_id == consumer.aci_vrf_id or (
+                    scopes[aci_contract_id] == ContractScopeChoices.SCOPE_TENANT
+                    and provider.aci_tenant_id != consumer.aci_tenant_id
+                ):
+                    continue
+                leaks[consumer.aci_vrf_id, provider].update(
+                    get_prefixes(provider, consumer)
+                )
+                leaks[provider.aci_vrf_id, consumer].update(
+                    get_prefixes(consumer, provider)
+                )
+
+    content_types = ContentType.objects.get_for_models(
+        ACIEndpointGroup, ACIUSegEndpointGroup, ACIExternalEndpointGroup
+    )
+    return [
+        ACIRouteLeak(
+            aci_fabric_id=aci_fabric_id,
+            aci_vrf_id=aci_vrf_id,
+            source_aci_vrf_id=source.aci_vrf_id,
+            source_type=content_types[source.model],
+            source_id=source.pk,
+            prefix=prefix.prefix,
+            aggregate=prefix.aggregate,
+            shared_security_enabled=prefix.shared_security_enabled,
+        )
+        for (aci_vrf_id, source), prefixes in leaks.items()
+        for prefix in merge_prefixes(prefixes)
+    ]
+
+
+def refresh_route_leaks(aci_fabric_id: int, batch_size: int = BULK_BATCH_SIZE) -> int:
+    """Recompute the route leaks of a fabric and return their number.
+
+    The route leaks are stored for the version token read before the
+    computation, so a change committed meanwhile leaves them outdated.
+    """
+    version_key = _get_version_key(aci_fabric_id)
+    cache.add(version_key, uuid4().hex, None)
+    version = cache.get(version_key)
+    route_leaks = compute_route_leaks(aci_fabric_id)
+    with transaction.atomic():
+        ACIRouteLeak.objects.filter(aci_fabric_id=aci_fabric_id).delete()
+        ACIRouteLeak.objects.bulk_create(route_leaks, batch_size=batch_size)
+    cache.set(_get_computed_key(aci_fabric_id), version, None)
+    return len(route_leaks)
+
+
+def get_aci_fabric_id(instance: Model) -> int | None:
+    """Return the ACI Fabric ID of an object, if its parents still exist."""
+    if isinstance(instance, ACIFabric):
+        return instance.pk
+    if isinstance(instance, IPAddress):
+        return (
+            ACIBridgeDomainSubnet.objects.filter(gateway_ip_address=instance)
+            .values_list("aci_bridge_domain__aci_tenant__aci_fabric_id", flat=True)
+            .first()
+        )
+    if (aci_fabric_id := getattr(instance, "aci_fabric_id", None)) is not None:
+        return aci_fabric_id
+    # A missing parent object raises a subclass of AttributeError
+    if isinstance(instance, ACIContractRelation):
+        instance = getattr(instance, "aci_contract", None)
+    aci_tenant = getattr(instance, "aci_tenant", None)
+    return aci_tenant.aci_fabric_id if aci_tenant is not None else None
+
+
+@receiver(post_save, dispatch_uid="aci_invalidate_route_leaks_on_save")
+@receiver(post_delete, dispatch_uid="aci_invalidate_route_leaks_on_delete")
+def handle_route_leak_change(sender: type[Model], instance: Model, **kwargs) -> None:
+    """Invalidate the route leaks of the fabric of a changed object."""
+    if sender not in ROUTE_LEAK_MODELS or _bulk_aci_fabric_id.get() is not None:
+        return
+    if (aci_fabric_id := get_aci_fabric_id(instance)) is not None:
+        invalidate_route_leaks([aci_fabric_id])
+
+
+@receiver(
+    post_save,
+    sender=IPAddress,
+    dispatch_uid="aci_invalidate_route_leaks_ip_address",
+)
+def handle_route_leak_gateway_save(
+    sender: type[Model], instance: IPAddress, created: bool, **kwargs
+) -> None:
+    """Invalidate the route leaks of the fabric of a saved gateway address."""
+    # New IP addresses are not the gateway of a subnet yet
+    if created or _bulk_aci_fabric_id.get() is not None:
+        return
+    if (aci_fabric_id := get_aci_fabric_id(instance)) is not None:
+        invalidate_route_leaks([aci_fabric_id])
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Streaming reader of offline APIC configuration snapshots.
+
+A snapshot is an APIC configuration export in JSON or XML format, either as
+a single file or as a tar archive (optionally compressed) of such files.
+The reader yields the ``fvTenant`` managed objects one at a time, so only a
+single tenant subtree is held in memory while the snapshot is processed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import tarfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+from xml.etree.ElementTree import Element, iterparse
+
+from .apic import ManagedObject
+
+TENANT_CLASS = "fvTenant"
+
+# Bytes read from the snapshot file per read call
+READ_CHUNK_SIZE = 1024 * 1024
+
+SNAPSHOT_SUFFIXES = (".json", ".xml")
+
+_JSON_TENANT_RE = re.compile(r'\{\s*"' + TENANT_CLASS + r'"')
+_JSON_SEPARATOR_RE = re.compile(r"[\s,]*")
+
+
+class SnapshotError(Exception):
+    """Raised if a snapshot file cannot be read."""
+
+
+def iter_snapshot_tenants(path: str | Path) -> Iterator[ManagedObject]:
+    """Yield the ACI Tenant managed objects of a snapshot file or archive."""
+    path = Path(path)
+    if not path.is_file():
+        raise SnapshotError(f"Snapshot file {path} does not exist.")
+
+    if tarfile.is_tarfile(path):
+        with tarfile.open(path, mode="r:*") as archive:
+            for member in archive:
+                if not member.isfile() or not member.name.endswith(SNAPSHOT_SUFFIXES):
+                    continue
+                fileobj = archive.extractfile(member)
+                yield from _iter_file_tenants(member.name, fileobj)
+        return
+
+    with path.open("rb") as fileobj:
+        yield from _iter_file_tenants(path.name, fileobj)
+
+
+def _iter_file_tenants(name: str, fileobj: IO[bytes]) -> Iterator[ManagedObject]:
+    """Yield the ACI Tenant managed objects of a JSON or XML file."""
+    if name.endswith(".xml"):
+        return iter_xml_tenants(fileobj)
+    if name.endswith(".json"):
+        return iter_json_tenants(fileobj)
+    raise SnapshotError(f"Unsupported snapshot file format: {name}")
+
+
+def iter_xml_tenants(fileobj: IO[bytes]) -> Iterator[ManagedObject]:
+    """Yield the ACI Tenant managed objects of an XML snapshot.
+
+    The document is parsed incrementally and each tenant element is released
+    once it has been converted.
+    """
+    depth = 0
+    tenant_depth = None
+    parents: list[Element] = []
+    try:
+        for event, element in iterparse(fileobj, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if tenant_depth is None and element.tag == TENANT_CLASS:
+                    tenant_depth = depth
+                parents.append(element)
+                continue
+
+            depth -= 1
+            parents.pop()
+            if tenant_depth is None:
+                # Release elements outside of a tenant subtree
+                element.clear()
+            elif depth == tenant_depth - 1:
+                tenant_depth = None
+                yield _mo_from_element(element)
+                element.clear()
+                if parents:
+                    parents[-1].remove(element)
+    except SyntaxError as exc:
+        raise SnapshotError(f"Invalid XML snapshot: {exc}") from exc
+
+
+def _mo_from_element(element: Element) -> ManagedObject:
+    """Return the managed object of an XML element."""
+    return ManagedObject(
+        apic_class=element.tag,
+        attributes=dict(element.attrib),
+        children=tuple(_mo_from_element(child) for child in element),
+    )
+
+
+def iter_json_tenants(fileobj: IO[bytes]) -> Iterator[ManagedObject]:
+    """Yield the ACI Tenant managed objects of a JSON snapshot.
+
+    The document is read in chunks. Each tenant object (``{"fvTenant": ...}``)
+    is decoded as a whole once it is completely buffered, skipping the
+    enclosing ``imdata`` or ``polUni`` containers.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    while True:
+        match = _JSON_TENANT_RE.search(buffer, position)
+        if match is None:
+            if eof:
+                return
+            # Keep a tail which may hold the start of a split tenant object
+            buffer = buffer[max(position, len(buffer) - 64) :]
+            position = 0
+            buffer, eof = _read_json_chunk(fileobj, buffer)
+            continue
+
+        try:
+            document, end = decoder.raw_decode(buffer, match.start())
+        except json.JSONDecodeError as exc:
+            if eof:
+                raise SnapshotError(f"Invalid JSON snapshot: {exc}") from exc
+            # The tenant object is not completely buffered yet
+            buffer = buffer[match.start() :]
+            position = 0
+            buffer, eof = _read_json_chunk(fileobj, buffer)
+            continue
+
+        yield _mo_from_json(TENANT_CLASS, document[TENANT_CLASS])
+        position = _JSON_SEPARATOR_RE.match(buffer, end).end()
+
+
+def _read_json_chunk(fileobj: IO[bytes], buffer: str) -> tuple[str, bool]:
+    """Return the buffer extended by the next chunk and the EOF state.
+
+    The chunk size grows with the buffer, so that a large tenant object is
+    decoded a logarithmic number of times only.
+    """
+    chunk = fileobj.read(max(READ_CHUNK_SIZE, len(buffer)))
+    if not chunk:
+        return buffer, True
+    # Decode incomplete UTF-8 sequences together with the next chunk
+    while True:
+        try:
+            return buffer + chunk.decode("utf-8"), False
+        except UnicodeDecodeError as exc:
+            more = fileobj.read(1) if exc.start >= len(chunk) - 3 else b""
+            if not more:
+                raise SnapshotError(f"Invalid JSON snapshot: {exc}") from exc
+            chunk += more
+
+
+def iter_document_tenants(document: dict | list) -> Iterator[ManagedObject]:
+    """Yield the ACI Tenant managed objects of a decoded JSON document.
+
+    The tenant objects may be enclosed in ``imdata`` or ``polUni``
+    containers, or in a list. Other objects are ignored.
+    """
+    if isinstance(document, list):
+        for item in document:
+            yield from iter_document_tenants(item)
+        return
+    if not isinstance(document, dict):
+        return
+    for key, value in document.items():
+        if key == TENANT_CLASS and isinstance(value, dict):
+            yield _mo_from_json(TENANT_CLASS, value)
+        elif key == "imdata":
+            yield from iter_document_tenants(value)
+        elif key == "polUni" and isinstance(value, dict):
+            yield from iter_document_tenants(value.get("children", []))
+
+
+def _mo_from_json(apic_class: str, body: dict) -> ManagedObject:
+    """Return the managed object of a decoded JSON object body."""
+    return ManagedObject(
+        apic_class=apic_class,
+        attributes=dict(body.get("attributes", {})),
+        children=tuple(
+            _mo_from_json(child_class, child_body)
+            for child in body.get("children", ())
+            for child_class, child_body in child.items()
+        ),
+    )
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Detection of overlapping ACI Bridge Domain subnets within an ACI VRF."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ..models.tenant.bridge_domains import ACIBridgeDomainSubnet
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from netaddr import IPNetwork
+
+
+@dataclass(frozen=True, slots=True)
+class SubnetOverlap:
+    """Pair of overlapping subnets of two ACI Bridge Domains in one VRF.
+
+    The ``subnet`` side always encloses (or equals) the
+    ``overlapping_subnet`` side.
+    """
+
+    aci_vrf_id: int
+    subnet_id: int
+    subnet: IPNetwork
+    aci_bridge_domain_id: int
+    overlapping_subnet_id: int
+    overlapping_subnet: IPNetwork
+    overlapping_aci_bridge_domain_id: int
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the overlap."""
+        return {
+            "aci_vrf": self.aci_vrf_id,
+            "aci_bridge_domain_subnet": self.subnet_id,
+            "subnet": str(self.subnet),
+            "aci_bridge_domain": self.aci_bridge_domain_id,
+            "overlapping_aci_bridge_domain_subnet": self.overlapping_subnet_id,
+            "overlapping_subnet": str(self.overlapping_subnet),
+            "overlapping_aci_bridge_domain": self.overlapping_aci_bridge_domain_id,
+        }
+
+
+def find_bridge_domain_subnet_overlaps(
+    queryset: QuerySet | None = None,
+    aci_vrf_overrides: dict[int, int] | None = None,
+) -> list[SubnetOverlap]:
+    """Return all overlapping subnets of different BDs sharing an ACI VRF.
+
+    The subnets are fetched with a single query and grouped by the VRF of
+    their Bridge Domain, so Bridge Domains of any tenant using a VRF in
+    the tenant 'common' are compared with each other as well. The VRF of
+    a Bridge Domain can be overridden by its ID to check a planned change.
+
+    CIDR networks either nest or are disjoint, so each VRF group is
+    sorted by (first address, descending last address) and swept once
+    while keeping a stack of the enclosing networks. This runs in
+    O(n log n + k) for n subnets and k reported overlaps.
+    """
+    if queryset is None:
+        queryset = ACIBridgeDomainSubnet.objects.all()
+
+    groups: dict[tuple[int, int], list[tuple]] = defaultdict(list)
+    for pk, aci_bd_id, aci_vrf_id, address in queryset.values_list(
+        "pk",
+        "aci_bridge_domain_id",
+        "aci_bridge_domain__aci_vrf_id",
+        "gateway_ip_address__address",
+    ):
+        if aci_vrf_overrides:
+            aci_vrf_id = aci_vrf_overrides.get(aci_bd_id, aci_vrf_id)
+        network = address.cidr
+        groups[(aci_vrf_id, network.version)].append(
+            (network.first, network.last, pk, aci_bd_id, network)
+        )
+
+    overlaps: list[SubnetOverlap] = []
+    for (aci_vrf_id, _version), entries in sorted(groups.items()):
+        entries.sort(key=lambda entry: (entry[0], -entry[1], entry[2]))
+        enclosing: list[tuple] = []
+        for entry in entries:
+            first, _last, pk, aci_bd_id, network = entry
+            while enclosing and enclosing[-1][1] < first:
+                enclosing.pop()
+            overlaps.extend(
+                SubnetOverlap(
+                    aci_vrf_id=aci_vrf_id,
+                    subnet_id=outer[2],
+                    subnet=outer[4],
+                    aci_bridge_domain_id=outer[3],
+                    overlapping_subnet_id=pk,
+                    overlapping_subnet=network,
+                    overlapping_aci_bridge_domain_id=aci_bd_id,
+                )
+                for outer in enclosing
+                if outer[3] != aci_bd_id
+            )
+            enclosing.append(entry)
+
+    return overlaps
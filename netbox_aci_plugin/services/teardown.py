@@ -0,0 +1,313 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Deletion plan of an ACI Fabric or ACI Tenant with its dependent objects.
+
+Deleting an ACI Fabric or Tenant is blocked by the protected foreign keys
+of its dependent objects (for example the ACI Nodes of a Pod, or the ACI
+L3Outs of a Routed Domain), which would have to be deleted one by one in
+the right order.
+
+The plan is built from the foreign keys between the plugin models: the
+models are visited in topological order, and the objects referencing an
+object already in the plan are added with one query per model. The plan
+deletes the models in the reverse order, the dependent objects before the
+objects they depend on.
+
+Objects of ACI Tenants outside the root may depend on it, for example the
+Bridge Domains of other tenants using a VRF of the tenant *common*. These
+foreign dependents, and the objects reached only through them, are listed
+separately, and the plan is refused unless they are explicitly included.
+
+The plan is executed in a single transaction with a bulk delete per model
+and batch. The serialized change record of each object is replaced by a
+summary record (the object type, ID, and name) inserted in bulk.
+"""
+
+from __future__ import annotations
+
+import operator
+import uuid
+from dataclasses import dataclass, field
+from functools import reduce
+from graphlib import TopologicalSorter
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import transaction
+from django.db.models import Q
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange
+from netbox.context import current_request
+from netbox.models import NetBoxModel
+
+from ..models.tenant.tenants import ACITenant
+from .route_leaks import bulk_route_leak_changes, get_aci_fabric_id
+
+if TYPE_CHECKING:
+    from django.db.models import Field, Model
+
+    from users.models import User
+
+PLUGIN_NAME = "netbox_aci_plugin"
+# Objects deleted per DELETE statement and change records per INSERT
+BULK_BATCH_SIZE = 1000
+
+
+def get_dependency_order() -> list[tuple[type[Model], list[Field]]]:
+    """Return the plugin models in topological order with their dependencies.
+
+    Each model follows the models it references and is returned with its
+    foreign keys to other plugin models. The derived tables are deleted with
+    the objects they are derived from and are not part of the order.
+    """
+    dependencies = {
+        model: [
+            field
+            for field in model._meta.concrete_fields
+            if field.many_to_one
+            and field.related_model is not model
+            and field.related_model._meta.app_label == PLUGIN_NAME
+        ]
+        for model in apps.get_app_config(PLUGIN_NAME).get_models()
+        if issubclass(model, NetBoxModel)
+    }
+    sorter = TopologicalSorter(
+        {
+            model: {field.related_model for field in fields}
+            for model, fields in dependencies.items()
+        }
+    )
+    return [(model, dependencies[model]) for model in sorter.static_order()]
+
+
+@dataclass(slots=True)
+class DeletionStep:
+    """Objects of a model deleted by a step of a deletion plan.
+
+    The objects map the primary key to the name of each object. The foreign
+    objects are the objects of the step outside the ACI Tenants of the root.
+    """
+
+    model: type[Model]
+    objects: dict[int, str]
+    foreign: set[int] = field(default_factory=set)
+
+    @property
+    def pks(self) -> list[int]:
+        """Primary keys of the objects of the step."""
+        return list(self.objects)
+
+    def serialize(self, foreign: bool = False) -> dict:
+        """Return a JSON serializable representation of the step.
+
+        With ``foreign`` set, only the foreign objects are represented.
+        """
+        pks = [pk for pk in self.pks if pk in self.foreign or not foreign]
+        return {
+            "object_type": self.model._meta.label_lower,
+            "count": len(pks),
+            "objects": pks,
+        }
+
+
+class DeletionPlan:
+    """Ordered deletion of an ACI object and the objects depending on it.
+
+    Executing the plan requires the given user to be permitted to delete
+    every object of the plan, and ``include_foreign_dependents`` to be set if
+    objects of other ACI Tenants depend on the root.
+    """
+
+    def __init__(
+        self,
+        root: Model,
+        user: User | None = None,
+        batch_size: int = BULK_BATCH_SIZE,
+        include_foreign_dependents: bool = False,
+    ) -> None:
+        """Initialize the plan deleting the root object."""
+        self.root = root
+        self.user = user
+        self.batch_size = batch_size
+        self.include_foreign_dependents = include_foreign_dependents
+        self.steps = self._build_steps()
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of objects deleted per model, in the order of deletion."""
+        return {step.model._meta.label: len(step.objects) for step in self.steps}
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the plan."""
+        return {
+            "counts": self.counts,
+            "steps": [step.serialize() for step in self.steps],
+            "foreign_dependents": [
+                step.serialize(foreign=True) for step in self.steps if step.foreign
+            ],
+        }
+
+    @staticmethod
+    def _get_rows(model: type[Model], query: Q, fields: list[Field]) -> list[dict]:
+        """Return the objects of the query with their planned references.
+
+        Each row holds the primary key, the name, the ACI Tenant if the model
+        has one, and the given foreign keys of the object.
+        """
+        names = {field.name for field in model._meta.concrete_fields}
+        values = ["pk", *(field.attname for field in fields)]
+        values += [name for name in ("name", "aci_tenant_id") if name in names]
+        return list(model.objects.filter(query).order_by("pk").values(*values))
+
+    def _build_steps(self) -> list[DeletionStep]:
+        """Return the steps deleting the dependent objects first.
+
+        An object is foreign if its ACI Tenant is not planned for deletion,
+        or, for a model without an ACI Tenant, if every planned object it
+        references is foreign.
+        """
+        root_model = type(self.root)
+        planned: dict[type[Model], DeletionStep] = {}
+        for model, fields in get_dependency_order():
+            fields = [field for field in fields if field.related_model in planned]
+            if model is root_model:
+                query = Q(pk=self.root.pk)
+            elif fields:
+                query = reduce(
+                    operator.or_,
+                    (
+                        Q(**{f"{field.name}__in": planned[field.related_model].pks})
+                        for field in fields
+                    ),
+                )
+            else:
+                continue
+            if not (rows := self._get_rows(model, query, fields)):
+                continue
+            step = DeletionStep(
+                model=model,
+                objects={row["pk"]: row.get("name", "") for row in rows},
+            )
+            if model is not root_model:
+                tenant_ids = planned[ACITenant].objects if ACITenant in planned else {}
+                step.foreign = {
+                    row["pk"]
+                    for row in rows
+                    if self._is_foreign(row, fields, planned, tenant_ids)
+                }
+            planned[model] = step
+        return list(reversed(planned.values()))
+
+    @staticmethod
+    def _is_foreign(
+        row: dict,
+        fields: list[Field],
+        planned: dict[type[Model], DeletionStep],
+        tenant_ids: dict[int, str],
+    ) -> bool:
+        """Return whether the object is outside the ACI Tenants of the root."""
+        if "aci_tenant_id" in row:
+            return row["aci_tenant_id"] not in tenant_ids
+        references = [
+            (planned[field.related_model], row[field.attname])
+            for field in fields
+            if row[field.attname] in planned[field.related_model].objects
+        ]
+        return all(pk in step.foreign for step, pk in references)
+
+    def check_foreign_dependents(self) -> None:
+        """Check the plan only deletes foreign objects if they are included.
+
+        Raises ValidationError with the number of foreign objects per model.
+        """
+        if self.include_foreign_dependents:
+            return
+        foreign = [
+            f"{len(step.foreign)} {step.model._meta.verbose_name_plural}"
+            for step in self.steps
+            if step.foreign
+        ]
+        if foreign:
+            raise ValidationError(
+                f"Objects of other ACI Tenants depend on the deleted objects "
+                f"and are only deleted if included explicitly: "
+                f"{', '.join(foreign)}."
+            )
+
+    def check_permissions(self) -> None:
+        """Check the user may delete every object of the plan.
+
+        Raises PermissionDenied with the models of the objects the user may
+        not delete.
+        """
+        if self.user is None:
+            return
+        denied = [
+            step.model._meta.verbose_name_plural
+            for step in self.steps
+            if step.model.objects.restrict(self.user, "delete")
+            .filter(pk__in=list(step.objects))
+            .count()
+            != len(step.objects)
+        ]
+        if denied:
+            raise PermissionDenied(
+                f"Deleting the following objects is not permitted: "
+                f"{', '.join(str(name) for name in denied)}."
+            )
+
+    def execute(self) -> dict[str, int]:
+        """Delete the objects of the plan and record the summary changes.
+
+        Returns the number of deleted objects per model. Raises
+        PermissionDenied if the user may not delete every object, and
+        ValidationError if foreign dependents are deleted without being
+        included.
+        """
+        self.check_permissions()
+        self.check_foreign_dependents()
+        request = current_request.get()
+        request_id = getattr(request, "id", None) or uuid.uuid4()
+        with transaction.atomic():
+            ObjectChange.objects.bulk_create(
+                self._get_object_changes(request_id), batch_size=self.batch_size
+            )
+            # Without a current request, NetBox does not record a change per
+            # deleted object
+            token = current_request.set(None)
+            try:
+                with bulk_route_leak_changes(get_aci_fabric_id(self.root)):
+                    for step in self.steps:
+                        pks = step.pks
+                        for index in range(0, len(pks), self.batch_size):
+                            step.model.objects.filter(
+                                pk__in=pks[index : index + self.batch_size]
+                            ).delete()
+            finally:
+                current_request.reset(token)
+        return self.counts
+
+    def _get_object_changes(self, request_id: uuid.UUID) -> list[ObjectChange]:
+        """Return the summary change records of the deleted objects."""
+        content_types = ContentType.objects.get_for_models(
+            *(step.model for step in self.steps)
+        )
+        user_name = self.user.username if self.user is not None else ""
+        return [
+            ObjectChange(
+                user=self.user,
+                user_name=user_name,
+                request_id=request_id,
+                action=ObjectChangeActionChoices.ACTION_DELETE,
+                changed_object_type=content_types[step.model],
+                changed_object_id=pk,
+                object_repr=(name or f"{step.model._meta.verbose_name} {pk}")[:200],
+            )
+            for step in self.steps
+            for pk, name in step.objects.items()
+        ]
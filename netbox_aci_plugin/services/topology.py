@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Topology tree of ACI Fabrics with their pods, nodes, and devices.
+
+The tree (fabric, pods, nodes with their device or virtual machine and TEP
+IP address) is built with one query per level. The node objects are read
+through the cached ``_device`` and ``_virtual_machine`` relations of the
+nodes instead of resolving the generic foreign key per node.
+
+The ETag of a topology is derived from the fabrics and cheap aggregates
+(counts and latest ``last_updated``) of the pods, nodes, and related
+objects, so an unchanged topology is recognized without building it. The
+built tree is cached by the user and its ETag.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from ..fragment_cache import get_permission_hash
+from ..models.fabric.nodes import ACINode
+from ..models.fabric.pods import ACIPod
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from users.models import User
+
+TOPOLOGY_CACHE_PREFIX = "netbox_aci_plugin.topology"
+TOPOLOGY_CACHE_TIMEOUT = 3600
+
+# Cached relations of the ACI Node objects by object type
+NODE_OBJECT_RELATIONS = (
+    ("dcim.device", "_device"),
+    ("virtualization.virtualmachine", "_virtual_machine"),
+)
+
+
+class FabricTopology:
+    """Topology tree of ACI Fabrics.
+
+    The pods and nodes are restricted to those the given user may view.
+    """
+
+    def __init__(self, aci_fabrics: QuerySet, user: User | None = None) -> None:
+        """Initialize the topology of the given ACI Fabrics."""
+        self.user = user
+        self.aci_fabrics = aci_fabrics.prefetch_related(None).order_by("name", "pk")
+        self.aci_pods = self._restrict(
+            ACIPod.objects.filter(aci_fabric__in=self.aci_fabrics.values("pk"))
+        )
+        self.aci_nodes = self._restrict(
+            ACINode.objects.filter(aci_pod__in=self.aci_pods.values("pk"))
+        )
+
+    def _restrict(self, queryset: QuerySet) -> QuerySet:
+        """Return the queryset restricted to objects viewable by the user."""
+        if self.user is None:
+            return queryset
+        return queryset.restrict(self.user, "view")
+
+    def get_etag(self) -> str:
+        """Return the ETag of the topology.
+
+        Any change of the tree changes the identity, count, or latest
+        ``last_updated`` timestamp of an aggregated level.
+        """
+        aci_fabrics = list(self.aci_fabrics.values_list("pk", "last_updated"))
+        aci_pods = self.aci_pods.aggregate(
+            count=Count("pk"),
+            last_updated=Max("last_updated"),
+            tep_pool_count=Count("tep_pool"),
+            tep_pool_last_updated=Max("tep_pool__last_updated"),
+        )
+        node_aggregates = {
+            f"{relation}_last_updated": Max(f"{relation}__last_updated")
+            for _object_type, relation in NODE_OBJECT_RELATIONS
+        }
+        aci_nodes = self.aci_nodes.aggregate(
+            count=Count("pk"),
+            last_updated=Max("last_updated"),
+            tep_ip_address_count=Count("tep_ip_address"),
+            tep_ip_address_last_updated=Max("tep_ip_address__last_updated"),
+            **node_aggregates,
+        )
+        parts = (
+            get_permission_hash(self.user),
+            repr(aci_fabrics),
+            repr(sorted(aci_pods.items())),
+            repr(sorted(aci_nodes.items())),
+        )
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def get_or_build(self, etag: str) -> list[dict]:
+        """Return the cached topology tree of the ETag or build it.
+
+        The tree is cached per user, since the aggregates of the ETag do not
+        identify the pods and nodes a user may view.
+        """
+        user_pk = getattr(self.user, "pk", None)
+        key = f"{TOPOLOGY_CACHE_PREFIX}.{user_pk}.{etag}"
+        if (topology := cache.get(key)) is None:
+            topology = self.build()
+            cache.set(key, topology, TOPOLOGY_CACHE_TIMEOUT)
+        return topology
+
+    def build(self) -> list[dict]:
+        """Build the topology tree with one query per level."""
+        nodes_by_pod = defaultdict(list)
+        for values in self.aci_nodes.order_by("aci_pod", "node_id").values(
+            "pk",
+            "aci_pod_id",
+            "name",
+            "node_id",
+            "role",
+            "node_type",
+            "tep_ip_address_id",
+            "tep_ip_address__address",
+            *(
+                f"{relation}{suffix}"
+                for _object_type, relation in NODE_OBJECT_RELATIONS
+                for suffix in ("_id", "__name")
+            ),
+        ):
+            nodes_by_pod[values["aci_pod_id"]].append(_serialize_node(values))
+
+        pods_by_fabric = defaultdict(list)
+        for values in self.aci_pods.order_by("aci_fabric", "pod_id").values(
+            "pk", "aci_fabric_id", "name", "pod_id", "tep_pool__prefix"
+        ):
+            tep_pool = values["tep_pool__prefix"]
+            pods_by_fabric[values["aci_fabric_id"]].append(
+                {
+                    "id": values["pk"],
+                    "name": values["name"],
+                    "pod_id": values["pod_id"],
+                    "tep_pool": str(tep_pool) if tep_pool is not None else None,
+                    "nodes": nodes_by_pod[values["pk"]],
+                }
+            )
+
+        return [
+            {
+                "id": values["pk"],
+                "name": values["name"],
+                "fabric_id": values["fabric_id"],
+                "pods": pods_by_fabric[values["pk"]],
+            }
+            for values in self.aci_fabrics.values("pk", "name", "fabric_id")
+        ]
+
+
+def _serialize_node(values: dict) -> dict:
+    """Return the topology tree node of the values of an ACI Node."""
+    node_object = next(
+        (
+            {
+                "object_type": object_type,
+                "id": values[f"{relation}_id"],
+                "name": values[f"{relation}__name"],
+            }
+            for object_type, relation in NODE_OBJECT_RELATIONS
+            if values[f"{relation}_id"] is not None
+        ),
+        None,
+    )
+    tep_ip_address = None
+    if values["tep_ip_address_id"] is not None:
+        tep_ip_address = {
+            "id": values["tep_ip_address_id"],
+            "address": str(values["tep_ip_address__address"]),
+        }
+    return {
+        "id": values["pk"],
+        "name": values["name"],
+        "node_id": values["node_id"],
+        "role": values["role"],
+        "node_type": values["node_type"],
+        "node_object": node_object,
+        "tep_ip_address": tep_ip_address,
+    }
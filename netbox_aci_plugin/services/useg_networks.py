@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Resolved networks of the ACI uSeg Endpoint Groups.
+
+A uSeg network attribute matches an IP address, a MAC address, or a prefix
+selected through a generic foreign key, or, with ``use_epg_subnet``, the
+subnets of the bridge domain of its uSeg Endpoint Group. The resolved
+network table holds the concrete prefix or MAC address of each attribute
+(one row per bridge domain subnet for ``use_epg_subnet``), so the networks
+of all uSeg EPGs of a tenant, or the uSeg EPGs matching a network, are read
+with a single query. IP addresses resolve to their host prefix, bridge
+domain subnets to the prefix of their gateway IP address.
+
+The rows are kept in sync by the signal receivers of this module:
+
+- saving an attribute rewrites its rows,
+- saving a bridge domain subnet or a uSeg Endpoint Group rewrites the rows
+  of the attributes using the EPG subnet,
+- saving an IP address, a MAC address, or a prefix rewrites the rows of the
+  attributes matching it, directly or as gateway of a subnet.
+
+Deleting an attribute, a subnet, or a matched object deletes the rows by
+cascade. Bulk writes bypass the signals, so the writers refresh the rows of
+the affected attributes with ``refresh_useg_networks()``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+import netaddr
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from dcim.models import MACAddress
+from ipam.models import IPAddress, Prefix
+
+from ..models.tenant.bridge_domains import ACIBridgeDomainSubnet
+from ..models.tenant.endpoint_groups import (
+    ACIUSegEndpointGroup,
+    ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+# Resolved networks inserted per INSERT statement
+BULK_BATCH_SIZE = 1000
+
+# Lookup path of the bridge domain subnets of an attribute
+SUBNET_PATH = "aci_useg_endpoint_group__aci_bridge_domain__aci_bridge_domain_subnets"
+
+
+def _iter_object_networks(attributes: QuerySet) -> Iterator[dict]:
+    """Yield the networks of the attributes matching an object."""
+    for pk, aci_useg_epg_id, address, prefix, mac_address in (
+        attributes.filter(use_epg_subnet=False)
+        .order_by("pk")
+        .values_list(
+            "pk",
+            "aci_useg_endpoint_group_id",
+            "_ip_address__address",
+            "_prefix__prefix",
+            "_mac_address__mac_address",
+        )
+    ):
+        if address is not None:
+            prefix = netaddr.IPNetwork(address.ip)
+        elif prefix is None and mac_address is None:
+            # An attribute written without its cached relations matches nothing
+            continue
+        yield {
+            "aci_useg_endpoint_group_id": aci_useg_epg_id,
+            "aci_useg_network_attribute_id": pk,
+            "prefix": prefix,
+            "mac_address": mac_address,
+        }
+
+
+def _iter_subnet_networks(attributes: QuerySet) -> Iterator[dict]:
+    """Yield the networks of the attributes using the EPG subnet."""
+    for pk, aci_useg_epg_id, aci_bd_subnet_id, address in (
+        attributes.filter(use_epg_subnet=True, **{f"{SUBNET_PATH}__isnull": False})
+        .order_by("pk", SUBNET_PATH)
+        .values_list(
+            "pk",
+            "aci_useg_endpoint_group_id",
+            SUBNET_PATH,
+            f"{SUBNET_PATH}__gateway_ip_address__address",
+        )
+    ):
+        yield {
+            "aci_useg_endpoint_group_id": aci_useg_epg_id,
+            "aci_useg_network_attribute_id": pk,
+            "aci_bridge_domain_subnet_id": aci_bd_subnet_id,
+            "prefix": address.cidr,
+        }
+
+
+def resolve_useg_networks(attributes: QuerySet) -> Iterator[dict]:
+    """Yield the field values of the resolved networks of the attributes.
+
+    The networks are read with one query for the attributes matching an
+    object and one query for the attributes using the EPG subnet.
+    """
+    yield from _iter_object_networks(attributes)
+    yield from _iter_subnet_networks(attributes)
+
+
+def refresh_useg_networks(
+    attribute_ids: Iterable[int] | QuerySet, batch_size: int = BULK_BATCH_SIZE
+) -> int:
+    """Rebuild the networks of the attributes and return their number."""
+    attributes = ACIUSegNetworkAttribute.objects.filter(pk__in=attribute_ids)
+    networks = [
+        ACIUSegResolvedNetwork(**values) for values in resolve_useg_networks(attributes)
+    ]
+    with transaction.atomic():
+        ACIUSegResolvedNetwork.objects.filter(
+            aci_useg_network_attribute__in=attributes
+        ).delete()
+        ACIUSegResolvedNetwork.objects.bulk_create(networks, batch_size=batch_size)
+    return len(networks)
+
+
+def get_dependent_attributes(
+    instance: ACIBridgeDomainSubnet
+    | ACIUSegEndpointGroup
+    | IPAddress
+    | MACAddress
+    | Prefix,
+) -> QuerySet:
+    """Return the IDs of the attributes resolved from a saved object."""
+    if isinstance(instance, ACIBridgeDomainSubnet):
+        # A moved subnet leaves the attributes of its former bridge domain
+        query = Q(
+            use_epg_subnet=True,
+            aci_useg_endpoint_group__aci_bridge_domain=instance.aci_bridge_domain,
+        ) | Q(aci_useg_resolved_networks__aci_bridge_domain_subnet=instance)
+    elif isinstance(instance, ACIUSegEndpointGroup):
+        query = Q(use_epg_subnet=True, aci_useg_endpoint_group=instance)
+    elif isinstance(instance, IPAddress):
+        query = Q(_ip_address=instance) | Q(
+            pk__in=ACIUSegResolvedNetwork.objects.filter(
+                aci_bridge_domain_subnet__gateway_ip_address=instance
+            ).values("aci_useg_network_attribute")
+        )
+    elif isinstance(instance, MACAddress):
+        query = Q(_mac_address=instance)
+    else:
+        query = Q(_prefix=instance)
+    return (
+        ACIUSegNetworkAttribute.objects.filter(query)
+        .order_by()
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+
+
+@receiver(
+    post_save,
+    sender=ACIUSegNetworkAttribute,
+    dispatch_uid="aci_refresh_useg_networks_attribute",
+)
+def handle_useg_network_attribute_save(
+    sender: type[Model], instance: ACIUSegNetworkAttribute, **kwargs
+) -> None:
+    """Rebuild the resolved networks of a saved uSeg network attribute."""
+    refresh_useg_networks([instance.pk])
+
+
+@receiver(
+    post_save,
+    sender=ACIBridgeDomainSubnet,
+    dispatch_uid="aci_refresh_useg_networks_bd_subnet",
+)
+@receiver(
+    post_save,
+    sender=ACIUSegEndpointGroup,
+    dispatch_uid="aci_refresh_useg_networks_useg_epg",
+)
+@receiver(
+    post_save,
+    sender=IPAddress,
+    dispatch_uid="aci_refresh_useg_networks_ip_address",
+)
+@receiver(
+    post_save,
+    sender=MACAddress,
+    dispatch_uid="aci_refresh_useg_networks_mac_address",
+)
+@receiver(
+    post_save,
+    sender=Prefix,
+    dispatch_uid="aci_refresh_useg_networks_prefix",
+)
+def handle_useg_network_source_save(
+    sender: type[Model], instance: Model, created: bool, **kwargs
+) -> None:
+    """Rebuild the resolved networks of the attributes of a saved object."""
+    # New objects other than subnets are not matched by any attribute yet
+    if created and sender is not ACIBridgeDomainSubnet:
+        return
+    if attribute_ids := list(get_dependent_attributes(instance)):
+        refresh_useg_networks(attribute_ids)
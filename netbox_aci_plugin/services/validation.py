@@ -0,0 +1,508 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Batch validation of candidate ACI objects without writing them.
+
+The candidates (of mixed object types) are built as unsaved instances, or
+as changed copies of existing objects, and validated by the model rules
+(``full_clean()``) without writing anything.
+
+The objects referenced by the candidates are preloaded with one query per
+model and then their parents, level by level, until all are loaded. The
+loaded objects are shared by all candidates and cached on their relations,
+so the parent lookups of the model rules do not query the database. The
+existence of the referenced objects is checked against the preloaded
+objects, and the unique and check constraints are validated set-wise, with
+one query per unique constraint for all candidates of a model (including
+duplicates within the batch).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import (
+    NON_FIELD_ERRORS,
+    FieldDoesNotExist,
+    ValidationError,
+)
+from django.db.models import CheckConstraint, Q, UniqueConstraint
+
+from netbox.models import NetBoxModel
+
+if TYPE_CHECKING:
+    from django.db.models import Field, Model, QuerySet
+
+    from users.models import User
+
+PLUGIN_NAME = "netbox_aci_plugin"
+
+
+@dataclass(slots=True)
+class Candidate:
+    """Candidate object with the field values to validate.
+
+    The object type is the model label (e.g. ``netbox_aci_plugin.acivrf``).
+    With an ID, the field values change the existing object.
+    """
+
+    object_type: str
+    data: dict
+    id: int | None = None
+
+
+@dataclass(slots=True)
+class ValidationReport:
+    """Validation errors of a batch of candidate objects."""
+
+    count: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """True if all candidate objects are valid."""
+        return not self.errors
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the report."""
+        return {
+            "valid": self.valid,
+            "count": self.count,
+            "invalid": len(self.errors),
+            "errors": self.errors,
+        }
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Candidate object with its instance and validation errors."""
+
+    index: int
+    candidate: Candidate | None
+    instance: Model | None = None
+    errors: dict[str, list[str]] = field(default_factory=dict)
+
+    def add_error(self, name: str, *messages: str) -> None:
+        """Add validation error messages of a field."""
+        self.errors.setdefault(name, []).extend(messages)
+
+
+class BatchValidator:
+    """Validate candidate ACI objects by the model rules without writing.
+
+    Referenced and existing objects the given user may not view are
+    treated as missing.
+    """
+
+    def __init__(self, user: User | None = None) -> None:
+        """Initialize the validator."""
+        self.user = user
+        self.models = {
+            model._meta.label_lower: model
+            for model in apps.get_app_config(PLUGIN_NAME).get_models()
+            if issubclass(model, NetBoxModel)
+        }
+        # Preloaded objects shared by all candidates, by model and pk
+        self._objects: dict[type[Model], dict[int, Model]] = defaultdict(dict)
+        # IDs of the objects referenced by the candidates the user may view
+        self._visible: dict[type[Model], set[int]] = defaultdict(set)
+
+    def _restrict(self, queryset: QuerySet) -> QuerySet:
+        """Return the queryset restricted to objects viewable by the user."""
+        if self.user is None or not hasattr(queryset, "restrict"):
+            return queryset
+        return queryset.restrict(self.user, "view")
+
+    def validate(self, candidates: Iterable[Candidate]) -> ValidationReport:
+        """Validate the candidate objects and return the report."""
+        entries = [
+            _Entry(index, candidate) for index, candidate in enumerate(candidates)
+        ]
+        by_model: dict[type[Model], list[_Entry]] = defaultdict(list)
+        for entry in entries:
+            model = self.models.get(entry.candidate.object_type.lower())
+            if model is None:
+                entry.add_error("object_type", "Unknown ACI object type.")
+                continue
+            by_model[model].append(entry)
+
+        for model, model_entries in by_model.items():
+            self._build_instances(model, model_entries)
+        self._preload(
+            entry.instance
+            for model_entries in by_model.values()
+            for entry in model_entries
+            if entry.instance is not None
+        )
+        for model, model_entries in by_model.items():
+            built = [entry for entry in model_entries if entry.instance is not None]
+            self._check_references(model, built)
+            for entry in built:
+                self._clean(model, entry)
+            self._check_constraints(model, built)
+
+        return ValidationReport(
+            count=len(entries),
+            errors=[
+                {
+                    "index": entry.index,
+                    "object_type": entry.candidate.object_type,
+                    "id": entry.candidate.id,
+                    "errors": entry.errors,
+                }
+                for entry in entries
+                if entry.errors
+            ],
+        )
+
+    def check_rules(self, instances: Iterable[Model]) -> list[dict[str, list[str]]]:
+        """Return the field and model rule errors of unsaved instances.
+
+        The objects referenced by the instances are preloaded as for the
+        candidates. The references and the constraints are not validated,
+        as the bulk writers calling this resolve and check them set-wise.
+        """
+        entries = [
+            _Entry(index, None, instance) for index, instance in enumerate(instances)
+        ]
+        self._preload(entry.instance for entry in entries)
+        for entry in entries:
+            self._clean(type(entry.instance), entry)
+        return [entry.errors for entry in entries]
+
+    #
+    # Instances
+    #
+
+    def _build_instances(self, model: type[Model], entries: list[_Entry]) -> None:
+        """Build the instances of the candidates of a model.
+
+        The existing objects of the candidates with an ID are loaded with
+        one query.
+        """
+        existing = {
+            obj.pk: obj
+            for obj in self._restrict(
+                model.objects.filter(
+                    pk__in={entry.candidate.id for entry in entries} - {None}
+                )
+            )
+        }
+        loaded = set(existing)
+        for entry in entries:
+            if entry.candidate.id is None:
+                instance = model()
+            elif (instance := existing.pop(entry.candidate.id, None)) is None:
+                entry.add_error(
+                    "id",
+                    "The object is duplicated in the batch."
+                    if entry.candidate.id in loaded
+                    else "The object does not exist.",
+                )
+                continue
+            self._set_values(model, entry, instance)
+            entry.instance = instance
+
+    def _set_values(self, model: type[Model], entry: _Entry, instance: Model) -> None:
+        """Set the candidate field values on the instance.
+
+        Related objects are given by their ID, content types also by their
+        ``app_label.model`` name.
+        """
+        for name, value in entry.candidate.data.items():
+            try:
+                model_field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                model_field = None
+            if (
+                model_field is None
+                or not model_field.concrete
+                or model_field.many_to_many
+                or model_field.primary_key
+            ):
+                entry.add_error(name, "Unknown field.")
+                continue
+            if (
+                model_field.is_relation
+                and model_field.related_model is ContentType
+                and isinstance(value, str)
+            ):
+                try:
+                    value = ContentType.objects.get_by_natural_key(
+                        *value.split(".", 1)
+                    ).pk
+                except (ContentType.DoesNotExist, TypeError):
+                    entry.add_error(name, f"Unknown object type: {value}")
+                    continue
+            setattr(instance, model_field.attname, value)
+
+    #
+    # Related objects
+    #
+
+    def _preload(self, instances: Iterable[Model]) -> None:
+        """Load the objects referenced by the instances and their parents.
+
+        The referenced objects are loaded with one query per model, then
+        the objects referenced by those (within the plugin), and so on.
+        """
+        instances = list(instances)
+        loaded: list[Model] = []
+        pending = self._get_references(instances)
+        referenced = True
+        while pending:
+            objects = []
+            for model, pks in pending.items():
+                cache = self._objects[model]
+                if not (pks := pks.difference(cache)):
+                    continue
+                queryset = model.objects.filter(pk__in=pks)
+                # The parents of the referenced objects are not restricted
+                if referenced:
+                    queryset = self._restrict(queryset)
+                for obj in queryset:
+                    cache[obj.pk] = obj
+                    objects.append(obj)
+                    if referenced:
+                        self._visible[model].add(obj.pk)
+            loaded.extend(objects)
+            pending = self._get_references(objects, plugin_only=True)
+            referenced = False
+        for obj in (*loaded, *instances):
+            self._attach(obj)
+
+    def _iter_references(
+        self, obj: Model
+    ) -> Iterator[tuple[Field | GenericForeignKey, type[Model], int]]:
+        """Yield the relations, models, and IDs of the referenced objects."""
+        opts = obj._meta
+        for model_field in opts.concrete_fields:
+            if not model_field.many_to_one:
+                continue
+            if (object_id := getattr(obj, model_field.attname)) is not None:
+                yield model_field, model_field.related_model, object_id
+        for generic_field in opts.private_fields:
+            if not isinstance(generic_field, GenericForeignKey):
+                continue
+            content_type_id = getattr(
+                obj, opts.get_field(generic_field.ct_field).attname
+            )
+            object_id = getattr(obj, generic_field.fk_field)
+            if content_type_id is None or object_id is None:
+                continue
+            try:
+                related_model = ContentType.objects.get_for_id(
+                    content_type_id
+                ).model_class()
+            except ContentType.DoesNotExist:
+                continue
+            yield generic_field, related_model, object_id
+
+    def _get_references(
+        self, objects: Iterable[Model], plugin_only: bool = False
+    ) -> dict[type[Model], set]:
+        """Return the IDs of the objects referenced by the objects by model."""
+        references: dict[type[Model], set] = defaultdict(set)
+        for obj in objects:
+            for _field, related_model, object_id in self._iter_references(obj):
+                if plugin_only and related_model._meta.app_label != PLUGIN_NAME:
+                    continue
+                references[related_model].add(object_id)
+        return references
+
+    def _attach(self, obj: Model) -> None:
+        """Cache the preloaded referenced objects on the relations."""
+        for relation, related_model, object_id in self._iter_references(obj):
+            related = self._objects[related_model].get(object_id)
+            if related is not None:
+                relation.set_cached_value(obj, related)
+
+    def _check_references(self, model: type[Model], entries: list[_Entry]) -> None:
+        """Check the referenced objects exist (and match their choices)."""
+        for model_field in model._meta.concrete_fields:
+            if not model_field.many_to_one:
+                continue
+            related_model = model_field.related_model
+            permitted = self._visible[related_model]
+            if limit_choices_to := model_field.get_limit_choices_to():
+                permitted = set(
+                    related_model.objects.complex_filter(limit_choices_to)
+                    .filter(pk__in=permitted)
+                    .values_list("pk", flat=True)
+                )
+            for entry in entries:
+                value = getattr(entry.instance, model_field.attname)
+                if value is None:
+                    if not model_field.null:
+                        entry.add_error(
+                            model_field.name, str(model_field.error_messages["null"])
+                        )
+                    continue
+                if value not in permitted:
+                    entry.add_error(
+                        model_field.name,
+                        str(model_field.error_messages["invalid"])
+                        % {
+                            "model": related_model._meta.verbose_name,
+                            "pk": value,
+                            "field": model_field.remote_field.field_name,
+                            "value": value,
+                        },
+                    )
+        for entry in entries:
+            for relation, related_model, object_id in self._iter_references(
+                entry.instance
+            ):
+                if isinstance(relation, GenericForeignKey) and (
+                    object_id not in self._visible[related_model]
+                ):
+                    entry.add_error(
+                        relation.name,
+                        f"{related_model._meta.verbose_name} with ID {object_id} "
+                        "does not exist.",
+                    )
+
+    #
+    # Model rules
+    #
+
+    def _clean(self, model: type[Model], entry: _Entry) -> None:
+        """Validate the fields and the model rules of a candidate.
+
+        The relations are checked by ``_check_references`` and the
+        constraints by ``_check_constraints`` for all candidates at once.
+        The model rules depend on the related objects and are validated
+        for candidates with valid references and field names only.
+        """
+        exclude = [
+            model_field.name
+            for model_field in model._meta.concrete_fields
+            if model_field.many_to_one
+        ]
+        try:
+            if entry.errors:
+                entry.instance.clean_fields(exclude=exclude)
+            else:
+                entry.instance.full_clean(
+                    exclude=exclude,
+                    validate_unique=False,
+                    validate_constraints=False,
+                )
+        except ValidationError as exc:
+            messages = (
+                exc.message_dict
+                if hasattr(exc, "error_dict")
+                else {NON_FIELD_ERRORS: exc.messages}
+            )
+            for name, field_messages in messages.items():
+                entry.add_error(name, *field_messages)
+
+    def _check_constraints(self, model: type[Model], entries: list[_Entry]) -> None:
+        """Validate the unique and check constraints of the candidates."""
+        opts = model._meta
+        unique_fields = [
+            ((model_field.name,), None, None)
+            for model_field in opts.concrete_fields
+            if model_field.unique and not model_field.primary_key
+        ]
+        for constraint in opts.constraints:
+            if isinstance(constraint, UniqueConstraint) and constraint.fields:
+                unique_fields.append(
+                    (constraint.fields, constraint.condition, constraint)
+                )
+            elif isinstance(constraint, CheckConstraint):
+                for entry in entries:
+                    if not evaluate_condition(constraint.condition, entry.instance):
+                        entry.add_error(
+                            NON_FIELD_ERRORS, constraint.get_violation_error_message()
+                        )
+        for fields, condition, constraint in unique_fields:
+            self._check_unique(model, entries, fields, condition, constraint)
+
+    def _check_unique(
+        self,
+        model: type[Model],
+        entries: list[_Entry],
+        fields: tuple[str, ...],
+        condition: Q | None,
+        constraint: UniqueConstraint | None,
+    ) -> None:
+        """Validate the candidates are unique by the fields with one query.
+
+        The existing objects changed by the candidates are compared by their
+        candidate values only.
+        """
+        attnames = [model._meta.get_field(name).attname for name in fields]
+        keyed: dict[tuple, list[_Entry]] = defaultdict(list)
+        for entry in entries:
+            if condition is not None and not evaluate_condition(
+                condition, entry.instance
+            ):
+                continue
+            key = tuple(getattr(entry.instance, attname) for attname in attnames)
+            if None not in key:
+                keyed[key].append(entry)
+        if not keyed:
+            return
+
+        changed_pks = {entry.instance.pk for entry in entries} - {None}
+        queryset = model.objects.filter(
+            **{f"{attnames[0]}__in": {key[0] for key in keyed}}
+        ).exclude(pk__in=changed_pks)
+        if condition is not None:
+            queryset = queryset.filter(condition)
+        existing = set(queryset.values_list(*attnames))
+
+        for key, key_entries in keyed.items():
+            if len(key_entries) == 1 and key not in existing:
+                continue
+            for entry in key_entries:
+                if constraint is None or (
+                    condition is None
+                    and constraint.violation_error_message
+                    == constraint.default_violation_error_message
+                ):
+                    message = entry.instance.unique_error_message(model, fields)
+                    entry.add_error(NON_FIELD_ERRORS, *message.messages)
+                else:
+                    entry.add_error(
+                        NON_FIELD_ERRORS, constraint.get_violation_error_message()
+                    )
+
+
+def evaluate_condition(condition: Q, instance: Model) -> bool:
+    """Return whether the field values of the instance match the condition.
+
+    Exact and ``isnull`` lookups are evaluated in Python, other lookups by
+    the database.
+    """
+    results = []
+    for child in condition.children:
+        if isinstance(child, Q):
+            results.append(evaluate_condition(child, instance))
+            continue
+        lookup, value = child
+        name, _sep, lookup_type = lookup.partition("__")
+        field_value = getattr(instance, instance._meta.get_field(name).attname)
+        if lookup_type in ("", "exact"):
+            results.append(field_value == value)
+        elif lookup_type == "isnull":
+            results.append((field_value is None) == value)
+        else:
+            results.append(Q(child).check({name: field_value}))
+    matched = all(results) if condition.connector == Q.AND else any(results)
+    return not matched if condition.negated else matched
+
+
+def validate_objects(
+    candidates: Iterable[Candidate], user: User | None = None
+) -> ValidationReport:
+    """Validate the candidate objects and return the report."""
+    return BatchValidator(user=user).validate(candidates)
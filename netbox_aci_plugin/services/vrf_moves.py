@@ -0,0 +1,309 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Impact analysis of moving ACI Bridge Domains to other ACI VRFs.
+
+Moving a Bridge Domain moves its Endpoint Groups and uSeg Endpoint Groups
+to the new VRF. The analysis collects every affected object and reports
+the conflicts of the move:
+
+- ESG Endpoint Group selectors selecting a moved Endpoint Group for an
+  Endpoint Security Group of another VRF,
+- L3Out bindings of a moved Bridge Domain to an L3Out of another VRF,
+- subnets of a moved Bridge Domain overlapping a subnet of another Bridge
+  Domain in the new VRF,
+- contract relations of a moved Endpoint Group to a contract with the VRF
+  scope relating objects of different VRFs after the move.
+
+The moves of any number of Bridge Domains are analyzed with a fixed number
+of set-based queries.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db.models import Q
+from django.utils.translation import gettext as _
+
+from ..choices import ContractScopeChoices
+from ..models.tenant.bridge_domains import (
+    ACIBridgeDomain,
+    ACIBridgeDomainL3OutBinding,
+    ACIBridgeDomainSubnet,
+)
+from ..models.tenant.contracts import ACIContractRelation
+from ..models.tenant.endpoint_groups import ACIEndpointGroup, ACIUSegEndpointGroup
+from ..models.tenant.endpoint_security_groups import ACIEsgEndpointGroupSelector
+from .subnet_overlaps import find_bridge_domain_subnet_overlaps
+
+# Lookups of the VRF of a contract relation object by cached relation
+CONTRACT_RELATION_VRF_LOOKUPS = (
+    "_aci_endpoint_group__aci_bridge_domain__aci_vrf_id",
+    "_aci_useg_endpoint_group__aci_bridge_domain__aci_vrf_id",
+    "_aci_endpoint_security_group__aci_vrf_id",
+    "_aci_external_endpoint_group__aci_l3out__aci_vrf_id",
+    "_aci_vrf_id",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class VRFMoveConflict:
+    """Object conflicting with the VRF move of an ACI Bridge Domain."""
+
+    aci_bridge_domain_id: int
+    object_type: str
+    object_id: int
+    message: str
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the conflict."""
+        return {
+            "aci_bridge_domain": self.aci_bridge_domain_id,
+            "object_type": self.object_type,
+            "object_id": self.object_id,
+            "message": self.message,
+        }
+
+
+@dataclass(slots=True)
+class VRFMoveImpact:
+    """Objects affected by the VRF moves of ACI Bridge Domains."""
+
+    aci_bridge_domain_ids: list[int] = field(default_factory=list)
+    aci_endpoint_group_ids: list[int] = field(default_factory=list)
+    aci_useg_endpoint_group_ids: list[int] = field(default_factory=list)
+    aci_esg_endpoint_group_selector_ids: list[int] = field(default_factory=list)
+    aci_bridge_domain_l3out_binding_ids: list[int] = field(default_factory=list)
+    aci_contract_relation_ids: list[int] = field(default_factory=list)
+    conflicts: list[VRFMoveConflict] = field(default_factory=list)
+
+    def serialize(self) -> dict:
+        """Return a JSON serializable representation of the impact."""
+        return {
+            "aci_bridge_domains": self.aci_bridge_domain_ids,
+            "aci_endpoint_groups": self.aci_endpoint_group_ids,
+            "aci_useg_endpoint_groups": self.aci_useg_endpoint_group_ids,
+            "aci_esg_endpoint_group_selectors": (
+                self.aci_esg_endpoint_group_selector_ids
+            ),
+            "aci_bridge_domain_l3out_bindings": (
+                self.aci_bridge_domain_l3out_binding_ids
+            ),
+            "aci_contract_relations": self.aci_contract_relation_ids,
+            "conflicts": [conflict.serialize() for conflict in self.conflicts],
+        }
+
+
+class BridgeDomainVRFMoves:
+    """Impact analysis of moving ACI Bridge Domains to other ACI VRFs."""
+
+    def __init__(self, moves: dict[int, int]) -> None:
+        """Initialize the analysis of the new VRF IDs by Bridge Domain ID.
+
+        Bridge Domains keeping their VRF are ignored.
+        """
+        self.aci_vrf_ids: dict[int, int] = {}
+        self.names: dict[int, str] = {}
+        self.impact = VRFMoveImpact()
+        for pk, name, aci_vrf_id in ACIBridgeDomain.objects.filter(
+            pk__in=moves
+        ).values_list("pk", "name", "aci_vrf_id"):
+            if moves[pk] != aci_vrf_id:
+                self.aci_vrf_ids[pk] = moves[pk]
+                self.names[pk] = name
+
+    def _conflict(self, aci_bd_id: int, model, pk: int, message: str) -> None:
+        """Record a conflict of an object with a moved Bridge Domain."""
+        self.impact.conflicts.append(
+            VRFMoveConflict(
+                aci_bridge_domain_id=aci_bd_id,
+                object_type=model._meta.label_lower,
+                object_id=pk,
+                message=_("Bridge Domain {name}: {message}").format(
+                    name=self.names[aci_bd_id], message=message
+                ),
+            )
+        )
+
+    def analyze(self) -> VRFMoveImpact:
+        """Return the affected objects and conflicts of the moves."""
+        self.impact = VRFMoveImpact(aci_bridge_domain_ids=sorted(self.aci_vrf_ids))
+        if self.aci_vrf_ids:
+            self._analyze_endpoint_groups()
+            self._analyze_esg_selectors()
+            self._analyze_l3out_bindings()
+            self._analyze_subnets()
+            self._analyze_contract_relations()
+        return self.impact
+
+    def _analyze_endpoint_groups(self) -> None:
+        """Collect the Endpoint Groups and uSeg EPGs of the moved BDs."""
+        moved = Q(aci_bridge_domain__in=list(self.aci_vrf_ids))
+        self.impact.aci_endpoint_group_ids = list(
+            ACIEndpointGroup.objects.filter(moved)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        self.impact.aci_useg_endpoint_group_ids = list(
+            ACIUSegEndpointGroup.objects.filter(moved)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+    def _analyze_esg_selectors(self) -> None:
+        """Check the ESGs selecting the moved Endpoint Groups."""
+        aci_bd_ids = list(self.aci_vrf_ids)
+        for pk, name, esg_name, esg_vrf_id, epg_bd_id, useg_bd_id in (
+            ACIEsgEndpointGroupSelector.objects.filter(
+                Q(_aci_endpoint_group__aci_bridge_domain__in=aci_bd_ids)
+                | Q(_aci_useg_endpoint_group__aci_bridge_domain__in=aci_bd_ids)
+            )
+            .order_by("pk")
+            .values_list(
+                "pk",
+                "name",
+                "aci_endpoint_security_group__name",
+                "aci_endpoint_security_group__aci_vrf_id",
+                "_aci_endpoint_group__aci_bridge_domain_id",
+                "_aci_useg_endpoint_group__aci_bridge_domain_id",
+            )
+        ):
+            self.impact.aci_esg_endpoint_group_selector_ids.append(pk)
+            aci_bd_id = epg_bd_id or useg_bd_id
+            if esg_vrf_id != self.aci_vrf_ids[aci_bd_id]:
+                self._conflict(
+                    aci_bd_id,
+                    ACIEsgEndpointGroupSelector,
+                    pk,
+                    _(
+                        "The selector {name} of the Endpoint Security Group "
+                        "{esg} selects a moved Endpoint Group, but the ESG "
+                        "belongs to a different ACI VRF."
+                    ).format(name=name, esg=esg_name),
+                )
+
+    def _analyze_l3out_bindings(self) -> None:
+        """Check the L3Out bindings of the moved Bridge Domains."""
+        for pk, aci_bd_id, l3out_name, l3out_vrf_id in (
+            ACIBridgeDomainL3OutBinding.objects.filter(
+                aci_bridge_domain__in=list(self.aci_vrf_ids)
+            )
+            .order_by("pk")
+            .values_list(
+                "pk", "aci_bridge_domain_id", "aci_l3out__name", "aci_l3out__aci_vrf_id"
+            )
+        ):
+            self.impact.aci_bridge_domain_l3out_binding_ids.append(pk)
+            if l3out_vrf_id != self.aci_vrf_ids[aci_bd_id]:
+                self._conflict(
+                    aci_bd_id,
+                    ACIBridgeDomainL3OutBinding,
+                    pk,
+                    _("The bound L3Out {name} belongs to a different ACI VRF.").format(
+                        name=l3out_name
+                    ),
+                )
+
+    def _analyze_subnets(self) -> None:
+        """Check the subnets of the moved BDs for overlaps in the new VRFs."""
+        queryset = ACIBridgeDomainSubnet.objects.filter(
+            Q(aci_bridge_domain__in=list(self.aci_vrf_ids))
+            | Q(aci_bridge_domain__aci_vrf__in=set(self.aci_vrf_ids.values()))
+        )
+        for overlap in find_bridge_domain_subnet_overlaps(
+            queryset, aci_vrf_overrides=self.aci_vrf_ids
+        ):
+            for pk, subnet, aci_bd_id, other_subnet in (
+                (
+                    overlap.subnet_id,
+                    overlap.subnet,
+                    overlap.aci_bridge_domain_id,
+                    overlap.overlapping_subnet,
+                ),
+                (
+                    overlap.overlapping_subnet_id,
+                    overlap.overlapping_subnet,
+                    overlap.overlapping_aci_bridge_domain_id,
+                    overlap.subnet,
+                ),
+            ):
+                if aci_bd_id in self.aci_vrf_ids:
+                    self._conflict(
+                        aci_bd_id,
+                        ACIBridgeDomainSubnet,
+                        pk,
+                        _(
+                            "The subnet {subnet} overlaps with the subnet "
+                            "{other} of another Bridge Domain in the new "
+                            "ACI VRF."
+                        ).format(subnet=subnet, other=other_subnet),
+                    )
+
+    def _analyze_contract_relations(self) -> None:
+        """Check the VRF-scoped contracts of the moved Endpoint Groups.
+
+        A contract with the VRF scope only applies between objects of the
+        same VRF, so its relations must not span VRFs after the move.
+        """
+        aci_bd_ids = list(self.aci_vrf_ids)
+        moved = Q(_aci_endpoint_group__aci_bridge_domain__in=aci_bd_ids) | Q(
+            _aci_useg_endpoint_group__aci_bridge_domain__in=aci_bd_ids
+        )
+        relations_by_contract = defaultdict(list)
+        for values in (
+            ACIContractRelation.objects.filter(
+                aci_contract__in=ACIContractRelation.objects.filter(moved).values(
+                    "aci_contract"
+                )
+            )
+            .order_by("pk")
+            .values_list(
+                "pk",
+                "aci_contract_id",
+                "aci_contract__name",
+                "aci_contract__scope",
+                "_aci_endpoint_group__aci_bridge_domain_id",
+                "_aci_useg_endpoint_group__aci_bridge_domain_id",
+                *CONTRACT_RELATION_VRF_LOOKUPS,
+            )
+        ):
+            pk, aci_contract_id, name, scope, epg_bd_id, useg_bd_id = values[:6]
+            aci_bd_id = epg_bd_id or useg_bd_id
+            aci_vrf_id = next(
+                (vrf_id for vrf_id in values[6:] if vrf_id is not None), None
+            )
+            if aci_bd_id in self.aci_vrf_ids:
+                self.impact.aci_contract_relation_ids.append(pk)
+                aci_vrf_id = self.aci_vrf_ids[aci_bd_id]
+            if scope == ContractScopeChoices.SCOPE_VRF:
+                relations_by_contract[aci_contract_id].append(
+                    (pk, name, aci_bd_id, aci_vrf_id)
+                )
+
+        for relations in relations_by_contract.values():
+            aci_vrf_ids = {relation[3] for relation in relations}
+            if len(aci_vrf_ids) < 2:
+                continue
+            for pk, name, aci_bd_id, _aci_vrf_id in relations:
+                if aci_bd_id in self.aci_vrf_ids:
+                    self._conflict(
+                        aci_bd_id,
+                        ACIContractRelation,
+                        pk,
+                        _(
+                            "The contract {name} has the VRF scope, but "
+                            "relates objects of different ACI VRFs after the "
+                            "move."
+                        ).format(name=name),
+                    )
+
+
+def analyze_bridge_domain_vrf_moves(moves: dict[int, int]) -> VRFMoveImpact:
+    """Return the impact of moving the Bridge Domains to the new VRFs.
+
+    The moves map the ID of each Bridge Domain to the ID of its new VRF.
+    """
+    return BridgeDomainVRFMoves(moves).analyze()
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django import template
+
+from ..fragment_cache import get_or_render_fragment
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    """Render a template fragment of an ACI object through the cache."""
+
+    def __init__(self, nodelist, name, instance) -> None:
+        """Initialize the node with the fragment name and the object."""
+        self.nodelist = nodelist
+        self.name = name
+        self.instance = instance
+
+    def render(self, context) -> str:
+        """Return the cached fragment or render it."""
+        request = context.get("request")
+        return get_or_render_fragment(
+            self.name.resolve(context),
+            self.instance.resolve(context),
+            getattr(request, "user", None),
+            lambda: self.nodelist.render(context),
+        )
+
+
+@register.tag("aci_cache_fragment")
+def do_aci_cache_fragment(parser, token) -> FragmentCacheNode:
+    """Cache a fragment of an ACI object detail page.
+
+    Usage::
+
+        {% aci_cache_fragment "attributes" object %}
+          ...
+        {% endaci_cache_fragment %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 3:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag requires a fragment name and an object."
+        )
+    nodelist = parser.parse(("endaci_cache_fragment",))
+    parser.delete_first_token()
+    return FragmentCacheNode(
+        nodelist, parser.compile_filter(bits[1]), parser.compile_filter(bits[2])
+    )
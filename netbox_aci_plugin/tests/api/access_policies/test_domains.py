@@ -8,9 +8,12 @@ from utilities.testing import APIViewTestCases
 from ....api.urls import app_name
 from ....models.access_policies.domains import ACIRoutedDomain
 from ....models.fabric.fabrics import ACIFabric
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIRoutedDomainAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIRoutedDomainAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Routed Domain."""
 
     model = ACIRoutedDomain
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ..base import QueryScalingMixin
+
+__all__ = ("ACIAPIViewTestMixin",)
+
+
+class ACIAPIViewTestMixin(QueryScalingMixin):
+    """Plugin mixin for ``APIViewTestCases.APIViewTestCase`` classes.
+
+    Checks the list endpoint for N+1 queries and sparse fieldsets, and the
+    conditional GET requests of the list and detail endpoints; it is no
+    test case itself, so that importing it does not collect its tests.
+    """
+
+    def test_list_objects_query_scaling(self) -> None:
+        """Test the list query count is independent of the page size."""
+        self.add_permissions(
+            f"{self.model._meta.app_label}.view_{self.model._meta.model_name}"
+        )
+        url = self._get_list_url()
+
+        def request(size: int) -> None:
+            response = self.client.get(f"{url}?limit={size}", **self.header)
+            self.assertHttpStatus(response, 200)
+
+        self.assertQueryCountScaling(request, self.model)
+
+    def test_list_objects_sparse_fieldset(self) -> None:
+        """Test a sparse fieldset does not load unrequested relations."""
+        self.add_permissions(
+            f"{self.model._meta.app_label}.view_{self.model._meta.model_name}"
+        )
+        url = self._get_list_url()
+        self.client.get(url, **self.header)
+        with CaptureQueriesContext(connection) as full:
+            self.client.get(url, **self.header)
+        with CaptureQueriesContext(connection) as sparse:
+            response = self.client.get(f"{url}?fields=id", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.data["results"])
+        for result in response.data["results"]:
+            self.assertEqual(set(result), {"id"})
+        self.assertLess(len(sparse), len(full))
+
+    def test_list_objects_display_query_scaling(self) -> None:
+        """Test the display field of a sparse fieldset loads its relations."""
+        self.add_permissions(
+            f"{self.model._meta.app_label}.view_{self.model._meta.model_name}"
+        )
+        url = self._get_list_url()
+
+        def request(size: int) -> None:
+            response = self.client.get(
+                f"{url}?fields=id,display&limit={size}", **self.header
+            )
+            self.assertHttpStatus(response, 200)
+
+        self.assertQueryCountScaling(request, self.model)
+
+    def test_list_objects_not_modified(self) -> None:
+        """Test an unchanged list is answered with 304 Not Modified."""
+        self.add_permissions(
+            f"{self.model._meta.app_label}.view_{self.model._meta.model_name}"
+        )
+        url = self._get_list_url()
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertHttpStatus(response, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.client.get(
+            f"{url}?limit=1", HTTP_IF_NONE_MATCH=etag, **self.header
+        )
+        self.assertHttpStatus(response, 200)
+
+    def test_get_object_not_modified(self) -> None:
+        """Test an unchanged object is answered with 304 Not Modified."""
+        self.add_permissions(
+            f"{self.model._meta.app_label}.view_{self.model._meta.model_name}"
+        )
+        instance = self._get_queryset().first()
+        url = self._get_detail_url(instance)
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertHttpStatus(response, 304)
+
+        self._get_queryset().filter(pk=instance.pk).update(last_updated=timezone.now())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertNotEqual(response["ETag"], etag)
@@ -2,15 +2,25 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+
 from ipam.models import VLAN, Prefix
 from tenancy.models import Tenant
-from utilities.testing import APIViewTestCases
+from utilities.testing import APITestCase, APIViewTestCases
 
 from ....api.urls import app_name
+from ....jobs import ACIBridgeDomainSubnetOverlapJob
 from ....models.fabric.fabrics import ACIFabric
+from ....models.fabric.pods import ACIPod
+from ....models.tenant.tenants import ACITenant
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIFabricAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIFabricAPIViewTestCase(ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase):
     """API view test case for ACI Fabric."""
 
     model = ACIFabric
@@ -100,3 +110,286 @@ class ACIFabricAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         cls.bulk_update_data = {
             "description": "New description",
         }
+
+
+class ACIFabricSubnetOverlapReportAPITestCase(APITestCase):
+    """API test case for the ACI Fabric subnet overlap report action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Fabric for the subnet overlap report."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACIFabricTestAPIReport", fabric_id=110, infra_vlan_vid=3900
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acifabric-subnet-overlap-report",
+            kwargs={"pk": cls.aci_fabric.pk},
+        )
+
+    def test_subnet_overlap_report_without_permission(self) -> None:
+        """Test enqueuing the report requires view permission on the fabric."""
+        response = self.client.post(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_subnet_overlap_report(self) -> None:
+        """Test enqueuing the report returns the created job."""
+        self.add_permissions("netbox_aci_plugin.view_acifabric")
+        enqueue = ACIBridgeDomainSubnetOverlapJob.enqueue
+        with patch.object(
+            ACIBridgeDomainSubnetOverlapJob,
+            "enqueue",
+            side_effect=lambda **kwargs: enqueue(immediate=True, **kwargs),
+        ):
+            response = self.client.post(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["object_id"], self.aci_fabric.pk)
+        self.assertEqual(response.data["data"]["overlap_count"], 0)
+
+
+class ACIFabricExportAPITestCase(APITestCase):
+    """API test case for the ACI Fabric export action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Fabrics with ACI Tenants for the export."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACIFabricTestAPIExport", fabric_id=111, infra_vlan_vid=3900
+        )
+        aci_fabric_other = ACIFabric.objects.create(
+            name="ACIFabricTestAPIExportOther", fabric_id=112, infra_vlan_vid=3900
+        )
+        ACITenant.objects.create(
+            name="ACITestTenantAPIExport", aci_fabric=cls.aci_fabric
+        )
+        ACITenant.objects.create(
+            name="ACITestTenantAPIExportOther", aci_fabric=aci_fabric_other
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acifabric-export",
+            kwargs={"pk": cls.aci_fabric.pk},
+        )
+
+    def test_export_restricts_tenants(self) -> None:
+        """Test exporting streams only the viewable tenants of the fabric."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric", "netbox_aci_plugin.view_acitenant"
+        )
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        document = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            [
+                fv_tenant["fvTenant"]["attributes"]["name"]
+                for fv_tenant in document["polUni"]["children"]
+            ],
+            ["ACITestTenantAPIExport"],
+        )
+
+    def test_export_without_tenant_permission(self) -> None:
+        """Test exporting omits tenants the user may not view."""
+        self.add_permissions("netbox_aci_plugin.view_acifabric")
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        document = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(document["polUni"]["children"], [])
+
+
+class ACIFabricTeardownAPITestCase(APITestCase):
+    """API test case for the ACI Fabric teardown action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Fabric with an ACI Tenant for the teardown."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACIFabricTestAPITeardown", fabric_id=113, infra_vlan_vid=3900
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACITestTenantAPITeardown", aci_fabric=cls.aci_fabric
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acifabric-teardown",
+            kwargs={"pk": cls.aci_fabric.pk},
+        )
+
+    def test_teardown_plan(self) -> None:
+        """Test the deletion plan lists the tenant before the fabric."""
+        self.add_permissions("netbox_aci_plugin.view_acifabric")
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["counts"],
+            {"netbox_aci_plugin.ACITenant": 1, "netbox_aci_plugin.ACIFabric": 1},
+        )
+
+
+class ACIFabricApplyAPITestCase(APITestCase):
+    """API test case for the ACI Fabric apply action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI Fabric and a desired-state tenant document."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACIFabricTestAPIApply", fabric_id=117, infra_vlan_vid=3900
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acifabric-apply",
+            kwargs={"pk": cls.aci_fabric.pk},
+        )
+        cls.document = {
+            "fvTenant": {
+                "attributes": {"name": "ACITestTenantAPIApply"},
+                "children": [
+                    {"fvCtx": {"attributes": {"name": "VRF1"}}},
+                    {
+                        "fvBD": {
+                            "attributes": {"name": "BD1"},
+                            "children": [
+                                {"fvRsCtx": {"attributes": {"tnFvCtxName": "VRF1"}}},
+                                {"fvSubnet": {"attributes": {"ip": "10.21.0.1/24"}}},
+                            ],
+                        }
+                    },
+                ],
+            }
+        }
+
+    def add_apply_permissions(self) -> None:
+        """Add the permissions required to apply the document."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric",
+            "netbox_aci_plugin.add_acitenant",
+            "netbox_aci_plugin.add_acivrf",
+            "netbox_aci_plugin.add_acibridgedomain",
+            "netbox_aci_plugin.add_acibridgedomainsubnet",
+            "ipam.add_ipaddress",
+        )
+
+    def test_apply_without_permission(self) -> None:
+        """Test applying requires permission to add the planned objects."""
+        self.add_permissions("netbox_aci_plugin.view_acifabric")
+        response = self.client.post(
+            self.url, self.document, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_apply_dry_run(self) -> None:
+        """Test a dry run returns the plan without applying it."""
+        self.add_apply_permissions()
+        response = self.client.post(
+            f"{self.url}?dry_run=true", self.document, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertTrue(response.data["dry_run"])
+        self.assertFalse(response.data["applied"])
+        self.assertEqual(response.data["counts"]["added"], 4)
+        self.assertFalse(
+            ACITenant.objects.filter(name="ACITestTenantAPIApply").exists()
+        )
+
+    def test_apply(self) -> None:
+        """Test applying a document creates the tenant tree once."""
+        self.add_apply_permissions()
+        response = self.client.post(
+            self.url, self.document, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertTrue(response.data["applied"])
+        self.assertTrue(
+            ACITenant.objects.filter(
+                aci_fabric=self.aci_fabric, name="ACITestTenantAPIApply"
+            ).exists()
+        )
+
+        response = self.client.post(
+            self.url, {"imdata": [self.document]}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["changes"], [])
+
+    def test_apply_invalid_document(self) -> None:
+        """Test an invalid document is rejected with the object errors."""
+        self.add_apply_permissions()
+        response = self.client.post(self.url, {}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+        document = {
+            "fvTenant": {
+                "attributes": {"name": "ACITestTenantAPIApply"},
+                "children": [{"fvBD": {"attributes": {"name": "BD1"}}}],
+            }
+        }
+        response = self.client.post(self.url, document, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [error["dn"] for error in response.data["errors"]],
+            ["uni/tn-ACITestTenantAPIApply/BD-BD1"],
+        )
+        self.assertFalse(
+            ACITenant.objects.filter(name="ACITestTenantAPIApply").exists()
+        )
+
+
+class ACIFabricTopologyAPITestCase(APITestCase):
+    """API test case for the ACI Fabric topology actions."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Fabrics with ACI Pods for the topology."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACIFabricTestAPITopology", fabric_id=115, infra_vlan_vid=3900
+        )
+        aci_fabric_other = ACIFabric.objects.create(
+            name="ACIFabricTestAPITopologyOther", fabric_id=116, infra_vlan_vid=3900
+        )
+        for aci_fabric in (cls.aci_fabric, aci_fabric_other):
+            ACIPod.objects.create(
+                name="ACIPodTestAPITopology", aci_fabric=aci_fabric, pod_id=1
+            )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acifabric-topology",
+            kwargs={"pk": cls.aci_fabric.pk},
+        )
+        cls.list_url = reverse(f"plugins-api:{app_name}-api:acifabric-topology-list")
+
+    def test_topology_without_permission(self) -> None:
+        """Test the topology requires view permission on the fabric."""
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_topology(self) -> None:
+        """Test the topology of a fabric omits pods the user may not view."""
+        self.add_permissions("netbox_aci_plugin.view_acifabric")
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], self.aci_fabric.pk)
+        self.assertEqual(response.data["pods"], [])
+        self.assertIn("ETag", response)
+
+    def test_topology_list(self) -> None:
+        """Test the topology of the filtered fabrics."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric", "netbox_aci_plugin.view_acipod"
+        )
+        response = self.client.get(self.list_url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+        response = self.client.get(f"{self.list_url}?fabric_id=115", **self.header)
+        self.assertEqual([f["name"] for f in response.data], [self.aci_fabric.name])
+        self.assertEqual(len(response.data[0]["pods"]), 1)
+
+    def test_topology_not_modified(self) -> None:
+        """Test a request with the current ETag is not modified."""
+        self.add_permissions("netbox_aci_plugin.view_acifabric")
+        etag = self.client.get(self.list_url, **self.header)["ETag"]
+        response = self.client.get(
+            self.list_url, HTTP_IF_NONE_MATCH=etag, **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        self.aci_fabric.save()
+        response = self.client.get(
+            self.list_url, HTTP_IF_NONE_MATCH=etag, **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
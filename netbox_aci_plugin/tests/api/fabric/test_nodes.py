@@ -11,9 +11,10 @@ from ....api.urls import app_name
 from ....models.fabric.fabrics import ACIFabric
 from ....models.fabric.nodes import ACINode
 from ....models.fabric.pods import ACIPod
+from ..base import ACIAPIViewTestMixin
 
 
-class ACINodeAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACINodeAPIViewTestCase(ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase):
     """API view test case for ACI Node."""
 
     model = ACINode
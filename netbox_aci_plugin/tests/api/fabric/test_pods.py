@@ -2,16 +2,28 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from ipam.models import Prefix
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+
+from core.models import ObjectType
+from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site
+from ipam.choices import IPAddressStatusChoices
+from ipam.models import IPAddress, Prefix
 from tenancy.models import Tenant
-from utilities.testing import APIViewTestCases
+from users.models import ObjectPermission
+from utilities.testing import APITestCase, APIViewTestCases
 
 from ....api.urls import app_name
+from ....jobs import ACINodeOnboardingJob
 from ....models.fabric.fabrics import ACIFabric
+from ....models.fabric.nodes import ACINode
 from ....models.fabric.pods import ACIPod
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIPodAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIPodAPIViewTestCase(ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase):
     """API view test case for ACI Pod."""
 
     model = ACIPod
@@ -118,3 +130,203 @@ class ACIPodAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         cls.bulk_update_data = {
             "description": "New description",
         }
+
+
+class ACIPodAvailableNodesAPITestCase(APITestCase):
+    """API test case for the ACI Pod available nodes action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI Pod with a small TEP pool."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestFabricAPIAllocation", fabric_id=113, infra_vlan_vid=3900
+        )
+        cls.aci_pod = ACIPod.objects.create(
+            name="ACITestPodAPIAllocation",
+            aci_fabric=aci_fabric,
+            pod_id=1,
+            tep_pool=Prefix.objects.create(prefix="10.8.0.0/29"),
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acipod-available-nodes",
+            kwargs={"pk": cls.aci_pod.pk},
+        )
+
+    def test_list_available_nodes_without_permission(self) -> None:
+        """Test listing the available nodes requires view permission."""
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_list_available_nodes(self) -> None:
+        """Test listing the available nodes does not reserve addresses."""
+        self.add_permissions("netbox_aci_plugin.view_acipod")
+        response = self.client.get(f"{self.url}?count=2", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [
+                {"node_id": 101, "tep_address": "10.8.0.1/29", "tep_ip_address": None},
+                {"node_id": 102, "tep_address": "10.8.0.2/29", "tep_ip_address": None},
+            ],
+        )
+        self.assertFalse(IPAddress.objects.exists())
+
+    def test_list_available_nodes_invalid_count(self) -> None:
+        """Test an invalid count is rejected."""
+        self.add_permissions("netbox_aci_plugin.view_acipod")
+        response = self.client.get(f"{self.url}?count=0", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_available_nodes_exhausted(self) -> None:
+        """Test requesting more TEP addresses than available is a conflict."""
+        self.add_permissions("netbox_aci_plugin.view_acipod")
+        response = self.client.get(f"{self.url}?count=7", **self.header)
+        self.assertHttpStatus(response, status.HTTP_409_CONFLICT)
+
+    def test_reserve_available_nodes_without_permission(self) -> None:
+        """Test reserving the available nodes requires to add IP addresses."""
+        self.add_permissions("netbox_aci_plugin.view_acipod")
+        response = self.client.post(self.url, {"count": 1}, **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_reserve_available_nodes(self) -> None:
+        """Test reserving the available nodes creates reserved addresses."""
+        self.add_permissions("netbox_aci_plugin.view_acipod", "ipam.add_ipaddress")
+        response = self.client.post(
+            self.url, {"count": 1}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        tep_ip_address = IPAddress.objects.get(pk=response.data[0]["tep_ip_address"])
+        self.assertEqual(str(tep_ip_address.address), "10.8.0.1/29")
+        self.assertEqual(tep_ip_address.status, IPAddressStatusChoices.STATUS_RESERVED)
+
+    def test_reserve_available_nodes_constrained_permission(self) -> None:
+        """Test the reserved addresses must match the add constraints."""
+        self.add_permissions("netbox_aci_plugin.view_acipod")
+        obj_perm = ObjectPermission(
+            name="ACI allocation API test add",
+            actions=["add"],
+            constraints={"status": IPAddressStatusChoices.STATUS_ACTIVE},
+        )
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(IPAddress))
+        response = self.client.post(
+            self.url, {"count": 1}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(IPAddress.objects.exists())
+
+
+class ACIPodOnboardNodesAPITestCase(APITestCase):
+    """API test case for the ACI Pod node onboarding action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI Pod scoped to a site with a device."""
+        site = Site.objects.create(name="ACITestSiteAPIOnboarding", slug="onboarding")
+        manufacturer = Manufacturer.objects.create(name="Cisco", slug="cisco")
+        cls.device_type = DeviceType.objects.create(
+            manufacturer=manufacturer, model="N9K-C93180YC-FX", slug="n9k"
+        )
+        cls.device_role = DeviceRole.objects.create(name="Leaf", slug="leaf")
+        cls.device = Device.objects.create(
+            name="ACITestDeviceAPIOnboarding",
+            device_type=cls.device_type,
+            role=cls.device_role,
+            site=site,
+        )
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestFabricAPIOnboarding", fabric_id=114, infra_vlan_vid=3900
+        )
+        cls.aci_pod = ACIPod.objects.create(
+            name="ACITestPodAPIOnboarding",
+            aci_fabric=aci_fabric,
+            pod_id=1,
+            tep_pool=Prefix.objects.create(prefix="10.7.0.0/16"),
+            scope=site,
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acipod-onboard-nodes",
+            kwargs={"pk": cls.aci_pod.pk},
+        )
+        cls.data = {
+            "nodes": [
+                {"device": cls.device.pk},
+                {
+                    "name": "ACITestLeafAPIOnboarding",
+                    "device_type": cls.device_type.pk,
+                    "device_role": cls.device_role.pk,
+                },
+            ]
+        }
+
+    def test_onboard_nodes_without_permission(self) -> None:
+        """Test onboarding requires to add nodes, IP addresses and devices."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acipod",
+            "netbox_aci_plugin.add_acinode",
+            "ipam.add_ipaddress",
+        )
+        response = self.client.post(self.url, self.data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_onboard_nodes(self) -> None:
+        """Test onboarding creates the nodes, devices and TEP IP addresses."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acipod",
+            "netbox_aci_plugin.add_acinode",
+            "ipam.add_ipaddress",
+            "dcim.add_device",
+            "dcim.view_device",
+            "dcim.view_devicetype",
+            "dcim.view_devicerole",
+        )
+        response = self.client.post(self.url, self.data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [node["node_id"] for node in response.data["nodes"]], [101, 102]
+        )
+        self.assertEqual(response.data["counts"]["dcim.Device"], 1)
+        self.assertEqual(ACINode.objects.filter(aci_pod=self.aci_pod).count(), 2)
+
+    def test_onboard_nodes_invalid(self) -> None:
+        """Test onboarding devices not viewable by the user is rejected."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acipod",
+            "netbox_aci_plugin.add_acinode",
+            "ipam.add_ipaddress",
+        )
+        response = self.client.post(
+            self.url,
+            {"nodes": [{"device": self.device.pk}]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data["nodes"]), 1)
+        self.assertFalse(ACINode.objects.exists())
+
+    def test_onboard_nodes_background(self) -> None:
+        """Test onboarding in the background enqueues a job."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acipod",
+            "netbox_aci_plugin.add_acinode",
+            "ipam.add_ipaddress",
+            "dcim.view_device",
+        )
+        enqueue = ACINodeOnboardingJob.enqueue
+        with patch.object(
+            ACINodeOnboardingJob,
+            "enqueue",
+            side_effect=lambda **kwargs: enqueue(immediate=True, **kwargs),
+        ):
+            response = self.client.post(
+                self.url,
+                {"nodes": [{"device": self.device.pk}], "background": True},
+                format="json",
+                **self.header,
+            )
+        self.assertHttpStatus(response, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["object_id"], self.aci_pod.pk)
+        self.assertEqual(response.data["data"]["nodes"][0]["node_id"], 101)
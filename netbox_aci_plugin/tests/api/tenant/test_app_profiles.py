@@ -2,16 +2,22 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from django.urls import reverse
+from rest_framework import status
+
 from tenancy.models import Tenant
-from utilities.testing import APIViewTestCases
+from utilities.testing import APITestCase, APIViewTestCases
 
 from ....api.urls import app_name
 from ....models.fabric.fabrics import ACIFabric
 from ....models.tenant.app_profiles import ACIAppProfile
 from ....models.tenant.tenants import ACITenant
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIAppProfileAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIAppProfileAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI AppProfile."""
 
     model = ACIAppProfile
@@ -98,3 +104,56 @@ class ACIAppProfileAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         cls.bulk_update_data = {
             "description": "New description",
         }
+
+
+class ACIAppProfileCloneAPITestCase(APITestCase):
+    """API test case for the ACI Application Profile clone action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Application Profile to clone."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestFabricAPIClone", fabric_id=113, infra_vlan_vid=3900
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACITestTenantAPIClone", aci_fabric=aci_fabric
+        )
+        cls.aci_app_profile = ACIAppProfile.objects.create(
+            name="ACITestAppProfileAPIClone", aci_tenant=cls.aci_tenant
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:aciappprofile-clone",
+            kwargs={"pk": cls.aci_app_profile.pk},
+        )
+
+    def test_clone_unknown_tenant(self) -> None:
+        """Test the target tenant must be viewable."""
+        self.add_permissions("netbox_aci_plugin.view_aciappprofile")
+        response = self.client.post(
+            self.url, {"aci_tenant": self.aci_tenant.pk}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("aci_tenant", response.data)
+
+    def test_clone(self) -> None:
+        """Test the clone returns the copy of the application profile."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acitenant",
+            "netbox_aci_plugin.view_aciappprofile",
+            "netbox_aci_plugin.add_aciappprofile",
+        )
+        response = self.client.post(
+            self.url,
+            {"name": "ACITestAppProfileAPIClone2", "aci_tenant": self.aci_tenant.pk},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(
+            response.data["object_type"], "netbox_aci_plugin.aciappprofile"
+        )
+        self.assertTrue(
+            ACIAppProfile.objects.filter(
+                name="ACITestAppProfileAPIClone2", aci_tenant=self.aci_tenant
+            ).exists()
+        )
@@ -17,9 +17,12 @@ from ....models.tenant.bridge_domains import (
 from ....models.tenant.l3outs import ACIL3Out
 from ....models.tenant.tenants import ACITenant
 from ....models.tenant.vrfs import ACIVRF
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIBridgeDomainAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIBridgeDomainAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Bridge Domain."""
 
     model = ACIBridgeDomain
@@ -207,7 +210,9 @@ class ACIBridgeDomainAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIBridgeDomainSubnetAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIBridgeDomainSubnetAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Bridge Domain Subnet."""
 
     model = ACIBridgeDomainSubnet
@@ -374,7 +379,9 @@ class ACIBridgeDomainSubnetAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIBridgeDomainL3OutBindingAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIBridgeDomainL3OutBindingAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Bridge Domain L3Out Binding."""
 
     model = ACIBridgeDomainL3OutBinding
@@ -12,9 +12,12 @@ from ....models.tenant.contract_filters import (
     ACIContractFilterEntry,
 )
 from ....models.tenant.tenants import ACITenant
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIContractFilterAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIContractFilterAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Contract Filter."""
 
     model = ACIContractFilter
@@ -103,7 +106,9 @@ class ACIContractFilterAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIContractFilterEntryAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIContractFilterEntryAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Contract Filter."""
 
     model = ACIContractFilterEntry
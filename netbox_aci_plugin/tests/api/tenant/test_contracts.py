@@ -25,9 +25,10 @@ from ....models.tenant.endpoint_security_groups import ACIEndpointSecurityGroup
 from ....models.tenant.l3outs import ACIExternalEndpointGroup, ACIL3Out
 from ....models.tenant.tenants import ACITenant
 from ....models.tenant.vrfs import ACIVRF
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIContractAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIContractAPIViewTestCase(ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase):
     """API view test case for ACI Contract."""
 
     model = ACIContract
@@ -132,7 +133,9 @@ class ACIContractAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIContractRelationAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIContractRelationAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Contract Relation."""
 
     model = ACIContractRelation
@@ -455,7 +458,9 @@ class ACIContractRelationAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIContractSubjectAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIContractSubjectAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Contract Subject."""
 
     model = ACIContractSubject
@@ -585,7 +590,9 @@ class ACIContractSubjectAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIContractSubjectFilterAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIContractSubjectFilterAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Contract Subject Filter."""
 
     model = ACIContractSubjectFilter
@@ -18,9 +18,12 @@ from ....models.tenant.endpoint_groups import (
 )
 from ....models.tenant.tenants import ACITenant
 from ....models.tenant.vrfs import ACIVRF
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIEndpointGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIEndpointGroupAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Endpoint Group."""
 
     model = ACIEndpointGroup
@@ -182,7 +185,9 @@ class ACIEndpointGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIUSegEndpointGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIUSegEndpointGroupAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI uSeg Endpoint Group."""
 
     model = ACIUSegEndpointGroup
@@ -344,7 +349,9 @@ class ACIUSegEndpointGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIUSegNetworkAttributeAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIUSegNetworkAttributeAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI uSeg Network Attribute."""
 
     model = ACIUSegNetworkAttribute
@@ -21,9 +21,12 @@ from ....models.tenant.endpoint_security_groups import (
 )
 from ....models.tenant.tenants import ACITenant
 from ....models.tenant.vrfs import ACIVRF
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIEndpointSecurityGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIEndpointSecurityGroupAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI Endpoint Security Group."""
 
     model = ACIEndpointSecurityGroup
@@ -156,7 +159,9 @@ class ACIEndpointSecurityGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIEsgEndpointGroupSelectorAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIEsgEndpointGroupSelectorAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI ESG Endpoint Group Selector."""
 
     model = ACIEsgEndpointGroupSelector
@@ -341,7 +346,9 @@ class ACIEsgEndpointGroupSelectorAPIViewTestCase(APIViewTestCases.APIViewTestCas
         }
 
 
-class ACIEsgEndpointSelectorAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIEsgEndpointSelectorAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI ESG Endpoint Selector."""
 
     model = ACIEsgEndpointSelector
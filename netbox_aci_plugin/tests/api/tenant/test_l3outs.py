@@ -24,9 +24,10 @@ from ....models.tenant.l3outs import (
 )
 from ....models.tenant.tenants import ACITenant
 from ....models.tenant.vrfs import ACIVRF
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIL3OutAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIL3OutAPIViewTestCase(ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase):
     """API view test case for ACI L3Out."""
 
     model = ACIL3Out
@@ -210,7 +211,9 @@ class ACIL3OutAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         )
 
 
-class ACIExternalEndpointGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIExternalEndpointGroupAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI External Endpoint Group."""
 
     model = ACIExternalEndpointGroup
@@ -334,7 +337,9 @@ class ACIExternalEndpointGroupAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         }
 
 
-class ACIExternalSubnetAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIExternalSubnetAPIViewTestCase(
+    ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase
+):
     """API view test case for ACI External Subnet."""
 
     model = ACIExternalSubnet
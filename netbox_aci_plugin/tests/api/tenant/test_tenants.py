@@ -2,15 +2,26 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
+from unittest.mock import patch
+
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from rest_framework import status
+
 from tenancy.models import Tenant
-from utilities.testing import APIViewTestCases
+from utilities.testing import APITestCase, APIViewTestCases
 
 from ....api.urls import app_name
+from ....jobs import ACIExportJob, ACITeardownJob
 from ....models.fabric.fabrics import ACIFabric
+from ....models.tenant.bridge_domains import ACIBridgeDomain
 from ....models.tenant.tenants import ACITenant
+from ....models.tenant.vrfs import ACIVRF
+from ..base import ACIAPIViewTestMixin
 
 
-class ACITenantAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACITenantAPIViewTestCase(ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase):
     """API view test case for ACI Tenant."""
 
     model = ACITenant
@@ -89,3 +100,254 @@ class ACITenantAPIViewTestCase(APIViewTestCases.APIViewTestCase):
         cls.bulk_update_data = {
             "description": "New description",
         }
+
+
+class ACITenantExportAPITestCase(APITestCase):
+    """API test case for the ACI Tenant export action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Tenant for the export."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestFabricAPIExport", fabric_id=111, infra_vlan_vid=3900
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACITestTenantAPIExport", aci_fabric=aci_fabric
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acitenant-export",
+            kwargs={"pk": cls.aci_tenant.pk},
+        )
+
+    def test_export_without_permission(self) -> None:
+        """Test exporting requires view permission on the tenant."""
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_export_apic_json(self) -> None:
+        """Test exporting streams the APIC JSON document."""
+        self.add_permissions("netbox_aci_plugin.view_acitenant")
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json")
+        document = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            document["polUni"]["children"][0]["fvTenant"]["attributes"]["name"],
+            self.aci_tenant.name,
+        )
+
+    def test_export_nac_yaml(self) -> None:
+        """Test exporting streams the NaC YAML document."""
+        self.add_permissions("netbox_aci_plugin.view_acitenant")
+        response = self.client.get(f"{self.url}?output=nac-yaml", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIn(
+            f'filename="{self.aci_tenant.name}.yaml"',
+            response["Content-Disposition"],
+        )
+        document = b"".join(response.streaming_content).decode()
+        self.assertIn(f'- name: "{self.aci_tenant.name}"', document)
+
+    def test_export_invalid_format(self) -> None:
+        """Test exporting rejects an unsupported output format."""
+        self.add_permissions("netbox_aci_plugin.view_acitenant")
+        response = self.client.get(f"{self.url}?output=xml", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_job(self) -> None:
+        """Test enqueuing the export returns the created job."""
+        self.add_permissions("netbox_aci_plugin.view_acitenant")
+        enqueue = ACIExportJob.enqueue
+        with patch.object(
+            ACIExportJob,
+            "enqueue",
+            side_effect=lambda **kwargs: enqueue(immediate=True, **kwargs),
+        ):
+            response = self.client.post(f"{self.url}?output=nac-yaml", **self.header)
+        self.assertHttpStatus(response, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["object_id"], self.aci_tenant.pk)
+        self.assertEqual(response.data["data"]["format"], "nac-yaml")
+        name = response.data["data"]["file"]
+        self.addCleanup(default_storage.delete, name)
+        with default_storage.open(name) as fileobj:
+            self.assertIn(self.aci_tenant.name, fileobj.read().decode())
+
+
+class ACITenantTeardownAPITestCase(APITestCase):
+    """API test case for the ACI Tenant teardown action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Tenant with a VRF for the teardown."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestFabricAPITeardown", fabric_id=112, infra_vlan_vid=3900
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACITestTenantAPITeardown", aci_fabric=aci_fabric
+        )
+        cls.aci_vrf = ACIVRF.objects.create(
+            name="ACITestVRFAPITeardown", aci_tenant=cls.aci_tenant
+        )
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acitenant-teardown",
+            kwargs={"pk": cls.aci_tenant.pk},
+        )
+
+    def test_teardown_without_permission(self) -> None:
+        """Test the deletion plan requires view permission on the tenant."""
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_teardown_plan(self) -> None:
+        """Test the deletion plan lists the VRF before the tenant."""
+        self.add_permissions("netbox_aci_plugin.view_acitenant")
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(
+            list(response.data["counts"]),
+            ["netbox_aci_plugin.ACIVRF", "netbox_aci_plugin.ACITenant"],
+        )
+        self.assertEqual(response.data["steps"][0]["objects"], [self.aci_vrf.pk])
+
+    def test_teardown_without_delete_permission(self) -> None:
+        """Test the deletion requires delete permission on every object."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acitenant", "netbox_aci_plugin.delete_acitenant"
+        )
+        response = self.client.post(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_teardown_job(self) -> None:
+        """Test enqueuing the deletion returns the created job."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acitenant",
+            "netbox_aci_plugin.delete_acitenant",
+            "netbox_aci_plugin.delete_acivrf",
+        )
+        enqueue = ACITeardownJob.enqueue
+        with patch.object(
+            ACITeardownJob,
+            "enqueue",
+            side_effect=lambda **kwargs: enqueue(immediate=True, **kwargs),
+        ):
+            response = self.client.post(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_202_ACCEPTED)
+        self.assertEqual(
+            response.data["data"]["counts"]["netbox_aci_plugin.ACITenant"], 1
+        )
+        self.assertFalse(ACITenant.objects.filter(pk=self.aci_tenant.pk).exists())
+
+    def test_teardown_foreign_dependents(self) -> None:
+        """Test the dependents of other tenants are deleted if included."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acitenant",
+            "netbox_aci_plugin.delete_acitenant",
+            "netbox_aci_plugin.delete_acivrf",
+            "netbox_aci_plugin.delete_acibridgedomain",
+        )
+        aci_bd = ACIBridgeDomain.objects.create(
+            name="ACITestBDAPITeardown",
+            aci_tenant=ACITenant.objects.create(
+                name="ACITestTenantAPITeardownOther",
+                aci_fabric=self.aci_tenant.aci_fabric,
+            ),
+            aci_vrf=self.aci_vrf,
+        )
+
+        response = self.client.post(self.url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["foreign_dependents"][0]["objects"], [aci_bd.pk])
+
+        enqueue = ACITeardownJob.enqueue
+        with patch.object(
+            ACITeardownJob,
+            "enqueue",
+            side_effect=lambda **kwargs: enqueue(immediate=True, **kwargs),
+        ):
+            response = self.client.post(
+                f"{self.url}?include_foreign_dependents=true", **self.header
+            )
+        self.assertHttpStatus(response, status.HTTP_202_ACCEPTED)
+        self.assertFalse(ACIBridgeDomain.objects.filter(pk=aci_bd.pk).exists())
+
+
+class ACITenantCloneAPITestCase(APITestCase):
+    """API test case for the ACI Tenant clone action."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Tenant with a VRF to clone."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACITestFabricAPIClone", fabric_id=113, infra_vlan_vid=3900
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACITestTenantAPIClone", aci_fabric=cls.aci_fabric
+        )
+        ACIVRF.objects.create(name="ACITestVRFAPIClone", aci_tenant=cls.aci_tenant)
+        cls.url = reverse(
+            f"plugins-api:{app_name}-api:acitenant-clone",
+            kwargs={"pk": cls.aci_tenant.pk},
+        )
+
+    def test_clone_without_permission(self) -> None:
+        """Test the clone requires view permission on the tenant."""
+        response = self.client.post(self.url, {}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_clone_without_add_permission(self) -> None:
+        """Test the clone requires add permission on the cloned models."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acitenant", "netbox_aci_plugin.view_acivrf"
+        )
+        response = self.client.post(
+            self.url, {"name": "ACITestTenantAPIClone2"}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_clone_invalid(self) -> None:
+        """Test invalid clone requests are rejected."""
+        self.add_permissions("netbox_aci_plugin.view_acitenant")
+        for data, field in (
+            ({"rename": [{"pattern": "("}]}, "rename"),
+            ({"aci_fabric": 0}, "aci_fabric"),
+            ({}, "detail"),
+        ):
+            with self.subTest(data=data):
+                response = self.client.post(
+                    self.url, data, format="json", **self.header
+                )
+                self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(field, response.data)
+
+    def test_clone(self) -> None:
+        """Test the clone returns the copy of the tenant."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric",
+            "netbox_aci_plugin.view_acitenant",
+            "netbox_aci_plugin.add_acitenant",
+            "netbox_aci_plugin.view_acivrf",
+            "netbox_aci_plugin.add_acivrf",
+        )
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestFabricAPIClone2", fabric_id=114, infra_vlan_vid=3900
+        )
+        response = self.client.post(
+            self.url,
+            {
+                "aci_fabric": aci_fabric.pk,
+                "rename": [{"pattern": "APIClone$", "replacement": "APICopy"}],
+            },
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["name"], "ACITestTenantAPICopy")
+        self.assertEqual(
+            response.data["counts"],
+            {"netbox_aci_plugin.ACITenant": 1, "netbox_aci_plugin.ACIVRF": 1},
+        )
+        self.assertTrue(
+            ACIVRF.objects.filter(
+                name="ACITestVRFAPICopy", aci_tenant__aci_fabric=aci_fabric
+            ).exists()
+        )
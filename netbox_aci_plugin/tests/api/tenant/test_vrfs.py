@@ -10,9 +10,10 @@ from ....api.urls import app_name
 from ....models.fabric.fabrics import ACIFabric
 from ....models.tenant.tenants import ACITenant
 from ....models.tenant.vrfs import ACIVRF
+from ..base import ACIAPIViewTestMixin
 
 
-class ACIVRFAPIViewTestCase(APIViewTestCases.APIViewTestCase):
+class ACIVRFAPIViewTestCase(ACIAPIViewTestMixin, APIViewTestCases.APIViewTestCase):
     """API view test case for ACI VRF."""
 
     model = ACIVRF
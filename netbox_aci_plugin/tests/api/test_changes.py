@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+
+from django.urls import reverse
+from django.utils import timezone
+
+from utilities.testing import APITestCase
+
+from ...models.fabric.fabrics import ACIFabric
+from ...models.tenant.tenants import ACITenant
+
+
+class ACIChangeFeedAPITestCase(APITestCase):
+    """API test case for the change feed of the ACI objects."""
+
+    def setUp(self) -> None:
+        """Set up the URL of the change feed."""
+        super().setUp()
+        self.url = reverse("plugins-api:netbox_aci_plugin-api:changes")
+
+    def get_feed(self, **params) -> dict:
+        """Return the decoded change feed of the query parameters."""
+        response = self.client.get(self.url, params, **self.header)
+        self.assertHttpStatus(response, 200)
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_changes(self) -> None:
+        """Test the feed returns the changed objects and a cursor."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric", "netbox_aci_plugin.view_acitenant"
+        )
+        since = timezone.now().isoformat()
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestChangesFabric", fabric_id=110, infra_vlan_vid=3910
+        )
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestChangesTenant", aci_fabric=aci_fabric
+        )
+
+        feed = self.get_feed(since=since)
+        self.assertEqual(
+            [
+                (change["action"], change["object_type"], change["object_id"])
+                for change in feed["changes"]
+            ],
+            [
+                ("create", "netbox_aci_plugin.acifabric", aci_fabric.pk),
+                ("create", "netbox_aci_plugin.acitenant", aci_tenant.pk),
+            ],
+        )
+        self.assertEqual(feed["changes"][1]["object"]["name"], "ACITestChangesTenant")
+
+        feed = self.get_feed(cursor=feed["cursor"])
+        self.assertEqual(len(feed["changes"]), 2)
+
+    def test_changes_invalid(self) -> None:
+        """Test the feed requires a valid timestamp or cursor."""
+        for params, field in (
+            ({}, "since"),
+            ({"since": "invalid"}, "since"),
+            ({"cursor": "invalid"}, "cursor"),
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params, **self.header)
+                self.assertHttpStatus(response, 400)
+                self.assertIn(field, response.data)
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django.urls import reverse
+
+from utilities.testing import APITestCase
+
+from ...models.fabric.fabrics import ACIFabric
+from ...models.tenant.app_profiles import ACIAppProfile
+from ...models.tenant.bridge_domains import ACIBridgeDomain
+from ...models.tenant.endpoint_groups import ACIEndpointGroup
+from ...models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+)
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+
+
+class ACIEsgMembershipAPITestCase(APITestCase):
+    """API test case for the memberships of ACI Endpoint Security Groups."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ESGs selecting an Endpoint Group."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestMembershipFabric", fabric_id=119, infra_vlan_vid=3919
+        )
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestMembershipTenant", aci_fabric=aci_fabric
+        )
+        aci_app_profile = ACIAppProfile.objects.create(
+            name="ACITestMembershipAppProfile", aci_tenant=aci_tenant
+        )
+        cls.aci_vrf = ACIVRF.objects.create(
+            name="ACITestMembershipVRF", aci_tenant=aci_tenant
+        )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestMembershipEPG",
+            aci_app_profile=aci_app_profile,
+            aci_bridge_domain=ACIBridgeDomain.objects.create(
+                name="ACITestMembershipBD",
+                aci_tenant=aci_tenant,
+                aci_vrf=cls.aci_vrf,
+            ),
+        )
+        for index in range(2):
+            ACIEsgEndpointGroupSelector.objects.create(
+                name="ACITestMembershipSelector",
+                aci_endpoint_security_group=ACIEndpointSecurityGroup.objects.create(
+                    name=f"ACITestMembershipESG{index}",
+                    aci_app_profile=aci_app_profile,
+                    aci_vrf=cls.aci_vrf,
+                ),
+                aci_epg_object=cls.aci_epg,
+            )
+
+    def setUp(self) -> None:
+        """Set up the URL of the membership endpoint."""
+        super().setUp()
+        self.url = reverse("plugins-api:netbox_aci_plugin-api:esg-memberships")
+
+    def test_list_memberships(self) -> None:
+        """Test the ESGs of an Endpoint Group are listed and filtered."""
+        self.add_permissions("netbox_aci_plugin.view_aciendpointsecuritygroup")
+
+        response = self.client.get(
+            f"{self.url}?aci_endpoint_group_id={self.aci_epg.pk}", **self.header
+        )
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], 2)
+        membership = response.data["results"][0]
+        self.assertEqual(
+            membership["member_type"], "netbox_aci_plugin.aciendpointgroup"
+        )
+        self.assertEqual(membership["member"]["id"], self.aci_epg.pk)
+        self.assertEqual(membership["aci_vrf"]["id"], self.aci_vrf.pk)
+        self.assertEqual(
+            membership["aci_endpoint_security_group"]["name"], "ACITestMembershipESG0"
+        )
+
+        response = self.client.get(f"{self.url}?ip_address_id=0", **self.header)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_list_memberships_restricted(self) -> None:
+        """Test the memberships of ESGs the user may not view are hidden."""
+        response = self.client.get(self.url, **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], 0)
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from unittest.mock import patch
+
+from django.urls import reverse
+
+from ipam.models import IPAddress
+from utilities.testing import APITestCase
+
+from ...choices import ContractRelationRoleChoices, ContractScopeChoices
+from ...jobs import ACIRouteLeakRefreshJob
+from ...models.fabric.fabrics import ACIFabric
+from ...models.tenant.app_profiles import ACIAppProfile
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ...models.tenant.contracts import ACIContract, ACIContractRelation
+from ...models.tenant.endpoint_groups import ACIEndpointGroup
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF, ACIRouteLeak
+from ...services.route_leaks import invalidate_route_leaks, refresh_route_leaks
+
+
+class ACIRouteLeakAPITestCase(APITestCase):
+    """API test case for the route leaks of the shared services."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up two EPGs in different VRFs sharing a global contract."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACITestLeakFabric", fabric_id=131, infra_vlan_vid=3931
+        )
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestLeakTenant", aci_fabric=cls.aci_fabric
+        )
+        aci_app_profile = ACIAppProfile.objects.create(
+            name="ACITestLeakAppProfile", aci_tenant=aci_tenant
+        )
+        aci_contract = ACIContract.objects.create(
+            name="ACITestLeakContract",
+            aci_tenant=aci_tenant,
+            scope=ContractScopeChoices.SCOPE_GLOBAL,
+        )
+        for index, role in enumerate(
+            (
+                ContractRelationRoleChoices.ROLE_PROVIDER,
+                ContractRelationRoleChoices.ROLE_CONSUMER,
+            )
+        ):
+            aci_bd = ACIBridgeDomain.objects.create(
+                name=f"ACITestLeakBD{index}",
+                aci_tenant=aci_tenant,
+                aci_vrf=ACIVRF.objects.create(
+                    name=f"ACITestLeakVRF{index}", aci_tenant=aci_tenant
+                ),
+            )
+            ACIBridgeDomainSubnet.objects.create(
+                name=f"ACITestLeakSubnet{index}",
+                aci_bridge_domain=aci_bd,
+                gateway_ip_address=IPAddress.objects.create(
+                    address=f"10.6{index}.0.1/24"
+                ),
+                shared_enabled=True,
+            )
+            ACIContractRelation.objects.create(
+                aci_contract=aci_contract,
+                aci_object=ACIEndpointGroup.objects.create(
+                    name=f"ACITestLeakEPG{index}",
+                    aci_app_profile=aci_app_profile,
+                    aci_bridge_domain=aci_bd,
+                ),
+                role=role,
+            )
+
+    def setUp(self) -> None:
+        """Set up the URL of the route leak endpoint."""
+        super().setUp()
+        self.url = reverse("plugins-api:netbox_aci_plugin-api:route-leaks")
+
+    def invalidate(self) -> None:
+        """Outdate the route leaks of the fabric without enqueuing a job."""
+        with (
+            patch.object(ACIRouteLeakRefreshJob, "enqueue"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            invalidate_route_leaks([self.aci_fabric.pk])
+
+    def test_list_route_leaks(self) -> None:
+        """Test the computed route leaks of a fabric are listed."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric", "netbox_aci_plugin.view_acivrf"
+        )
+        refresh_route_leaks(self.aci_fabric.pk)
+
+        response = self.client.get(
+            f"{self.url}?aci_fabric_id={self.aci_fabric.pk}", **self.header
+        )
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["stale_aci_fabrics"], [])
+        route_leak = response.data["results"][0]
+        self.assertEqual(route_leak["aci_vrf"]["name"], "ACITestLeakVRF0")
+        self.assertEqual(route_leak["source_aci_vrf"]["name"], "ACITestLeakVRF1")
+        self.assertEqual(
+            route_leak["source_type"], "netbox_aci_plugin.aciendpointgroup"
+        )
+        self.assertEqual(
+            route_leak["source"]["id"],
+            ACIEndpointGroup.objects.get(name="ACITestLeakEPG1").pk,
+        )
+        self.assertEqual(route_leak["prefix"], "10.61.0.0/24")
+        self.assertFalse(route_leak["aggregate"])
+
+        response = self.client.get(f"{self.url}?contains=10.60.0.1", **self.header)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_list_reports_stale_fabrics(self) -> None:
+        """Test listing outdated route leaks reports without recomputing."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric", "netbox_aci_plugin.view_acivrf"
+        )
+        self.invalidate()
+
+        response = self.client.get(
+            f"{self.url}?aci_fabric_id={self.aci_fabric.pk}", **self.header
+        )
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], 0)
+        self.assertEqual(response.data["stale_aci_fabrics"], [self.aci_fabric.pk])
+        self.assertFalse(ACIRouteLeak.objects.exists())
+
+    def test_refresh_route_leaks(self) -> None:
+        """Test a POST request enqueues the refresh of the outdated fabrics."""
+        self.add_permissions(
+            "netbox_aci_plugin.view_acifabric", "netbox_aci_plugin.view_acivrf"
+        )
+        self.invalidate()
+        enqueue = ACIRouteLeakRefreshJob.enqueue
+        with patch.object(
+            ACIRouteLeakRefreshJob,
+            "enqueue",
+            side_effect=lambda **kwargs: enqueue(immediate=True, **kwargs),
+        ):
+            response = self.client.post(self.url, **self.header)
+
+        self.assertHttpStatus(response, 202)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["object_id"], self.aci_fabric.pk)
+        self.assertEqual(response.data[0]["data"], {"route_leak_count": 2})
+        response = self.client.get(self.url, **self.header)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["stale_aci_fabrics"], [])
+
+    def test_list_route_leaks_restricted(self) -> None:
+        """Test the route leaks into VRFs the user may not view are hidden."""
+        self.add_permissions("netbox_aci_plugin.view_acifabric")
+        refresh_route_leaks(self.aci_fabric.pk)
+
+        response = self.client.get(self.url, **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], 0)
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django.urls import reverse
+
+from ipam.models import IPAddress
+from utilities.testing import APITestCase
+
+from ...models.fabric.fabrics import ACIFabric
+from ...models.tenant.app_profiles import ACIAppProfile
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ...models.tenant.endpoint_groups import (
+    ACIUSegEndpointGroup,
+    ACIUSegNetworkAttribute,
+)
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+
+
+class ACIUSegResolvedNetworkAPITestCase(APITestCase):
+    """API test case for the resolved networks of ACI uSeg Endpoint Groups."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up uSeg EPGs using the subnets of their Bridge Domain."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestResolvedFabric", fabric_id=130, infra_vlan_vid=3930
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACITestResolvedTenant", aci_fabric=aci_fabric
+        )
+        aci_app_profile = ACIAppProfile.objects.create(
+            name="ACITestResolvedAppProfile", aci_tenant=cls.aci_tenant
+        )
+        aci_bd = ACIBridgeDomain.objects.create(
+            name="ACITestResolvedBD",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=ACIVRF.objects.create(
+                name="ACITestResolvedVRF", aci_tenant=cls.aci_tenant
+            ),
+        )
+        cls.aci_bd_subnet = ACIBridgeDomainSubnet.objects.create(
+            name="ACITestResolvedSubnet",
+            aci_bridge_domain=aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.30.0.1/24"),
+        )
+        for index in range(2):
+            ACIUSegNetworkAttribute.objects.create(
+                name="ACITestResolvedAttribute",
+                aci_useg_endpoint_group=ACIUSegEndpointGroup.objects.create(
+                    name=f"ACITestResolvedUSegEPG{index}",
+                    aci_app_profile=aci_app_profile,
+                    aci_bridge_domain=aci_bd,
+                ),
+                use_epg_subnet=True,
+            )
+
+    def setUp(self) -> None:
+        """Set up the URL of the resolved network endpoint."""
+        super().setUp()
+        self.url = reverse("plugins-api:netbox_aci_plugin-api:useg-networks")
+
+    def test_list_networks(self) -> None:
+        """Test the networks of the uSeg EPGs of a tenant are listed."""
+        self.add_permissions("netbox_aci_plugin.view_aciusegendpointgroup")
+
+        response = self.client.get(
+            f"{self.url}?aci_tenant_id={self.aci_tenant.pk}", **self.header
+        )
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], 2)
+        network = response.data["results"][0]
+        self.assertEqual(network["prefix"], "10.30.0.0/24")
+        self.assertIsNone(network["mac_address"])
+        self.assertEqual(
+            network["aci_bridge_domain_subnet"]["id"], self.aci_bd_subnet.pk
+        )
+        self.assertEqual(
+            network["aci_useg_endpoint_group"]["name"], "ACITestResolvedUSegEPG0"
+        )
+
+        response = self.client.get(f"{self.url}?contains=10.31.0.1", **self.header)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_list_networks_restricted(self) -> None:
+        """Test the networks of uSeg EPGs the user may not view are hidden."""
+        response = self.client.get(self.url, **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], 0)
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django.urls import reverse
+
+from utilities.testing import APITestCase
+
+from ...models.fabric.fabrics import ACIFabric
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+
+
+class ACIValidationAPITestCase(APITestCase):
+    """API test case for the batch validation of candidate ACI objects."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up the ACI Tenant referenced by the candidates."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestValidationFabric", fabric_id=118, infra_vlan_vid=3918
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACITestValidationTenant", aci_fabric=aci_fabric
+        )
+
+    def setUp(self) -> None:
+        """Set up the URL of the validation endpoint."""
+        super().setUp()
+        self.url = reverse("plugins-api:netbox_aci_plugin-api:validate")
+
+    def test_validate(self) -> None:
+        """Test the candidate objects are validated without writing."""
+        self.add_permissions("netbox_aci_plugin.view_acitenant")
+        data = {
+            "objects": [
+                {
+                    "object_type": "netbox_aci_plugin.acivrf",
+                    "data": {"name": "VRF1", "aci_tenant": self.aci_tenant.pk},
+                },
+                {
+                    "object_type": "netbox_aci_plugin.acivrf",
+                    "data": {"name": "VRF1", "aci_tenant": self.aci_tenant.pk},
+                },
+                {"object_type": "netbox_aci_plugin.acitenant", "id": 0, "data": {}},
+            ]
+        }
+
+        response = self.client.post(self.url, data, format="json", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertFalse(response.data["valid"])
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            [error["index"] for error in response.data["errors"]], [0, 1, 2]
+        )
+        self.assertFalse(ACIVRF.objects.exists())
+
+        data["objects"] = data["objects"][:1]
+        response = self.client.post(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.data["valid"])
+
+    def test_validate_invalid(self) -> None:
+        """Test the validation requires a list of candidate objects."""
+        response = self.client.post(
+            self.url, {"objects": []}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, 400)
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""N+1 query detection shared by the view, API, and GraphQL test bases."""
+
+import itertools
+import re
+from collections import Counter
+from collections.abc import Callable
+
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.db import IntegrityError, connection, transaction
+from django.db.models import CharField, IntegerField, Max, Model, UniqueConstraint
+from django.test.utils import CaptureQueriesContext
+
+from ..services.validation import evaluate_condition
+
+__all__ = ("QUERY_SCALING_SIZES", "QueryScalingMixin", "get_sql_fingerprint")
+
+# Page sizes compared by the N+1 detection
+QUERY_SCALING_SIZES: tuple[int, int] = (5, 50)
+
+# Suffix index of the values of the cloned objects
+_clone_index = itertools.count()
+
+_SQL_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_SQL_IN_LIST_RE = re.compile(r"\bIN \((?:\?|%s)(?:, (?:\?|%s))*\)")
+
+
+def get_sql_fingerprint(sql: str) -> str:
+    """Return the SQL statement with its literals and IN lists collapsed."""
+    sql = _SQL_LITERAL_RE.sub("?", sql)
+    return _SQL_IN_LIST_RE.sub("IN (...)", sql)
+
+
+class QueryScalingMixin:
+    """Detect query counts growing with the number of listed objects.
+
+    A list is requested with a small and a large page size after a warm-up
+    request; differing query counts fail the test and report the SQL
+    fingerprints executed more often for the larger page.
+    """
+
+    query_scaling_sizes: tuple[int, int] = QUERY_SCALING_SIZES
+
+    def create_query_scaling_objects(self, model: type[Model], count: int) -> None:
+        """Clone an existing object until the model has the given count.
+
+        Fails the test if the model has no object to clone or the clones
+        cannot be inserted.
+        """
+        available = model.objects.count()
+        if available >= count:
+            return
+        source = model.objects.order_by("pk").first()
+        if source is None:
+            self.fail(f"No {model._meta.verbose_name} object to clone.")
+        try:
+            with transaction.atomic():
+                self._clone_query_scaling_object(source, count - available)
+        except IntegrityError as exc:
+            self.fail(
+                f"Cloning {count - available} {model._meta.verbose_name_plural} "
+                f"failed: {exc}"
+            )
+
+    def _clone_query_scaling_object(self, source: Model, count: int) -> list[Model]:
+        """Insert clones of an object distinct by its unique fields.
+
+        The clones get distinct text and integer values of the unique
+        fields, and, for unique fields referencing other objects, clones of
+        the referenced objects.
+        """
+        model = type(source)
+        opts = model._meta
+        fields = [field for field in opts.concrete_fields if not field.primary_key]
+        clones = [
+            model(**{field.attname: getattr(source, field.attname) for field in fields})
+            for _ in range(count)
+        ]
+        varied: set[str] = set()
+        for field_names in self._get_unique_field_names(source):
+            if varied.intersection(field_names):
+                continue
+            varied.add(self._vary_unique_field(source, clones, field_names))
+        model.objects.bulk_create(clones)
+        return clones
+
+    @staticmethod
+    def _get_unique_field_names(source: Model) -> list[tuple[str, ...]]:
+        """Return the field names of the unique constraints of the object.
+
+        The name comes first, and constraints not applying to the object
+        (by their condition or a null value) are left out.
+        """
+        opts = source._meta
+        field_names = [("name",)] if "name" in {f.name for f in opts.fields} else []
+        field_names += [
+            (field.name,)
+            for field in opts.concrete_fields
+            if field.unique and not field.primary_key
+        ]
+        field_names += [
+            constraint.fields
+            for constraint in opts.constraints
+            if isinstance(constraint, UniqueConstraint)
+            and constraint.fields
+            and (
+                constraint.condition is None
+                or evaluate_condition(constraint.condition, source)
+            )
+        ]
+        field_names += [tuple(fields) for fields in opts.unique_together]
+        return [
+            names
+            for names in field_names
+            if all(
+                getattr(source, opts.get_field(name).attname) is not None
+                for name in names
+            )
+        ]
+
+    def _vary_unique_field(
+        self, source: Model, clones: list[Model], field_names: tuple[str, ...]
+    ) -> str:
+        """Set distinct values of one of the unique fields on the clones.
+
+        Returns the name of the varied field.
+        """
+        opts = source._meta
+        for generic_field in opts.private_fields:
+            if (
+                isinstance(generic_field, GenericForeignKey)
+                and generic_field.ct_field in field_names
+                and generic_field.fk_field in field_names
+            ):
+                related = getattr(source, generic_field.name)
+                targets = self._clone_query_scaling_object(related, len(clones))
+                for clone, target in zip(clones, targets, strict=True):
+                    setattr(clone, generic_field.fk_field, target.pk)
+                return generic_field.fk_field
+
+        # Free text and integer values are varied before the references
+        model_fields = [opts.get_field(name) for name in field_names]
+        for model_field in model_fields:
+            if isinstance(model_field, CharField) and not model_field.choices:
+                value = getattr(source, model_field.attname)
+                for clone in clones:
+                    suffix = f"-QS{next(_clone_index)}"
+                    value_length = model_field.max_length - len(suffix)
+                    setattr(clone, model_field.attname, value[:value_length] + suffix)
+                return model_field.name
+        for model_field in model_fields:
+            if isinstance(model_field, IntegerField) and not model_field.choices:
+                maximum = opts.model.objects.aggregate(maximum=Max(model_field.name))[
+                    "maximum"
+                ]
+                for value, clone in enumerate(clones, start=maximum + 1):
+                    setattr(clone, model_field.attname, value)
+                return model_field.name
+        for model_field in model_fields:
+            if model_field.many_to_one:
+                related = getattr(source, model_field.name)
+                targets = self._clone_query_scaling_object(related, len(clones))
+                for clone, target in zip(clones, targets, strict=True):
+                    setattr(clone, model_field.attname, target.pk)
+                return model_field.name
+        raise self.failureException(
+            f"No {opts.verbose_name} field of the unique fields "
+            f"{', '.join(field_names)} can be varied."
+        )
+
+    def assertQueryCountScaling(
+        self, request: Callable[[int], object], model: type[Model]
+    ) -> None:
+        """Assert the query count of a list request is independent of size.
+
+        The request callable receives the page size. The objects of the
+        larger size are cloned from the existing objects.
+        """
+        small, large = self.query_scaling_sizes
+        self.create_query_scaling_objects(model, large)
+
+        request(small)
+        queries = {}
+        for size in (small, large):
+            with CaptureQueriesContext(connection) as context:
+                request(size)
+            queries[size] = Counter(
+                get_sql_fingerprint(query["sql"]) for query in context.captured_queries
+            )
+
+        small_count = sum(queries[small].values())
+        large_count = sum(queries[large].values())
+        if small_count != large_count:
+            repeated = "\n".join(
+                f"  +{count}x {fingerprint}"
+                for fingerprint, count in (queries[large] - queries[small]).items()
+            )
+            self.fail(
+                f"Query count grows with the number of objects: {small_count} "
+                f"queries for {small} object(s), {large_count} queries for "
+                f"{large} object(s). Repeated SQL fingerprints:\n{repeated}"
+            )
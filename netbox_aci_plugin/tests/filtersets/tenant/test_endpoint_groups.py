@@ -6,17 +6,19 @@
 
 from dcim.models import MACAddress
 from ipam.models import IPAddress, Prefix
-from utilities.testing import ChangeLoggedFilterSetTests
+from utilities.testing import BaseFilterSetTests, ChangeLoggedFilterSetTests
 
 from ....filtersets.tenant.endpoint_groups import (
     ACIEndpointGroupFilterSet,
     ACIUSegEndpointGroupFilterSet,
     ACIUSegNetworkAttributeFilterSet,
+    ACIUSegResolvedNetworkFilterSet,
 )
 from ....models.tenant.endpoint_groups import (
     ACIEndpointGroup,
     ACIUSegEndpointGroup,
     ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
 )
 from ....models.tenant.endpoint_security_groups import ACIEndpointSecurityGroup
 from ...models.base import ACIBaseTestCase
@@ -227,3 +229,48 @@ class ACIUSegNetworkAttributeFilterSetTestCase(
         """Test an unparseable prefix yields no results."""
         params = {"prefix": ["not-a-prefix"]}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 0)
+
+
+class ACIUSegResolvedNetworkFilterSetTestCase(ACIBaseTestCase, BaseFilterSetTests):
+    """Test case for ACIUSegResolvedNetworkFilterSet."""
+
+    queryset = ACIUSegResolvedNetwork.objects.all()
+    filterset = ACIUSegResolvedNetworkFilterSet
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data for ACIUSegResolvedNetworkFilterSet tests."""
+        super().setUpTestData()
+        cls.aci_useg_epg = ACIUSegEndpointGroup.objects.create(
+            name="ACIFSResolvedUSegEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        for index, attr_object in enumerate(
+            (cls.ip_address1, cls.prefix2, cls.mac_address1), start=1
+        ):
+            ACIUSegNetworkAttribute.objects.create(
+                name=f"ACIFSTestResolvedAttr{index}",
+                aci_useg_endpoint_group=cls.aci_useg_epg,
+                attr_object=attr_object,
+            )
+
+    def test_prefix(self) -> None:
+        """Test filtering by the resolved prefix."""
+        params = {"prefix": ["192.168.1.1/32", "192.168.2.0/24", "invalid"]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+    def test_contains(self) -> None:
+        """Test filtering by the prefixes containing an IP address."""
+        params = {"contains": ["192.168.2.10"]}
+        self.assertEqual(
+            str(self.filterset(params, self.queryset).qs.get().prefix),
+            "192.168.2.0/24",
+        )
+        params = {"contains": ["invalid"]}
+        self.assertFalse(self.filterset(params, self.queryset).qs.exists())
+
+    def test_mac_address(self) -> None:
+        """Test filtering by the resolved MAC address."""
+        params = {"mac_address": ["00:00:00:00:00:01"]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
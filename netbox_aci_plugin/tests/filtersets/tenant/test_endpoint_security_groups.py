@@ -5,18 +5,20 @@
 """Filterset tests for tenant Endpoint Security Group models."""
 
 from ipam.models import IPAddress, Prefix
-from utilities.testing import ChangeLoggedFilterSetTests
+from utilities.testing import BaseFilterSetTests, ChangeLoggedFilterSetTests
 
 from ....filtersets.tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroupFilterSet,
     ACIEsgEndpointGroupSelectorFilterSet,
     ACIEsgEndpointSelectorFilterSet,
+    ACIEsgMembershipFilterSet,
 )
 from ....models.tenant.endpoint_groups import ACIEndpointGroup
 from ....models.tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroup,
     ACIEsgEndpointGroupSelector,
     ACIEsgEndpointSelector,
+    ACIEsgMembership,
 )
 from ...models.base import ACIBaseTestCase
 
@@ -202,3 +204,56 @@ class ACIEsgEndpointSelectorFilterSetTestCase(
         """Test an unparseable prefix yields no results."""
         params = {"prefix": ["not-a-prefix"]}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 0)
+
+
+class ACIEsgMembershipFilterSetTestCase(ACIBaseTestCase, BaseFilterSetTests):
+    """Test case for ACIEsgMembershipFilterSet."""
+
+    queryset = ACIEsgMembership.objects.all()
+    filterset = ACIEsgMembershipFilterSet
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data for ACIEsgMembershipFilterSet tests."""
+        super().setUpTestData()
+        cls.aci_esg = ACIEndpointSecurityGroup.objects.create(
+            name="ACIFSMembershipESG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_vrf=cls.aci_vrf,
+        )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACIFSMembershipEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        ACIEsgEndpointGroupSelector.objects.create(
+            name="ACIFSTestMembershipSel1",
+            aci_endpoint_security_group=cls.aci_esg,
+            aci_epg_object=cls.aci_epg,
+        )
+        for index, ep_object in enumerate((cls.ip_address1, cls.prefix1), start=2):
+            ACIEsgEndpointSelector.objects.create(
+                name=f"ACIFSTestMembershipSel{index}",
+                aci_endpoint_security_group=cls.aci_esg,
+                ep_object=ep_object,
+            )
+
+    def test_member_type(self) -> None:
+        """Test filtering by the object type of the members."""
+        params = {"member_type": ["ipam.ipaddress", "ipam.prefix"]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+    def test_member(self) -> None:
+        """Test filtering by the members of each type."""
+        for name, member in (
+            ("aci_endpoint_group_id", self.aci_epg),
+            ("ip_address_id", self.ip_address1),
+            ("prefix_id", self.prefix1),
+        ):
+            with self.subTest(name=name):
+                params = {name: [member.pk]}
+                self.assertEqual(
+                    self.filterset(params, self.queryset).qs.get().member, member
+                )
+        params = {"aci_useg_endpoint_group_id": [self.aci_epg.pk]}
+        self.assertFalse(self.filterset(params, self.queryset).qs.exists())
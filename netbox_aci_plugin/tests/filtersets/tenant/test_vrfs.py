@@ -2,12 +2,13 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-"""Filterset tests for the ACI VRF model."""
+"""Filterset tests for the ACI VRF and ACI Route Leak models."""
 
-from utilities.testing import ChangeLoggedFilterSetTests
+from utilities.testing import BaseFilterSetTests, ChangeLoggedFilterSetTests
 
-from ....filtersets.tenant.vrfs import ACIVRFFilterSet
-from ....models.tenant.vrfs import ACIVRF
+from ....filtersets.tenant.vrfs import ACIRouteLeakFilterSet, ACIVRFFilterSet
+from ....models.tenant.endpoint_groups import ACIEndpointGroup
+from ....models.tenant.vrfs import ACIVRF, ACIRouteLeak
 from ...models.base import ACIBaseTestCase
 
 
@@ -57,3 +58,76 @@ class ACIVRFFilterSetTestCase(ACIBaseTestCase, ChangeLoggedFilterSetTests):
             self.queryset, "name", None
         )
         self.assertEqual(result.count(), 0)
+
+    def test_content_hash(self) -> None:
+        """Test the content_hash filter matches the object with the hash."""
+        params = {"content_hash": [self.aci_vrf_2.content_hash]}
+        qs = self.filterset(params, self.queryset).qs
+        self.assertIn(self.aci_vrf_2, qs)
+        self.assertNotIn(self.aci_vrf_3, qs)
+
+
+class ACIRouteLeakFilterSetTestCase(ACIBaseTestCase, BaseFilterSetTests):
+    """Test case for ACIRouteLeakFilterSet."""
+
+    queryset = ACIRouteLeak.objects.all()
+    filterset = ACIRouteLeakFilterSet
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data for ACIRouteLeakFilterSet tests."""
+        super().setUpTestData()
+        cls.aci_vrf_other = ACIVRF.objects.create(
+            name="ACIFSTestLeakVRF", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACIFSTestLeakEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        for prefix, aggregate in (
+            ("192.168.1.0/24", False),
+            ("192.168.2.0/24", False),
+            ("10.0.0.0/8", True),
+        ):
+            ACIRouteLeak.objects.create(
+                aci_fabric=cls.aci_fabric,
+                aci_vrf=cls.aci_vrf_other,
+                source_aci_vrf=cls.aci_vrf,
+                source=cls.aci_epg,
+                prefix=prefix,
+                aggregate=aggregate,
+            )
+
+    def test_prefix(self) -> None:
+        """Test filtering by the leaked prefix."""
+        params = {"prefix": ["192.168.1.0/24", "10.0.0.0/8", "invalid"]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+    def test_contains(self) -> None:
+        """Test filtering by the prefixes containing an IP address."""
+        params = {"contains": ["10.1.2.3"]}
+        self.assertEqual(
+            str(self.filterset(params, self.queryset).qs.get().prefix), "10.0.0.0/8"
+        )
+        params = {"contains": ["invalid"]}
+        self.assertFalse(self.filterset(params, self.queryset).qs.exists())
+
+    def test_aggregate(self) -> None:
+        """Test filtering by the aggregate flag."""
+        params = {"aggregate": True}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
+
+    def test_source(self) -> None:
+        """Test filtering by the source of the route leaks."""
+        params = {"aci_endpoint_group_id": [self.aci_epg.pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 3)
+        params = {"aci_external_endpoint_group_id": [self.aci_epg.pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 0)
+
+    def test_aci_vrf(self) -> None:
+        """Test filtering by the VRF the prefixes leak into."""
+        params = {"aci_vrf_id": [self.aci_vrf_other.pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 3)
+        params = {"source_aci_vrf_id": [self.aci_vrf_other.pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 0)
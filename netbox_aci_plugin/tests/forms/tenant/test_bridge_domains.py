@@ -5,6 +5,7 @@
 from django import forms
 
 from ....forms.tenant.bridge_domains import (
+    ACIBridgeDomainBulkEditForm,
     ACIBridgeDomainEditForm,
     ACIBridgeDomainFilterForm,
     ACIBridgeDomainImportForm,
@@ -13,6 +14,7 @@ from ....forms.tenant.bridge_domains import (
     ACIBridgeDomainSubnetEditForm,
 )
 from ....models.access_policies.domains import ACIRoutedDomain
+from ....models.tenant.bridge_domains import ACIBridgeDomainL3OutBinding
 from ....models.tenant.l3outs import ACIL3Out
 from ....models.tenant.vrfs import ACIVRF
 from ..base import ACIBaseFormTestCase
@@ -185,3 +187,63 @@ class ACIBridgeDomainL3OutBindingFormTestCase(ACIBaseFormTestCase):
         self.assertTrue(form.is_valid())
         self.assertEqual(form.errors.get("aci_bridge_domain"), None)
         self.assertEqual(form.errors.get("aci_l3out"), None)
+
+
+class ACIBridgeDomainVRFMoveFormTestCase(ACIBaseFormTestCase):
+    """Test case for the VRF move validation of ACIBridgeDomain forms."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a Bridge Domain bound to an L3Out of its VRF."""
+        super().setUpTestData()
+        cls.aci_routed_domain = ACIRoutedDomain.objects.create(
+            name="ACIBaseFormTestRoutedDomain",
+            aci_fabric=cls.aci_fabric,
+        )
+        cls.aci_l3out = ACIL3Out.objects.create(
+            name="ACIBaseFormTestL3Out",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf,
+            aci_routed_domain=cls.aci_routed_domain,
+        )
+        ACIBridgeDomainL3OutBinding.objects.create(
+            aci_bridge_domain=cls.aci_bd, aci_l3out=cls.aci_l3out
+        )
+        cls.aci_vrf2 = ACIVRF.objects.create(
+            name="ACIBaseFormTestVRF2",
+            aci_tenant=cls.aci_tenant,
+        )
+
+    def test_edit_form_rejects_conflicting_vrf_move(self) -> None:
+        """Test the BD edit form reports the conflicts of a VRF move."""
+        form = ACIBridgeDomainEditForm(
+            instance=self.aci_bd,
+            data={
+                "name": self.aci_bd.name,
+                "aci_tenant": self.aci_tenant,
+                "aci_vrf": self.aci_vrf2,
+            },
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("ACIBaseFormTestL3Out", form.errors["aci_vrf"][0])
+
+    def test_edit_form_accepts_unchanged_vrf(self) -> None:
+        """Test the BD edit form accepts keeping the VRF."""
+        form = ACIBridgeDomainEditForm(
+            instance=self.aci_bd,
+            data={
+                "name": self.aci_bd.name,
+                "aci_tenant": self.aci_tenant,
+                "aci_vrf": self.aci_vrf,
+            },
+        )
+        form.is_valid()
+        self.assertIsNone(form.errors.get("aci_vrf"))
+
+    def test_bulk_edit_form_rejects_conflicting_vrf_move(self) -> None:
+        """Test the BD bulk edit form reports the conflicts of a VRF move."""
+        form = ACIBridgeDomainBulkEditForm(
+            data={"pk": [self.aci_bd.pk], "aci_vrf": self.aci_vrf2.pk}
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("ACIBaseFormTestL3Out", form.errors["aci_vrf"][0])
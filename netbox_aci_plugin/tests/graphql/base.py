@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from django.db.models import Model
 from django.test import override_settings
 from django.urls import reverse
 
@@ -10,12 +11,13 @@ from utilities.testing import APITestCase
 from ...models.fabric.fabrics import ACIFabric
 from ...models.tenant.tenants import ACITenant
 from ...models.tenant.vrfs import ACIVRF
+from ..base import QueryScalingMixin
 
 __all__ = ("ACIBaseGraphQLTestCase",)
 
 
 @override_settings(LOGIN_REQUIRED=True)
-class ACIBaseGraphQLTestCase(APITestCase):
+class ACIBaseGraphQLTestCase(QueryScalingMixin, APITestCase):
     """Base test case driving the plugin GraphQL endpoint over HTTP."""
 
     @classmethod
@@ -47,3 +49,18 @@ class ACIBaseGraphQLTestCase(APITestCase):
         )
         self.assertEqual(response.status_code, 200, response.content)
         return response.json()
+
+    def assertListQueryScaling(
+        self, field: str, model: type[Model], selection: str
+    ) -> None:
+        """Assert a list query's query count is independent of its length."""
+        self.add_permissions(f"{model._meta.app_label}.view_{model._meta.model_name}")
+
+        def request(size: int) -> None:
+            result = self.query(
+                f"query {{ {field}(pagination: {{limit: {size}}}) {{ {selection} }} }}"
+            )
+            self.assertNotIn("errors", result, result)
+            self.assertEqual(len(result["data"][field]), size)
+
+        self.assertQueryCountScaling(request, model)
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from ...models.tenant.app_profiles import ACIAppProfile
+from ...models.tenant.bridge_domains import ACIBridgeDomain
+from ...models.tenant.endpoint_groups import ACIEndpointGroup
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from .base import ACIBaseGraphQLTestCase
+
+
+class ACIQueryScalingGraphQLTestCase(ACIBaseGraphQLTestCase):
+    """Test plugin GraphQL list queries for N+1 queries."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up the ACI objects cloned for the list queries."""
+        super().setUpTestData()
+        cls.aci_bd1 = ACIBridgeDomain.objects.create(
+            name="ACIGraphQLTestBD1",
+            aci_tenant=cls.aci_tenant1,
+            aci_vrf=cls.aci_vrf1,
+        )
+        cls.aci_app_profile1 = ACIAppProfile.objects.create(
+            name="ACIGraphQLTestAppProfile1", aci_tenant=cls.aci_tenant1
+        )
+        cls.aci_epg1 = ACIEndpointGroup.objects.create(
+            name="ACIGraphQLTestEPG1",
+            aci_app_profile=cls.aci_app_profile1,
+            aci_bridge_domain=cls.aci_bd1,
+        )
+
+    def test_tenant_list_query_scaling(self) -> None:
+        """The aci_tenant_list query count is independent of its length."""
+        self.assertListQueryScaling(
+            "aci_tenant_list", ACITenant, "id name aci_fabric { id name }"
+        )
+
+    def test_vrf_list_query_scaling(self) -> None:
+        """The aci_vrf_list query count is independent of its length."""
+        self.assertListQueryScaling(
+            "aci_vrf_list",
+            ACIVRF,
+            "id name aci_tenant { id name aci_fabric { id name } }",
+        )
+
+    def test_bridge_domain_list_query_scaling(self) -> None:
+        """The aci_bridge_domain_list query count is independent of length."""
+        self.assertListQueryScaling(
+            "aci_bridge_domain_list",
+            ACIBridgeDomain,
+            "id name aci_tenant { id name } aci_vrf { id name }",
+        )
+
+    def test_endpoint_group_list_query_scaling(self) -> None:
+        """The aci_endpoint_group_list query count is independent of length."""
+        self.assertListQueryScaling(
+            "aci_endpoint_group_list",
+            ACIEndpointGroup,
+            "id name aci_app_profile { id name } aci_bridge_domain { id name }",
+        )
@@ -719,6 +719,74 @@ class ACIBridgeDomainSubnetTestCase(ACIBaseTestCase):
         with self.assertRaises(IntegrityError), transaction.atomic():
             second_preferred_ip_subnet.save()
 
+    def test_valid_aci_bd_subnet_overlap_within_same_bridge_domain(self) -> None:
+        """Test overlapping subnets within the same ACI BD are permitted."""
+        subnet = ACIBridgeDomainSubnet(
+            name="ACIBDSubnetTest1",
+            aci_bridge_domain=self.aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.0.0.129/25"),
+        )
+        subnet.full_clean()
+
+    def test_valid_aci_bd_subnet_overlap_in_other_aci_vrf(self) -> None:
+        """Test overlapping subnets of BDs in other ACI VRFs are permitted."""
+        aci_vrf = ACIVRF.objects.create(name="ACITestVRF2", aci_tenant=self.aci_tenant)
+        aci_bd = ACIBridgeDomain.objects.create(
+            name="ACITestBD2", aci_tenant=self.aci_tenant, aci_vrf=aci_vrf
+        )
+        subnet = ACIBridgeDomainSubnet(
+            name="ACIBDSubnetTest1",
+            aci_bridge_domain=aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.0.0.1/16"),
+        )
+        subnet.full_clean()
+
+    def test_invalid_aci_bd_subnet_overlap_in_same_aci_vrf(self) -> None:
+        """Test overlapping subnets of other BDs in the same VRF fail."""
+        aci_bd = ACIBridgeDomain.objects.create(
+            name="ACITestBD2", aci_tenant=self.aci_tenant, aci_vrf=self.aci_vrf
+        )
+        subnet = ACIBridgeDomainSubnet(
+            name="ACIBDSubnetTest1",
+            aci_bridge_domain=aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.0.0.65/26"),
+        )
+        with self.assertRaises(ValidationError) as cm:
+            subnet.full_clean()
+        self.assertIn("gateway_ip_address", cm.exception.message_dict)
+
+    def test_invalid_aci_bd_subnet_overlap_in_aci_vrf_from_tenant_common(
+        self,
+    ) -> None:
+        """Test overlapping subnets of BDs using a 'common' VRF fail."""
+        aci_tenant_common = ACITenant.objects.get_or_create(
+            name="common", aci_fabric=self.aci_fabric
+        )[0]
+        aci_tenant_other = ACITenant.objects.create(
+            name="ACITestTenant2", aci_fabric=self.aci_fabric
+        )
+        aci_vrf_common = ACIVRF.objects.create(
+            name="ACITestVRFCommon", aci_tenant=aci_tenant_common
+        )
+        aci_bd1 = ACIBridgeDomain.objects.create(
+            name="ACITestBD1", aci_tenant=self.aci_tenant, aci_vrf=aci_vrf_common
+        )
+        aci_bd2 = ACIBridgeDomain.objects.create(
+            name="ACITestBD2", aci_tenant=aci_tenant_other, aci_vrf=aci_vrf_common
+        )
+        ACIBridgeDomainSubnet.objects.create(
+            name="ACIBDSubnetTest1",
+            aci_bridge_domain=aci_bd1,
+            gateway_ip_address=IPAddress.objects.create(address="172.16.0.1/16"),
+        )
+        subnet = ACIBridgeDomainSubnet(
+            name="ACIBDSubnetTest2",
+            aci_bridge_domain=aci_bd2,
+            gateway_ip_address=IPAddress.objects.create(address="172.16.10.1/24"),
+        )
+        with self.assertRaises(ValidationError):
+            subnet.full_clean()
+
 
 class ACIBridgeDomainL3OutBindingTestCase(ACIBaseTestCase):
     """Test case for ACIBridgeDomainL3OutBinding model."""
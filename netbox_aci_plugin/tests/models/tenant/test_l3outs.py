@@ -745,6 +745,49 @@ class ACIL3OutTestCase(ACIBaseTestCase):
         with self.assertRaises(ValidationError):
             l3out.save()
 
+    def test_invalid_aci_l3out_flags_invalidating_external_subnets(self) -> None:
+        """Test that changed flags must not invalidate the External Subnets."""
+        l3out = ACIL3Out.objects.create(
+            name="L3OutSubnetFlags",
+            aci_tenant=self.aci_tenant,
+            aci_vrf=self.aci_vrf,
+            aci_routed_domain=self.aci_routed_domain,
+            bgp_enabled=True,
+        )
+        aci_ext_epg = ACIExternalEndpointGroup.objects.create(
+            name="ExtEPGSubnetFlags", aci_l3out=l3out
+        )
+        ACIExternalSubnet.objects.bulk_create(
+            ACIExternalSubnet(
+                name=f"SubnetFlags{index}",
+                aci_external_endpoint_group=aci_ext_epg,
+                matched_prefix=f"10.{index}.0.0/16",
+                bgp_route_summarization_enabled=index < 6,
+                export_route_control_enabled=True,
+                import_security_enabled=True,
+            )
+            for index in range(8)
+        )
+        l3out.full_clean()
+
+        l3out.bgp_enabled = False
+        l3out.ospf_enabled = True
+        with self.assertRaises(ValidationError) as context:
+            l3out.full_clean()
+
+        self.assertEqual(
+            context.exception.message_dict["__all__"],
+            [
+                (
+                    "The change invalidates 6 ACI External Subnet(s) (10.0.0.0/16 "
+                    "(ExtEPGSubnetFlags), 10.1.0.0/16 (ExtEPGSubnetFlags), "
+                    "10.2.0.0/16 (ExtEPGSubnetFlags), 10.3.0.0/16 (ExtEPGSubnetFlags), "
+                    "10.4.0.0/16 (ExtEPGSubnetFlags), ...): BGP route summarization "
+                    "can only be enabled when BGP is enabled on the parent ACI L3Out."
+                )
+            ],
+        )
+
 
 class ACIExternalEndpointGroupTestCase(ACIBaseTestCase):
     """Test case for ACIExternalEndpointGroup model."""
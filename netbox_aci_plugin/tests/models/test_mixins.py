@@ -6,7 +6,14 @@
 
 from django.test import TestCase
 
-from ...models.mixins import UniqueGenericForeignKeyMixin
+from ...models.mixins import (
+    UniqueGenericForeignKeyMixin,
+    get_content_hash,
+    update_content_hashes,
+)
+from ...models.tenant.contracts import ACIContract, ACIContractRelation
+from ...models.tenant.vrfs import ACIVRF
+from .base import ACIBaseTestCase
 
 
 class UniqueGenericForeignKeyMixinTestCase(TestCase):
@@ -20,3 +27,59 @@ class UniqueGenericForeignKeyMixinTestCase(TestCase):
 
         with self.assertRaises(NotImplementedError):
             _Stub()._validate_generic_uniqueness()  # noqa: SLF001
+
+
+class ContentHashMixinTestCase(ACIBaseTestCase):
+    """Tests for the content hash of the ACI models."""
+
+    def test_content_hash_computed_on_save(self) -> None:
+        """Test the content hash is stored and follows the field values."""
+        aci_vrf = ACIVRF.objects.create(
+            name="ACITestVRFHash", aci_tenant=self.aci_tenant
+        )
+        content_hash = aci_vrf.content_hash
+        self.assertEqual(len(content_hash), 64)
+        self.assertEqual(content_hash, get_content_hash(aci_vrf))
+
+        aci_vrf.description = "Changed"
+        aci_vrf.save(update_fields=["description"])
+        aci_vrf.refresh_from_db()
+        self.assertNotEqual(aci_vrf.content_hash, content_hash)
+
+    def test_content_hash_ignores_bookkeeping_fields(self) -> None:
+        """Test comments and timestamps do not change the content hash."""
+        aci_vrf = ACIVRF.objects.create(
+            name="ACITestVRFHash", aci_tenant=self.aci_tenant
+        )
+        content_hash = aci_vrf.content_hash
+        aci_vrf.comments = "Changed"
+        aci_vrf.save()
+        self.assertEqual(aci_vrf.content_hash, content_hash)
+
+    def test_content_hash_of_relation_model(self) -> None:
+        """Test the relation models maintain a content hash."""
+        aci_contract = ACIContract.objects.create(
+            name="ACITestContractHash", aci_tenant=self.aci_tenant
+        )
+        aci_contract_relation = ACIContractRelation.objects.create(
+            aci_contract=aci_contract, aci_object=self.aci_vrf, role="cons"
+        )
+        content_hash = aci_contract_relation.content_hash
+        self.assertEqual(content_hash, get_content_hash(aci_contract_relation))
+
+        aci_contract_relation.role = "prov"
+        aci_contract_relation.save()
+        self.assertNotEqual(aci_contract_relation.content_hash, content_hash)
+
+    def test_update_content_hashes(self) -> None:
+        """Test the content hashes are recomputed after bulk writes."""
+        aci_vrf = ACIVRF.objects.create(
+            name="ACITestVRFHash", aci_tenant=self.aci_tenant
+        )
+        ACIVRF.objects.filter(pk=aci_vrf.pk).update(description="Changed")
+        queryset = ACIVRF.objects.filter(pk=aci_vrf.pk)
+
+        self.assertEqual(update_content_hashes(queryset), 1)
+        self.assertEqual(update_content_hashes(queryset), 0)
+        aci_vrf.refresh_from_db()
+        self.assertEqual(aci_vrf.content_hash, get_content_hash(aci_vrf))
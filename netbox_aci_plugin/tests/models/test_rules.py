@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the declarative validation rule tables of the ACI models."""
+
+from django.db.models import Q
+from netaddr import IPNetwork
+
+from ...models.access_policies.domains import ACIRoutedDomain
+from ...models.rules import Rule, RuleTable
+from ...models.tenant.l3outs import (
+    EXTERNAL_SUBNET_L3OUT_PATH,
+    EXTERNAL_SUBNET_RULES,
+    L3OUT_RULES,
+    ACIExternalEndpointGroup,
+    ACIExternalSubnet,
+    ACIL3Out,
+)
+from .base import ACIBaseTestCase
+
+
+class RuleTableTestCase(ACIBaseTestCase):
+    """Test case for the evaluation of validation rule tables."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI L3Out with ACI External Subnets."""
+        super().setUpTestData()
+        cls.aci_l3out = ACIL3Out.objects.create(
+            name="ACITestRulesL3Out",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf,
+            aci_routed_domain=ACIRoutedDomain.objects.create(
+                name="ACITestRulesRoutedDomain", aci_fabric=cls.aci_fabric
+            ),
+            bgp_enabled=True,
+            import_route_control_enforcement_enabled=True,
+        )
+        aci_ext_epg = ACIExternalEndpointGroup.objects.create(
+            name="ACITestRulesExtEPG", aci_l3out=cls.aci_l3out
+        )
+        cls.aci_subnet_bgp = ACIExternalSubnet.objects.create(
+            name="ACITestRulesSubnetBGP",
+            aci_external_endpoint_group=aci_ext_epg,
+            matched_prefix="10.1.0.0/24",
+            bgp_route_summarization_enabled=True,
+            export_route_control_enabled=True,
+            import_security_enabled=True,
+        )
+        cls.aci_subnet_import = ACIExternalSubnet.objects.create(
+            name="ACITestRulesSubnetImport",
+            aci_external_endpoint_group=aci_ext_epg,
+            matched_prefix="10.2.0.0/24",
+            import_route_control_enabled=True,
+        )
+        ACIExternalSubnet.objects.create(
+            name="ACITestRulesSubnet",
+            aci_external_endpoint_group=aci_ext_epg,
+            matched_prefix="10.3.0.0/24",
+        )
+
+    def test_check_instance(self) -> None:
+        """Test the rules are evaluated on an instance and its parents."""
+        aci_l3out = ACIL3Out(name="ACITestRulesL3Out", multipod_enabled=True)
+        # The rule does not apply without an ACI Tenant
+        self.assertEqual(L3OUT_RULES.check(aci_l3out), {})
+
+        aci_l3out.aci_tenant = self.aci_tenant
+        aci_l3out.eigrp_enabled = aci_l3out.bgp_enabled = True
+        self.assertEqual(
+            sorted(L3OUT_RULES.check(aci_l3out)), ["eigrp_enabled", "multipod_enabled"]
+        )
+
+        aci_subnet = ACIExternalSubnet(
+            aci_external_endpoint_group=self.aci_subnet_bgp.aci_external_endpoint_group,
+            matched_prefix=IPNetwork("0.0.0.0/0"),
+            aggregate_export_route_control_enabled=True,
+            export_route_control_enabled=True,
+        )
+        self.assertEqual(EXTERNAL_SUBNET_RULES.check(aci_subnet), {})
+        aci_subnet.matched_prefix = IPNetwork("10.0.0.0/8")
+        self.assertEqual(
+            list(EXTERNAL_SUBNET_RULES.check(aci_subnet)),
+            ["aggregate_export_route_control_enabled"],
+        )
+
+    def test_check_batch(self) -> None:
+        """Test the rules are evaluated on a batch with one query."""
+        queryset = ACIExternalSubnet.objects.filter(
+            aci_external_endpoint_group__aci_l3out=self.aci_l3out
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(EXTERNAL_SUBNET_RULES.check_batch(queryset), {})
+
+        # The subnets invalidated by changing the flags of the parent L3Out
+        self.aci_l3out.bgp_enabled = False
+        self.aci_l3out.import_route_control_enforcement_enabled = False
+        with self.assertNumQueries(1):
+            invalid = EXTERNAL_SUBNET_RULES.check_batch(
+                queryset, parents={EXTERNAL_SUBNET_L3OUT_PATH: self.aci_l3out}
+            )
+        self.assertEqual(
+            {pk: list(errors) for pk, errors in invalid.items()},
+            {
+                self.aci_subnet_bgp.pk: ["bgp_route_summarization_enabled"],
+                self.aci_subnet_import.pk: ["import_route_control_enabled"],
+            },
+        )
+
+    def test_rule_conditions(self) -> None:
+        """Test the lookups and connectors of the rule conditions."""
+        rule_table = RuleTable(
+            Rule(("name",), Q(name="ACITestRulesL3Out") | Q(name=""), "Name"),
+            Rule(("aci_vrf",), ~Q(aci_vrf__isnull=True), "VRF"),
+            Rule(("aci_tenant",), Q(aci_tenant__name__exact="Other"), "Tenant"),
+        )
+
+        self.assertEqual(
+            rule_table.check(self.aci_l3out), {"name": ["Name"], "aci_vrf": ["VRF"]}
+        )
+        self.assertEqual(
+            rule_table.get_lookups(ACIL3Out),
+            {
+                "name": ("name", "exact"),
+                "aci_vrf__isnull": ("aci_vrf", "isnull"),
+                "aci_tenant__name__exact": ("aci_tenant__name", "exact"),
+            },
+        )
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the Node ID and TEP address allocation of an ACI Pod."""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db.models import F
+from netaddr import IPNetwork
+
+from core.models import ObjectType
+from ipam.choices import IPAddressStatusChoices
+from ipam.models import VRF, IPAddress, Prefix
+from users.models import ObjectPermission
+
+from ...choices import NodeRoleChoices
+from ...models.fabric.nodes import ACINode
+from ...models.fabric.pods import ACIPod
+from ...services import allocation
+from ...services.allocation import (
+    NodeAllocation,
+    allocate_nodes,
+    get_available_node_ids,
+    get_available_nodes,
+    get_available_tep_addresses,
+    iter_free_ranges,
+)
+from ..models.base import ACIBaseTestCase
+
+
+class NodeAllocationTestCase(ACIBaseTestCase):
+    """Test case for the allocation of Node IDs and TEP addresses."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Nodes and used TEP addresses around the test pod."""
+        super().setUpTestData()
+
+        for node_id in (102, 104):
+            ACINode.objects.create(
+                name=f"ACITestAllocationNode{node_id}",
+                aci_pod=cls.aci_pod,
+                node_id=node_id,
+                role=NodeRoleChoices.ROLE_LEAF,
+            )
+        IPAddress.objects.create(address="10.0.0.3/32")
+        # Addresses in another VRF do not use the TEP pool addresses
+        cls.nb_vrf_other = VRF.objects.create(name="ACITestAllocationVRF")
+        IPAddress.objects.create(address="10.0.0.4/19", vrf=cls.nb_vrf_other)
+
+        cls.aci_pod_without_pool = ACIPod.objects.create(
+            name="ACITestAllocationPodNoPool",
+            aci_fabric=cls.aci_fabric,
+            pod_id=2,
+        )
+        cls.aci_pod_small_pool = ACIPod.objects.create(
+            name="ACITestAllocationPodSmallPool",
+            aci_fabric=cls.aci_fabric,
+            pod_id=3,
+            tep_pool=Prefix.objects.create(prefix="10.9.0.0/30"),
+        )
+
+    def test_iter_free_ranges(self) -> None:
+        """Test the free ranges are the gaps between the used values."""
+        queryset = ACINode.objects.filter(aci_pod=self.aci_pod)
+        self.assertEqual(
+            list(iter_free_ranges(queryset, F("node_id"), 1, 4000)),
+            [(1, 100), (103, 103), (105, 4000)],
+        )
+        self.assertEqual(
+            list(iter_free_ranges(queryset, F("node_id"), 102, 104)), [(103, 103)]
+        )
+        self.assertEqual(
+            list(iter_free_ranges(queryset.none(), F("node_id"), 1, 10)), [(1, 10)]
+        )
+
+    def test_get_available_node_ids(self) -> None:
+        """Test the lowest free node IDs of the role are returned."""
+        self.assertEqual(get_available_node_ids(self.aci_pod, 3), [103, 105, 106])
+        self.assertEqual(
+            get_available_node_ids(self.aci_pod, 2, NodeRoleChoices.ROLE_APIC),
+            [1, 2],
+        )
+        self.assertEqual(get_available_node_ids(self.aci_pod_without_pool, 1), [101])
+
+    def test_get_available_tep_addresses(self) -> None:
+        """Test the lowest free TEP pool addresses are returned."""
+        self.assertEqual(
+            get_available_tep_addresses(self.aci_pod, 3),
+            [
+                IPNetwork("10.0.0.2/19"),
+                IPNetwork("10.0.0.4/19"),
+                IPNetwork("10.0.0.5/19"),
+            ],
+        )
+        # The network and broadcast addresses are excluded
+        self.assertEqual(
+            get_available_tep_addresses(self.aci_pod_small_pool, 3),
+            [IPNetwork("10.9.0.1/30"), IPNetwork("10.9.0.2/30")],
+        )
+        self.assertEqual(get_available_tep_addresses(self.aci_pod_without_pool, 1), [])
+
+    def test_allocate_nodes(self) -> None:
+        """Test allocating nodes does not reserve the TEP addresses."""
+        allocations = allocate_nodes(self.aci_pod, 2)
+        self.assertEqual(
+            allocations,
+            [
+                NodeAllocation(node_id=103, tep_address=IPNetwork("10.0.0.2/19")),
+                NodeAllocation(node_id=105, tep_address=IPNetwork("10.0.0.4/19")),
+            ],
+        )
+        self.assertEqual(
+            allocations[0].serialize(),
+            {"node_id": 103, "tep_address": "10.0.0.2/19", "tep_ip_address": None},
+        )
+        self.assertEqual(allocate_nodes(self.aci_pod, 2), allocations)
+
+    def test_allocate_nodes_reserve_tep_addresses(self) -> None:
+        """Test reserved TEP addresses are not allocated again."""
+        allocations = allocate_nodes(self.aci_pod, 2, reserve_tep_addresses=True)
+        tep_ip_address = IPAddress.objects.get(pk=allocations[0].tep_ip_address_id)
+        self.assertEqual(str(tep_ip_address.address), "10.0.0.2/19")
+        self.assertEqual(tep_ip_address.status, IPAddressStatusChoices.STATUS_RESERVED)
+        self.assertEqual(
+            [a.tep_address for a in allocate_nodes(self.aci_pod, 1)],
+            [IPNetwork("10.0.0.5/19")],
+        )
+
+    def test_allocate_nodes_reserve_checks_add_constraints(self) -> None:
+        """Test the reserved TEP addresses must match the add constraints."""
+        user = get_user_model().objects.create_user(username="acitestallocation")
+        obj_perm = ObjectPermission(
+            name="ACI allocation test add",
+            actions=["add"],
+            constraints={"status": IPAddressStatusChoices.STATUS_ACTIVE},
+        )
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(IPAddress))
+        user = get_user_model().objects.get(pk=user.pk)
+        ip_address_count = IPAddress.objects.count()
+
+        with self.assertRaises(PermissionDenied):
+            allocate_nodes(self.aci_pod, 1, reserve_tep_addresses=True, user=user)
+        self.assertEqual(IPAddress.objects.count(), ip_address_count)
+
+    def test_get_available_nodes(self) -> None:
+        """Test the available nodes are read without locking the pod."""
+        with patch.object(allocation, "lock_aci_pod") as lock_aci_pod:
+            self.assertEqual(
+                get_available_nodes(self.aci_pod, 2),
+                [
+                    NodeAllocation(node_id=103, tep_address=IPNetwork("10.0.0.2/19")),
+                    NodeAllocation(node_id=105, tep_address=IPNetwork("10.0.0.4/19")),
+                ],
+            )
+            with self.assertRaises(ValidationError):
+                get_available_nodes(self.aci_pod_small_pool, 3)
+        lock_aci_pod.assert_not_called()
+
+    def test_allocate_nodes_without_tep_pool(self) -> None:
+        """Test allocating nodes in a pod without a TEP pool."""
+        self.assertEqual(
+            allocate_nodes(self.aci_pod_without_pool, 1),
+            [NodeAllocation(node_id=101)],
+        )
+
+    def test_allocate_nodes_exhausted(self) -> None:
+        """Test allocating more nodes than available raises an error."""
+        with self.assertRaises(ValidationError):
+            allocate_nodes(self.aci_pod_small_pool, 3)
+        with (
+            patch.object(allocation, "NODE_ID_MAX", 103),
+            self.assertRaises(ValidationError),
+        ):
+            allocate_nodes(self.aci_pod, 2)
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the APIC and NaC object model mapping."""
+
+from django.test import SimpleTestCase
+from netaddr import EUI, IPNetwork
+
+from ...services.apic import (
+    BRIDGE_DOMAIN_SUBNET_SPEC,
+    CONTRACT_SUBJECT_FILTER_SPEC,
+    ENABLED_DISABLED,
+    ENDPOINT_GROUP_SPEC,
+    LIST,
+    TEXT,
+    ManagedObject,
+    _ep_selector_expression,
+    _ep_selector_ip,
+    _epg_dn,
+    _useg_ip,
+    _useg_mac,
+    iter_subject_filters,
+)
+
+
+class CodecTestCase(SimpleTestCase):
+    """Test case for the APIC and NaC value codecs."""
+
+    def test_text_codec(self) -> None:
+        """Test the text codec converts values to strings."""
+        self.assertEqual(TEXT.to_apic(None), "")
+        self.assertEqual(TEXT.to_apic(5), "5")
+        self.assertIsNone(TEXT.to_nac(None))
+        self.assertIs(TEXT.to_nac(True), True)
+        self.assertEqual(TEXT.to_nac(IPNetwork("10.0.0.0/8")), "10.0.0.0/8")
+
+    def test_boolean_codec(self) -> None:
+        """Test the boolean codec converts values to APIC keywords."""
+        self.assertEqual(ENABLED_DISABLED.to_apic(True), "enabled")
+        self.assertEqual(ENABLED_DISABLED.to_apic(False), "disabled")
+
+    def test_list_codec(self) -> None:
+        """Test the list codec converts arrays to comma-separated values."""
+        self.assertEqual(LIST.to_apic(["a", "b"]), "a,b")
+        self.assertEqual(LIST.to_apic(None), "")
+        self.assertEqual(LIST.to_nac(None), [])
+
+    def test_codecs_from_apic(self) -> None:
+        """Test the codecs convert APIC values back to field values."""
+        self.assertEqual(TEXT.from_apic("5"), "5")
+        self.assertIs(ENABLED_DISABLED.from_apic("enabled"), True)
+        self.assertIs(ENABLED_DISABLED.from_apic("disabled"), False)
+        self.assertEqual(LIST.from_apic("a,,b"), ["a", "b"])
+        self.assertEqual(LIST.from_apic(""), [])
+
+
+class ObjectSpecFromApicTestCase(SimpleTestCase):
+    """Test case for the mapping of APIC managed objects to field values."""
+
+    def test_attributes_flags_and_relations(self) -> None:
+        """Test attributes, flag sets, and relations are mapped to fields."""
+        mo = ManagedObject(
+            "fvSubnet",
+            {"ip": "10.0.0.1/24", "scope": "public,shared", "unknown": "x"},
+            (ManagedObject("fvRsNdPfxPol", {"tnNdPfxPolName": "NDPolicy"}),),
+        )
+        self.assertEqual(
+            BRIDGE_DOMAIN_SUBNET_SPEC.from_apic(mo),
+            {
+                "gateway_ip_address__address": "10.0.0.1/24",
+                "advertised_externally_enabled": True,
+                "shared_enabled": True,
+                "nd_ra_prefix_policy_name": "NDPolicy",
+            },
+        )
+
+    def test_apic_class_field(self) -> None:
+        """Test the APIC class of a managed object is mapped to a field."""
+        relation_spec = ENDPOINT_GROUP_SPEC.children[0]
+        mo = ManagedObject("fvRsCons", {"tnVzBrCPName": "Contract"})
+        self.assertEqual(
+            relation_spec.from_apic(mo),
+            {"aci_contract__name": "Contract", "role": "cons"},
+        )
+
+    def test_relative_names(self) -> None:
+        """Test the APIC relative names of objects are built from fields."""
+        self.assertEqual(
+            BRIDGE_DOMAIN_SUBNET_SPEC.get_rn(
+                {"gateway_ip_address__address": "10.0.0.1/24"}
+            ),
+            "subnet-[10.0.0.1/24]",
+        )
+        self.assertEqual(
+            ENDPOINT_GROUP_SPEC.children[0].get_rn(
+                {"role": "prov", "aci_contract__name": "Contract"}
+            ),
+            "rsprov-Contract",
+        )
+        self.assertEqual(
+            CONTRACT_SUBJECT_FILTER_SPEC.get_rn(
+                {"apply_direction": "ptc", "aci_contract_filter__name": "Filter"}
+            ),
+            "outtmnl/rsfiltAtt-Filter",
+        )
+
+    def test_iter_subject_filters(self) -> None:
+        """Test the subject filters are yielded with their direction."""
+        mo = ManagedObject(
+            "vzSubj",
+            {"name": "Subject"},
+            (
+                ManagedObject("vzRsSubjFiltAtt", {"tnVzFilterName": "F1"}),
+                ManagedObject(
+                    "vzInTerm",
+                    {},
+                    (ManagedObject("vzRsFiltAtt", {"tnVzFilterName": "F2"}),),
+                ),
+                ManagedObject(
+                    "vzOutTerm",
+                    {},
+                    (ManagedObject("vzRsFiltAtt", {"tnVzFilterName": "F3"}),),
+                ),
+            ),
+        )
+        self.assertEqual(
+            [
+                (child_mo.attributes["tnVzFilterName"], apply_direction)
+                for child_mo, apply_direction in iter_subject_filters(mo)
+            ],
+            [("F1", "both"), ("F2", "ctp"), ("F3", "ptc")],
+        )
+
+
+class ComputedAttributeTestCase(SimpleTestCase):
+    """Test case for the computed APIC attributes."""
+
+    def test_epg_dn(self) -> None:
+        """Test the DN of the EPG or uSeg EPG selected by an ESG selector."""
+        row = {
+            "_aci_endpoint_group__name": None,
+            "_aci_useg_endpoint_group__name": "uEPG",
+            "_aci_useg_endpoint_group__aci_app_profile__name": "AP",
+            "_aci_useg_endpoint_group__aci_app_profile__aci_tenant__name": "TN",
+        }
+        self.assertEqual(_epg_dn(row), "uni/tn-TN/ap-AP/epg-uEPG")
+        row["_aci_useg_endpoint_group__name"] = None
+        self.assertIsNone(_epg_dn(row))
+
+    def test_ep_selector(self) -> None:
+        """Test the match expression and value of an ESG endpoint selector."""
+        row = {"_ip_address__address": None, "_prefix__prefix": None}
+        self.assertIsNone(_ep_selector_expression(row))
+        self.assertIsNone(_ep_selector_ip(row))
+        row["_prefix__prefix"] = IPNetwork("10.0.0.0/24")
+        self.assertEqual(_ep_selector_expression(row), "ip=='10.0.0.0/24'")
+        self.assertEqual(_ep_selector_ip(row), "10.0.0.0/24")
+        row["_ip_address__address"] = IPNetwork("10.0.0.1/24")
+        self.assertEqual(_ep_selector_ip(row), "10.0.0.1")
+
+    def test_useg_ip_and_mac(self) -> None:
+        """Test the IP and MAC values of a uSeg network attribute."""
+        row = {
+            "type": "ip",
+            "use_epg_subnet": False,
+            "_ip_address__address": None,
+            "_prefix__prefix": None,
+            "_mac_address__mac_address": None,
+        }
+        self.assertIsNone(_useg_ip(row))
+        self.assertIsNone(_useg_mac(row))
+        row["_prefix__prefix"] = IPNetwork("10.0.0.0/24")
+        self.assertEqual(_useg_ip(row), "10.0.0.0/24")
+        row["use_epg_subnet"] = True
+        self.assertEqual(_useg_ip(row), "0.0.0.0")
+        row["type"] = "mac"
+        self.assertIsNone(_useg_ip(row))
+        self.assertIsNone(_useg_mac(row))
+        row["_mac_address__mac_address"] = EUI("00:00:00:00:00:01")
+        self.assertEqual(_useg_mac(row), "00-00-00-00-00-01")
@@ -0,0 +1,284 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the apply of desired-state ACI Tenant documents."""
+
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied
+from netaddr import IPNetwork
+
+from core.models import ObjectType
+from users.models import ObjectPermission
+
+from ...choices import ContractSubjectFilterApplyDirectionChoices
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ...models.tenant.contract_filters import (
+    ACIContractFilter,
+    ACIContractFilterEntry,
+)
+from ...models.tenant.contracts import (
+    ACIContract,
+    ACIContractRelation,
+    ACIContractSubject,
+    ACIContractSubjectFilter,
+)
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from ...services.apply import TenantApply, apply_tenants
+from ...services.diff import DIFF_ADDED, DIFF_CHANGED, DIFF_DELETED
+from ...services.export import TenantExporter
+from ...services.ingest import INGESTED_SPECS
+from ...services.snapshot import iter_document_tenants
+from ..models.base import ACIBaseTestCase
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "snapshots"
+TENANT_DN = "uni/tn-ACISnapshotTenant"
+
+
+def get_document(exclude: tuple[str, ...] = ("BDInvalid",)) -> dict:
+    """Return the snapshot fixture tenant without the excluded objects."""
+    document = json.loads((FIXTURES_PATH / "tenant.json").read_text())
+    tenant = document["imdata"][0]["fvTenant"]
+    tenant["children"] = [
+        child
+        for child in tenant["children"]
+        if next(iter(child.values()))["attributes"].get("name") not in exclude
+    ]
+    return document
+
+
+def get_child(document: dict, apic_class: str, name: str) -> dict:
+    """Return the body of a named child object of the document tenant."""
+    for child in document["imdata"][0]["fvTenant"]["children"]:
+        if apic_class in child and child[apic_class]["attributes"]["name"] == name:
+            return child[apic_class]
+    raise KeyError(name)
+
+
+class TenantApplyTestCase(ACIBaseTestCase):
+    """Test case for the apply of desired-state ACI Tenant documents."""
+
+    def apply(self, document: dict, **kwargs):
+        """Apply the ACI Tenants of a document to the test ACI Fabric."""
+        return apply_tenants(self.aci_fabric, iter_document_tenants(document), **kwargs)
+
+    def test_apply_creates_tenant_tree(self) -> None:
+        """Test applying a document creates the tenant tree in one pass."""
+        result = self.apply(get_document())
+
+        self.assertTrue(result.applied)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.counts[DIFF_ADDED], len(result.changes))
+        self.assertEqual(result.counts[DIFF_DELETED], 0)
+        aci_tenant = ACITenant.objects.get(name="ACISnapshotTenant")
+        self.assertEqual(aci_tenant.aci_fabric, self.aci_fabric)
+        self.assertEqual(
+            ACIContractRelation.objects.filter(
+                aci_contract__aci_tenant=aci_tenant
+            ).count(),
+            2,
+        )
+        # Other tenants and the objects not managed by the apply are kept
+        self.assertTrue(ACITenant.objects.filter(pk=self.aci_tenant.pk).exists())
+
+    def test_apply_unchanged_document(self) -> None:
+        """Test applying an unchanged document plans and writes nothing."""
+        self.apply(get_document())
+        aci_vrf = ACIVRF.objects.get(name="VRF1")
+
+        # The existing objects are loaded with one query per model
+        with self.assertNumQueries(len(INGESTED_SPECS)):
+            result = self.apply(get_document())
+
+        self.assertTrue(result.applied)
+        self.assertEqual(result.changes, [])
+        self.assertEqual(
+            ACIVRF.objects.get(pk=aci_vrf.pk).last_updated, aci_vrf.last_updated
+        )
+
+    def test_apply_exported_document(self) -> None:
+        """Test applying the APIC JSON export of a tenant plans no changes."""
+        self.apply(get_document())
+        aci_tenant = ACITenant.objects.get(name="ACISnapshotTenant")
+        aci_contract = ACIContract.objects.get(aci_tenant=aci_tenant)
+        # Subjects applying their filters per direction (with or without
+        # filters) are exported with their vzInTerm and vzOutTerm
+        ACIContractSubjectFilter.objects.create(
+            aci_contract_subject=ACIContractSubject.objects.create(
+                name="Subject2",
+                aci_contract=aci_contract,
+                apply_both_directions_enabled=False,
+            ),
+            aci_contract_filter=ACIContractFilter.objects.get(aci_tenant=aci_tenant),
+            apply_direction=ContractSubjectFilterApplyDirectionChoices.DIR_PROV_TO_CONS,
+        )
+        ACIContractSubject.objects.create(
+            name="Subject3",
+            aci_contract=aci_contract,
+            apply_both_directions_enabled=False,
+        )
+        exporter = TenantExporter(ACITenant.objects.filter(pk=aci_tenant.pk))
+        document = json.loads("".join(exporter.iter_apic_json()))
+
+        result = self.apply(document)
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.changes, [])
+
+    def test_apply_updates_and_deletes_objects(self) -> None:
+        """Test changed objects are updated and missing objects deleted."""
+        self.apply(get_document())
+        aci_vrf = ACIVRF.objects.get(name="VRF1")
+        document = get_document()
+        get_child(document, "fvBD", "BD1")["attributes"]["arpFlood"] = "no"
+        get_child(document, "vzFilter", "Filter1")["children"] = []
+        epg = get_child(document, "fvAp", "AP1")["children"][0]["fvAEPg"]
+        epg["children"] = [
+            child for child in epg["children"] if "fvRsCons" not in child
+        ]
+
+        result = self.apply(document)
+
+        self.assertTrue(result.applied)
+        self.assertEqual(
+            sorted((change.action, change.dn) for change in result.changes),
+            [
+                (DIFF_CHANGED, f"{TENANT_DN}/BD-BD1"),
+                (DIFF_DELETED, f"{TENANT_DN}/ap-AP1/epg-EPG1/rscons-Contract1"),
+                (DIFF_DELETED, f"{TENANT_DN}/flt-Filter1/e-HTTPS"),
+            ],
+        )
+        self.assertFalse(ACIBridgeDomain.objects.get(name="BD1").arp_flooding_enabled)
+        self.assertFalse(ACIContractFilterEntry.objects.filter(name="HTTPS").exists())
+        self.assertEqual(
+            ACIContractRelation.objects.filter(aci_contract__name="Contract1").count(),
+            1,
+        )
+        # Unchanged objects are not written again
+        self.assertEqual(
+            ACIVRF.objects.get(pk=aci_vrf.pk).last_updated, aci_vrf.last_updated
+        )
+
+    def test_apply_keeps_subnet_matched_by_name(self) -> None:
+        """Test a subnet with a new gateway IP address is updated in place."""
+        document = get_document()
+        subnet = get_child(document, "fvBD", "BD1")["children"][1]["fvSubnet"]
+        subnet["attributes"]["name"] = "Gateway"
+        self.apply(document)
+        aci_bd_subnet = ACIBridgeDomainSubnet.objects.get(name="Gateway")
+
+        subnet["attributes"]["ip"] = "10.20.0.254/24"
+        result = self.apply(document)
+
+        self.assertTrue(result.applied)
+        self.assertEqual(
+            list(
+                ACIBridgeDomainSubnet.objects.filter(
+                    aci_bridge_domain__name="BD1"
+                ).values_list("pk", "gateway_ip_address__address")
+            ),
+            [(aci_bd_subnet.pk, IPNetwork("10.20.0.254/24"))],
+        )
+
+    def test_apply_dry_run(self) -> None:
+        """Test a dry run returns the plan without applying it."""
+        result = self.apply(get_document(), dry_run=True)
+
+        self.assertFalse(result.applied)
+        self.assertTrue(result.dry_run)
+        self.assertIn(
+            (DIFF_ADDED, f"{TENANT_DN}/BD-BD1"),
+            [(change.action, change.dn) for change in result.changes],
+        )
+        self.assertFalse(ACITenant.objects.filter(name="ACISnapshotTenant").exists())
+
+    def test_apply_rolls_back_invalid_documents(self) -> None:
+        """Test a document with invalid objects is not applied at all."""
+        result = self.apply(get_document(exclude=()))
+
+        self.assertFalse(result.applied)
+        self.assertEqual(
+            [error["dn"] for error in result.errors], [f"{TENANT_DN}/BD-BDInvalid"]
+        )
+        self.assertFalse(ACITenant.objects.filter(name="ACISnapshotTenant").exists())
+
+    def test_apply_rolls_back_protected_deletes(self) -> None:
+        """Test deleting an object still referenced rolls back the apply."""
+        self.apply(get_document())
+
+        result = self.apply(get_document(exclude=("BDInvalid", "BD1")))
+
+        self.assertFalse(result.applied)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIsNone(result.errors[0]["dn"])
+        self.assertTrue(ACIBridgeDomain.objects.filter(name="BD1").exists())
+
+    def test_apply_requires_permissions(self) -> None:
+        """Test applying requires permission for every planned change."""
+        user = get_user_model().objects.create_user(username="acitestapply")
+        obj_perm = ObjectPermission(name="ACI apply test", actions=["view", "add"])
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+        user = get_user_model().objects.get(pk=user.pk)
+        document = {
+            "fvTenant": {
+                "attributes": {"name": "ACITestApplyTenant"},
+                "children": [{"fvCtx": {"attributes": {"name": "VRF1"}}}],
+            }
+        }
+        tenant_apply = TenantApply(self.aci_fabric, user=user)
+
+        with self.assertRaisesMessage(PermissionDenied, "add ACI VRFs"):
+            tenant_apply.apply(iter_document_tenants(document))
+
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACIVRF))
+        tenant_apply.user = get_user_model().objects.get(pk=user.pk)
+        self.assertTrue(tenant_apply.apply(iter_document_tenants(document)).applied)
+
+        document["fvTenant"]["children"][0]["fvCtx"]["attributes"]["descr"] = "New"
+        with self.assertRaisesMessage(PermissionDenied, "change ACI VRFs"):
+            tenant_apply.apply(iter_document_tenants(document))
+
+    def test_apply_checks_add_constraints(self) -> None:
+        """Test the created objects must match the "add" constraints."""
+        user = get_user_model().objects.create_user(username="acitestapplyadd")
+        obj_perm = ObjectPermission(
+            name="ACI apply add test",
+            actions=["view", "add"],
+            constraints={"name__startswith": "ACITestApplyAllowed"},
+        )
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+        tenant_apply = TenantApply(
+            self.aci_fabric, user=get_user_model().objects.get(pk=user.pk)
+        )
+
+        document = {"fvTenant": {"attributes": {"name": "ACITestApplyDenied"}}}
+        with self.assertRaisesMessage(PermissionDenied, "add ACI Tenants"):
+            tenant_apply.apply(iter_document_tenants(document))
+        self.assertFalse(ACITenant.objects.filter(name="ACITestApplyDenied").exists())
+
+        document = {"fvTenant": {"attributes": {"name": "ACITestApplyAllowed"}}}
+        self.assertTrue(tenant_apply.apply(iter_document_tenants(document)).applied)
+
+    def test_apply_reports_model_rule_violations(self) -> None:
+        """Test objects failing the model rules are reported as plan errors."""
+        document = get_document()
+        get_child(document, "vzFilter", "Filter1")["children"][0]["vzEntry"][
+            "attributes"
+        ]["etherT"] = "arp"
+
+        result = self.apply(document)
+
+        self.assertFalse(result.applied)
+        self.assertEqual(
+            [error["dn"] for error in result.errors],
+            [f"{TENANT_DN}/flt-Filter1/e-HTTPS"],
+        )
+        self.assertFalse(ACITenant.objects.filter(name="ACISnapshotTenant").exists())
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the change feed of the ACI objects."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db.models import Model
+from django.test import override_settings
+from django.utils import timezone
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectType
+from users.models import ObjectPermission
+
+from ...models.tenant.app_profiles import ACIAppProfile
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from ...services.changes import (
+    ChangeFeed,
+    change_feed_overlap,
+    decode_cursor,
+    encode_cursor,
+    parse_since,
+)
+from ..models.base import ACIBaseTestCase
+
+
+def delete_with_changelog(instance: Model) -> None:
+    """Delete the object and record the deletion in the change log."""
+    objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
+    objectchange.user_name = "acitestchanges"
+    objectchange.request_id = uuid.uuid4()
+    objectchange.save()
+    instance.delete()
+
+
+class ChangeFeedTestCase(ACIBaseTestCase):
+    """Test case for the change feed of the ACI objects."""
+
+    def setUp(self) -> None:
+        """Start the feed after the objects of the test data."""
+        self.since = timezone.now()
+
+    def get_feed(self, **kwargs) -> ChangeFeed:
+        """Return the feed of the ACI Tenants, App Profiles, and VRFs."""
+        return ChangeFeed(
+            (
+                ACITenant.objects.all(),
+                ACIAppProfile.objects.all(),
+                ACIVRF.objects.all(),
+            ),
+            self.since,
+            **kwargs,
+        )
+
+    @staticmethod
+    def get_changes(feed: ChangeFeed) -> list[tuple]:
+        """Return the action, model, and object ID of the feed changes."""
+        return [
+            (change.action, change.model, change.object_id)
+            for batch in feed.iter_batches()
+            for change in batch
+        ]
+
+    def test_iter_batches(self) -> None:
+        """Test the created, updated, and deleted objects are reported."""
+        self.aci_vrf.description = "ACITestChangesDescription"
+        self.aci_vrf.save()
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestChangesTenant", aci_fabric=self.aci_fabric
+        )
+        aci_app_profile = ACIAppProfile.objects.create(
+            name="ACITestChangesAppProfile", aci_tenant=self.aci_tenant
+        )
+        aci_app_profile_pk = aci_app_profile.pk
+        delete_with_changelog(aci_app_profile)
+
+        feed = self.get_feed()
+        self.assertEqual(
+            self.get_changes(feed),
+            [
+                (ObjectChangeActionChoices.ACTION_CREATE, ACITenant, aci_tenant.pk),
+                (ObjectChangeActionChoices.ACTION_UPDATE, ACIVRF, self.aci_vrf.pk),
+                (
+                    ObjectChangeActionChoices.ACTION_DELETE,
+                    ACIAppProfile,
+                    aci_app_profile_pk,
+                ),
+            ],
+        )
+        self.assertLessEqual(feed.cursor_start, feed.until)
+        self.assertEqual(
+            decode_cursor(feed.cursor), feed.cursor_start - change_feed_overlap()
+        )
+
+    def test_cursor_open_transactions(self) -> None:
+        """Test the cursor continues before the oldest open transaction.
+
+        The change of a transaction open while the feed is read is stamped
+        before the end of the feed but committed after the cursor was issued.
+        """
+        transaction_start = timezone.now()
+        with patch(
+            "netbox_aci_plugin.services.changes.get_oldest_transaction_start",
+            return_value=transaction_start,
+        ):
+            feed = self.get_feed()
+        self.assertEqual(self.get_changes(feed), [])
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestChangesTenant", aci_fabric=self.aci_fabric
+        )
+        ACITenant.objects.filter(pk=aci_tenant.pk).update(
+            last_updated=transaction_start
+        )
+
+        self.assertEqual(feed.cursor_start, transaction_start)
+        self.since = decode_cursor(feed.cursor)
+        self.assertIn(
+            (ObjectChangeActionChoices.ACTION_CREATE, ACITenant, aci_tenant.pk),
+            self.get_changes(self.get_feed()),
+        )
+
+    def test_iter_batches_batch_size(self) -> None:
+        """Test the changes are yielded in batches of the batch size."""
+        for i in range(3):
+            ACITenant.objects.create(
+                name=f"ACITestChangesTenant{i}", aci_fabric=self.aci_fabric
+            )
+        feed = self.get_feed(batch_size=2)
+        self.assertEqual([len(batch) for batch in feed.iter_batches()], [2, 1])
+
+    def test_iter_batches_restricted(self) -> None:
+        """Test the changes are restricted to the models the user may view."""
+        user = get_user_model().objects.create_user(username="acitestchanges")
+        self.aci_vrf.save()
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestChangesTenant", aci_fabric=self.aci_fabric
+        )
+        self.assertEqual(self.get_changes(self.get_feed(user=user)), [])
+
+        obj_perm = ObjectPermission(name="ACI changes test view", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+        user = get_user_model().objects.get(pk=user.pk)
+        self.assertEqual(
+            self.get_changes(self.get_feed(user=user)),
+            [(ObjectChangeActionChoices.ACTION_CREATE, ACITenant, aci_tenant.pk)],
+        )
+
+    def test_decode_cursor(self) -> None:
+        """Test a cursor continues the feed before the end of a feed."""
+        start = timezone.now()
+        self.assertEqual(
+            decode_cursor(encode_cursor(start)), start - timedelta(minutes=1)
+        )
+        with override_settings(
+            PLUGINS_CONFIG={"netbox_aci_plugin": {"change_feed_overlap": 300}}
+        ):
+            self.assertEqual(
+                decode_cursor(encode_cursor(start)), start - timedelta(minutes=5)
+            )
+        with self.assertRaises(ValidationError):
+            decode_cursor("invalid")
+
+    def test_parse_since(self) -> None:
+        """Test timestamps are parsed to aware datetimes."""
+        self.assertEqual(
+            parse_since("2026-01-02T03:04:05+00:00"),
+            datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        )
+        self.assertTrue(timezone.is_aware(parse_since("2026-01-02T03:04:05")))
+        for value in ("invalid", "2026-13-01T00:00:00"):
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                parse_since(value)
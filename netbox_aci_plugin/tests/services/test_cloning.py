@@ -0,0 +1,486 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the deep clone of ACI Tenants and Application Profiles."""
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied, ValidationError
+
+from core.models import ObjectType
+from extras.models import Tag
+from ipam.models import IPAddress
+from users.models import ObjectPermission
+
+from ...choices import ContractRelationRoleChoices
+from ...models.access_policies.domains import ACIRoutedDomain
+from ...models.fabric.fabrics import ACIFabric
+from ...models.tenant.app_profiles import ACIAppProfile
+from ...models.tenant.bridge_domains import (
+    ACIBridgeDomain,
+    ACIBridgeDomainL3OutBinding,
+    ACIBridgeDomainSubnet,
+)
+from ...models.tenant.contract_filters import ACIContractFilter, ACIContractFilterEntry
+from ...models.tenant.contracts import (
+    ACIContract,
+    ACIContractRelation,
+    ACIContractSubject,
+    ACIContractSubjectFilter,
+)
+from ...models.tenant.endpoint_groups import (
+    ACIEndpointGroup,
+    ACIUSegEndpointGroup,
+    ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
+)
+from ...models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+    ACIEsgMembership,
+)
+from ...models.tenant.l3outs import ACIExternalEndpointGroup, ACIL3Out
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from ...services.cloning import RenameRule, SubtreeCloner, clone_subtree
+from ..models.base import ACIBaseTestCase
+
+
+class SubtreeClonerTestCase(ACIBaseTestCase):
+    """Test case for the deep clone of ACI Tenants and App Profiles."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI Tenant tree referencing the tenant 'common'."""
+        super().setUpTestData()
+
+        cls.tag = Tag.objects.create(name="ACITestClone", slug="acitestclone")
+        cls.aci_bd.tags.add(cls.tag)
+        ACIBridgeDomainSubnet.objects.create(
+            name="ACIBaseTestSubnet",
+            aci_bridge_domain=cls.aci_bd,
+            gateway_ip_address=IPAddress.objects.create(
+                address="10.1.0.1/24", vrf=cls.nb_vrf
+            ),
+        )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACIBaseTestEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        aci_useg_epg = ACIUSegEndpointGroup.objects.create(
+            name="ACIBaseTestUSegEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        ACIUSegNetworkAttribute.objects.create(
+            name="ACIBaseTestUSegAttribute",
+            aci_useg_endpoint_group=aci_useg_epg,
+            attr_object=cls.ip_address1,
+            use_epg_subnet=False,
+        )
+        ACIUSegNetworkAttribute.objects.create(
+            name="ACIBaseTestUSegSubnetAttribute",
+            aci_useg_endpoint_group=aci_useg_epg,
+            use_epg_subnet=True,
+        )
+        cls.aci_esg = ACIEndpointSecurityGroup.objects.create(
+            name="ACIBaseTestESG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_vrf=cls.aci_vrf,
+        )
+        ACIEsgEndpointGroupSelector.objects.create(
+            name="ACIBaseTestESGSelector",
+            aci_endpoint_security_group=cls.aci_esg,
+            aci_epg_object=cls.aci_epg,
+        )
+
+        aci_contract_filter = ACIContractFilter.objects.create(
+            name="ACIBaseTestFilter", aci_tenant=cls.aci_tenant
+        )
+        ACIContractFilterEntry.objects.create(
+            name="ACIBaseTestEntry", aci_contract_filter=aci_contract_filter
+        )
+        cls.aci_contract = ACIContract.objects.create(
+            name="ACIBaseTestContract", aci_tenant=cls.aci_tenant
+        )
+        aci_subject = ACIContractSubject.objects.create(
+            name="ACIBaseTestSubject", aci_contract=cls.aci_contract
+        )
+        ACIContractSubjectFilter.objects.create(
+            aci_contract_filter=aci_contract_filter,
+            aci_contract_subject=aci_subject,
+        )
+        ACIContractRelation.objects.create(
+            aci_contract=cls.aci_contract,
+            aci_object=cls.aci_epg,
+            role=ContractRelationRoleChoices.ROLE_PROVIDER,
+        )
+
+        cls.aci_routed_domain = ACIRoutedDomain.objects.create(
+            name="ACIBaseTestRoutedDomain", aci_fabric=cls.aci_fabric
+        )
+        cls.aci_l3out = ACIL3Out.objects.create(
+            name="ACIBaseTestL3Out",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf,
+            aci_routed_domain=cls.aci_routed_domain,
+        )
+        ACIExternalEndpointGroup.objects.create(
+            name="ACIBaseTestExtEPG", aci_l3out=cls.aci_l3out
+        )
+        ACIBridgeDomainL3OutBinding.objects.create(
+            aci_bridge_domain=cls.aci_bd, aci_l3out=cls.aci_l3out
+        )
+
+        # Contract of the tenant 'common' consumed by the EPG
+        cls.aci_tenant_common = ACITenant.objects.create(
+            name="common", aci_fabric=cls.aci_fabric
+        )
+        cls.aci_contract_common = ACIContract.objects.create(
+            name="ACITestCloneCommonContract", aci_tenant=cls.aci_tenant_common
+        )
+        ACIContractRelation.objects.create(
+            aci_contract=cls.aci_contract_common,
+            aci_object=cls.aci_epg,
+            role=ContractRelationRoleChoices.ROLE_CONSUMER,
+        )
+
+    def test_clone_tenant(self) -> None:
+        """Test cloning a tenant copies and remaps its subtree."""
+        result = clone_subtree(self.aci_tenant, name="ACITestCloneTenant")
+        aci_tenant = result.root
+
+        self.assertEqual(aci_tenant.name, "ACITestCloneTenant")
+        self.assertEqual(aci_tenant.aci_fabric, self.aci_fabric)
+        for model, count in (
+            (ACITenant, 1),
+            (ACIVRF, 1),
+            (ACIBridgeDomain, 1),
+            (ACIBridgeDomainSubnet, 1),
+            (IPAddress, 1),
+            (ACIEndpointGroup, 1),
+            (ACIUSegNetworkAttribute, 2),
+            (ACIEsgEndpointGroupSelector, 1),
+            (ACIContractSubjectFilter, 1),
+            (ACIBridgeDomainL3OutBinding, 1),
+            (ACIContractRelation, 2),
+        ):
+            with self.subTest(model=model):
+                self.assertEqual(result.counts[model._meta.label], count)
+
+        aci_vrf = ACIVRF.objects.get(aci_tenant=aci_tenant)
+        aci_bd = ACIBridgeDomain.objects.get(aci_tenant=aci_tenant)
+        self.assertEqual(aci_vrf.name, self.aci_vrf.name)
+        self.assertEqual(aci_vrf.nb_vrf, self.nb_vrf)
+        self.assertEqual(aci_bd.aci_vrf, aci_vrf)
+        self.assertEqual(list(aci_bd.tags.all()), [self.tag])
+        self.assertTrue(aci_bd.content_hash)
+
+        aci_bd_subnet = ACIBridgeDomainSubnet.objects.get(aci_bridge_domain=aci_bd)
+        self.assertEqual(str(aci_bd_subnet.gateway_ip_address.address), "10.1.0.1/24")
+        self.assertEqual(aci_bd_subnet.gateway_ip_address.vrf, self.nb_vrf)
+        self.assertEqual(IPAddress.objects.filter(address="10.1.0.1/24").count(), 2)
+
+        aci_epg = ACIEndpointGroup.objects.get(aci_app_profile__aci_tenant=aci_tenant)
+        self.assertEqual(aci_epg.aci_bridge_domain, aci_bd)
+        self.assertEqual(
+            ACIEsgEndpointGroupSelector.objects.get(
+                aci_endpoint_security_group__aci_vrf=aci_vrf
+            ).aci_epg_object,
+            aci_epg,
+        )
+        # The memberships of the selectors inserted in bulk are refreshed
+        self.assertEqual(
+            list(
+                ACIEsgMembership.objects.filter(aci_vrf=aci_vrf).values_list(
+                    "member_id", flat=True
+                )
+            ),
+            [aci_epg.pk],
+        )
+        self.assertEqual(
+            {
+                str(network.prefix)
+                for network in ACIUSegResolvedNetwork.objects.filter(
+                    aci_useg_endpoint_group__aci_app_profile__aci_tenant=aci_tenant
+                )
+            },
+            {"192.168.1.1/32", "10.1.0.0/24"},
+        )
+        self.assertEqual(
+            {
+                (relation.aci_contract.aci_tenant, relation.role)
+                for relation in ACIContractRelation.objects.filter(
+                    _aci_endpoint_group=aci_epg
+                )
+            },
+            {
+                (aci_tenant, ContractRelationRoleChoices.ROLE_PROVIDER),
+                (self.aci_tenant_common, ContractRelationRoleChoices.ROLE_CONSUMER),
+            },
+        )
+        aci_l3out = ACIL3Out.objects.get(aci_tenant=aci_tenant)
+        self.assertEqual(aci_l3out.aci_vrf, aci_vrf)
+        self.assertEqual(aci_l3out.aci_routed_domain, self.aci_routed_domain)
+
+        # The source tenant is unchanged
+        self.assertEqual(
+            ACIBridgeDomain.objects.filter(aci_vrf=self.aci_vrf).count(), 1
+        )
+        self.assertEqual(
+            result.serialize(),
+            {
+                "object_type": "netbox_aci_plugin.acitenant",
+                "id": aci_tenant.pk,
+                "name": "ACITestCloneTenant",
+                "counts": result.counts,
+            },
+        )
+
+    def test_clone_tenant_rename_rules(self) -> None:
+        """Test the rename rules rewrite the names of the copies."""
+        result = clone_subtree(
+            self.aci_tenant,
+            rename_rules=(RenameRule(pattern="^ACIBaseTest", replacement="Clone"),),
+        )
+
+        self.assertEqual(result.root.name, "CloneTenant")
+        self.assertEqual(
+            set(
+                ACIBridgeDomain.objects.filter(aci_tenant=result.root).values_list(
+                    "name", flat=True
+                )
+            ),
+            {"CloneBD"},
+        )
+
+    def test_clone_tenant_into_other_fabric(self) -> None:
+        """Test the references are resolved by name in the target fabric."""
+        aci_fabric = ACIFabric.objects.create(
+            name="ACITestCloneFabric", fabric_id=120, infra_vlan_vid=3920
+        )
+        with self.assertRaisesMessage(ValidationError, "does not exist"):
+            clone_subtree(self.aci_tenant, target=aci_fabric)
+        self.assertFalse(ACITenant.objects.filter(aci_fabric=aci_fabric).exists())
+
+        aci_tenant_common = ACITenant.objects.create(
+            name="common", aci_fabric=aci_fabric
+        )
+        aci_contract_common = ACIContract.objects.create(
+            name="ACITestCloneCommonContract", aci_tenant=aci_tenant_common
+        )
+        aci_routed_domain = ACIRoutedDomain.objects.create(
+            name="ACIBaseTestRoutedDomain", aci_fabric=aci_fabric
+        )
+
+        result = clone_subtree(self.aci_tenant, target=aci_fabric)
+
+        self.assertEqual(result.root.name, self.aci_tenant.name)
+        self.assertEqual(result.root.aci_fabric, aci_fabric)
+        self.assertEqual(
+            ACIL3Out.objects.get(aci_tenant=result.root).aci_routed_domain,
+            aci_routed_domain,
+        )
+        self.assertTrue(
+            ACIContractRelation.objects.filter(
+                aci_contract=aci_contract_common,
+                _aci_endpoint_group__aci_app_profile__aci_tenant=result.root,
+            ).exists()
+        )
+
+    def test_clone_app_profile(self) -> None:
+        """Test cloning an App Profile keeps the references of its tenant."""
+        result = SubtreeCloner(self.aci_app_profile, name="ACITestCloneAP").clone()
+        aci_app_profile = result.root
+
+        self.assertEqual(aci_app_profile.aci_tenant, self.aci_tenant)
+        self.assertNotIn(ACIVRF._meta.label, result.counts)
+        self.assertNotIn(ACIContract._meta.label, result.counts)
+        aci_epg = ACIEndpointGroup.objects.get(aci_app_profile=aci_app_profile)
+        self.assertEqual(aci_epg.aci_bridge_domain, self.aci_bd)
+        self.assertEqual(
+            ACIEndpointSecurityGroup.objects.get(
+                aci_app_profile=aci_app_profile
+            ).aci_vrf,
+            self.aci_vrf,
+        )
+        self.assertEqual(
+            set(
+                ACIContractRelation.objects.filter(
+                    _aci_endpoint_group=aci_epg
+                ).values_list("aci_contract", flat=True)
+            ),
+            {self.aci_contract.pk, self.aci_contract_common.pk},
+        )
+
+    def test_clone_app_profile_into_other_tenant(self) -> None:
+        """Test the references of the source tenant resolve by name."""
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestCloneTenant", aci_fabric=self.aci_fabric
+        )
+        aci_vrf = ACIVRF.objects.create(name=self.aci_vrf.name, aci_tenant=aci_tenant)
+        aci_bd = ACIBridgeDomain.objects.create(
+            name=self.aci_bd.name, aci_tenant=aci_tenant, aci_vrf=aci_vrf
+        )
+        with self.assertRaisesMessage(ValidationError, "does not exist"):
+            clone_subtree(self.aci_app_profile, target=aci_tenant)
+
+        aci_contract = ACIContract.objects.create(
+            name=self.aci_contract.name, aci_tenant=aci_tenant
+        )
+        result = clone_subtree(self.aci_app_profile, target=aci_tenant)
+
+        aci_epg = ACIEndpointGroup.objects.get(aci_app_profile=result.root)
+        self.assertEqual(aci_epg.aci_bridge_domain, aci_bd)
+        self.assertEqual(
+            set(
+                ACIContractRelation.objects.filter(
+                    _aci_endpoint_group=aci_epg
+                ).values_list("aci_contract", flat=True)
+            ),
+            {aci_contract.pk, self.aci_contract_common.pk},
+        )
+
+    def test_clone_app_profile_selecting_other_app_profile(self) -> None:
+        """Test an ESG selecting an EPG of another AP stays in its tenant."""
+        aci_app_profile = ACIAppProfile.objects.create(
+            name="ACITestCloneAP", aci_tenant=self.aci_tenant
+        )
+        aci_esg = ACIEndpointSecurityGroup.objects.create(
+            name="ACITestCloneESG",
+            aci_app_profile=aci_app_profile,
+            aci_vrf=self.aci_vrf,
+        )
+        ACIEsgEndpointGroupSelector.objects.create(
+            name="ACITestCloneSelector",
+            aci_endpoint_security_group=aci_esg,
+            aci_epg_object=self.aci_epg,
+        )
+        aci_tenant = ACITenant.objects.create(
+            name="ACITestCloneTenant", aci_fabric=self.aci_fabric
+        )
+        ACIVRF.objects.create(name=self.aci_vrf.name, aci_tenant=aci_tenant)
+
+        with self.assertRaisesMessage(ValidationError, "outside of the cloned"):
+            clone_subtree(aci_app_profile, target=aci_tenant)
+
+        result = clone_subtree(aci_app_profile, name="ACITestCloneAP2")
+        self.assertEqual(
+            ACIEsgEndpointGroupSelector.objects.get(
+                aci_endpoint_security_group__aci_app_profile=result.root
+            ).aci_epg_object,
+            self.aci_epg,
+        )
+
+    def test_clone_invalid(self) -> None:
+        """Test invalid names and rules abort the clone."""
+        ACIVRF.objects.create(name="ACITestCloneVRF2", aci_tenant=self.aci_tenant)
+        for kwargs, message in (
+            ({}, "already exists"),
+            ({"name": "invalid name"}, "invalid name"),
+            (
+                {"rename_rules": (RenameRule(pattern="(", replacement=""),)},
+                "Invalid rename rule",
+            ),
+            (
+                {
+                    "name": "ACITestCloneTenant",
+                    "rename_rules": (RenameRule(pattern="Test", replacement=" "),),
+                },
+                "ACIBase VRF",
+            ),
+            (
+                {
+                    "name": "ACITestCloneTenant",
+                    "rename_rules": (
+                        RenameRule(pattern=r"^ACI\w*VRF\w*$", replacement="X"),
+                    ),
+                },
+                "conflict with existing objects",
+            ),
+        ):
+            with (
+                self.subTest(kwargs=kwargs),
+                self.assertRaisesMessage(ValidationError, message),
+            ):
+                clone_subtree(self.aci_tenant, **kwargs)
+        self.assertEqual(ACITenant.objects.count(), 2)
+
+    def test_clone_validates_model_rules(self) -> None:
+        """Test copies failing the model rules abort the clone."""
+        ACIContractFilterEntry.objects.filter(name="ACIBaseTestEntry").update(
+            ether_type="arp", ip_protocol="tcp"
+        )
+
+        with self.assertRaisesMessage(ValidationError, "ACIBaseTestEntry"):
+            clone_subtree(self.aci_tenant, name="ACITestCloneTenant")
+        self.assertFalse(ACITenant.objects.filter(name="ACITestCloneTenant").exists())
+
+    def test_clone_overlapping_subnets(self) -> None:
+        """Test subnet copies overlapping in a shared VRF abort the clone."""
+        aci_vrf_common = ACIVRF.objects.create(
+            name="ACITestCloneCommonVRF", aci_tenant=self.aci_tenant_common
+        )
+        aci_bd = ACIBridgeDomain.objects.create(
+            name="ACITestCloneBD", aci_tenant=self.aci_tenant, aci_vrf=aci_vrf_common
+        )
+        ACIBridgeDomainSubnet.objects.create(
+            name="ACITestCloneSubnet",
+            aci_bridge_domain=aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.2.0.1/24"),
+        )
+
+        with self.assertRaisesMessage(ValidationError, "must not overlap"):
+            clone_subtree(self.aci_tenant, name="ACITestCloneTenant")
+        self.assertFalse(ACITenant.objects.filter(name="ACITestCloneTenant").exists())
+
+    def test_clone_requires_add_permission(self) -> None:
+        """Test cloning requires adding objects of every cloned model."""
+        user = get_user_model().objects.create_user(username="acitestclone")
+        obj_perms = {}
+        for action in ("view", "add"):
+            obj_perms[action] = ObjectPermission(
+                name=f"ACI clone test {action}", actions=[action]
+            )
+            obj_perms[action].save()
+            obj_perms[action].users.add(user)
+            obj_perms[action].object_types.add(
+                ObjectType.objects.get_for_model(ACITenant)
+            )
+        obj_perms["view"].object_types.add(ObjectType.objects.get_for_model(ACIVRF))
+        user = get_user_model().objects.get(pk=user.pk)
+
+        with self.assertRaises(PermissionDenied):
+            clone_subtree(self.aci_tenant, name="ACITestCloneTenant", user=user)
+
+        # Only the objects viewable by the user are cloned
+        obj_perms["add"].object_types.add(ObjectType.objects.get_for_model(ACIVRF))
+        user = get_user_model().objects.get(pk=user.pk)
+        result = clone_subtree(self.aci_tenant, name="ACITestCloneTenant", user=user)
+        self.assertEqual(
+            result.counts,
+            {ACITenant._meta.label: 1, ACIVRF._meta.label: 1},
+        )
+
+    def test_clone_checks_add_constraints(self) -> None:
+        """Test the copies must match the constraints of the add permission."""
+        user = get_user_model().objects.create_user(username="acitestcloneadd")
+        obj_perm = ObjectPermission(
+            name="ACI clone add test",
+            actions=["view", "add"],
+            constraints={"name__startswith": "ACITestCloneAllowed"},
+        )
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+        user = get_user_model().objects.get(pk=user.pk)
+
+        with self.assertRaisesMessage(PermissionDenied, "ACI Tenants"):
+            clone_subtree(self.aci_tenant, name="ACITestCloneTenant", user=user)
+        self.assertFalse(ACITenant.objects.filter(name="ACITestCloneTenant").exists())
+
+        result = clone_subtree(
+            self.aci_tenant, name="ACITestCloneAllowedTenant", user=user
+        )
+        self.assertEqual(result.counts, {ACITenant._meta.label: 1})
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the APIC snapshot diff."""
+
+from pathlib import Path
+
+from ...models.tenant.bridge_domains import ACIBridgeDomain
+from ...services.diff import (
+    DIFF_ADDED,
+    DIFF_CHANGED,
+    DIFF_DELETED,
+    ObjectDiff,
+    SnapshotDiff,
+)
+from ...services.ingest import SnapshotIngester
+from ...services.snapshot import iter_snapshot_tenants
+from ..models.base import ACIBaseTestCase
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "snapshots"
+SNAPSHOT_PATH = FIXTURES_PATH / "tenant.json"
+TENANT_DN = "uni/tn-ACISnapshotTenant"
+
+
+class SnapshotDiffTestCase(ACIBaseTestCase):
+    """Test case for the APIC snapshot diff."""
+
+    def diff(self) -> tuple[SnapshotDiff, dict[str, ObjectDiff]]:
+        """Compare the snapshot fixture and return the diffs by DN."""
+        snapshot_diff = SnapshotDiff(self.aci_fabric)
+        diffs = {
+            diff.dn: diff
+            for diff in snapshot_diff.iter_diffs(iter_snapshot_tenants(SNAPSHOT_PATH))
+        }
+        return snapshot_diff, diffs
+
+    def test_diff_added_objects(self) -> None:
+        """Test objects missing from the fabric are reported as added."""
+        snapshot_diff, diffs = self.diff()
+
+        aci_bd_diff = diffs[f"{TENANT_DN}/BD-BD1"]
+        self.assertEqual(aci_bd_diff.action, DIFF_ADDED)
+        self.assertEqual(aci_bd_diff.model, "netbox_aci_plugin.ACIBridgeDomain")
+        self.assertEqual(aci_bd_diff.changes["aci_vrf__name"], (None, "VRF1"))
+        self.assertIs(aci_bd_diff.changes["arp_flooding_enabled"][1], True)
+        self.assertIn(f"{TENANT_DN}/BD-BD1/subnet-[10.20.0.1/24]", diffs)
+        self.assertIn(
+            f"{TENANT_DN}/brc-Contract1/subj-Subject1/rssubjFiltAtt-Filter1", diffs
+        )
+        self.assertIn(f"{TENANT_DN}/ap-AP1/epg-EPG1/rsprov-Contract1", diffs)
+        self.assertEqual(
+            diffs[f"{TENANT_DN}/ap-AP1/epg-uEPG1"].model,
+            "netbox_aci_plugin.ACIUSegEndpointGroup",
+        )
+        self.assertEqual(
+            snapshot_diff.counts[DIFF_ADDED],
+            sum(diff.action == DIFF_ADDED for diff in diffs.values()),
+        )
+
+    def test_diff_deleted_objects(self) -> None:
+        """Test fabric objects missing from the snapshot are deleted."""
+        _snapshot_diff, diffs = self.diff()
+
+        aci_tenant_diff = diffs[f"uni/tn-{self.aci_tenant.name}"]
+        self.assertEqual(aci_tenant_diff.action, DIFF_DELETED)
+        self.assertEqual(aci_tenant_diff.pk, self.aci_tenant.pk)
+        self.assertEqual(
+            diffs[f"uni/tn-{self.aci_tenant.name}/BD-{self.aci_bd.name}"].action,
+            DIFF_DELETED,
+        )
+
+    def test_diff_changed_objects(self) -> None:
+        """Test changed objects are reported with their field-level deltas."""
+        SnapshotIngester(self.aci_fabric).ingest(iter_snapshot_tenants(SNAPSHOT_PATH))
+        aci_bd = ACIBridgeDomain.objects.get(name="BD1")
+        aci_bd.arp_flooding_enabled = False
+        aci_bd.description = "Changed"
+        aci_bd.save()
+
+        snapshot_diff, diffs = self.diff()
+
+        self.assertEqual(
+            [diff for diff in diffs.values() if diff.action == DIFF_CHANGED],
+            [
+                ObjectDiff(
+                    DIFF_CHANGED,
+                    "netbox_aci_plugin.ACIBridgeDomain",
+                    f"{TENANT_DN}/BD-BD1",
+                    pk=aci_bd.pk,
+                    changes={
+                        "description": ("Changed", ""),
+                        "arp_flooding_enabled": (False, True),
+                    },
+                )
+            ],
+        )
+        self.assertEqual(snapshot_diff.counts[DIFF_CHANGED], 1)
+        # Objects rejected or skipped by the ingest remain added
+        self.assertEqual(
+            sorted(diff.dn for diff in diffs.values() if diff.action == DIFF_ADDED),
+            [f"{TENANT_DN}/BD-BDInvalid", f"{TENANT_DN}/ap-AP1/epg-uEPG1"],
+        )
+
+    def test_serialize(self) -> None:
+        """Test the serialized representation of an object difference."""
+        diff = ObjectDiff(
+            DIFF_CHANGED,
+            "netbox_aci_plugin.ACIVRF",
+            "uni/tn-T/ctx-V",
+            pk=1,
+            changes={"description": ("a", "b")},
+        )
+        self.assertEqual(
+            diff.serialize(),
+            {
+                "action": DIFF_CHANGED,
+                "model": "netbox_aci_plugin.ACIVRF",
+                "dn": "uni/tn-T/ctx-V",
+                "id": 1,
+                "changes": {"description": {"netbox": "a", "snapshot": "b"}},
+            },
+        )
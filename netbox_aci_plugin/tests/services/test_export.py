@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the APIC JSON and NaC YAML export."""
+
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ipam.models import IPAddress
+
+from ...choices import (
+    ContractRelationRoleChoices,
+    ContractSubjectFilterApplyDirectionChoices,
+    USegAttributeTypeChoices,
+)
+from ...models.tenant.bridge_domains import ACIBridgeDomainSubnet
+from ...models.tenant.contract_filters import ACIContractFilter
+from ...models.tenant.contracts import (
+    ACIContract,
+    ACIContractRelation,
+    ACIContractSubject,
+    ACIContractSubjectFilter,
+)
+from ...models.tenant.endpoint_groups import (
+    ACIEndpointGroup,
+    ACIUSegEndpointGroup,
+    ACIUSegNetworkAttribute,
+)
+from ...models.tenant.tenants import ACITenant
+from ...services import export
+from ...services.apic import TENANT_SPEC, ObjectSpec
+from ...services.export import (
+    EXPORT_FORMAT_APIC_JSON,
+    EXPORT_FORMAT_NAC_YAML,
+    TenantExporter,
+)
+from ..models.base import ACIBaseTestCase
+
+
+def _child(mo: dict, apic_class: str, name: str | None = None) -> dict:
+    """Return the first child of an APIC object of the given class and name."""
+    mo_body = next(iter(mo.values()))
+    for child in mo_body.get("children", []):
+        if apic_class in child and (
+            name is None or child[apic_class]["attributes"].get("name") == name
+        ):
+            return child
+    raise AssertionError(f"{apic_class} {name} not found")
+
+
+class TenantExporterTestCase(ACIBaseTestCase):
+    """Test case for the ACI Tenant exporter."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI Tenant tree to export."""
+        super().setUpTestData()
+
+        cls.aci_tenant_other = ACITenant.objects.create(
+            name="ACITestTenantOther", aci_fabric=cls.aci_fabric
+        )
+        ACIBridgeDomainSubnet.objects.create(
+            name="ACITestSubnet",
+            aci_bridge_domain=cls.aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.1.0.1/24"),
+            advertised_externally_enabled=True,
+            shared_enabled=True,
+        )
+        aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        aci_contract = ACIContract.objects.create(
+            name="ACITestContract", aci_tenant=cls.aci_tenant
+        )
+        for role in (
+            ContractRelationRoleChoices.ROLE_PROVIDER,
+            ContractRelationRoleChoices.ROLE_CONSUMER,
+        ):
+            ACIContractRelation.objects.create(
+                aci_contract=aci_contract, aci_object=aci_epg, role=role
+            )
+        aci_useg_epg = ACIUSegEndpointGroup.objects.create(
+            name="ACITestUSegEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        ACIUSegNetworkAttribute.objects.create(
+            name="ACITestUSegAttribute",
+            aci_useg_endpoint_group=aci_useg_epg,
+            type=USegAttributeTypeChoices.TYPE_IP,
+            use_epg_subnet=True,
+        )
+
+    def test_apic_json_tenant_tree(self) -> None:
+        """Test the APIC JSON export renders the tenant object tree."""
+        exporter = TenantExporter(ACITenant.objects.filter(pk=self.aci_tenant.pk))
+        document = json.loads("".join(exporter.iter_apic_json()))
+
+        fv_tenants = document["polUni"]["children"]
+        self.assertEqual(len(fv_tenants), 1)
+        fv_tenant = fv_tenants[0]
+        self.assertEqual(
+            fv_tenant["fvTenant"]["attributes"]["name"], self.aci_tenant.name
+        )
+
+        fv_bd = _child(fv_tenant, "fvBD", self.aci_bd.name)
+        self.assertEqual(
+            _child(fv_bd, "fvRsCtx")["fvRsCtx"]["attributes"],
+            {"tnFvCtxName": self.aci_vrf.name},
+        )
+        fv_subnet = _child(fv_bd, "fvSubnet", "ACITestSubnet")["fvSubnet"]
+        self.assertEqual(fv_subnet["attributes"]["ip"], "10.1.0.1/24")
+        self.assertEqual(fv_subnet["attributes"]["scope"], "public,shared")
+
+        fv_ap = _child(fv_tenant, "fvAp", self.aci_app_profile.name)
+        fv_aepg = _child(fv_ap, "fvAEPg", "ACITestEPG")
+        self.assertEqual(
+            _child(fv_aepg, "fvRsProv")["fvRsProv"]["attributes"],
+            {"tnVzBrCPName": "ACITestContract"},
+        )
+        self.assertEqual(
+            _child(fv_aepg, "fvRsCons")["fvRsCons"]["attributes"],
+            {"tnVzBrCPName": "ACITestContract"},
+        )
+        fv_useg_epg = _child(fv_ap, "fvAEPg", "ACITestUSegEPG")
+        self.assertEqual(fv_useg_epg["fvAEPg"]["attributes"]["isAttrBasedEPg"], "yes")
+        fv_crtrn = _child(fv_useg_epg, "fvCrtrn")
+        fv_ip_attr = _child(fv_crtrn, "fvIpAttr")["fvIpAttr"]["attributes"]
+        self.assertEqual(fv_ip_attr["ip"], "0.0.0.0")
+        self.assertEqual(fv_ip_attr["usefvSubnet"], "yes")
+
+    def test_apic_json_subject_filter_terms(self) -> None:
+        """Test direction-specific subject filters are held by their terms."""
+        aci_contract_filter = ACIContractFilter.objects.create(
+            name="ACITestFilter", aci_tenant=self.aci_tenant
+        )
+        aci_contract = ACIContract.objects.get(name="ACITestContract")
+        for name, apply_direction in (
+            ("ACITestSubjectBoth", ContractSubjectFilterApplyDirectionChoices.DIR_BOTH),
+            (
+                "ACITestSubjectCtp",
+                ContractSubjectFilterApplyDirectionChoices.DIR_CONS_TO_PROV,
+            ),
+        ):
+            ACIContractSubjectFilter.objects.create(
+                aci_contract_subject=ACIContractSubject.objects.create(
+                    name=name,
+                    aci_contract=aci_contract,
+                    apply_both_directions_enabled=(
+                        apply_direction
+                        == ContractSubjectFilterApplyDirectionChoices.DIR_BOTH
+                    ),
+                ),
+                aci_contract_filter=aci_contract_filter,
+                apply_direction=apply_direction,
+            )
+
+        exporter = TenantExporter(ACITenant.objects.filter(pk=self.aci_tenant.pk))
+        document = json.loads("".join(exporter.iter_apic_json()))
+        vz_br_cp = _child(
+            document["polUni"]["children"][0], "vzBrCP", "ACITestContract"
+        )
+
+        vz_subj = _child(vz_br_cp, "vzSubj", "ACITestSubjectBoth")
+        self.assertEqual(
+            _child(vz_subj, "vzRsSubjFiltAtt")["vzRsSubjFiltAtt"]["attributes"][
+                "tnVzFilterName"
+            ],
+            "ACITestFilter",
+        )
+        self.assertRaises(AssertionError, _child, vz_subj, "vzInTerm")
+        vz_subj = _child(vz_br_cp, "vzSubj", "ACITestSubjectCtp")
+        self.assertRaises(AssertionError, _child, vz_subj, "vzRsSubjFiltAtt")
+        vz_in_term = _child(vz_subj, "vzInTerm")
+        self.assertEqual(
+            _child(vz_in_term, "vzRsFiltAtt")["vzRsFiltAtt"]["attributes"][
+                "tnVzFilterName"
+            ],
+            "ACITestFilter",
+        )
+        # The subject is not applied in both directions
+        self.assertEqual(_child(vz_subj, "vzOutTerm")["vzOutTerm"]["children"], [])
+
+    def test_nac_yaml_tenant_tree(self) -> None:
+        """Test the NaC YAML export renders the tenant object tree."""
+        exporter = TenantExporter(ACITenant.objects.filter(pk=self.aci_tenant.pk))
+        document = "".join(exporter.iter_export(EXPORT_FORMAT_NAC_YAML))
+
+        self.assertTrue(document.startswith("apic:\n  tenants:\n"))
+        self.assertIn(f'    - name: "{self.aci_tenant.name}"\n', document)
+        self.assertIn(f'          vrf: "{self.aci_vrf.name}"\n', document)
+        self.assertIn(
+            "              contracts:\n"
+            "                consumers:\n"
+            '                  - "ACITestContract"\n'
+            "                providers:\n"
+            '                  - "ACITestContract"\n',
+            document,
+        )
+        self.assertNotIn(self.aci_tenant_other.name, document)
+
+    def test_export_orders_tenants_by_name(self) -> None:
+        """Test the export renders all tenants ordered by name."""
+        exporter = TenantExporter(ACITenant.objects.all())
+        document = json.loads("".join(exporter.iter_export(EXPORT_FORMAT_APIC_JSON)))
+        names = [
+            fv_tenant["fvTenant"]["attributes"]["name"]
+            for fv_tenant in document["polUni"]["children"]
+        ]
+        self.assertLess(
+            names.index(self.aci_tenant.name), names.index(self.aci_tenant_other.name)
+        )
+
+    def test_export_query_count_is_bounded(self) -> None:
+        """Test the export runs at most one query per exported model."""
+
+        def count_specs(spec: ObjectSpec) -> int:
+            return 1 + sum(count_specs(child) for child in spec.children)
+
+        with CaptureQueriesContext(connection) as queries:
+            "".join(TenantExporter(ACITenant.objects.all()).iter_apic_json())
+        self.assertLessEqual(len(queries), count_specs(TENANT_SPEC))
+
+    def test_export_yields_buffered_chunks(self) -> None:
+        """Test the export combines small writes into larger chunks."""
+        exporter = TenantExporter(ACITenant.objects.all())
+        original_size = export.WRITE_BUFFER_SIZE
+        export.WRITE_BUFFER_SIZE = 1
+        try:
+            chunks = list(exporter.iter_apic_json())
+        finally:
+            export.WRITE_BUFFER_SIZE = original_size
+        self.assertGreater(len(chunks), 1)
+        self.assertIsNotNone(json.loads("".join(chunks)))
@@ -0,0 +1,330 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the APIC snapshot ingest."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.db import IntegrityError
+
+from ipam.models import IPAddress
+
+from ...choices import ContractSubjectFilterApplyDirectionChoices
+from ...models.mixins import get_content_hash
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ...models.tenant.contract_filters import ACIContractFilterEntry
+from ...models.tenant.contracts import (
+    ACIContract,
+    ACIContractRelation,
+    ACIContractSubject,
+    ACIContractSubjectFilter,
+)
+from ...models.tenant.endpoint_groups import ACIEndpointGroup, ACIUSegEndpointGroup
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from ...services.apic import ManagedObject
+from ...services.ingest import SnapshotCheckpoint, SnapshotIngester
+from ...services.snapshot import iter_snapshot_tenants
+from ..models.base import ACIBaseTestCase
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "snapshots"
+
+
+class SnapshotIngesterTestCase(ACIBaseTestCase):
+    """Test case for the APIC snapshot ingester."""
+
+    def ingest(self, name: str, **kwargs):
+        """Ingest a snapshot fixture into the test ACI Fabric."""
+        ingester = SnapshotIngester(self.aci_fabric)
+        return ingester.ingest(iter_snapshot_tenants(FIXTURES_PATH / name), **kwargs)
+
+    def test_ingest_tenant_tree(self) -> None:
+        """Test the ingest creates the object tree of a tenant."""
+        result = self.ingest("tenant.json")
+
+        self.assertEqual(result.tenants, ["ACISnapshotTenant"])
+        aci_tenant = ACITenant.objects.get(
+            aci_fabric=self.aci_fabric, name="ACISnapshotTenant"
+        )
+        self.assertEqual(aci_tenant.description, "Snapshot tenant")
+        aci_bd = ACIBridgeDomain.objects.get(aci_tenant=aci_tenant, name="BD1")
+        self.assertEqual(aci_bd.aci_vrf.name, "VRF1")
+        self.assertTrue(aci_bd.arp_flooding_enabled)
+        aci_subnet = ACIBridgeDomainSubnet.objects.get(aci_bridge_domain=aci_bd)
+        self.assertEqual(aci_subnet.name, "10.20.0.1_24")
+        self.assertEqual(str(aci_subnet.gateway_ip_address.address), "10.20.0.1/24")
+        self.assertTrue(aci_subnet.preferred_ip_address_enabled)
+        self.assertTrue(aci_subnet.shared_enabled)
+        entry = ACIContractFilterEntry.objects.get(
+            aci_contract_filter__aci_tenant=aci_tenant
+        )
+        self.assertEqual(entry.destination_from_port, "https")
+        subject_filter = ACIContractSubjectFilter.objects.get(
+            aci_contract_subject__aci_contract__aci_tenant=aci_tenant
+        )
+        self.assertEqual(
+            subject_filter.apply_direction,
+            ContractSubjectFilterApplyDirectionChoices.DIR_BOTH,
+        )
+        self.assertTrue(subject_filter.log_enabled)
+
+        aci_epg = ACIEndpointGroup.objects.get(aci_app_profile__aci_tenant=aci_tenant)
+        self.assertEqual(aci_epg.aci_bridge_domain, aci_bd)
+        relations = ACIContractRelation.objects.filter(_aci_endpoint_group=aci_epg)
+        self.assertEqual(
+            sorted(relations.values_list("role", flat=True)), ["cons", "prov"]
+        )
+        self.assertFalse(
+            ACIUSegEndpointGroup.objects.filter(
+                aci_app_profile__aci_tenant=aci_tenant
+            ).exists()
+        )
+
+    def test_ingest_reports_invalid_objects(self) -> None:
+        """Test objects with unresolvable references are skipped."""
+        result = self.ingest("tenant.json")
+
+        self.assertEqual(
+            [error["dn"] for error in result.errors],
+            ["uni/tn-ACISnapshotTenant/BD-BDInvalid"],
+        )
+        self.assertFalse(ACIBridgeDomain.objects.filter(name="BDInvalid").exists())
+
+    def test_ingest_updates_existing_objects(self) -> None:
+        """Test a repeated ingest updates the objects in place."""
+        self.ingest("tenant.json")
+        aci_bd = ACIBridgeDomain.objects.get(name="BD1")
+        aci_bd.arp_flooding_enabled = False
+        aci_bd.save()
+        gateway_ip_address = ACIBridgeDomainSubnet.objects.get(
+            aci_bridge_domain=aci_bd
+        ).gateway_ip_address
+
+        result = self.ingest("tenant.json")
+
+        aci_bd.refresh_from_db()
+        self.assertTrue(aci_bd.arp_flooding_enabled)
+        self.assertEqual(aci_bd.content_hash, get_content_hash(aci_bd))
+        self.assertEqual(ACIBridgeDomain.objects.filter(name="BD1").count(), 1)
+        self.assertEqual(
+            ACIBridgeDomainSubnet.objects.get(
+                aci_bridge_domain=aci_bd
+            ).gateway_ip_address,
+            gateway_ip_address,
+        )
+        self.assertEqual(result.counts["ipam.IPAddress"], 0)
+
+    def test_ingest_subject_filter_directions(self) -> None:
+        """Test subject filters of vzInTerm/vzOutTerm get their direction."""
+        result = self.ingest("tenant.xml")
+
+        aci_subject = ACIContractSubject.objects.get(
+            aci_contract__aci_tenant__name="ACISnapshotTenantXML"
+        )
+        self.assertFalse(aci_subject.apply_both_directions_enabled)
+        self.assertEqual(
+            list(
+                aci_subject.aci_contract_subject_filters.values_list(
+                    "apply_direction", flat=True
+                )
+            ),
+            [ContractSubjectFilterApplyDirectionChoices.DIR_CONS_TO_PROV],
+        )
+        self.assertEqual(
+            [error["dn"] for error in result.errors],
+            [
+                (
+                    "uni/tn-ACISnapshotTenantXML/brc-Contract1/subj-Subject1"
+                    "/outtmnl/rsfiltAtt-FilterMissing"
+                )
+            ],
+        )
+
+    def test_ingest_resolves_common_objects(self) -> None:
+        """Test references are resolved to objects in the tenant 'common'."""
+        aci_tenant_common = ACITenant.objects.get_or_create(
+            name="common", aci_fabric=self.aci_fabric
+        )[0]
+        aci_vrf_common = ACIVRF.objects.create(
+            name="VRFCommon", aci_tenant=aci_tenant_common
+        )
+        tenant = ManagedObject(
+            "fvTenant",
+            {"name": "ACISnapshotTenantCommon"},
+            (
+                ManagedObject(
+                    "fvBD",
+                    {"name": "BD1"},
+                    (ManagedObject("fvRsCtx", {"tnFvCtxName": "VRFCommon"}),),
+                ),
+            ),
+        )
+
+        result = SnapshotIngester(self.aci_fabric).ingest([tenant])
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(
+            ACIBridgeDomain.objects.get(
+                aci_tenant__name="ACISnapshotTenantCommon"
+            ).aci_vrf,
+            aci_vrf_common,
+        )
+
+    def test_ingest_rejects_invalid_values_and_duplicates(self) -> None:
+        """Test invalid field values and duplicate objects are reported."""
+        tenant = ManagedObject(
+            "fvTenant",
+            {"name": "ACISnapshotTenantInvalid"},
+            (
+                ManagedObject("fvCtx", {"name": "VRF 1"}),
+                ManagedObject("vzBrCP", {"name": "Contract1"}),
+                ManagedObject("vzBrCP", {"name": "Contract1"}),
+            ),
+        )
+
+        result = SnapshotIngester(self.aci_fabric).ingest([tenant])
+
+        self.assertEqual(
+            [error["dn"] for error in result.errors],
+            [
+                "uni/tn-ACISnapshotTenantInvalid/ctx-VRF 1",
+                "uni/tn-ACISnapshotTenantInvalid/brc-Contract1",
+            ],
+        )
+        self.assertIn("name", result.errors[0]["error"])
+        self.assertEqual(
+            ACIContract.objects.filter(
+                aci_tenant__name="ACISnapshotTenantInvalid"
+            ).count(),
+            1,
+        )
+
+    def test_ingest_rejects_unique_constraint_violations(self) -> None:
+        """Test objects violating other unique constraints are reported."""
+
+        def get_tenant(*subnets: ManagedObject) -> ManagedObject:
+            return ManagedObject(
+                "fvTenant",
+                {"name": "ACISnapshotTenantUnique"},
+                (
+                    ManagedObject("fvCtx", {"name": "VRF1"}),
+                    ManagedObject(
+                        "fvBD",
+                        {"name": "BD1"},
+                        (ManagedObject("fvRsCtx", {"tnFvCtxName": "VRF1"}), *subnets),
+                    ),
+                ),
+            )
+
+        ingester = SnapshotIngester(self.aci_fabric)
+        ingester.ingest(
+            [
+                get_tenant(
+                    ManagedObject(
+                        "fvSubnet",
+                        {"ip": "10.70.0.1/24", "name": "Subnet1", "preferred": "yes"},
+                    )
+                )
+            ]
+        )
+        # A second preferred subnet conflicts with the existing subnet
+        result = SnapshotIngester(self.aci_fabric).ingest(
+            [
+                get_tenant(
+                    ManagedObject(
+                        "fvSubnet",
+                        {"ip": "10.71.0.1/24", "name": "Subnet2", "preferred": "yes"},
+                    )
+                )
+            ]
+        )
+
+        self.assertEqual(
+            [error["dn"] for error in result.errors],
+            ["uni/tn-ACISnapshotTenantUnique/BD-BD1/subnet-[10.71.0.1/24]"],
+        )
+        self.assertEqual(
+            ACIBridgeDomainSubnet.objects.filter(
+                aci_bridge_domain__name="BD1",
+                aci_bridge_domain__aci_tenant__name="ACISnapshotTenantUnique",
+            ).count(),
+            1,
+        )
+        self.assertFalse(IPAddress.objects.filter(address="10.71.0.1/24").exists())
+
+    def test_ingest_rejects_model_rule_violations(self) -> None:
+        """Test objects failing the model rules are reported."""
+        tenant = ManagedObject(
+            "fvTenant",
+            {"name": "ACISnapshotTenantRules"},
+            (
+                ManagedObject(
+                    "vzFilter",
+                    {"name": "Filter1"},
+                    (
+                        ManagedObject(
+                            "vzEntry", {"name": "Valid", "etherT": "ip", "prot": "tcp"}
+                        ),
+                        # The IP protocol requires an IP ether type
+                        ManagedObject(
+                            "vzEntry",
+                            {"name": "Invalid", "etherT": "arp", "prot": "tcp"},
+                        ),
+                    ),
+                ),
+            ),
+        )
+
+        result = SnapshotIngester(self.aci_fabric).ingest([tenant])
+
+        self.assertEqual(
+            [error["dn"] for error in result.errors],
+            ["uni/tn-ACISnapshotTenantRules/flt-Filter1/e-Invalid"],
+        )
+        self.assertIn("ip_protocol", result.errors[0]["error"])
+        self.assertEqual(
+            list(
+                ACIContractFilterEntry.objects.filter(
+                    aci_contract_filter__aci_tenant__name="ACISnapshotTenantRules"
+                ).values_list("name", flat=True)
+            ),
+            ["Valid"],
+        )
+
+    def test_ingest_reports_integrity_errors(self) -> None:
+        """Test a tenant failing to be written is rolled back and reported."""
+        ingester = SnapshotIngester(self.aci_fabric)
+        with patch.object(
+            ingester, "_ingest_contracts", side_effect=IntegrityError("conflict")
+        ):
+            result = ingester.ingest(
+                iter_snapshot_tenants(FIXTURES_PATH / "tenant.json")
+            )
+
+        self.assertEqual(result.tenants, [])
+        self.assertEqual(result.counts, {})
+        self.assertEqual(
+            [error["dn"] for error in result.errors],
+            ["uni/tn-ACISnapshotTenant/BD-BDInvalid", "uni/tn-ACISnapshotTenant"],
+        )
+        self.assertFalse(ACITenant.objects.filter(name="ACISnapshotTenant").exists())
+
+    def test_ingest_resumes_from_checkpoint(self) -> None:
+        """Test tenants recorded in the checkpoint are skipped."""
+        progress = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "checkpoint.json"
+            self.ingest(
+                "tenant.json",
+                checkpoint=SnapshotCheckpoint(path),
+                progress=lambda name, result: progress.append(name),
+            )
+            result = self.ingest("tenant.json", checkpoint=SnapshotCheckpoint(path))
+
+        self.assertEqual(progress, ["ACISnapshotTenant"])
+        self.assertEqual(result.tenants, [])
+        self.assertEqual(result.skipped_tenants, ["ACISnapshotTenant"])
+        self.assertEqual(result.counts, {})
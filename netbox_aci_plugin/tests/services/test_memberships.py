@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the materialized membership of ACI Endpoint Security Groups."""
+
+from ...models.tenant.bridge_domains import ACIBridgeDomain
+from ...models.tenant.endpoint_groups import ACIEndpointGroup, ACIUSegEndpointGroup
+from ...models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+    ACIEsgEndpointSelector,
+    ACIEsgMembership,
+)
+from ...models.tenant.vrfs import ACIVRF
+from ...services.memberships import get_esg_memberships, refresh_esg_memberships
+from ..models.base import ACIBaseTestCase
+
+
+class ESGMembershipTestCase(ACIBaseTestCase):
+    """Test case for the materialized membership of ACI ESGs."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ESG selecting endpoint groups and endpoints."""
+        super().setUpTestData()
+        cls.aci_vrf_other = ACIVRF.objects.create(
+            name="ACITestMembershipVRF", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_bd_other = ACIBridgeDomain.objects.create(
+            name="ACITestMembershipBD",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf_other,
+        )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestMembershipEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        cls.aci_useg_epg = ACIUSegEndpointGroup.objects.create(
+            name="ACITestMembershipUSegEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        cls.aci_esg = ACIEndpointSecurityGroup.objects.create(
+            name="ACITestMembershipESG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_vrf=cls.aci_vrf,
+        )
+        cls.aci_epg_selector = ACIEsgEndpointGroupSelector.objects.create(
+            name="ACITestMembershipEPGSelector",
+            aci_endpoint_security_group=cls.aci_esg,
+            aci_epg_object=cls.aci_epg,
+        )
+        ACIEsgEndpointGroupSelector.objects.create(
+            name="ACITestMembershipUSegEPGSelector",
+            aci_endpoint_security_group=cls.aci_esg,
+            aci_epg_object=cls.aci_useg_epg,
+        )
+        cls.aci_ip_selector = ACIEsgEndpointSelector.objects.create(
+            name="ACITestMembershipIPSelector",
+            aci_endpoint_security_group=cls.aci_esg,
+            ep_object=cls.ip_address1,
+        )
+        cls.aci_prefix_selector = ACIEsgEndpointSelector.objects.create(
+            name="ACITestMembershipPrefixSelector",
+            aci_endpoint_security_group=cls.aci_esg,
+            ep_object=cls.prefix1,
+        )
+
+    def get_members(self) -> dict:
+        """Return the ACI VRF IDs of the ESG members by member."""
+        return {
+            membership.member: membership.aci_vrf_id
+            for membership in ACIEsgMembership.objects.filter(
+                aci_endpoint_security_group=self.aci_esg
+            )
+        }
+
+    def test_selector_changes(self) -> None:
+        """Test saving and deleting selectors maintains the memberships."""
+        self.assertEqual(
+            self.get_members(),
+            {
+                self.aci_epg: self.aci_vrf.pk,
+                self.aci_useg_epg: self.aci_vrf.pk,
+                self.ip_address1: self.aci_vrf.pk,
+                self.prefix1: self.aci_vrf.pk,
+            },
+        )
+
+        aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestMembershipEPG2",
+            aci_app_profile=self.aci_app_profile,
+            aci_bridge_domain=self.aci_bd,
+        )
+        self.aci_epg_selector.aci_epg_object = aci_epg
+        self.aci_epg_selector.save()
+        self.aci_prefix_selector.ep_object = None
+        self.aci_prefix_selector.save()
+        self.aci_ip_selector.delete()
+
+        self.assertEqual(
+            self.get_members(),
+            {aci_epg: self.aci_vrf.pk, self.aci_useg_epg: self.aci_vrf.pk},
+        )
+
+    def test_vrf_changes(self) -> None:
+        """Test the VRF of the members follows the ESG, EPG and BD changes."""
+        self.aci_esg.aci_vrf = self.aci_vrf_other
+        self.aci_esg.save()
+        self.aci_epg.aci_bridge_domain = self.aci_bd_other
+        self.aci_epg.save()
+        self.assertEqual(
+            self.get_members(),
+            {
+                self.aci_epg: self.aci_vrf_other.pk,
+                self.aci_useg_epg: self.aci_vrf.pk,
+                self.ip_address1: self.aci_vrf_other.pk,
+                self.prefix1: self.aci_vrf_other.pk,
+            },
+        )
+
+        self.aci_bd.aci_vrf = self.aci_vrf_other
+        self.aci_bd.save()
+        self.assertEqual(set(self.get_members().values()), {self.aci_vrf_other.pk})
+
+    def test_refresh(self) -> None:
+        """Test the memberships are read with one query per selector model."""
+        ACIEsgMembership.objects.all().delete()
+        with self.assertNumQueries(2):
+            memberships = list(
+                get_esg_memberships(
+                    ACIEsgEndpointGroupSelector.objects.all(),
+                    ACIEsgEndpointSelector.objects.all(),
+                )
+            )
+        self.assertEqual(len(memberships), 4)
+
+        self.assertEqual(refresh_esg_memberships([self.aci_esg.pk]), 4)
+        self.assertEqual(len(self.get_members()), 4)
@@ -0,0 +1,258 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the bulk onboarding of ACI Nodes."""
+
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from netaddr import IPNetwork
+
+from dcim.models import Device, Location, Region, Site, SiteGroup
+from ipam.choices import IPAddressStatusChoices
+from ipam.models import Prefix
+
+from ...choices import NodeRoleChoices, NodeTypeChoices
+from ...models.fabric.nodes import ACINode
+from ...models.fabric.pods import ACIPod
+from ...services.onboarding import (
+    NodeOnboarding,
+    NodeOnboardingRow,
+    get_scope_filter,
+)
+from ..models.base import ACIBaseTestCase
+
+
+class NodeOnboardingTestCase(ACIBaseTestCase):
+    """Test case for the bulk onboarding of ACI Nodes."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up devices inside and outside of the ACI Pod scope."""
+        super().setUpTestData()
+
+        cls.devices = [
+            Device.objects.create(
+                name=f"ACITestOnboardingDevice{i}",
+                device_type=cls.device_type1,
+                role=cls.device_role1,
+                site=cls.site,
+            )
+            for i in range(3)
+        ]
+        cls.site_other = Site.objects.create(
+            name="ACITestOnboardingSite", slug="acitestonboardingsite"
+        )
+        cls.device_other_site = Device.objects.create(
+            name="ACITestOnboardingDeviceOther",
+            device_type=cls.device_type1,
+            role=cls.device_role1,
+            site=cls.site_other,
+        )
+
+    def new_device_row(self, name: str, **kwargs) -> NodeOnboardingRow:
+        """Return an onboarding row of a new device."""
+        return NodeOnboardingRow(
+            name=name,
+            device_type=self.device_type1.pk,
+            device_role=self.device_role1.pk,
+            **kwargs,
+        )
+
+    def test_onboard(self) -> None:
+        """Test onboarding nodes of existing and new devices."""
+        result = NodeOnboarding(self.aci_pod).onboard(
+            [
+                NodeOnboardingRow(device=self.devices[0].pk),
+                NodeOnboardingRow(
+                    name="ACITestOnboardingSpine",
+                    device=self.devices[1].pk,
+                    role=NodeRoleChoices.ROLE_SPINE,
+                ),
+                NodeOnboardingRow(
+                    device=self.devices[2].pk, role=NodeRoleChoices.ROLE_APIC
+                ),
+                self.new_device_row(
+                    "ACITestOnboardingLeafNew",
+                    node_type=NodeTypeChoices.TYPE_REMOTE_LEAF_WAN,
+                ),
+            ]
+        )
+        self.assertEqual(
+            result.counts,
+            {"dcim.Device": 1, "ipam.IPAddress": 4, "netbox_aci_plugin.ACINode": 4},
+        )
+        self.assertEqual(
+            [(node["name"], node["node_id"]) for node in result.serialize()["nodes"]],
+            [
+                ("ACITestOnboardingDevice0", 102),
+                ("ACITestOnboardingSpine", 103),
+                ("ACITestOnboardingDevice2", 1),
+                ("ACITestOnboardingLeafNew", 104),
+            ],
+        )
+
+        aci_node = ACINode.objects.get(aci_pod=self.aci_pod, node_id=104)
+        self.assertEqual(aci_node.node_type, NodeTypeChoices.TYPE_REMOTE_LEAF_WAN)
+        self.assertEqual(aci_node.node_object.name, "ACITestOnboardingLeafNew")
+        self.assertEqual(aci_node._device, aci_node.node_object)  # noqa: SLF001
+        self.assertEqual(aci_node.node_object.site, self.site)
+        self.assertEqual(str(aci_node.tep_ip_address.address), "10.0.0.5/19")
+        self.assertEqual(
+            aci_node.tep_ip_address.status, IPAddressStatusChoices.STATUS_ACTIVE
+        )
+        self.assertNotEqual(aci_node.content_hash, "")
+        aci_node.full_clean()
+
+    def test_onboard_without_tep_pool(self) -> None:
+        """Test onboarding nodes into a pod without a TEP pool."""
+        aci_pod = ACIPod.objects.create(
+            name="ACITestOnboardingPodNoPool", aci_fabric=self.aci_fabric, pod_id=2
+        )
+        result = NodeOnboarding(aci_pod).onboard(
+            [NodeOnboardingRow(device=self.device_other_site.pk)]
+        )
+        self.assertEqual(result.counts["ipam.IPAddress"], 0)
+        self.assertIsNone(result.aci_nodes[0].tep_ip_address_id)
+
+    def test_onboard_invalid_rows(self) -> None:
+        """Test the errors of all invalid nodes are raised at once."""
+        existing_device = self.aci_node_object1
+        with self.assertRaises(ValidationError) as cm:
+            NodeOnboarding(self.aci_pod).onboard(
+                [
+                    NodeOnboardingRow(device=0),
+                    NodeOnboardingRow(name="ACITestNodeX", device=existing_device.pk),
+                    NodeOnboardingRow(
+                        name="ACITestNodeY", device=self.device_other_site.pk
+                    ),
+                    NodeOnboardingRow(name="ACITestNodeZ", device=self.devices[0].pk),
+                    NodeOnboardingRow(name="ACITestNodeZ", device=self.devices[0].pk),
+                    NodeOnboardingRow(name=self.aci_node.name, device_type=0),
+                    self.new_device_row("ACITestOnboardingDevice1", role="invalid"),
+                ]
+            )
+        messages = cm.exception.messages
+        self.assertEqual(
+            [message.split(":", 1)[0] for message in messages],
+            [
+                "Node 0 ()",
+                "Node 0 ()",
+                "Node 1 (ACITestNodeX)",
+                "Node 2 (ACITestNodeY)",
+                "Node 3 (ACITestNodeZ)",
+                "Node 3 (ACITestNodeZ)",
+                "Node 4 (ACITestNodeZ)",
+                "Node 4 (ACITestNodeZ)",
+                f"Node 5 ({self.aci_node.name})",
+                f"Node 5 ({self.aci_node.name})",
+                f"Node 5 ({self.aci_node.name})",
+                f"Node 5 ({self.aci_node.name})",
+                "Node 6 (ACITestOnboardingDevice1)",
+                "Node 6 (ACITestOnboardingDevice1)",
+            ],
+        )
+        self.assertIn("Node 0 (): Device 0 does not exist.", messages)
+        self.assertIn(
+            "Node 2 (ACITestNodeY): Device "
+            f"{self.device_other_site.pk} does not match the Pod's scope.",
+            messages,
+        )
+        self.assertIn(
+            "Node 6 (ACITestOnboardingDevice1): The device name "
+            "ACITestOnboardingDevice1 is not unique within the site.",
+            messages,
+        )
+        self.assertEqual(ACINode.objects.count(), 1)
+
+    def test_onboard_new_device_requires_site(self) -> None:
+        """Test new devices require a pod scoped to a site or location."""
+        aci_pod = ACIPod.objects.create(
+            name="ACITestOnboardingPodNoScope", aci_fabric=self.aci_fabric, pod_id=3
+        )
+        with self.assertRaises(ValidationError):
+            NodeOnboarding(aci_pod).onboard(
+                [self.new_device_row("ACITestOnboardingLeafNoSite")]
+            )
+
+    def test_onboard_exhausted_tep_pool(self) -> None:
+        """Test no object is created if the TEP pool is exhausted."""
+        aci_pod = ACIPod.objects.create(
+            name="ACITestOnboardingPodSmallPool",
+            aci_fabric=self.aci_fabric,
+            pod_id=4,
+            tep_pool=Prefix.objects.create(prefix="10.9.0.0/30"),
+            scope=self.site,
+        )
+        with self.assertRaises(ValidationError):
+            NodeOnboarding(aci_pod).onboard(
+                [self.new_device_row(f"ACITestOnboardingLeaf{i}") for i in range(3)]
+            )
+        self.assertFalse(
+            Device.objects.filter(name__startswith="ACITestOnboardingLeaf").exists()
+        )
+
+    def test_onboard_duplicate_tep_ip_address(self) -> None:
+        """Test a TEP IP address written meanwhile is rejected as duplicate."""
+        address = self.aci_node_tep_ip_address.address
+        with (
+            patch(
+                "netbox_aci_plugin.services.onboarding.allocate_tep_addresses",
+                return_value=[IPNetwork(f"{address.ip}/19")],
+            ),
+            self.assertRaises(ValidationError) as cm,
+        ):
+            NodeOnboarding(self.aci_pod).onboard(
+                [NodeOnboardingRow(device=self.devices[0].pk)]
+            )
+        self.assertIn(str(address), cm.exception.messages[0])
+        self.assertEqual(ACINode.objects.count(), 1)
+
+    def test_onboard_concurrent_conflict(self) -> None:
+        """Test a conflicting concurrent node is reported as invalid."""
+        aci_pod = ACIPod.objects.create(
+            name="ACITestOnboardingPodConcurrent", aci_fabric=self.aci_fabric, pod_id=5
+        )
+        onboarding = NodeOnboarding(self.aci_pod)
+        validate = onboarding.validate
+
+        def validate_concurrently(rows: list[NodeOnboardingRow]) -> None:
+            """Validate the rows, then assign the device in another pod."""
+            validate(rows)
+            ACINode.objects.create(
+                name="ACITestOnboardingConcurrent",
+                aci_pod=aci_pod,
+                node_id=101,
+                node_object=self.devices[0],
+            )
+
+        with (
+            patch.object(onboarding, "validate", side_effect=validate_concurrently),
+            self.assertRaises(ValidationError) as cm,
+        ):
+            onboarding.onboard([NodeOnboardingRow(device=self.devices[0].pk)])
+        self.assertIn("could not be written", cm.exception.messages[0])
+        self.assertEqual(ACINode.objects.count(), 1)
+
+    def test_get_scope_filter(self) -> None:
+        """Test the scope filter matches the devices within the scope."""
+        region = Region.objects.create(name="ACITestRegion", slug="acitestregion")
+        site_group = SiteGroup.objects.create(
+            name="ACITestSiteGroup", slug="acitestsitegroup"
+        )
+        self.site_other.region = region
+        self.site_other.group = site_group
+        self.site_other.save()
+        location = Location.objects.create(
+            name="ACITestLocation", slug="acitestlocation", site=self.site_other
+        )
+        self.device_other_site.location = location
+        self.device_other_site.save()
+
+        for scope in (self.site_other, location, region, site_group):
+            with self.subTest(scope=scope):
+                self.assertQuerySetEqual(
+                    Device.objects.filter(get_scope_filter(scope)),
+                    [self.device_other_site],
+                )
@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the route leaks of the shared services across ACI VRFs."""
+
+from unittest.mock import patch
+
+from ipam.models import IPAddress
+
+from ...choices import ContractRelationRoleChoices, ContractScopeChoices
+from ...jobs import ACIRouteLeakRefreshJob
+from ...models.access_policies.domains import ACIRoutedDomain
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ...models.tenant.contracts import ACIContract, ACIContractRelation
+from ...models.tenant.endpoint_groups import ACIEndpointGroup
+from ...models.tenant.l3outs import (
+    ACIExternalEndpointGroup,
+    ACIExternalSubnet,
+    ACIL3Out,
+)
+from ...models.tenant.vrfs import ACIVRF, ACIRouteLeak
+from ...services.route_leaks import (
+    bulk_route_leak_changes,
+    compute_route_leaks,
+    get_stale_fabric_ids,
+    invalidate_route_leaks,
+    refresh_route_leaks,
+)
+from ..models.base import ACIBaseTestCase
+
+
+class RouteLeakTestCase(ACIBaseTestCase):
+    """Test case for the route leaks between the VRFs of an ACI Fabric."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an EPG providing a global contract to another VRF."""
+        super().setUpTestData()
+        cls.aci_vrf_other = ACIVRF.objects.create(
+            name="ACITestLeakVRF", aci_tenant=cls.aci_tenant
+        )
+        aci_bd_other = ACIBridgeDomain.objects.create(
+            name="ACITestLeakBD",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf_other,
+        )
+        for name, address, shared_enabled in (
+            ("ACITestLeakSharedSubnet", "10.40.0.1/24", True),
+            ("ACITestLeakPrivateSubnet", "10.41.0.1/24", False),
+        ):
+            ACIBridgeDomainSubnet.objects.create(
+                name=name,
+                aci_bridge_domain=cls.aci_bd,
+                gateway_ip_address=IPAddress.objects.create(address=address),
+                shared_enabled=shared_enabled,
+            )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestLeakEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        cls.aci_epg_other = ACIEndpointGroup.objects.create(
+            name="ACITestLeakOtherEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=aci_bd_other,
+        )
+        cls.aci_ext_epg = ACIExternalEndpointGroup.objects.create(
+            name="ACITestLeakExtEPG",
+            aci_l3out=ACIL3Out.objects.create(
+                name="ACITestLeakL3Out",
+                aci_tenant=cls.aci_tenant,
+                aci_vrf=cls.aci_vrf_other,
+                aci_routed_domain=ACIRoutedDomain.objects.create(
+                    name="ACITestLeakRoutedDomain", aci_fabric=cls.aci_fabric
+                ),
+            ),
+        )
+        cls.aci_contract = ACIContract.objects.create(
+            name="ACITestLeakContract",
+            aci_tenant=cls.aci_tenant,
+            scope=ContractScopeChoices.SCOPE_GLOBAL,
+        )
+        for aci_object, role in (
+            (cls.aci_epg, ContractRelationRoleChoices.ROLE_PROVIDER),
+            (cls.aci_epg_other, ContractRelationRoleChoices.ROLE_CONSUMER),
+            (cls.aci_ext_epg, ContractRelationRoleChoices.ROLE_CONSUMER),
+        ):
+            ACIContractRelation.objects.create(
+                aci_contract=cls.aci_contract, aci_object=aci_object, role=role
+            )
+
+    def setUp(self) -> None:
+        """Record the refresh jobs enqueued on commit without running them."""
+        super().setUp()
+        patcher = patch.object(ACIRouteLeakRefreshJob, "enqueue")
+        self.enqueue = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_external_subnet(self, prefix: str, **kwargs) -> ACIExternalSubnet:
+        """Create an external subnet, with shared route control by default."""
+        kwargs.setdefault("shared_route_control_enabled", True)
+        return ACIExternalSubnet.objects.create(
+            name=f"ACITestLeakExtSubnet{prefix}",
+            aci_external_endpoint_group=self.aci_ext_epg,
+            matched_prefix=prefix,
+            **kwargs,
+        )
+
+    def get_leaks(self) -> set[tuple[str, str, str, bool]]:
+        """Return the computed leaks as VRF, source, prefix, and aggregate."""
+        return {
+            (
+                leak.aci_vrf.name,
+                leak.source.name,
+                str(leak.prefix),
+                leak.aggregate,
+            )
+            for leak in compute_route_leaks(self.aci_fabric.pk)
+        }
+
+    def test_compute_leaks(self) -> None:
+        """Test the shared subnets leak into the VRF of the contract peers."""
+        self.create_external_subnet("10.50.0.0/16", shared_security_enabled=True)
+        self.create_external_subnet("10.51.0.0/16", shared_route_control_enabled=False)
+
+        self.assertEqual(
+            self.get_leaks(),
+            {
+                ("ACITestLeakVRF", "ACITestLeakEPG", "10.40.0.0/24", False),
+                ("ACIBaseTestVRF", "ACITestLeakExtEPG", "10.50.0.0/16", False),
+            },
+        )
+
+        # Subnets leak into the VRF of an L3Out only if advertised externally
+        leak = ("ACITestLeakVRF", "ACITestLeakEPG", "10.40.0.0/24", False)
+        ACIContractRelation.objects.filter(
+            _aci_endpoint_group=self.aci_epg_other
+        ).delete()
+        self.assertNotIn(leak, self.get_leaks())
+        ACIBridgeDomainSubnet.objects.filter(shared_enabled=True).update(
+            advertised_externally_enabled=True
+        )
+        self.assertIn(leak, self.get_leaks())
+
+    def test_contract_scope(self) -> None:
+        """Test contracts scoped to a VRF do not leak prefixes."""
+        ACIContract.objects.filter(pk=self.aci_contract.pk).update(
+            scope=ContractScopeChoices.SCOPE_VRF
+        )
+        self.assertEqual(self.get_leaks(), set())
+
+        ACIContract.objects.filter(pk=self.aci_contract.pk).update(
+            scope=ContractScopeChoices.SCOPE_TENANT
+        )
+        self.assertEqual(len(self.get_leaks()), 1)
+
+    def test_aggregate_merging(self) -> None:
+        """Test adjacent aggregates are merged and absorb their prefixes."""
+        for prefix in ("10.0.0.0/9", "10.128.0.0/9"):
+            self.create_external_subnet(
+                prefix, aggregate_shared_route_control_enabled=True
+            )
+        self.create_external_subnet("10.1.0.0/16")
+        self.create_external_subnet("172.16.0.0/16")
+
+        self.assertEqual(
+            {leak for leak in self.get_leaks() if leak[1] == "ACITestLeakExtEPG"},
+            {
+                ("ACIBaseTestVRF", "ACITestLeakExtEPG", "10.0.0.0/8", True),
+                ("ACIBaseTestVRF", "ACITestLeakExtEPG", "172.16.0.0/16", False),
+            },
+        )
+
+    def test_compute_queries(self) -> None:
+        """Test the route leaks of a fabric are computed with three queries."""
+        self.create_external_subnet("10.50.0.0/16")
+        # Warm the content type cache
+        compute_route_leaks(self.aci_fabric.pk)
+        with self.assertNumQueries(3):
+            leaks = compute_route_leaks(self.aci_fabric.pk)
+        self.assertEqual(len(leaks), 2)
+
+    def test_invalidation(self) -> None:
+        """Test changes renew the version token and outdate the route leaks."""
+        fabric_ids = [self.aci_fabric.pk]
+        self.assertEqual(refresh_route_leaks(self.aci_fabric.pk), 1)
+        self.assertEqual(get_stale_fabric_ids(fabric_ids), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_external_subnet("10.50.0.0/16")
+        self.assertEqual(get_stale_fabric_ids(fabric_ids), fabric_ids)
+        self.enqueue.assert_called_once_with(instance=self.aci_fabric)
+        self.assertEqual(refresh_route_leaks(self.aci_fabric.pk), 2)
+        self.assertEqual(get_stale_fabric_ids(fabric_ids), [])
+
+        # A renamed gateway IP address invalidates the leaks of its subnet
+        gateway_ip_address = ACIBridgeDomainSubnet.objects.get(
+            shared_enabled=True
+        ).gateway_ip_address
+        gateway_ip_address.address = "10.42.0.1/24"
+        with self.captureOnCommitCallbacks(execute=True):
+            gateway_ip_address.save()
+        self.assertEqual(get_stale_fabric_ids(fabric_ids), fabric_ids)
+        refresh_route_leaks(self.aci_fabric.pk)
+        self.assertTrue(ACIRouteLeak.objects.filter(prefix="10.42.0.0/24").exists())
+
+    def test_contract_relation_invalidation(self) -> None:
+        """Test adding and deleting a contract relation outdates the leaks."""
+        fabric_ids = [self.aci_fabric.pk]
+        refresh_route_leaks(self.aci_fabric.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            relation = ACIContractRelation.objects.create(
+                aci_contract=self.aci_contract,
+                aci_object=self.aci_ext_epg,
+                role=ContractRelationRoleChoices.ROLE_PROVIDER,
+            )
+        self.assertEqual(get_stale_fabric_ids(fabric_ids), fabric_ids)
+
+        refresh_route_leaks(self.aci_fabric.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            relation.delete()
+        self.assertEqual(get_stale_fabric_ids(fabric_ids), fabric_ids)
+
+    def test_bulk_changes(self) -> None:
+        """Test bulk changes invalidate the route leaks of the fabric once."""
+        with (
+            patch(
+                "netbox_aci_plugin.services.route_leaks.invalidate_route_leaks"
+            ) as invalidate,
+            bulk_route_leak_changes(self.aci_fabric.pk),
+        ):
+            self.create_external_subnet("10.50.0.0/16")
+            self.aci_epg.save()
+        invalidate.assert_called_once_with([self.aci_fabric.pk])
+
+        refresh_route_leaks(self.aci_fabric.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_route_leaks([self.aci_fabric.pk])
+        self.assertEqual(
+            get_stale_fabric_ids([self.aci_fabric.pk]), [self.aci_fabric.pk]
+        )
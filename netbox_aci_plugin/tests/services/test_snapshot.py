@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the offline APIC snapshot reader."""
+
+import io
+import json
+import tarfile
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from ...services import snapshot
+from ...services.snapshot import (
+    SnapshotError,
+    iter_document_tenants,
+    iter_json_tenants,
+    iter_snapshot_tenants,
+    iter_xml_tenants,
+)
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "snapshots"
+
+
+class SnapshotReaderTestCase(SimpleTestCase):
+    """Test case for the APIC snapshot reader."""
+
+    def test_json_snapshot(self) -> None:
+        """Test the tenants of a JSON snapshot are read with their children."""
+        tenants = list(iter_snapshot_tenants(FIXTURES_PATH / "tenant.json"))
+        self.assertEqual(len(tenants), 1)
+        self.assertEqual(tenants[0].attributes["name"], "ACISnapshotTenant")
+        fv_bd = next(tenants[0].get_children("fvBD"))
+        self.assertEqual(
+            [child.apic_class for child in fv_bd.children], ["fvRsCtx", "fvSubnet"]
+        )
+
+    def test_xml_snapshot(self) -> None:
+        """Test the tenants of an XML snapshot are read with their children."""
+        tenants = list(iter_snapshot_tenants(FIXTURES_PATH / "tenant.xml"))
+        self.assertEqual(len(tenants), 1)
+        self.assertEqual(tenants[0].attributes["name"], "ACISnapshotTenantXML")
+        fv_subnet = next(next(tenants[0].get_children("fvBD")).get_children("fvSubnet"))
+        self.assertEqual(fv_subnet.attributes["ip"], "10.30.0.1/24")
+
+    def test_tar_snapshot(self) -> None:
+        """Test the snapshot files of a compressed tar archive are read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "snapshot.tar.gz"
+            with tarfile.open(path, "w:gz") as archive:
+                archive.add(FIXTURES_PATH / "tenant.json", arcname="a/tenant.json")
+                archive.add(FIXTURES_PATH / "tenant.xml", arcname="b/tenant.xml")
+                info = tarfile.TarInfo("README.txt")
+                archive.addfile(info, io.BytesIO(b""))
+            names = [mo.attributes["name"] for mo in iter_snapshot_tenants(path)]
+        self.assertEqual(names, ["ACISnapshotTenant", "ACISnapshotTenantXML"])
+
+    def test_document_tenants(self) -> None:
+        """Test the tenants of a decoded JSON document are read."""
+        document = {
+            "polUni": {
+                "attributes": {},
+                "children": [
+                    {"fvTenant": {"attributes": {"name": "T1"}}},
+                    {"infraInfra": {"attributes": {}}},
+                ],
+            },
+            "imdata": [{"fvTenant": {"attributes": {"name": "T2"}}}, "invalid"],
+        }
+        names = [mo.attributes["name"] for mo in iter_document_tenants(document)]
+        self.assertEqual(names, ["T1", "T2"])
+        self.assertEqual(list(iter_document_tenants({"fvTenant": "invalid"})), [])
+
+    def test_json_snapshot_read_in_small_chunks(self) -> None:
+        """Test tenants and multibyte characters split across reads."""
+        document = {
+            "imdata": [
+                {
+                    "polUni": {
+                        "attributes": {"descr": '{"fvTenant"'},
+                        "children": [
+                            {"fvTenant": {"attributes": {"name": "T1", "descr": "ä"}}},
+                            {"infraInfra": {"attributes": {}}},
+                            {"fvTenant": {"attributes": {"name": "T2"}}},
+                        ],
+                    }
+                }
+            ]
+        }
+        original_size = snapshot.READ_CHUNK_SIZE
+        snapshot.READ_CHUNK_SIZE = 7
+        try:
+            tenants = list(iter_json_tenants(io.BytesIO(json.dumps(document).encode())))
+        finally:
+            snapshot.READ_CHUNK_SIZE = original_size
+        self.assertEqual(
+            [mo.attributes for mo in tenants],
+            [{"name": "T1", "descr": "ä"}, {"name": "T2"}],
+        )
+
+    def test_invalid_snapshots(self) -> None:
+        """Test invalid or missing snapshots raise a snapshot error."""
+        with self.assertRaises(SnapshotError):
+            list(iter_snapshot_tenants(FIXTURES_PATH / "missing.json"))
+        with self.assertRaises(SnapshotError):
+            list(iter_json_tenants(io.BytesIO(b'{"imdata":[{"fvTenant":{"a')))
+        with self.assertRaises(SnapshotError):
+            list(iter_json_tenants(io.BytesIO(b'[{"fvTenant":{}} \xff\xfe')))
+        with self.assertRaises(SnapshotError):
+            list(iter_xml_tenants(io.BytesIO(b"<polUni><fvTenant></polUni>")))
+        with (
+            tempfile.NamedTemporaryFile(suffix=".txt") as fileobj,
+            self.assertRaises(SnapshotError),
+        ):
+            list(iter_snapshot_tenants(fileobj.name))
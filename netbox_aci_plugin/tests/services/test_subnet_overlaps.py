@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the ACI Bridge Domain subnet overlap analyzer."""
+
+from ipam.models import IPAddress
+
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from ...services.subnet_overlaps import find_bridge_domain_subnet_overlaps
+from ..models.base import ACIBaseTestCase
+
+
+class SubnetOverlapAnalyzerTestCase(ACIBaseTestCase):
+    """Test case for the Bridge Domain subnet overlap analyzer."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up overlapping and disjoint Bridge Domain subnets."""
+        super().setUpTestData()
+
+        cls.aci_tenant_common = ACITenant.objects.get_or_create(
+            name="common", aci_fabric=cls.aci_fabric
+        )[0]
+        cls.aci_vrf_common = ACIVRF.objects.create(
+            name="ACITestVRFCommon", aci_tenant=cls.aci_tenant_common
+        )
+        cls.aci_vrf_other = ACIVRF.objects.create(
+            name="ACITestVRFOther", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_bd2 = ACIBridgeDomain.objects.create(
+            name="ACITestBD2", aci_tenant=cls.aci_tenant, aci_vrf=cls.aci_vrf
+        )
+        cls.aci_bd_common1 = ACIBridgeDomain.objects.create(
+            name="ACITestBDCommon1",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf_common,
+        )
+        cls.aci_bd_common2 = ACIBridgeDomain.objects.create(
+            name="ACITestBDCommon2",
+            aci_tenant=cls.aci_tenant_common,
+            aci_vrf=cls.aci_vrf_common,
+        )
+        cls.aci_bd_other = ACIBridgeDomain.objects.create(
+            name="ACITestBDOther", aci_tenant=cls.aci_tenant, aci_vrf=cls.aci_vrf_other
+        )
+
+        def create_subnet(name, aci_bd, address) -> ACIBridgeDomainSubnet:
+            return ACIBridgeDomainSubnet.objects.create(
+                name=name,
+                aci_bridge_domain=aci_bd,
+                gateway_ip_address=IPAddress.objects.create(address=address),
+            )
+
+        # Same VRF: 10.1.0.0/16 encloses 10.1.2.0/24 of another BD
+        cls.subnet_outer = create_subnet("Outer", cls.aci_bd, "10.1.0.1/16")
+        cls.subnet_inner = create_subnet("Inner", cls.aci_bd2, "10.1.2.1/24")
+        # Same BD: nested subnets are not reported
+        create_subnet("SameBD", cls.aci_bd, "10.1.3.1/24")
+        # Same VRF, disjoint subnet
+        create_subnet("Disjoint", cls.aci_bd2, "10.2.0.1/24")
+        # Same VRF, IPv6 subnets of different BDs overlapping
+        cls.subnet_v6_outer = create_subnet("V6Outer", cls.aci_bd, "2001:db8::1/48")
+        cls.subnet_v6_inner = create_subnet("V6Inner", cls.aci_bd2, "2001:db8::2/64")
+        # Common VRF: BDs of different tenants with equal subnets
+        cls.subnet_common1 = create_subnet(
+            "Common1", cls.aci_bd_common1, "172.16.0.1/24"
+        )
+        cls.subnet_common2 = create_subnet(
+            "Common2", cls.aci_bd_common2, "172.16.0.2/24"
+        )
+        # Other VRF: overlapping with the first VRF is permitted
+        create_subnet("OtherVRF", cls.aci_bd_other, "10.1.2.1/25")
+
+    def test_find_overlaps_reports_pairs_per_vrf(self) -> None:
+        """Test the analyzer reports only overlaps of different BDs."""
+        overlaps = find_bridge_domain_subnet_overlaps()
+        pairs = {(o.subnet_id, o.overlapping_subnet_id) for o in overlaps}
+        self.assertEqual(
+            pairs,
+            {
+                (self.subnet_outer.pk, self.subnet_inner.pk),
+                (self.subnet_v6_outer.pk, self.subnet_v6_inner.pk),
+                (self.subnet_common1.pk, self.subnet_common2.pk),
+            },
+        )
+
+    def test_find_overlaps_with_queryset(self) -> None:
+        """Test the analyzer limits the analysis to the given queryset."""
+        overlaps = find_bridge_domain_subnet_overlaps(
+            ACIBridgeDomainSubnet.objects.filter(
+                aci_bridge_domain__aci_vrf=self.aci_vrf_common
+            )
+        )
+        self.assertEqual(len(overlaps), 1)
+        self.assertEqual(overlaps[0].aci_vrf_id, self.aci_vrf_common.pk)
+
+    def test_subnet_overlap_serialize(self) -> None:
+        """Test the serialized representation of a subnet overlap."""
+        overlap = find_bridge_domain_subnet_overlaps(
+            ACIBridgeDomainSubnet.objects.filter(
+                pk__in=(self.subnet_outer.pk, self.subnet_inner.pk)
+            )
+        )[0]
+        self.assertEqual(
+            overlap.serialize(),
+            {
+                "aci_vrf": self.aci_vrf.pk,
+                "aci_bridge_domain_subnet": self.subnet_outer.pk,
+                "subnet": "10.1.0.0/16",
+                "aci_bridge_domain": self.aci_bd.pk,
+                "overlapping_aci_bridge_domain_subnet": self.subnet_inner.pk,
+                "overlapping_subnet": "10.1.2.0/24",
+                "overlapping_aci_bridge_domain": self.aci_bd2.pk,
+            },
+        )
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the deletion plan of ACI Fabrics and ACI Tenants."""
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied, ValidationError
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from users.models import ObjectPermission
+
+from ...models.fabric.fabrics import ACIFabric
+from ...models.fabric.nodes import ACINode
+from ...models.fabric.pods import ACIPod
+from ...models.tenant.app_profiles import ACIAppProfile
+from ...models.tenant.bridge_domains import ACIBridgeDomain
+from ...models.tenant.contracts import ACIContract, ACIContractRelation
+from ...models.tenant.endpoint_security_groups import ACIEsgMembership
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from ...services.teardown import DeletionPlan, get_dependency_order
+from ..models.base import ACIBaseTestCase
+
+
+class DeletionPlanTestCase(ACIBaseTestCase):
+    """Test case for the deletion plan of ACI Fabrics and ACI Tenants."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up a contract relation and a BD of another tenant."""
+        super().setUpTestData()
+
+        cls.aci_contract = ACIContract.objects.create(
+            name="ACITestTeardownContract", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_contract_relation = ACIContractRelation.objects.create(
+            aci_contract=cls.aci_contract, aci_object=cls.aci_vrf
+        )
+        # Bridge Domain of another tenant depending on the VRF
+        cls.aci_tenant_other = ACITenant.objects.create(
+            name="ACITestTeardownTenant", aci_fabric=cls.aci_fabric
+        )
+        cls.aci_bd_other = ACIBridgeDomain.objects.create(
+            name="ACITestTeardownBD",
+            aci_tenant=cls.aci_tenant_other,
+            aci_vrf=cls.aci_vrf,
+        )
+
+    def test_get_dependency_order(self) -> None:
+        """Test the models follow the models they reference."""
+        order = [model for model, _fields in get_dependency_order()]
+        for parent, child in (
+            (ACIFabric, ACIPod),
+            (ACIPod, ACINode),
+            (ACITenant, ACIVRF),
+            (ACIVRF, ACIBridgeDomain),
+            (ACIVRF, ACIContractRelation),
+            (ACIContract, ACIContractRelation),
+        ):
+            with self.subTest(parent=parent, child=child):
+                self.assertLess(order.index(parent), order.index(child))
+        # The derived tables are deleted with their objects
+        self.assertNotIn(ACIEsgMembership, order)
+
+    def test_plan_of_tenant(self) -> None:
+        """Test the plan deletes the dependent objects of the tenant first."""
+        plan = DeletionPlan(self.aci_tenant)
+        models = [step.model for step in plan.steps]
+
+        self.assertEqual(models[-1], ACITenant)
+        self.assertLess(models.index(ACIBridgeDomain), models.index(ACIVRF))
+        self.assertLess(models.index(ACIContractRelation), models.index(ACIVRF))
+        self.assertNotIn(ACIFabric, models)
+        self.assertEqual(
+            plan.steps[models.index(ACIBridgeDomain)].objects,
+            {
+                self.aci_bd.pk: self.aci_bd.name,
+                self.aci_bd_other.pk: "ACITestTeardownBD",
+            },
+        )
+        self.assertEqual(
+            plan.steps[models.index(ACIBridgeDomain)].foreign, {self.aci_bd_other.pk}
+        )
+        self.assertEqual(plan.counts["netbox_aci_plugin.ACITenant"], 1)
+        self.assertEqual(plan.counts["netbox_aci_plugin.ACIAppProfile"], 1)
+
+        data = plan.serialize()
+        self.assertEqual(data["counts"], plan.counts)
+        self.assertEqual(
+            data["foreign_dependents"],
+            [
+                {
+                    "object_type": "netbox_aci_plugin.acibridgedomain",
+                    "count": 1,
+                    "objects": [self.aci_bd_other.pk],
+                }
+            ],
+        )
+        self.assertEqual(
+            data["steps"][-1],
+            {
+                "object_type": "netbox_aci_plugin.acitenant",
+                "count": 1,
+                "objects": [self.aci_tenant.pk],
+            },
+        )
+
+    def test_plan_of_fabric(self) -> None:
+        """Test the tenants of the fabric are not foreign to its plan."""
+        plan = DeletionPlan(self.aci_fabric)
+        self.assertFalse(any(step.foreign for step in plan.steps))
+        self.assertEqual(plan.serialize()["foreign_dependents"], [])
+
+    def test_execute_refuses_foreign_dependents(self) -> None:
+        """Test the dependents of other tenants are deleted if included."""
+        with self.assertRaises(ValidationError):
+            DeletionPlan(self.aci_tenant).execute()
+        self.assertTrue(ACITenant.objects.filter(pk=self.aci_tenant.pk).exists())
+
+        DeletionPlan(self.aci_tenant, include_foreign_dependents=True).execute()
+        self.assertFalse(ACITenant.objects.filter(pk=self.aci_tenant.pk).exists())
+        self.assertFalse(
+            ACIBridgeDomain.objects.filter(pk=self.aci_bd_other.pk).exists()
+        )
+        self.assertTrue(ACITenant.objects.filter(pk=self.aci_tenant_other.pk).exists())
+
+    def test_execute_fabric(self) -> None:
+        """Test executing the plan deletes the fabric and its dependents."""
+        plan = DeletionPlan(self.aci_fabric)
+        counts = plan.execute()
+
+        self.assertEqual(counts["netbox_aci_plugin.ACITenant"], 2)
+        self.assertEqual(counts["netbox_aci_plugin.ACINode"], 1)
+        for model in (ACIFabric, ACIPod, ACINode, ACITenant, ACIAppProfile, ACIVRF):
+            with self.subTest(model=model):
+                self.assertFalse(model.objects.exists())
+
+        object_changes = ObjectChange.objects.filter(
+            action=ObjectChangeActionChoices.ACTION_DELETE
+        )
+        self.assertEqual(object_changes.count(), sum(counts.values()))
+        self.assertEqual(len(set(object_changes.values_list("request_id"))), 1)
+        self.assertEqual(
+            object_changes.get(
+                changed_object_type=ObjectType.objects.get_for_model(
+                    ACIContractRelation
+                )
+            ).object_repr,
+            f"ACI Contract Relation {self.aci_contract_relation.pk}",
+        )
+
+    def test_execute_requires_delete_permission(self) -> None:
+        """Test executing the plan requires deleting every object."""
+        user = get_user_model().objects.create_user(username="acitestteardown")
+        obj_perm = ObjectPermission(name="ACI teardown test delete", actions=["delete"])
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+        user = get_user_model().objects.get(pk=user.pk)
+
+        with self.assertRaises(PermissionDenied):
+            DeletionPlan(self.aci_tenant, user=user).execute()
+        self.assertTrue(ACITenant.objects.filter(pk=self.aci_tenant.pk).exists())
+
+        plan = DeletionPlan(self.aci_tenant, user=user, include_foreign_dependents=True)
+        for step in plan.steps:
+            obj_perm.object_types.add(ObjectType.objects.get_for_model(step.model))
+        plan.user = get_user_model().objects.get(pk=user.pk)
+        plan.execute()
+        self.assertFalse(ACITenant.objects.filter(pk=self.aci_tenant.pk).exists())
+        self.assertEqual(
+            ObjectChange.objects.filter(user_name="acitestteardown").count(),
+            sum(plan.counts.values()),
+        )
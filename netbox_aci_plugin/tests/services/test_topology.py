@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the topology tree of ACI Fabrics."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from core.models import ObjectType
+from users.models import ObjectPermission
+from virtualization.models import VirtualMachine
+
+from ...choices import NodeRoleChoices
+from ...models.fabric.fabrics import ACIFabric
+from ...models.fabric.nodes import ACINode
+from ...models.fabric.pods import ACIPod
+from ...services.topology import FabricTopology
+from ..models.base import ACIBaseTestCase
+
+
+class FabricTopologyTestCase(ACIBaseTestCase):
+    """Test case for the topology tree of ACI Fabrics."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up a virtual ACI Node and an empty ACI Pod and Fabric."""
+        super().setUpTestData()
+
+        cls.virtual_machine = VirtualMachine.objects.create(
+            name="ACITestTopologyVM", site=cls.site
+        )
+        cls.aci_node_virtual = ACINode.objects.create(
+            name="ACITestTopologyNodeVirtual",
+            aci_pod=cls.aci_pod,
+            node_id=201,
+            role=NodeRoleChoices.ROLE_SPINE,
+            node_object=cls.virtual_machine,
+        )
+        cls.aci_pod_empty = ACIPod.objects.create(
+            name="ACITestTopologyPodEmpty", aci_fabric=cls.aci_fabric, pod_id=2
+        )
+        cls.aci_fabric_empty = ACIFabric.objects.create(
+            name="ACITestTopologyFabricEmpty", fabric_id=2, infra_vlan_vid=3900
+        )
+
+    def setUp(self) -> None:
+        """Clear the cached topology trees."""
+        cache.clear()
+
+    def test_build(self) -> None:
+        """Test the tree is built with one query per level."""
+        topology = FabricTopology(
+            ACIFabric.objects.filter(pk__in=(self.aci_fabric.pk,))
+        )
+        with self.assertNumQueries(3):
+            tree = topology.build()
+        self.assertEqual(len(tree), 1)
+        self.assertEqual(tree[0]["fabric_id"], self.aci_fabric.fabric_id)
+        pods = tree[0]["pods"]
+        self.assertEqual([pod["pod_id"] for pod in pods], [1, 2])
+        self.assertEqual(pods[0]["tep_pool"], "10.0.0.0/19")
+        self.assertIsNone(pods[1]["tep_pool"])
+        self.assertEqual(pods[1]["nodes"], [])
+        self.assertEqual(
+            pods[0]["nodes"],
+            [
+                {
+                    "id": self.aci_node.pk,
+                    "name": self.aci_node.name,
+                    "node_id": 101,
+                    "role": NodeRoleChoices.ROLE_LEAF,
+                    "node_type": self.aci_node.node_type,
+                    "node_object": {
+                        "object_type": "dcim.device",
+                        "id": self.aci_node_object1.pk,
+                        "name": self.aci_node_object1.name,
+                    },
+                    "tep_ip_address": {
+                        "id": self.aci_node_tep_ip_address.pk,
+                        "address": "10.0.0.1/19",
+                    },
+                },
+                {
+                    "id": self.aci_node_virtual.pk,
+                    "name": "ACITestTopologyNodeVirtual",
+                    "node_id": 201,
+                    "role": NodeRoleChoices.ROLE_SPINE,
+                    "node_type": self.aci_node_virtual.node_type,
+                    "node_object": {
+                        "object_type": "virtualization.virtualmachine",
+                        "id": self.virtual_machine.pk,
+                        "name": "ACITestTopologyVM",
+                    },
+                    "tep_ip_address": None,
+                },
+            ],
+        )
+
+    def test_build_many_fabrics(self) -> None:
+        """Test the tree contains all fabrics ordered by name."""
+        tree = FabricTopology(ACIFabric.objects.all()).build()
+        self.assertEqual(
+            [fabric["name"] for fabric in tree],
+            [self.aci_fabric.name, "ACITestTopologyFabricEmpty"],
+        )
+        self.assertEqual(tree[1]["pods"], [])
+
+    def test_etag_changes_with_related_objects(self) -> None:
+        """Test the ETag changes if a level of the tree changes."""
+        topology = FabricTopology(ACIFabric.objects.all())
+        with self.assertNumQueries(3):
+            etag = topology.get_etag()
+        self.assertEqual(topology.get_etag(), etag)
+
+        self.aci_node_object1.name = "ACITestTopologyDeviceRenamed"
+        self.aci_node_object1.save()
+        renamed_etag = topology.get_etag()
+        self.assertNotEqual(renamed_etag, etag)
+
+        self.aci_node_virtual.delete()
+        self.assertNotEqual(topology.get_etag(), renamed_etag)
+
+    def test_etag_varies_by_permissions(self) -> None:
+        """Test users with different permissions get different ETags."""
+        user = get_user_model().objects.create_user(username="acitopology")
+        self.assertNotEqual(
+            FabricTopology(ACIFabric.objects.all(), user=user).get_etag(),
+            FabricTopology(ACIFabric.objects.all()).get_etag(),
+        )
+
+    def test_get_or_build(self) -> None:
+        """Test the tree of an ETag is built once and then cached."""
+        topology = FabricTopology(ACIFabric.objects.all())
+        etag = topology.get_etag()
+        tree = topology.get_or_build(etag)
+        with self.assertNumQueries(0):
+            self.assertEqual(topology.get_or_build(etag), tree)
+
+    def test_get_or_build_per_user(self) -> None:
+        """Test users with different constraints get their own trees."""
+        trees = []
+        for index, aci_pod in enumerate((self.aci_pod, self.aci_pod_empty)):
+            user = get_user_model().objects.create_user(
+                username=f"acitopologyconstrained{index}"
+            )
+            obj_perm = ObjectPermission(
+                name=f"ACI topology test view {index}",
+                actions=["view"],
+                constraints={"pk": aci_pod.pk},
+            )
+            obj_perm.save()
+            obj_perm.users.add(user)
+            obj_perm.object_types.add(ObjectType.objects.get_for_model(ACIPod))
+            user = get_user_model().objects.get(pk=user.pk)
+            topology = FabricTopology(
+                ACIFabric.objects.filter(pk=self.aci_fabric.pk), user=user
+            )
+            # Both users share an ETag value
+            trees.append(topology.get_or_build("etag"))
+        self.assertEqual(
+            [[pod["id"] for pod in tree[0]["pods"]] for tree in trees],
+            [[self.aci_pod.pk], [self.aci_pod_empty.pk]],
+        )
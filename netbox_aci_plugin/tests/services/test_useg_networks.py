@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the resolved networks of ACI uSeg Endpoint Groups."""
+
+from ipam.models import IPAddress
+
+from ...models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ...models.tenant.endpoint_groups import (
+    ACIUSegEndpointGroup,
+    ACIUSegNetworkAttribute,
+    ACIUSegResolvedNetwork,
+)
+from ...services.useg_networks import refresh_useg_networks, resolve_useg_networks
+from ..models.base import ACIBaseTestCase
+
+
+class USegResolvedNetworkTestCase(ACIBaseTestCase):
+    """Test case for the resolved networks of ACI uSeg EPGs."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up a uSeg EPG with attributes of each kind."""
+        super().setUpTestData()
+        cls.aci_bd_other = ACIBridgeDomain.objects.create(
+            name="ACITestResolvedBD",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf,
+        )
+        cls.aci_bd_subnet = ACIBridgeDomainSubnet.objects.create(
+            name="ACITestResolvedSubnet",
+            aci_bridge_domain=cls.aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.20.0.1/24"),
+        )
+        cls.aci_useg_epg = ACIUSegEndpointGroup.objects.create(
+            name="ACITestResolvedUSegEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+        cls.attributes = {
+            name: ACIUSegNetworkAttribute.objects.create(
+                name=f"ACITestResolved{name}",
+                aci_useg_endpoint_group=cls.aci_useg_epg,
+                attr_object=attr_object,
+            )
+            for name, attr_object in (
+                ("IP", cls.ip_address1),
+                ("Prefix", cls.prefix1),
+                ("MAC", cls.mac_address1),
+            )
+        }
+        cls.attributes["Subnet"] = ACIUSegNetworkAttribute.objects.create(
+            name="ACITestResolvedSubnet",
+            aci_useg_endpoint_group=cls.aci_useg_epg,
+            use_epg_subnet=True,
+        )
+
+    def get_networks(self) -> set[str]:
+        """Return the resolved networks of the uSeg EPG."""
+        return {
+            str(network.prefix or network.mac_address)
+            for network in ACIUSegResolvedNetwork.objects.filter(
+                aci_useg_endpoint_group=self.aci_useg_epg
+            )
+        }
+
+    def test_attribute_changes(self) -> None:
+        """Test saving attributes and matched objects updates the networks."""
+        self.assertEqual(
+            self.get_networks(),
+            {"192.168.1.1/32", "192.168.1.0/24", "00:00:00:00:00:01", "10.20.0.0/24"},
+        )
+
+        self.ip_address1.address = "192.168.1.5/24"
+        self.ip_address1.save()
+        self.prefix1.prefix = "192.168.0.0/16"
+        self.prefix1.save()
+        self.mac_address1.mac_address = "00:00:00:00:00:03"
+        self.mac_address1.save()
+        attribute = self.attributes["IP"]
+        attribute.attr_object = self.ip_address2
+        attribute.save()
+        self.attributes["Prefix"].delete()
+
+        self.assertEqual(
+            self.get_networks(),
+            {"192.168.1.2/32", "00:00:00:00:00:03", "10.20.0.0/24"},
+        )
+
+    def test_subnet_changes(self) -> None:
+        """Test the EPG subnet follows the subnets of the bridge domain."""
+        ACIBridgeDomainSubnet.objects.create(
+            name="ACITestResolvedSubnet2",
+            aci_bridge_domain=self.aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.21.0.1/24"),
+        )
+        gateway_ip_address = self.aci_bd_subnet.gateway_ip_address
+        gateway_ip_address.address = "10.22.0.1/24"
+        gateway_ip_address.save()
+        self.assertEqual(
+            self.get_networks() - {"192.168.1.1/32", "192.168.1.0/24"},
+            {"00:00:00:00:00:01", "10.21.0.0/24", "10.22.0.0/24"},
+        )
+
+        self.aci_bd_subnet.aci_bridge_domain = self.aci_bd_other
+        self.aci_bd_subnet.save()
+        self.assertNotIn("10.22.0.0/24", self.get_networks())
+
+        self.aci_useg_epg.aci_bridge_domain = self.aci_bd_other
+        self.aci_useg_epg.save()
+        self.assertIn("10.22.0.0/24", self.get_networks())
+        self.assertNotIn("10.21.0.0/24", self.get_networks())
+
+        self.aci_bd_subnet.delete()
+        self.assertNotIn("10.22.0.0/24", self.get_networks())
+
+    def test_refresh(self) -> None:
+        """Test the networks are resolved with two queries and refreshed."""
+        ACIUSegResolvedNetwork.objects.all().delete()
+        attributes = ACIUSegNetworkAttribute.objects.all()
+        with self.assertNumQueries(2):
+            networks = list(resolve_useg_networks(attributes))
+        self.assertEqual(len(networks), 4)
+
+        # An attribute without cached relations resolves to no network
+        attributes.filter(pk=self.attributes["IP"].pk).update(_ip_address=None)
+        self.assertEqual(refresh_useg_networks(attributes.values("pk")), 3)
+        self.assertEqual(len(self.get_networks()), 3)
@@ -0,0 +1,292 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the batch validation of candidate ACI objects."""
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from core.models import ObjectType
+from users.models import ObjectPermission
+
+from ...choices import ContractRelationRoleChoices
+from ...models.access_policies.domains import ACIRoutedDomain
+from ...models.tenant.contracts import ACIContract
+from ...models.tenant.endpoint_groups import ACIEndpointGroup
+from ...models.tenant.l3outs import ACIExternalEndpointGroup, ACIL3Out
+from ...models.tenant.tenants import ACITenant
+from ...models.tenant.vrfs import ACIVRF
+from ...services.validation import (
+    BatchValidator,
+    Candidate,
+    evaluate_condition,
+    validate_objects,
+)
+from ..models.base import ACIBaseTestCase
+
+
+class BatchValidatorTestCase(ACIBaseTestCase):
+    """Test case for the batch validation of candidate ACI objects."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI L3Out and an ACI Contract for the candidates."""
+        super().setUpTestData()
+        cls.aci_routed_domain = ACIRoutedDomain.objects.create(
+            name="ACITestValidationRoutedDomain", aci_fabric=cls.aci_fabric
+        )
+        cls.aci_l3out = ACIL3Out.objects.create(
+            name="ACITestValidationL3Out",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf,
+            aci_routed_domain=cls.aci_routed_domain,
+        )
+        cls.aci_ext_epg = ACIExternalEndpointGroup.objects.create(
+            name="ACITestValidationExtEPG", aci_l3out=cls.aci_l3out
+        )
+        cls.aci_contract = ACIContract.objects.create(
+            name="ACITestValidationContract", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestValidationEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+
+    def validate(self, *candidates: Candidate) -> dict[int, dict]:
+        """Validate the candidates and return the errors by index."""
+        report = validate_objects(candidates)
+        self.assertEqual(report.count, len(candidates))
+        return {error["index"]: error["errors"] for error in report.errors}
+
+    def test_validate_valid_objects(self) -> None:
+        """Test valid candidates of mixed types are reported as valid."""
+        report = validate_objects(
+            [
+                Candidate(
+                    "netbox_aci_plugin.acivrf",
+                    {"name": "ACITestValidationVRF", "aci_tenant": self.aci_tenant.pk},
+                ),
+                Candidate(
+                    "netbox_aci_plugin.ACIExternalSubnet",
+                    {
+                        "name": "ACITestValidationSubnet",
+                        "aci_external_endpoint_group": self.aci_ext_epg.pk,
+                        "matched_prefix": "10.9.0.0/24",
+                    },
+                ),
+                Candidate(
+                    "netbox_aci_plugin.acicontractrelation",
+                    {
+                        "aci_contract": self.aci_contract.pk,
+                        "aci_object_type": "netbox_aci_plugin.aciendpointgroup",
+                        "aci_object_id": self.aci_epg.pk,
+                        "role": ContractRelationRoleChoices.ROLE_PROVIDER,
+                    },
+                ),
+                Candidate(
+                    "netbox_aci_plugin.acivrf",
+                    {"description": "Changed"},
+                    id=self.aci_vrf.pk,
+                ),
+            ]
+        )
+        self.assertTrue(report.valid)
+        self.assertEqual(
+            report.serialize(), {"valid": True, "count": 4, "invalid": 0, "errors": []}
+        )
+        # Nothing is written
+        self.assertFalse(ACIVRF.objects.filter(name="ACITestValidationVRF").exists())
+        self.assertEqual(ACIVRF.objects.get(pk=self.aci_vrf.pk).description, "")
+
+    def test_validate_model_rules(self) -> None:
+        """Test the model rules are applied with the preloaded parents."""
+        errors = self.validate(
+            Candidate(
+                "netbox_aci_plugin.aciexternalsubnet",
+                {
+                    "name": "ACITestValidationSubnet",
+                    "aci_external_endpoint_group": self.aci_ext_epg.pk,
+                    "matched_prefix": "10.9.0.0/24",
+                    "import_route_control_enabled": True,
+                },
+            ),
+            Candidate(
+                "netbox_aci_plugin.acil3out",
+                {
+                    "name": "ACITestValidationL3Out2",
+                    "aci_tenant": self.aci_tenant.pk,
+                    "aci_vrf": self.aci_vrf.pk,
+                    "aci_routed_domain": self.aci_routed_domain.pk,
+                    "eigrp_enabled": True,
+                    "bgp_enabled": True,
+                    "export_route_control_enforcement_enabled": False,
+                },
+            ),
+            Candidate("netbox_aci_plugin.acivrf", {"name": "Invalid Name!"}),
+        )
+        self.assertIn("import_route_control_enabled", errors[0])
+        self.assertIn("eigrp_enabled", errors[1])
+        # The check constraint of the ACI L3Out
+        self.assertIn("__all__", errors[1])
+        self.assertIn("name", errors[2])
+        self.assertEqual(errors[2]["aci_tenant"], ["This field cannot be null."])
+
+    def test_validate_unique_constraints(self) -> None:
+        """Test uniqueness against existing objects and within the batch."""
+        errors = self.validate(
+            Candidate(
+                "netbox_aci_plugin.acivrf",
+                {"name": self.aci_vrf.name, "aci_tenant": self.aci_tenant.pk},
+            ),
+            Candidate(
+                "netbox_aci_plugin.acivrf",
+                {"name": "ACITestValidationVRF", "aci_tenant": self.aci_tenant.pk},
+            ),
+            Candidate(
+                "netbox_aci_plugin.acivrf",
+                {"name": "ACITestValidationVRF", "aci_tenant": self.aci_tenant.pk},
+            ),
+            # Renaming the existing VRF frees its name for the first candidate
+            Candidate(
+                "netbox_aci_plugin.acivrf",
+                {"name": "ACITestValidationVRFRenamed"},
+                id=self.aci_vrf.pk,
+            ),
+            Candidate(
+                "netbox_aci_plugin.acicontractfilter",
+                {"name": "ACITestValidationFilter", "aci_tenant": self.aci_tenant.pk},
+            ),
+        )
+        self.assertEqual(sorted(errors), [1, 2])
+        self.assertEqual(len(errors[1]["__all__"]), 1)
+
+    def test_validate_conditional_unique_constraints(self) -> None:
+        """Test the conditional constraints with their custom messages."""
+        candidates = [
+            Candidate(
+                "netbox_aci_plugin.acibridgedomainsubnet",
+                {
+                    "name": f"ACITestValidationSubnet{index}",
+                    "aci_bridge_domain": self.aci_bd.pk,
+                    "gateway_ip_address": ip_address.pk,
+                    "preferred_ip_address_enabled": True,
+                },
+            )
+            for index, ip_address in enumerate((self.ip_address1, self.ip_address2))
+        ]
+        errors = self.validate(*candidates)
+        self.assertEqual(
+            errors[0]["__all__"],
+            [
+                (
+                    "ACI Bridge Domain with a preferred (primary) gateway IP "
+                    "address already exists."
+                )
+            ],
+        )
+
+    def test_validate_references(self) -> None:
+        """Test missing and invalid references and unknown fields."""
+        errors = self.validate(
+            Candidate("netbox_aci_plugin.acinothing", {}),
+            Candidate(
+                "netbox_aci_plugin.acivrf",
+                {
+                    "name": "ACITestValidationVRF",
+                    "aci_tenant": 0,
+                    "unknown": 1,
+                    "tags": [],
+                    "id": 1,
+                },
+            ),
+            Candidate(
+                "netbox_aci_plugin.acicontractrelation",
+                {
+                    "aci_contract": self.aci_contract.pk,
+                    "aci_object_type": "netbox_aci_plugin.acitenant",
+                    "aci_object_id": self.aci_tenant.pk,
+                    "role": ContractRelationRoleChoices.ROLE_PROVIDER,
+                },
+            ),
+            Candidate(
+                "netbox_aci_plugin.acicontractrelation",
+                {
+                    "aci_contract": self.aci_contract.pk,
+                    "aci_object_type": "invalid",
+                },
+            ),
+            Candidate(
+                "netbox_aci_plugin.acicontractrelation",
+                {
+                    "aci_contract": self.aci_contract.pk,
+                    "aci_object_type": 0,
+                    "aci_object_id": 1,
+                },
+            ),
+            Candidate(
+                "netbox_aci_plugin.acicontractrelation",
+                {
+                    "aci_contract": self.aci_contract.pk,
+                    "aci_object_type": "netbox_aci_plugin.aciendpointgroup",
+                    "aci_object_id": 0,
+                },
+            ),
+            Candidate("netbox_aci_plugin.acivrf", {}, id=0),
+            Candidate("netbox_aci_plugin.acitenant", {}, id=self.aci_tenant.pk),
+            Candidate("netbox_aci_plugin.acitenant", {}, id=self.aci_tenant.pk),
+            # Derived tables are not validated
+            Candidate("netbox_aci_plugin.aciesgmembership", {}),
+        )
+        self.assertEqual(errors[0], {"object_type": ["Unknown ACI object type."]})
+        self.assertEqual(len(errors[1]["aci_tenant"]), 1)
+        for name in ("unknown", "tags", "id"):
+            self.assertEqual(errors[1][name], ["Unknown field."])
+        # The object type is limited to the choices of the field
+        self.assertIn("aci_object_type", errors[2])
+        self.assertEqual(errors[3]["aci_object_type"], ["Unknown object type: invalid"])
+        self.assertIn("aci_object_type", errors[4])
+        self.assertEqual(
+            errors[5], {"aci_object": ["ACI Endpoint Group with ID 0 does not exist."]}
+        )
+        self.assertEqual(errors[6], {"id": ["The object does not exist."]})
+        self.assertNotIn(7, errors)
+        self.assertEqual(errors[8], {"id": ["The object is duplicated in the batch."]})
+        self.assertEqual(errors[9], {"object_type": ["Unknown ACI object type."]})
+
+    def test_validate_restricts_references(self) -> None:
+        """Test objects the user may not view are treated as missing."""
+        user = get_user_model().objects.create_user(username="acitestvalidation")
+        obj_perm = ObjectPermission(name="ACI validation test", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACIVRF))
+        user = get_user_model().objects.get(pk=user.pk)
+        candidate = Candidate(
+            "netbox_aci_plugin.acibridgedomain",
+            {
+                "name": "ACITestValidationBD",
+                "aci_tenant": self.aci_tenant.pk,
+                "aci_vrf": self.aci_vrf.pk,
+            },
+        )
+
+        report = BatchValidator(user=user).validate([candidate])
+
+        self.assertEqual(list(report.errors[0]["errors"]), ["aci_tenant"])
+
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+        user = get_user_model().objects.get(pk=user.pk)
+        self.assertTrue(BatchValidator(user=user).validate([candidate]).valid)
+
+    def test_evaluate_condition(self) -> None:
+        """Test the conditions are evaluated on the field values."""
+        aci_vrf = ACIVRF(name="ACITestValidationVRF", nb_vrf=None)
+        self.assertTrue(evaluate_condition(Q(name="ACITestValidationVRF"), aci_vrf))
+        self.assertTrue(evaluate_condition(Q(nb_vrf__isnull=True), aci_vrf))
+        self.assertTrue(evaluate_condition(Q(name__startswith="ACITest"), aci_vrf))
+        self.assertTrue(evaluate_condition(~Q(name="Other") | Q(name="Other"), aci_vrf))
+        self.assertFalse(
+            evaluate_condition(Q(name="Other") & Q(nb_vrf__isnull=True), aci_vrf)
+        )
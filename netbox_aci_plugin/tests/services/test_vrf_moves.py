@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the impact analysis of ACI Bridge Domain VRF moves."""
+
+from ipam.models import IPAddress
+
+from ...choices import ContractRelationRoleChoices, ContractScopeChoices
+from ...models.access_policies.domains import ACIRoutedDomain
+from ...models.tenant.bridge_domains import (
+    ACIBridgeDomain,
+    ACIBridgeDomainL3OutBinding,
+    ACIBridgeDomainSubnet,
+)
+from ...models.tenant.contracts import ACIContract, ACIContractRelation
+from ...models.tenant.endpoint_groups import ACIEndpointGroup
+from ...models.tenant.endpoint_security_groups import (
+    ACIEndpointSecurityGroup,
+    ACIEsgEndpointGroupSelector,
+)
+from ...models.tenant.l3outs import ACIL3Out
+from ...models.tenant.vrfs import ACIVRF
+from ...services.vrf_moves import (
+    BridgeDomainVRFMoves,
+    analyze_bridge_domain_vrf_moves,
+)
+from ..models.base import ACIBaseTestCase
+
+
+class BridgeDomainVRFMovesTestCase(ACIBaseTestCase):
+    """Test case for the impact analysis of Bridge Domain VRF moves."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up the objects depending on the VRF of a Bridge Domain."""
+        super().setUpTestData()
+
+        cls.aci_vrf2 = ACIVRF.objects.create(
+            name="ACITestVRFMovesVRF2", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_bd2 = ACIBridgeDomain.objects.create(
+            name="ACITestVRFMovesBD2", aci_tenant=cls.aci_tenant, aci_vrf=cls.aci_vrf2
+        )
+        cls.aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestVRFMovesEPG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_bridge_domain=cls.aci_bd,
+        )
+
+        # ESG of the current VRF selecting the EPG of the moved BD
+        cls.aci_esg = ACIEndpointSecurityGroup.objects.create(
+            name="ACITestVRFMovesESG",
+            aci_app_profile=cls.aci_app_profile,
+            aci_vrf=cls.aci_vrf,
+        )
+        cls.aci_esg_selector = ACIEsgEndpointGroupSelector.objects.create(
+            name="ACITestVRFMovesSelector",
+            aci_endpoint_security_group=cls.aci_esg,
+            aci_epg_object=cls.aci_epg,
+        )
+
+        # L3Out of the current VRF bound to the moved BD
+        aci_routed_domain = ACIRoutedDomain.objects.create(
+            name="ACITestVRFMovesRoutedDomain", aci_fabric=cls.aci_fabric
+        )
+        cls.aci_l3out = ACIL3Out.objects.create(
+            name="ACITestVRFMovesL3Out",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf,
+            aci_routed_domain=aci_routed_domain,
+        )
+        cls.aci_bd_l3out_binding = ACIBridgeDomainL3OutBinding.objects.create(
+            aci_bridge_domain=cls.aci_bd, aci_l3out=cls.aci_l3out
+        )
+
+        # Subnet of the moved BD overlapping a subnet in the new VRF
+        cls.aci_bd_subnet = ACIBridgeDomainSubnet.objects.create(
+            name="ACITestVRFMovesSubnet",
+            aci_bridge_domain=cls.aci_bd,
+            gateway_ip_address=IPAddress.objects.create(address="10.1.0.1/16"),
+        )
+        ACIBridgeDomainSubnet.objects.create(
+            name="ACITestVRFMovesSubnet2",
+            aci_bridge_domain=cls.aci_bd2,
+            gateway_ip_address=IPAddress.objects.create(address="10.1.2.1/24"),
+        )
+
+        # VRF-scoped contract between the EPG and the current VRF, and a
+        # tenant-scoped contract permitted across VRFs
+        cls.aci_contract_relations = {}
+        for scope in (
+            ContractScopeChoices.SCOPE_VRF,
+            ContractScopeChoices.SCOPE_TENANT,
+        ):
+            aci_contract = ACIContract.objects.create(
+                name=f"ACITestVRFMovesContract-{scope}",
+                aci_tenant=cls.aci_tenant,
+                scope=scope,
+            )
+            cls.aci_contract_relations[scope] = ACIContractRelation.objects.create(
+                aci_contract=aci_contract,
+                aci_object=cls.aci_epg,
+                role=ContractRelationRoleChoices.ROLE_PROVIDER,
+            )
+            ACIContractRelation.objects.create(
+                aci_contract=aci_contract,
+                aci_object=cls.aci_vrf,
+                role=ContractRelationRoleChoices.ROLE_CONSUMER,
+            )
+
+    def test_analyze_reports_affected_objects_and_conflicts(self) -> None:
+        """Test the move reports the affected objects and the conflicts."""
+        impact = analyze_bridge_domain_vrf_moves({self.aci_bd.pk: self.aci_vrf2.pk})
+
+        self.assertEqual(impact.aci_bridge_domain_ids, [self.aci_bd.pk])
+        self.assertEqual(impact.aci_endpoint_group_ids, [self.aci_epg.pk])
+        self.assertEqual(impact.aci_useg_endpoint_group_ids, [])
+        self.assertEqual(
+            impact.aci_esg_endpoint_group_selector_ids, [self.aci_esg_selector.pk]
+        )
+        self.assertEqual(
+            impact.aci_bridge_domain_l3out_binding_ids, [self.aci_bd_l3out_binding.pk]
+        )
+        self.assertEqual(
+            sorted(impact.aci_contract_relation_ids),
+            sorted(relation.pk for relation in self.aci_contract_relations.values()),
+        )
+        self.assertEqual(
+            {(c.object_type, c.object_id) for c in impact.conflicts},
+            {
+                (
+                    "netbox_aci_plugin.aciesgendpointgroupselector",
+                    self.aci_esg_selector.pk,
+                ),
+                (
+                    "netbox_aci_plugin.acibridgedomainl3outbinding",
+                    self.aci_bd_l3out_binding.pk,
+                ),
+                ("netbox_aci_plugin.acibridgedomainsubnet", self.aci_bd_subnet.pk),
+                (
+                    "netbox_aci_plugin.acicontractrelation",
+                    self.aci_contract_relations[ContractScopeChoices.SCOPE_VRF].pk,
+                ),
+            },
+        )
+        for conflict in impact.conflicts:
+            self.assertEqual(conflict.aci_bridge_domain_id, self.aci_bd.pk)
+            self.assertTrue(conflict.message.startswith("Bridge Domain ACIBaseTestBD:"))
+
+    def test_analyze_ignores_unchanged_vrf(self) -> None:
+        """Test Bridge Domains keeping their VRF are not analyzed."""
+        moves = BridgeDomainVRFMoves({self.aci_bd.pk: self.aci_vrf.pk})
+        self.assertEqual(moves.aci_vrf_ids, {})
+        self.assertEqual(moves.analyze().serialize()["aci_bridge_domains"], [])
+
+    def test_analyze_without_conflicts(self) -> None:
+        """Test a move keeping the contract scopes in one VRF is valid."""
+        aci_bd = ACIBridgeDomain.objects.create(
+            name="ACITestVRFMovesBD3", aci_tenant=self.aci_tenant, aci_vrf=self.aci_vrf2
+        )
+        # VRF-scoped contract between the EPG and the new VRF
+        aci_epg = ACIEndpointGroup.objects.create(
+            name="ACITestVRFMovesEPG3",
+            aci_app_profile=self.aci_app_profile,
+            aci_bridge_domain=aci_bd,
+        )
+        aci_contract = ACIContract.objects.create(
+            name="ACITestVRFMovesContract3", aci_tenant=self.aci_tenant
+        )
+        for aci_object in (aci_epg, self.aci_vrf):
+            ACIContractRelation.objects.create(
+                aci_contract=aci_contract, aci_object=aci_object
+            )
+
+        impact = analyze_bridge_domain_vrf_moves({aci_bd.pk: self.aci_vrf.pk})
+        self.assertEqual(impact.aci_bridge_domain_ids, [aci_bd.pk])
+        self.assertEqual(impact.aci_endpoint_group_ids, [aci_epg.pk])
+        self.assertEqual(impact.conflicts, [])
+
+    def test_impact_serialize(self) -> None:
+        """Test the serialized representation of the impact."""
+        impact = analyze_bridge_domain_vrf_moves({self.aci_bd.pk: self.aci_vrf2.pk})
+        data = impact.serialize()
+        self.assertEqual(data["aci_endpoint_groups"], [self.aci_epg.pk])
+        self.assertEqual(len(data["conflicts"]), 4)
+        self.assertEqual(
+            set(data["conflicts"][0]),
+            {"aci_bridge_domain", "object_type", "object_id", "message"},
+        )
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the management commands of the NetBox ACI plugin."""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+
+from ..models.tenant.tenants import ACITenant
+from .models.base import ACIBaseTestCase
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures" / "snapshots"
+
+
+class IngestSnapshotCommandTestCase(ACIBaseTestCase):
+    """Test case for the aci_ingest_snapshot management command."""
+
+    def call_command(self, *args, **kwargs) -> tuple[str, str]:
+        """Call the command and return its standard output and error."""
+        stdout = StringIO()
+        stderr = StringIO()
+        call_command(
+            "aci_ingest_snapshot", *args, stdout=stdout, stderr=stderr, **kwargs
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_command_ingests_snapshot(self) -> None:
+        """Test the command ingests the snapshot and reports the progress."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = str(Path(tmpdir) / "checkpoint.json")
+            stdout, stderr = self.call_command(
+                str(FIXTURES_PATH / "tenant.xml"),
+                fabric=self.aci_fabric.name,
+                checkpoint=checkpoint,
+                batch_size=10,
+            )
+            self.assertIn("Ingested ACI Tenant ACISnapshotTenantXML", stdout)
+            self.assertIn("FilterMissing", stderr)
+            self.assertTrue(
+                ACITenant.objects.filter(name="ACISnapshotTenantXML").exists()
+            )
+
+            stdout, _stderr = self.call_command(
+                str(FIXTURES_PATH / "tenant.xml"),
+                fabric=self.aci_fabric.name,
+                checkpoint=checkpoint,
+            )
+        self.assertIn("skipped 1 completed ACI Tenant(s)", stdout)
+
+    def test_command_errors(self) -> None:
+        """Test the command fails for an unknown fabric or snapshot."""
+        with self.assertRaises(CommandError):
+            self.call_command(str(FIXTURES_PATH / "tenant.xml"), fabric="Unknown")
+        with self.assertRaises(CommandError):
+            self.call_command(
+                str(FIXTURES_PATH / "missing.xml"), fabric=self.aci_fabric.name
+            )
+
+
+class DiffSnapshotCommandTestCase(ACIBaseTestCase):
+    """Test case for the aci_diff_snapshot management command."""
+
+    def test_command_writes_json_lines(self) -> None:
+        """Test the command writes one JSON line per difference."""
+        stdout = StringIO()
+        stderr = StringIO()
+        call_command(
+            "aci_diff_snapshot",
+            str(FIXTURES_PATH / "tenant.json"),
+            fabric=self.aci_fabric.name,
+            stdout=stdout,
+            stderr=stderr,
+        )
+        diffs = {
+            diff["dn"]: diff for diff in map(json.loads, stdout.getvalue().splitlines())
+        }
+        self.assertEqual(diffs["uni/tn-ACISnapshotTenant"]["action"], "added")
+        self.assertEqual(diffs[f"uni/tn-{self.aci_tenant.name}"]["action"], "deleted")
+        self.assertIn("0 changed", stderr.getvalue())
+
+    def test_command_errors(self) -> None:
+        """Test the command fails for an unknown fabric or snapshot."""
+        with self.assertRaises(CommandError):
+            call_command(
+                "aci_diff_snapshot", str(FIXTURES_PATH / "tenant.xml"), fabric="Unknown"
+            )
+        with self.assertRaises(CommandError):
+            call_command(
+                "aci_diff_snapshot",
+                str(FIXTURES_PATH / "missing.xml"),
+                fabric=self.aci_fabric.name,
+            )
@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the cache of the detail page attribute panels."""
+
+from unittest.mock import Mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import TestCase, override_settings
+
+from core.models import ObjectType
+from users.models import ObjectPermission
+
+from ..fragment_cache import (
+    get_fragment_key,
+    get_or_render_fragment,
+    invalidate_bulk_fragments,
+)
+from ..models.fabric.fabrics import ACIFabric
+from ..models.tenant.bridge_domains import ACIBridgeDomain
+from ..models.tenant.contracts import ACIContract, ACIContractRelation
+from ..models.tenant.tenants import ACITenant
+from ..models.tenant.vrfs import ACIVRF
+from ..services.apic import ManagedObject
+from ..services.ingest import SnapshotIngester
+
+CACHE_DISABLED = {"netbox_aci_plugin": {"fragment_cache_timeout": 0}}
+FRAGMENT_TEMPLATE = (
+    "{% load aci_cache %}"
+    '{% aci_cache_fragment "attributes" object %}'
+    "{{ object.name }}"
+    "{% endaci_cache_fragment %}"
+)
+
+
+class FragmentCacheTestCase(TestCase):
+    """Test case for the fragment cache keys, invalidation, and tag."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI object tree."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACIFragmentTestFabric", fabric_id=121, infra_vlan_vid=3921
+        )
+        cls.aci_tenant = ACITenant.objects.create(
+            name="ACIFragmentTestTenant", aci_fabric=cls.aci_fabric
+        )
+        cls.aci_vrf = ACIVRF.objects.create(
+            name="ACIFragmentTestVRF", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_bd = ACIBridgeDomain.objects.create(
+            name="ACIFragmentTestBD",
+            aci_tenant=cls.aci_tenant,
+            aci_vrf=cls.aci_vrf,
+        )
+        cls.user = get_user_model().objects.create_user(username="acifragment")
+
+    def get_key(self, instance) -> str:
+        """Return the attributes fragment key of a fresh instance."""
+        instance = instance._meta.model.objects.get(pk=instance.pk)
+        return get_fragment_key("attributes", instance, self.user)
+
+    def test_key_invalidated_by_referenced_object(self) -> None:
+        """Test saving a referenced VRF invalidates the Bridge Domain."""
+        key = self.get_key(self.aci_bd)
+        self.assertEqual(self.get_key(self.aci_bd), key)
+        self.aci_vrf.save()
+        self.assertNotEqual(self.get_key(self.aci_bd), key)
+
+    def test_key_not_invalidated_when_disabled(self) -> None:
+        """Test saving does not renew the version tokens if disabled."""
+        key = self.get_key(self.aci_bd)
+        with override_settings(PLUGINS_CONFIG=CACHE_DISABLED):
+            self.aci_vrf.save()
+        self.assertEqual(self.get_key(self.aci_bd), key)
+
+    def test_key_invalidated_by_parent_chain(self) -> None:
+        """Test saving the ACI Fabric invalidates the Bridge Domain."""
+        key = self.get_key(self.aci_bd)
+        self.aci_fabric.save()
+        self.assertNotEqual(self.get_key(self.aci_bd), key)
+
+    def test_key_invalidated_by_child(self) -> None:
+        """Test saving or deleting a Bridge Domain invalidates its VRF."""
+        key = self.get_key(self.aci_vrf)
+        self.aci_bd.save()
+        saved_key = self.get_key(self.aci_vrf)
+        self.assertNotEqual(saved_key, key)
+        self.aci_bd.delete()
+        self.assertNotEqual(self.get_key(self.aci_vrf), saved_key)
+
+    def test_key_invalidated_by_generic_relation(self) -> None:
+        """Test saving a Contract Relation invalidates the related VRF."""
+        aci_contract = ACIContract.objects.create(
+            name="ACIFragmentTestContract", aci_tenant=self.aci_tenant
+        )
+        key = self.get_key(self.aci_vrf)
+        ACIContractRelation.objects.create(
+            aci_contract=aci_contract, aci_object=self.aci_vrf
+        )
+        self.assertNotEqual(self.get_key(self.aci_vrf), key)
+
+    def test_key_invalidated_by_bulk_writes(self) -> None:
+        """Test bulk created and upserted objects invalidate their keys."""
+        key = self.get_key(self.aci_vrf)
+        aci_bds = ACIBridgeDomain.objects.bulk_create(
+            [
+                ACIBridgeDomain(
+                    name="ACIFragmentTestBulkBD",
+                    aci_tenant=self.aci_tenant,
+                    aci_vrf=self.aci_vrf,
+                )
+            ]
+        )
+        self.assertEqual(self.get_key(self.aci_vrf), key)
+        invalidate_bulk_fragments(aci_bds)
+        self.assertNotEqual(self.get_key(self.aci_vrf), key)
+
+        # The ingest upserts the VRF referenced by the Bridge Domain
+        key = self.get_key(self.aci_bd)
+        SnapshotIngester(self.aci_fabric).ingest(
+            [
+                ManagedObject(
+                    "fvTenant",
+                    {"name": self.aci_tenant.name},
+                    (
+                        ManagedObject(
+                            "fvCtx", {"name": self.aci_vrf.name, "descr": "Ingested"}
+                        ),
+                    ),
+                )
+            ]
+        )
+        self.assertNotEqual(self.get_key(self.aci_bd), key)
+
+    def test_key_varies_by_permissions(self) -> None:
+        """Test users with different permissions use different keys."""
+        superuser = get_user_model().objects.create_user(
+            username="acifragmentsuperuser", is_superuser=True
+        )
+        keys = {
+            get_fragment_key("attributes", self.aci_vrf, user)
+            for user in (self.user, superuser, AnonymousUser(), None)
+        }
+        self.assertEqual(len(keys), 3)
+
+    def test_key_varies_by_constraints(self) -> None:
+        """Test users with differently constrained permissions differ."""
+        keys = set()
+        for index, constraints in enumerate(
+            ({"name": "ACIFragmentTestVRF"}, {"name": "ACIFragmentTestOther"})
+        ):
+            user = get_user_model().objects.create_user(
+                username=f"acifragmentconstrained{index}"
+            )
+            obj_perm = ObjectPermission(
+                name=f"ACI fragment test view {index}",
+                actions=["view"],
+                constraints=constraints,
+            )
+            obj_perm.save()
+            obj_perm.users.add(user)
+            obj_perm.object_types.add(ObjectType.objects.get_for_model(ACIVRF))
+            user = get_user_model().objects.get(pk=user.pk)
+            keys.add(get_fragment_key("attributes", self.aci_vrf, user))
+        self.assertEqual(len(keys), 2)
+
+    def test_get_or_render_fragment(self) -> None:
+        """Test a fragment is rendered once and then served from the cache."""
+        render = Mock(return_value="<div>VRF</div>")
+        for _ in range(2):
+            self.assertEqual(
+                get_or_render_fragment("test", self.aci_vrf, self.user, render),
+                "<div>VRF</div>",
+            )
+        render.assert_called_once()
+
+        with override_settings(PLUGINS_CONFIG=CACHE_DISABLED):
+            get_or_render_fragment("test", self.aci_vrf, self.user, render)
+        self.assertEqual(render.call_count, 2)
+
+    def test_template_tag(self) -> None:
+        """Test the template tag serves the cached fragment until a save."""
+        template = Template(FRAGMENT_TEMPLATE)
+        self.assertEqual(
+            template.render(Context({"object": self.aci_bd})), self.aci_bd.name
+        )
+
+        # A queryset update bypasses the invalidation
+        ACIBridgeDomain.objects.filter(pk=self.aci_bd.pk).update(
+            name="ACIFragmentTestBDRenamed"
+        )
+        aci_bd = ACIBridgeDomain.objects.get(pk=self.aci_bd.pk)
+        self.assertEqual(
+            template.render(Context({"object": aci_bd})), "ACIFragmentTestBD"
+        )
+
+        self.aci_vrf.save()
+        self.assertEqual(
+            template.render(Context({"object": aci_bd})), "ACIFragmentTestBDRenamed"
+        )
+
+    def test_template_tag_syntax(self) -> None:
+        """Test the template tag requires a fragment name and an object."""
+        with self.assertRaises(TemplateSyntaxError):
+            Template(
+                "{% load aci_cache %}{% aci_cache_fragment object %}"
+                "{% endaci_cache_fragment %}"
+            )
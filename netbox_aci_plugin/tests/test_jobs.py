@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the background jobs of the NetBox ACI plugin."""
+
+import json
+from pathlib import Path
+
+from django.core.files.storage import default_storage
+
+from ipam.models import IPAddress
+
+from ..jobs import (
+    ACIBridgeDomainSubnetOverlapJob,
+    ACIExportJob,
+    ACINodeOnboardingJob,
+    ACIRouteLeakRefreshJob,
+    ACISnapshotDiffJob,
+    ACISnapshotIngestJob,
+    ACITeardownJob,
+)
+from ..models.fabric.fabrics import ACIFabric
+from ..models.fabric.nodes import ACINode
+from ..models.tenant.bridge_domains import ACIBridgeDomain, ACIBridgeDomainSubnet
+from ..models.tenant.tenants import ACITenant
+from ..models.tenant.vrfs import ACIRouteLeak
+from .models.base import ACIBaseTestCase
+
+
+class ACIBridgeDomainSubnetOverlapJobTestCase(ACIBaseTestCase):
+    """Test case for the Bridge Domain subnet overlap report job."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up overlapping Bridge Domain subnets."""
+        super().setUpTestData()
+
+        aci_bd2 = ACIBridgeDomain.objects.create(
+            name="ACITestBD2", aci_tenant=cls.aci_tenant, aci_vrf=cls.aci_vrf
+        )
+        for name, aci_bd, address in (
+            ("Subnet1", cls.aci_bd, "10.10.0.1/16"),
+            ("Subnet2", aci_bd2, "10.10.10.1/24"),
+        ):
+            ACIBridgeDomainSubnet.objects.create(
+                name=name,
+                aci_bridge_domain=aci_bd,
+                gateway_ip_address=IPAddress.objects.create(address=address),
+            )
+        cls.aci_fabric_empty = ACIFabric.objects.create(
+            name="ACITestFabricEmpty", fabric_id=1, infra_vlan_vid=3900
+        )
+
+    def test_job_reports_overlaps_of_fabric(self) -> None:
+        """Test the job stores the overlaps of the attached ACI Fabric."""
+        job = ACIBridgeDomainSubnetOverlapJob.enqueue(
+            instance=self.aci_fabric, immediate=True
+        )
+        self.assertEqual(job.data["overlap_count"], 1)
+        self.assertEqual(job.data["overlaps"][0]["subnet"], "10.10.0.0/16")
+
+    def test_job_reports_no_overlaps_of_other_fabric(self) -> None:
+        """Test the job limits the report to the attached ACI Fabric."""
+        job = ACIBridgeDomainSubnetOverlapJob.enqueue(
+            instance=self.aci_fabric_empty, immediate=True
+        )
+        self.assertEqual(job.data, {"overlap_count": 0, "overlaps": []})
+
+    def test_job_reports_overlaps_of_all_fabrics(self) -> None:
+        """Test the job analyzes all ACI Fabrics without an attached object."""
+        job = ACIBridgeDomainSubnetOverlapJob.enqueue(immediate=True)
+        self.assertEqual(job.data["overlap_count"], 1)
+
+
+class ACIExportJobTestCase(ACIBaseTestCase):
+    """Test case for the ACI export job."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Tenants of different ACI Fabrics."""
+        super().setUpTestData()
+
+        aci_fabric_other = ACIFabric.objects.create(
+            name="ACITestFabricOther", fabric_id=2, infra_vlan_vid=3900
+        )
+        cls.aci_tenant_other = ACITenant.objects.create(
+            name="ACITestTenantOther", aci_fabric=aci_fabric_other
+        )
+
+    def read_output(self, job) -> str:
+        """Return the saved export document of the job and remove it."""
+        self.addCleanup(default_storage.delete, job.data["file"])
+        with default_storage.open(job.data["file"]) as fileobj:
+            output = fileobj.read().decode()
+        self.assertEqual(len(output.encode()), job.data["size"])
+        return output
+
+    def get_tenant_names(self, job) -> list[str]:
+        """Return the ACI Tenant names of the exported APIC JSON document."""
+        document = json.loads(self.read_output(job))
+        return [
+            fv_tenant["fvTenant"]["attributes"]["name"]
+            for fv_tenant in document["polUni"]["children"]
+        ]
+
+    def test_job_exports_tenant(self) -> None:
+        """Test the job exports the attached ACI Tenant."""
+        job = ACIExportJob.enqueue(instance=self.aci_tenant, immediate=True)
+        self.assertEqual(job.data["format"], "apic-json")
+        self.assertTrue(job.data["file"].endswith(".json"))
+        self.assertNotIn("output", job.data)
+        self.assertEqual(self.get_tenant_names(job), [self.aci_tenant.name])
+
+    def test_job_exports_tenants_of_fabric(self) -> None:
+        """Test the job exports the ACI Tenants of the attached ACI Fabric."""
+        job = ACIExportJob.enqueue(instance=self.aci_fabric, immediate=True)
+        names = self.get_tenant_names(job)
+        self.assertIn(self.aci_tenant.name, names)
+        self.assertNotIn(self.aci_tenant_other.name, names)
+
+    def test_job_exports_all_tenants_as_nac_yaml(self) -> None:
+        """Test the job exports all ACI Tenants without an attached object."""
+        job = ACIExportJob.enqueue(immediate=True, export_format="nac-yaml")
+        output = self.read_output(job)
+        self.assertTrue(output.startswith("apic:\n  tenants:\n"))
+        self.assertIn(self.aci_tenant_other.name, output)
+
+
+class ACISnapshotIngestJobTestCase(ACIBaseTestCase):
+    """Test case for the ACI snapshot ingest job."""
+
+    snapshot_path = str(
+        Path(__file__).parent / "fixtures" / "snapshots" / "tenant.json"
+    )
+
+    def test_job_ingests_snapshot(self) -> None:
+        """Test the job ingests the snapshot into the attached ACI Fabric."""
+        job = ACISnapshotIngestJob.enqueue(
+            instance=self.aci_fabric,
+            immediate=True,
+            snapshot_path=self.snapshot_path,
+        )
+        self.assertEqual(job.data["tenants"], ["ACISnapshotTenant"])
+        self.assertEqual(len(job.data["errors"]), 1)
+        self.assertTrue(
+            ACITenant.objects.filter(
+                aci_fabric=self.aci_fabric, name="ACISnapshotTenant"
+            ).exists()
+        )
+
+    def test_job_requires_fabric(self) -> None:
+        """Test the job fails without an attached ACI Fabric."""
+        with self.assertRaises(ValueError):
+            ACISnapshotIngestJob.enqueue(
+                immediate=True, snapshot_path=self.snapshot_path
+            )
+
+
+class ACISnapshotDiffJobTestCase(ACIBaseTestCase):
+    """Test case for the ACI snapshot diff job."""
+
+    snapshot_path = str(
+        Path(__file__).parent / "fixtures" / "snapshots" / "tenant.json"
+    )
+
+    def test_job_diffs_snapshot(self) -> None:
+        """Test the job stores the differences to the attached ACI Fabric."""
+        job = ACISnapshotDiffJob.enqueue(
+            instance=self.aci_fabric,
+            immediate=True,
+            snapshot_path=self.snapshot_path,
+        )
+        self.assertEqual(job.data["counts"]["changed"], 0)
+        self.assertIn(
+            {
+                "action": "deleted",
+                "model": "netbox_aci_plugin.ACITenant",
+                "dn": f"uni/tn-{self.aci_tenant.name}",
+                "id": self.aci_tenant.pk,
+                "changes": {},
+            },
+            job.data["diffs"],
+        )
+        self.assertEqual(len(job.data["diffs"]), sum(job.data["counts"].values()))
+
+    def test_job_requires_fabric(self) -> None:
+        """Test the job fails without an attached ACI Fabric."""
+        with self.assertRaises(ValueError):
+            ACISnapshotDiffJob.enqueue(immediate=True, snapshot_path=self.snapshot_path)
+
+
+class ACINodeOnboardingJobTestCase(ACIBaseTestCase):
+    """Test case for the ACI node onboarding job."""
+
+    def test_job_onboards_nodes(self) -> None:
+        """Test the job onboards the nodes into the attached ACI Pod."""
+        job = ACINodeOnboardingJob.enqueue(
+            instance=self.aci_pod,
+            immediate=True,
+            nodes=[
+                {
+                    "name": "ACITestJobLeaf",
+                    "device_type": self.device_type1.pk,
+                    "device_role": self.device_role1.pk,
+                }
+            ],
+        )
+        self.assertEqual(job.data["counts"]["dcim.Device"], 1)
+        self.assertEqual(job.data["nodes"][0]["node_id"], 102)
+        self.assertTrue(
+            ACINode.objects.filter(aci_pod=self.aci_pod, node_id=102).exists()
+        )
+
+    def test_job_requires_pod(self) -> None:
+        """Test the job fails without an attached ACI Pod."""
+        with self.assertRaises(ValueError):
+            ACINodeOnboardingJob.enqueue(immediate=True, nodes=[])
+
+
+class ACITeardownJobTestCase(ACIBaseTestCase):
+    """Test case for the ACI teardown job."""
+
+    def test_job_deletes_tenant(self) -> None:
+        """Test the job deletes the ACI Tenant with its dependent objects."""
+        job = ACITeardownJob.enqueue(
+            immediate=True,
+            object_type="netbox_aci_plugin.acitenant",
+            object_id=self.aci_tenant.pk,
+        )
+        self.assertEqual(job.data["counts"]["netbox_aci_plugin.ACITenant"], 1)
+        self.assertFalse(ACITenant.objects.filter(pk=self.aci_tenant.pk).exists())
+        self.assertFalse(ACIBridgeDomain.objects.filter(pk=self.aci_bd.pk).exists())
+
+    def test_job_requires_fabric_or_tenant(self) -> None:
+        """Test the job fails for other object types."""
+        with self.assertRaises(ValueError):
+            ACITeardownJob.enqueue(
+                immediate=True,
+                object_type="netbox_aci_plugin.acipod",
+                object_id=self.aci_pod.pk,
+            )
+
+
+class ACIRouteLeakRefreshJobTestCase(ACIBaseTestCase):
+    """Test case for the ACI route leak refresh job."""
+
+    def test_job_recomputes_route_leaks(self) -> None:
+        """Test the job replaces the route leaks of the attached ACI Fabric."""
+        ACIRouteLeak.objects.create(
+            aci_fabric=self.aci_fabric,
+            aci_vrf=self.aci_vrf,
+            source_aci_vrf=self.aci_vrf,
+            source=self.aci_bd,
+            prefix="10.0.0.0/8",
+        )
+        job = ACIRouteLeakRefreshJob.enqueue(instance=self.aci_fabric, immediate=True)
+        self.assertEqual(job.data, {"route_leak_count": 0})
+        self.assertFalse(ACIRouteLeak.objects.exists())
+
+    def test_job_requires_fabric(self) -> None:
+        """Test the job fails without an attached ACI Fabric."""
+        with self.assertRaises(ValueError):
+            ACIRouteLeakRefreshJob.enqueue(immediate=True)
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the request-scoped cache of the permission filters and counts."""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.models import ObjectType
+from extras.models import Tag
+from netbox.context import current_request
+from users.models import ObjectPermission
+from utilities.permissions import qs_filter_from_constraints
+from utilities.testing import TestCase
+
+from ..models.fabric.fabrics import ACIFabric
+from ..models.tenant.tenants import ACITenant
+from ..permissions import (
+    PermissionFilterCacheMiddleware,
+    _permission_filters,
+    _query_counts,
+    count_related,
+    permission_filter_cache,
+    query_count_cache,
+)
+
+
+class PermissionFilterCacheTestCase(TestCase):
+    """Test case for the cached restriction of the plugin querysets."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI Tenants with a constrained view permission."""
+        cls.aci_fabric = ACIFabric.objects.create(
+            name="ACIPermissionTestFabric", fabric_id=120, infra_vlan_vid=3920
+        )
+        cls.aci_tenant1 = ACITenant.objects.create(
+            name="ACIPermissionTestTenant1", aci_fabric=cls.aci_fabric
+        )
+        cls.aci_tenant2 = ACITenant.objects.create(
+            name="ACIPermissionTestTenant2", aci_fabric=cls.aci_fabric
+        )
+        cls.viewer = get_user_model().objects.create_user(username="aciviewer")
+        obj_perm = ObjectPermission(
+            name="ACI permission test view",
+            actions=["view"],
+            constraints={"name": "ACIPermissionTestTenant1"},
+        )
+        obj_perm.save()
+        obj_perm.users.add(cls.viewer)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+
+    def test_restrict_compiles_filter_once(self) -> None:
+        """Test the permission filter is compiled once per cache scope."""
+        with (
+            patch(
+                "netbox_aci_plugin.permissions.qs_filter_from_constraints",
+                side_effect=qs_filter_from_constraints,
+            ) as compile_filter,
+            permission_filter_cache(),
+        ):
+            for _ in range(3):
+                self.assertQuerySetEqual(
+                    ACITenant.objects.restrict(self.viewer, "view"),
+                    [self.aci_tenant1],
+                )
+            self.assertQuerySetEqual(
+                ACITenant.objects.filter(aci_fabric__isnull=False).restrict(
+                    self.viewer, "view"
+                ),
+                [self.aci_tenant1],
+            )
+        compile_filter.assert_called_once()
+
+    def test_restrict_without_subquery(self) -> None:
+        """Test the constraints filter the queryset without a subquery."""
+        with permission_filter_cache():
+            queryset = ACITenant.objects.restrict(self.viewer, "view")
+            self.assertEqual(str(queryset.query).count("SELECT"), 1)
+            self.assertQuerySetEqual(queryset, [self.aci_tenant1])
+
+    def test_restrict_multi_valued_constraints(self) -> None:
+        """Test constraints spanning the tags do not duplicate the objects."""
+        tags = [
+            Tag.objects.create(name=f"ACIPermissionTest{i}", slug=f"acipermtest{i}")
+            for i in range(2)
+        ]
+        self.aci_tenant2.tags.add(*tags)
+        user = get_user_model().objects.create_user(username="acitagviewer")
+        obj_perm = ObjectPermission(
+            name="ACI permission test tags",
+            actions=["view"],
+            constraints={"tags__slug__in": [tag.slug for tag in tags]},
+        )
+        obj_perm.save()
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(ACITenant))
+        user = get_user_model().objects.get(pk=user.pk)
+
+        with permission_filter_cache():
+            self.assertQuerySetEqual(
+                ACITenant.objects.restrict(user, "view"), [self.aci_tenant2]
+            )
+
+    def test_restrict_cleared_by_permission_change(self) -> None:
+        """Test changing an object permission clears the cached filters."""
+        with permission_filter_cache() as permission_filters:
+            ACITenant.objects.restrict(self.viewer, "view")
+            self.assertTrue(permission_filters)
+            ObjectPermission.objects.get(name="ACI permission test view").save()
+            self.assertEqual(permission_filters, {})
+
+    def test_count_cache(self) -> None:
+        """Test the badge, panel, and table count the objects once."""
+        request = RequestFactory().get("/")
+        request.user = self.viewer
+        token = current_request.set(request)
+        self.addCleanup(current_request.reset, token)
+
+        def count_children() -> list[int]:
+            return [
+                # Tab badge
+                count_related(self.aci_fabric.aci_tenants),
+                # Related objects panel
+                ACITenant.objects.restrict(self.viewer, "view")
+                .filter(aci_fabric=self.aci_fabric)
+                .count(),
+                # Table of the children view
+                ACITenant.objects.restrict(self.viewer, "view")
+                .select_related("aci_fabric")
+                .filter(aci_fabric_id=self.aci_fabric.pk)
+                .order_by("name")
+                .count(),
+            ]
+
+        with permission_filter_cache():
+            ACITenant.objects.restrict(self.viewer, "view")
+            with self.assertNumQueries(3):
+                self.assertEqual(count_children(), [1, 1, 1])
+            with query_count_cache(), self.assertNumQueries(1):
+                self.assertEqual(count_children(), [1, 1, 1])
+
+    def test_restrict_unrestricted_and_denied(self) -> None:
+        """Test superusers see all objects and unpermitted users see none."""
+        superuser = get_user_model().objects.create_user(
+            username="acisuperuser", is_superuser=True
+        )
+        with permission_filter_cache():
+            self.assertEqual(
+                ACITenant.objects.restrict(superuser, "view").count(),
+                ACITenant.objects.count(),
+            )
+            self.assertFalse(ACITenant.objects.restrict(self.viewer, "change"))
+            self.assertFalse(ACITenant.objects.restrict(AnonymousUser(), "view"))
+
+    def test_restrict_outside_cache(self) -> None:
+        """Test restricting outside of a cache scope compiles the filter."""
+        self.assertQuerySetEqual(
+            ACITenant.objects.restrict(self.viewer, "view"), [self.aci_tenant1]
+        )
+        self.assertIsNone(_permission_filters.get())
+
+    def test_nested_cache_is_shared(self) -> None:
+        """Test a nested cache scope reuses the outer cache."""
+        with permission_filter_cache() as outer:
+            with permission_filter_cache() as inner:
+                self.assertIs(inner, outer)
+            self.assertIs(_permission_filters.get(), outer)
+        self.assertIsNone(_permission_filters.get())
+
+    def test_middleware(self) -> None:
+        """Test the middleware scopes the cache to the request."""
+        scopes = []
+
+        def get_response(request):
+            scopes.append((_permission_filters.get(), _query_counts.get()))
+            return HttpResponse()
+
+        middleware = PermissionFilterCacheMiddleware(get_response)
+        middleware(RequestFactory().get("/"))
+        middleware(RequestFactory().post("/"))
+        # The counts are only cached for requests not writing any objects
+        self.assertEqual(scopes, [({}, {}), ({}, None)])
+        self.assertIsNone(_permission_filters.get())
+        self.assertIsNone(_query_counts.get())
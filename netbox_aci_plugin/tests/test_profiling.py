@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 Martin Hauser
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the opt-in profiling of the plugin hot paths."""
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from prometheus_client import REGISTRY
+
+from ..api.views import ACIVRFListViewSet
+from ..filtersets.tenant.vrfs import ACIVRFFilterSet
+from ..models.base import ACIBaseModel
+from ..models.tenant.bridge_domains import ACIBridgeDomain
+from ..models.tenant.tenants import ACITenant
+from ..models.tenant.vrfs import ACIVRF
+from ..profiling import ProfilingMiddleware, install_profiling, profile_hook
+from ..views.tenant.vrfs import ACIVRFView
+
+PROFILING_ENABLED = {"netbox_aci_plugin": {"profiling_enabled": True}}
+
+
+def get_query_count(hook: str) -> float:
+    """Return the exported query count of a hook."""
+    return (
+        REGISTRY.get_sample_value("netbox_aci_hook_queries_total", {"hook": hook}) or 0
+    )
+
+
+class ProfilingTestCase(TestCase):
+    """Test case for the hook profiler and the profiling middleware."""
+
+    def test_profile_hook_records_queries(self) -> None:
+        """Test nested hooks each record the queries executed within them."""
+        inner = profile_hook("test.inner", lambda: ACITenant.objects.count())
+
+        def outer_func():
+            ACITenant.objects.exists()
+            return inner()
+
+        outer = profile_hook("test.outer", outer_func)
+        before = get_query_count("test.outer")
+
+        def get_response(request):
+            outer()
+            return HttpResponse()
+
+        with override_settings(PLUGINS_CONFIG=PROFILING_ENABLED):
+            middleware = ProfilingMiddleware(get_response)
+        response = middleware(RequestFactory().get("/"))
+
+        self.assertEqual(get_query_count("test.outer"), before + 2)
+        header = response["Server-Timing"]
+        self.assertIn("test.outer;dur=", header)
+        self.assertIn('desc="1 call(s), 2 queries', header)
+        self.assertIn('desc="1 call(s), 1 queries', header)
+
+    def test_profile_hook_is_idempotent(self) -> None:
+        """Test a profiled function is not wrapped again."""
+        hook = profile_hook("test.hook", len)
+        self.assertIs(profile_hook("test.hook", hook), hook)
+        self.assertEqual(hook("abc"), 3)
+
+    def test_middleware_without_hooks(self) -> None:
+        """Test requests without profiled hooks get no debug header."""
+        with override_settings(PLUGINS_CONFIG=PROFILING_ENABLED):
+            middleware = ProfilingMiddleware(lambda request: HttpResponse())
+        response = middleware(RequestFactory().get("/"))
+        self.assertNotIn("Server-Timing", response)
+
+    def test_middleware_disabled(self) -> None:
+        """Test the middleware is not used unless the profiling is enabled."""
+        with self.assertRaises(MiddlewareNotUsed):
+            ProfilingMiddleware(lambda request: HttpResponse())
+
+    def test_install_profiling(self) -> None:
+        """Test the plugin hooks are wrapped once where they are defined."""
+        install_profiling()
+        install_profiling()
+
+        for func in (
+            ACIVRFView.dispatch,
+            ACIVRFListViewSet.dispatch,
+            ACIVRFFilterSet.search,
+            ACIBridgeDomain.clean,
+            ACIBaseModel.save,
+        ):
+            self.assertTrue(func.__aci_profiled__)
+            self.assertFalse(getattr(func.__wrapped__, "__aci_profiled__", False))
+        self.assertIs(ACIVRF.__dict__.get("save"), None)
@@ -3,21 +3,23 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from tenancy.models import Tenant
-from utilities.testing import ModelViewTestCase
+from utilities.testing import ModelViewTestCase, ViewTestCases
 
 from ...models.fabric.fabrics import ACIFabric
 from ...models.tenant.app_profiles import ACIAppProfile
 from ...models.tenant.bridge_domains import ACIBridgeDomain
 from ...models.tenant.tenants import ACITenant
 from ...models.tenant.vrfs import ACIVRF
+from ..base import QueryScalingMixin
 
 
-class ACIModelViewTestCase(ModelViewTestCase):
+class ACIModelViewTestCase(QueryScalingMixin, ModelViewTestCase):
     """Plugin base for ``ViewTestCases.*`` mixins.
 
     Prefixes the URL namespace with ``plugins:`` (NetBox's default
-    omits this) and seeds the shared fabric / tenant / VRF / BD chain
-    that downstream model fixtures depend on.
+    omits this), seeds the shared fabric / tenant / VRF / BD chain
+    that downstream model fixtures depend on, and checks the list view
+    for N+1 queries.
     """
 
     def _get_base_url(self):
@@ -54,3 +56,18 @@ class ACIModelViewTestCase(ModelViewTestCase):
             name="ACIBaseViewTestAppProfile",
             aci_tenant=cls.aci_tenant,
         )
+
+    def test_list_objects_query_scaling(self) -> None:
+        """Test the list view query count is independent of the page size."""
+        if not isinstance(self, ViewTestCases.ListObjectsViewTestCase):
+            self.skipTest("No list view tested.")
+        self.add_permissions(
+            f"{self.model._meta.app_label}.view_{self.model._meta.model_name}"
+        )
+        url = self._get_url("list")
+
+        def request(size: int) -> None:
+            response = self.client.get(f"{url}?per_page={size}")
+            self.assertHttpStatus(response, 200)
+
+        self.assertQueryCountScaling(request, self.model)
@@ -19,6 +19,7 @@ from ...forms.access_policies.domains import (
 from ...models.access_policies.domains import ACIRoutedDomain
 from ...models.fabric.fabrics import ACIFabric
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.access_policies.domains import ACIRoutedDomainTable
 
 #
@@ -33,7 +34,7 @@ class ACIRoutedDomainChildrenView(generic.ObjectChildrenView):
     filterset = ACIRoutedDomainFilterSet
     tab = ViewTab(
         label=_("Routed Domains"),
-        badge=lambda obj: obj.aci_routed_domains.count(),
+        badge=lambda obj: count_related(obj.aci_routed_domains),
         permission="netbox_aci_plugin.view_acirouteddomain",
         weight=2000,
     )
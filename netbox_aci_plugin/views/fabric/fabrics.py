@@ -21,6 +21,7 @@ from ...forms.fabric.fabrics import (
 from ...models.fabric.fabrics import ACIFabric
 from ...models.fabric.nodes import ACINode
 from ...object_actions import add_child_action
+from ...permissions import count_viewable
 from ...tables.fabric.fabrics import ACIFabricTable
 from ..fabric.nodes import ACINodeChildrenView
 from ..fabric.pods import ACIPodChildrenView
@@ -131,9 +132,9 @@ class ACIFabricNodeView(ACINodeChildrenView):
     queryset = ACIFabric.objects.all()
     tab = ViewTab(
         label=_("Nodes"),
-        badge=lambda obj: ACINodeChildrenView.child_model.objects.filter(
-            aci_pod__aci_fabric=obj.pk
-        ).count(),
+        badge=lambda obj: count_viewable(
+            ACINodeChildrenView.child_model, aci_pod__aci_fabric=obj
+        ),
         permission="netbox_aci_plugin.view_acinode",
         weight=1000,
     )
@@ -17,6 +17,7 @@ from ...forms.fabric.nodes import (
     ACINodeImportForm,
 )
 from ...models.fabric.nodes import ACINode
+from ...permissions import count_related
 from ...tables.fabric.nodes import ACINodeTable
 
 #
@@ -31,7 +32,7 @@ class ACINodeChildrenView(generic.ObjectChildrenView):
     filterset = ACINodeFilterSet
     tab = ViewTab(
         label=_("Nodes"),
-        badge=lambda obj: obj.aci_nodes.count(),
+        badge=lambda obj: count_related(obj.aci_nodes),
         permission="netbox_aci_plugin.view_acinode",
         weight=1000,
     )
@@ -18,6 +18,7 @@ from ...forms.fabric.pods import (
 )
 from ...models.fabric.pods import ACIPod
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.fabric.pods import ACIPodTable
 from ..fabric.nodes import ACINodeChildrenView
 
@@ -33,7 +34,7 @@ class ACIPodChildrenView(generic.ObjectChildrenView):
     filterset = ACIPodFilterSet
     tab = ViewTab(
         label=_("Pods"),
-        badge=lambda obj: obj.aci_pods.count(),
+        badge=lambda obj: count_related(obj.aci_pods),
         permission="netbox_aci_plugin.view_acipod",
         weight=1000,
     )
@@ -16,6 +16,7 @@ from ...forms.tenant.app_profiles import (
 )
 from ...models.tenant.app_profiles import ACIAppProfile
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.app_profiles import ACIAppProfileTable
 from .endpoint_groups import (
     ACIEndpointGroupChildrenView,
@@ -35,7 +36,7 @@ class ACIAppProfileChildrenView(generic.ObjectChildrenView):
     filterset = ACIAppProfileFilterSet
     tab = ViewTab(
         label=_("Application Profiles"),
-        badge=lambda obj: obj.aci_app_profiles.count(),
+        badge=lambda obj: count_related(obj.aci_app_profiles),
         permission="netbox_aci_plugin.view_aciappprofile",
         weight=1000,
     )
@@ -32,6 +32,7 @@ from ...models.tenant.bridge_domains import (
     ACIBridgeDomainSubnet,
 )
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.bridge_domains import (
     ACIBridgeDomainL3OutBindingTable,
     ACIBridgeDomainSubnetReducedTable,
@@ -52,7 +53,7 @@ class ACIBridgeDomainChildrenView(generic.ObjectChildrenView):
     filterset = ACIBridgeDomainFilterSet
     tab = ViewTab(
         label=_("Bridge Domains"),
-        badge=lambda obj: obj.aci_bridge_domains.count(),
+        badge=lambda obj: count_related(obj.aci_bridge_domains),
         permission="netbox_aci_plugin.view_acibridgedomain",
         weight=1000,
     )
@@ -81,7 +82,7 @@ class ACIBridgeDomainSubnetChildrenView(generic.ObjectChildrenView):
     filterset = ACIBridgeDomainSubnetFilterSet
     tab = ViewTab(
         label=_("BD Subnets"),
-        badge=lambda obj: obj.aci_bridge_domain_subnets.count(),
+        badge=lambda obj: count_related(obj.aci_bridge_domain_subnets),
         permission="netbox_aci_plugin.view_acibridgedomainsubnet",
         weight=1000,
     )
@@ -110,7 +111,7 @@ class ACIBridgeDomainL3OutBindingChildrenView(generic.ObjectChildrenView):
     filterset = ACIBridgeDomainL3OutBindingFilterSet
     tab = ViewTab(
         label=_("L3Outs"),
-        badge=lambda obj: obj.aci_l3out_bindings.count(),
+        badge=lambda obj: count_related(obj.aci_l3out_bindings),
         permission="netbox_aci_plugin.view_acibridgedomainl3outbinding",
         weight=1000,
     )
@@ -26,6 +26,7 @@ from ...models.tenant.contract_filters import (
     ACIContractFilterEntry,
 )
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.contract_filters import (
     ACIContractFilterEntryReducedTable,
     ACIContractFilterEntryTable,
@@ -44,7 +45,7 @@ class ACIContractFilterEntryChildrenView(generic.ObjectChildrenView):
     filterset = ACIContractFilterEntryFilterSet
     tab = ViewTab(
         label=_("Filter Entries"),
-        badge=lambda obj: obj.aci_contract_filter_entries.count(),
+        badge=lambda obj: count_related(obj.aci_contract_filter_entries),
         permission="netbox_aci_plugin.view_acicontractfilterentry",
         weight=1000,
     )
@@ -38,6 +38,7 @@ from ...models.tenant.contracts import (
     ACIContractSubjectFilter,
 )
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.contracts import (
     ACIContractRelationTable,
     ACIContractSubjectFilterReducedTable,
@@ -59,7 +60,7 @@ class ACIContractChildrenView(generic.ObjectChildrenView):
     filterset = ACIContractFilterSet
     tab = ViewTab(
         label=_("Contracts"),
-        badge=lambda obj: obj.aci_contracts.count(),
+        badge=lambda obj: count_related(obj.aci_contracts),
         permission="netbox_aci_plugin.view_acicontract",
         weight=1000,
     )
@@ -87,7 +88,7 @@ class ACIContractRelationChildrenView(generic.ObjectChildrenView):
     filterset = ACIContractRelationFilterSet
     tab = ViewTab(
         label=_("Contracts"),
-        badge=lambda obj: obj.aci_contract_relations.count(),
+        badge=lambda obj: count_related(obj.aci_contract_relations),
         permission="netbox_aci_plugin.view_acicontractrelation",
         weight=1100,
     )
@@ -115,7 +116,7 @@ class ACIContractSubjectChildrenView(generic.ObjectChildrenView):
     filterset = ACIContractSubjectFilterSet
     tab = ViewTab(
         label=_("Subjects"),
-        badge=lambda obj: obj.aci_contract_subjects.count(),
+        badge=lambda obj: count_related(obj.aci_contract_subjects),
         permission="netbox_aci_plugin.view_acicontractsubject",
         weight=1000,
     )
@@ -143,7 +144,7 @@ class ACIContractSubjectFilterChildrenView(generic.ObjectChildrenView):
     filterset = ACIContractSubjectFilterFilterSet
     tab = ViewTab(
         label=_("Subject Filters"),
-        badge=lambda obj: obj.aci_contract_subject_filters.count(),
+        badge=lambda obj: count_related(obj.aci_contract_subject_filters),
         permission="netbox_aci_plugin.view_acicontractsubjectfilter",
         weight=1000,
     )
@@ -253,7 +254,7 @@ class ACIContractContractRelationView(ACIContractRelationChildrenView):
     ) + ACIContractRelationChildrenView.actions
     tab = ViewTab(
         label=_("Relations"),
-        badge=lambda obj: obj.aci_contract_relations.count(),
+        badge=lambda obj: count_related(obj.aci_contract_relations),
         permission="netbox_aci_plugin.view_acicontractrelation",
         weight=1100,
     )
@@ -33,6 +33,7 @@ from ...models.tenant.endpoint_groups import (
     ACIUSegNetworkAttribute,
 )
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.endpoint_groups import (
     ACIEndpointGroupTable,
     ACIUSegEndpointGroupTable,
@@ -52,7 +53,7 @@ class ACIEndpointGroupChildrenView(generic.ObjectChildrenView):
     filterset = ACIEndpointGroupFilterSet
     tab = ViewTab(
         label=_("Endpoint Groups"),
-        badge=lambda obj: obj.aci_endpoint_groups.count(),
+        badge=lambda obj: count_related(obj.aci_endpoint_groups),
         permission="netbox_aci_plugin.view_aciendpointgroup",
         weight=1000,
     )
@@ -81,7 +82,7 @@ class ACIUSegEndpointGroupChildrenView(generic.ObjectChildrenView):
     filterset = ACIUSegEndpointGroupFilterSet
     tab = ViewTab(
         label=_("uSeg Endpoint Groups"),
-        badge=lambda obj: obj.aci_useg_endpoint_groups.count(),
+        badge=lambda obj: count_related(obj.aci_useg_endpoint_groups),
         permission="netbox_aci_plugin.view_aciusegendpointgroup",
         weight=1000,
     )
@@ -110,7 +111,7 @@ class ACIUSegNetworkAttributeChildrenView(generic.ObjectChildrenView):
     filterset = ACIUSegNetworkAttributeFilterSet
     tab = ViewTab(
         label=_("Network Attributes"),
-        badge=lambda obj: obj.aci_useg_network_attributes.count(),
+        badge=lambda obj: count_related(obj.aci_useg_network_attributes),
         permission="netbox_aci_plugin.view_aciusegnetworkattribute",
         weight=1000,
     )
@@ -33,6 +33,7 @@ from ...models.tenant.endpoint_security_groups import (
     ACIEsgEndpointSelector,
 )
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.endpoint_security_groups import (
     ACIEndpointSecurityGroupTable,
     ACIEsgEndpointGroupSelectorTable,
@@ -52,7 +53,7 @@ class ACIEndpointSecurityGroupChildrenView(generic.ObjectChildrenView):
     filterset = ACIEndpointSecurityGroupFilterSet
     tab = ViewTab(
         label=_("Endpoint Security Groups"),
-        badge=lambda obj: obj.aci_endpoint_security_groups.count(),
+        badge=lambda obj: count_related(obj.aci_endpoint_security_groups),
         permission="netbox_aci_plugin.view_aciendpointsecuritygroup",
         weight=1000,
     )
@@ -81,7 +82,7 @@ class ACIEsgEndpointGroupSelectorChildrenView(generic.ObjectChildrenView):
     filterset = ACIEsgEndpointGroupSelectorFilterSet
     tab = ViewTab(
         label=_("EPG Selectors"),
-        badge=lambda obj: obj.aci_esg_endpoint_group_selectors.count(),
+        badge=lambda obj: count_related(obj.aci_esg_endpoint_group_selectors),
         permission="netbox_aci_plugin.view_aciesgendpointgroupselector",
         weight=1000,
     )
@@ -111,7 +112,7 @@ class ACIEsgEndpointSelectorChildrenView(generic.ObjectChildrenView):
     filterset = ACIEsgEndpointSelectorFilterSet
     tab = ViewTab(
         label=_("Endpoint Selectors"),
-        badge=lambda obj: obj.aci_esg_endpoint_selectors.count(),
+        badge=lambda obj: count_related(obj.aci_esg_endpoint_selectors),
         permission="netbox_aci_plugin.view_aciesgendpointselector",
         weight=1000,
     )
@@ -36,6 +36,7 @@ from ...models.tenant.l3outs import (
     ACIL3Out,
 )
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.l3outs import (
     ACIExternalEndpointGroupReducedTable,
     ACIExternalEndpointGroupTable,
@@ -57,7 +58,7 @@ class ACIL3OutChildrenView(generic.ObjectChildrenView):
     filterset = ACIL3OutFilterSet
     tab = ViewTab(
         label=_("L3Outs"),
-        badge=lambda obj: obj.aci_l3outs.count(),
+        badge=lambda obj: count_related(obj.aci_l3outs),
         permission="netbox_aci_plugin.view_acil3out",
         weight=1000,
     )
@@ -85,7 +86,7 @@ class ACIExternalEndpointGroupChildrenView(generic.ObjectChildrenView):
     filterset = ACIExternalEndpointGroupFilterSet
     tab = ViewTab(
         label=_("External EPGs"),
-        badge=lambda obj: obj.aci_external_endpoint_groups.count(),
+        badge=lambda obj: count_related(obj.aci_external_endpoint_groups),
         permission="netbox_aci_plugin.view_aciexternalendpointgroup",
         weight=1000,
     )
@@ -113,7 +114,7 @@ class ACIExternalSubnetChildrenView(generic.ObjectChildrenView):
     filterset = ACIExternalSubnetFilterSet
     tab = ViewTab(
         label=_("External Subnets"),
-        badge=lambda obj: obj.aci_external_subnets.count(),
+        badge=lambda obj: count_related(obj.aci_external_subnets),
         permission="netbox_aci_plugin.view_aciexternalsubnet",
         weight=1000,
     )
@@ -252,7 +253,7 @@ class ACIL3OutBridgeDomainBindingsView(ACIBridgeDomainL3OutBindingChildrenView):
     ) + ACIBridgeDomainL3OutBindingChildrenView.actions
     tab = ViewTab(
         label=_("Bridge Domains"),
-        badge=lambda obj: obj.aci_bridge_domain_bindings.count(),
+        badge=lambda obj: count_related(obj.aci_bridge_domain_bindings),
         permission="netbox_aci_plugin.view_acibridgedomainl3outbinding",
         weight=1000,
     )
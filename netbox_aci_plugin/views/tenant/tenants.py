@@ -22,6 +22,7 @@ from ...models.tenant.endpoint_groups import ACIEndpointGroup
 from ...models.tenant.endpoint_security_groups import ACIEndpointSecurityGroup
 from ...models.tenant.tenants import ACITenant
 from ...object_actions import add_child_action
+from ...permissions import count_related, count_viewable
 from ...tables.tenant.tenants import ACITenantTable
 from .app_profiles import ACIAppProfileChildrenView
 from .bridge_domains import ACIBridgeDomainChildrenView
@@ -46,7 +47,7 @@ class ACITenantChildrenView(generic.ObjectChildrenView):
     filterset = ACITenantFilterSet
     tab = ViewTab(
         label=_("Tenants"),
-        badge=lambda obj: obj.aci_tenants.count(),
+        badge=lambda obj: count_related(obj.aci_tenants),
         permission="netbox_aci_plugin.view_acitenant",
         weight=1000,
     )
@@ -190,9 +191,9 @@ class ACITenantEndpointGroupView(ACIEndpointGroupChildrenView):
     queryset = ACITenant.objects.all()
     tab = ViewTab(
         label=_("Endpoint Groups"),
-        badge=lambda obj: ACIEndpointGroupChildrenView.child_model.objects.filter(
-            aci_app_profile__aci_tenant=obj.pk
-        ).count(),
+        badge=lambda obj: count_viewable(
+            ACIEndpointGroupChildrenView.child_model, aci_app_profile__aci_tenant=obj
+        ),
         permission="netbox_aci_plugin.view_aciendpointgroup",
         weight=1000,
     )
@@ -234,10 +235,9 @@ class ACITenantEndpointSecurityGroupView(ACIEndpointSecurityGroupChildrenView):
     queryset = ACITenant.objects.all()
     tab = ViewTab(
         label=_("Endpoint Security Groups"),
-        badge=(
-            lambda obj: ACIEndpointSecurityGroupChildrenView.child_model.objects.filter(
-                aci_app_profile__aci_tenant=obj.pk
-            ).count()
+        badge=lambda obj: count_viewable(
+            ACIEndpointSecurityGroupChildrenView.child_model,
+            aci_app_profile__aci_tenant=obj,
         ),
         permission="netbox_aci_plugin.view_aciendpointsecuritygroup",
         weight=1000,
@@ -17,6 +17,7 @@ from ...forms.tenant.vrfs import (
 )
 from ...models.tenant.vrfs import ACIVRF
 from ...object_actions import add_child_action
+from ...permissions import count_related
 from ...tables.tenant.vrfs import ACIVRFTable
 from .bridge_domains import ACIBridgeDomainChildrenView
 from .contracts import ACIContractRelationChildrenView
@@ -33,7 +34,7 @@ class ACIVRFChildrenView(generic.ObjectChildrenView):
     filterset = ACIVRFFilterSet
     tab = ViewTab(
         label=_("VRFs"),
-        badge=lambda obj: obj.aci_vrfs.count(),
+        badge=lambda obj: count_related(obj.aci_vrfs),
         permission="netbox_aci_plugin.view_acivrf",
         weight=1000,
     )